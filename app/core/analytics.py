@@ -7,8 +7,9 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass
 from collections import defaultdict
 
-from ..services import get_logger
-from ..models import Campaign, Account, SendLog, SendStatus
+from ..services import get_logger, get_send_log_rollups
+from ..services.send_errors import classify_error_message
+from ..models import Campaign, Account, SendErrorCode, SendLog, SendStatus
 
 
 @dataclass
@@ -104,8 +105,9 @@ class AnalyticsCollector:
             if log.duration_ms:
                 durations.append(log.duration_ms)
             
-            if log.status == "failed" and log.error_message:
-                errors[log.error_message] += 1
+            if log.status == "failed":
+                code = SendErrorCode(log.error_code) if log.error_code else classify_error_message(log.error_message)
+                errors[code.value] += 1
         
         total_logs = len(send_logs)
         successful = status_counts.get("sent", 0)
@@ -120,6 +122,23 @@ class AnalyticsCollector:
             "average_duration_ms": average_duration,
             "error_summary": dict(errors)
         }
+    
+    def collect_rollup_analytics(self, campaign_id: Optional[int] = None, account_id: Optional[int] = None) -> Dict[str, Any]:
+        """Collect the same analytics as ``collect_send_log_analytics`` from the hourly rollups."""
+        rollups = get_send_log_rollups()
+        status_counts = rollups.status_counts(campaign_id=campaign_id, account_id=account_id)
+        
+        total_logs = sum(status_counts.values())
+        successful = status_counts.get("sent", 0)
+        success_rate = (successful / total_logs * 100) if total_logs > 0 else 0.0
+        
+        return {
+            "total_logs": total_logs,
+            "status_counts": status_counts,
+            "success_rate": success_rate,
+            "average_duration_ms": rollups.average_duration_ms(campaign_id=campaign_id, account_id=account_id),
+            "error_summary": rollups.error_summary(campaign_id=campaign_id, account_id=account_id)
+        }
 
 
 class CampaignAnalytics:
@@ -130,25 +149,18 @@ class CampaignAnalytics:
         self.analytics_collector = analytics_collector
         self.logger = get_logger()
     
-    def generate_campaign_report(self, campaign: Campaign, send_logs: List[SendLog]) -> Dict[str, Any]:
+    def generate_campaign_report(self, campaign: Campaign) -> Dict[str, Any]:
         """Generate comprehensive campaign report."""
         campaign_stats = self.analytics_collector.collect_campaign_analytics(campaign)
-        log_analytics = self.analytics_collector.collect_send_log_analytics(send_logs)
+        log_analytics = self.analytics_collector.collect_rollup_analytics(campaign_id=campaign.id)
+        rollups = get_send_log_rollups()
         
         # Calculate additional metrics
         completion_rate = (campaign_stats.sent_count + campaign_stats.failed_count) / campaign_stats.total_recipients * 100 if campaign_stats.total_recipients > 0 else 0.0
         
-        # Group by account
-        account_stats = defaultdict(lambda: {"sent": 0, "failed": 0, "skipped": 0})
-        for log in send_logs:
-            account_stats[log.account_id][log.status] += 1
-        
-        # Group by hour for timeline analysis
-        hourly_stats = defaultdict(lambda: {"sent": 0, "failed": 0, "skipped": 0})
-        for log in send_logs:
-            if log.completed_at:
-                hour = log.completed_at.hour
-                hourly_stats[hour][log.status] += 1
+        # Group by account, and by hour of day for timeline analysis
+        account_stats = rollups.breakdown("account", campaign_id=campaign.id)
+        hourly_stats = rollups.breakdown("hour", campaign_id=campaign.id)
         
         return {
             "campaign": {
@@ -168,31 +180,22 @@ class CampaignAnalytics:
             "timing": {
                 "start_time": campaign_stats.start_time,
                 "end_time": campaign_stats.end_time,
-                "hourly_breakdown": dict(hourly_stats)
+                "hourly_breakdown": hourly_stats
             },
-            "accounts": dict(account_stats),
+            "accounts": account_stats,
             "logs": log_analytics,
             "generated_at": datetime.utcnow()
         }
     
-    def generate_account_report(self, account: Account, send_logs: List[SendLog]) -> Dict[str, Any]:
+    def generate_account_report(self, account: Account) -> Dict[str, Any]:
         """Generate account performance report."""
         account_stats = self.analytics_collector.collect_account_analytics(account)
-        log_analytics = self.analytics_collector.collect_send_log_analytics(send_logs)
-        
-        # Calculate daily performance
-        daily_stats = defaultdict(lambda: {"sent": 0, "failed": 0, "skipped": 0})
-        for log in send_logs:
-            if log.completed_at:
-                day = log.completed_at.date()
-                daily_stats[day][log.status] += 1
+        log_analytics = self.analytics_collector.collect_rollup_analytics(account_id=account.id)
+        rollups = get_send_log_rollups()
         
-        # Calculate hourly performance
-        hourly_stats = defaultdict(lambda: {"sent": 0, "failed": 0, "skipped": 0})
-        for log in send_logs:
-            if log.completed_at:
-                hour = log.completed_at.hour
-                hourly_stats[hour][log.status] += 1
+        # Daily and hourly performance
+        daily_stats = rollups.breakdown("day", account_id=account.id)
+        hourly_stats = rollups.breakdown("hour", account_id=account.id)
         
         return {
             "account": {
@@ -206,8 +209,8 @@ class CampaignAnalytics:
                 "total_failed": account_stats.total_messages_failed,
                 "success_rate": account_stats.success_rate
             },
-            "daily_breakdown": {str(day): stats for day, stats in daily_stats.items()},
-            "hourly_breakdown": dict(hourly_stats),
+            "daily_breakdown": daily_stats,
+            "hourly_breakdown": hourly_stats,
             "logs": log_analytics,
             "generated_at": datetime.utcnow()
         }
@@ -248,3 +251,17 @@ class CampaignAnalytics:
         except Exception as e:
             self.logger.error(f"Failed to export analytics: {e}")
             return False
+    
+    def export_send_logs(self, filename: str, campaign_id: Optional[int] = None, account_id: Optional[int] = None) -> bool:
+        """Export the individual send logs behind a report; the format follows the file extension."""
+        try:
+            from ..services.data_export import get_data_export, send_log_source
+            from ..services.send_log_query import SendLogFilter
+            
+            filters = SendLogFilter(campaign_id=campaign_id, account_id=account_id)
+            get_data_export().export(send_log_source(filters), filename)
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Failed to export send logs: {e}")
+            return False
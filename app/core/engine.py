@@ -7,7 +7,8 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 
 from ..services import get_logger
-from ..models import Campaign, Account, Recipient, SendLog, SendStatus
+from ..services.send_errors import send_failure
+from ..models import Campaign, Account, Recipient, SendErrorCode, SendLog, SendStatus
 from .telethon_client import TelegramClientManager
 from .throttler import Throttler
 from .spintax import SpintaxProcessor
@@ -36,7 +37,7 @@ class MessageEngine:
             # Check if account is ready
             client = self.client_manager.get_client(account_id)
             if not client or not client.is_ready():
-                return {"success": False, "error": "Account not ready"}
+                return send_failure("Account not ready", code=SendErrorCode.CLIENT_NOT_READY)
             
             # Apply spintax if needed
             if "{" in message_text and "}" in message_text:
@@ -55,7 +56,7 @@ class MessageEngine:
             
         except Exception as e:
             self.logger.error(f"Error sending message: {e}")
-            return {"success": False, "error": str(e)}
+            return send_failure(str(e), e)
 
 
 class CampaignRunner:
@@ -19,7 +19,8 @@ from telethon.errors import (
 )
 
 from ..services.logger import get_logger
-from ..models import Account, AccountStatus
+from ..services.send_errors import send_failure
+from ..models import Account, AccountStatus, SendErrorCode
 
 
 class TelegramClientWrapper:
@@ -132,7 +133,7 @@ class TelegramClientWrapper:
     async def send_message(self, peer: str, text: str, media_path: Optional[str] = None) -> Dict[str, Any]:
         """Send a message."""
         if not self.client or not self._connected or not self._authorized:
-            return {"success": False, "error": "Client not ready"}
+            return send_failure("Client not ready", code=SendErrorCode.CLIENT_NOT_READY)
         
         try:
             # Get entity
@@ -177,17 +178,10 @@ class TelegramClientWrapper:
             
         except FloodWaitError as e:
             self.logger.warning(f"Rate limited for account {self.account.id}: {e.seconds} seconds")
-            return {
-                "success": False,
-                "error": "Rate limited",
-                "retry_after": e.seconds
-            }
+            return send_failure("Rate limited", e)
         except Exception as e:
             self.logger.error(f"Failed to send message from account {self.account.id}: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
+            return send_failure(str(e), e)
     
     async def get_me(self) -> Optional[Dict[str, Any]]:
         """Get current user info."""
@@ -277,7 +271,7 @@ class TelegramClientManager:
     async def send_message(self, account_id: int, peer: str, text: str, media_path: Optional[str] = None) -> Dict[str, Any]:
         """Send a message using an account."""
         if account_id not in self.clients:
-            return {"success": False, "error": "Account not found"}
+            return send_failure("Account not found", code=SendErrorCode.CLIENT_NOT_READY)
         
         return await self.clients[account_id].send_message(peer, text, media_path)
     
@@ -0,0 +1,98 @@
+"""
+Background exports started from a widget, with progress shown in its status label.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+
+from PyQt5.QtCore import QObject
+from PyQt5.QtWidgets import QFileDialog, QLabel, QMessageBox, QPushButton, QWidget
+
+from ..services import get_logger
+from ..services.data_export import EXPORT_FILE_FILTER, ExportResult, ExportSource, get_data_export
+
+
+class ExportRunner(QObject):
+    """Asks for a file, runs the export on the export service and reports back.
+
+    While an export runs, the widget's export button cancels it instead.
+    """
+
+    def __init__(self, widget: QWidget, title: str, file_prefix: str, status_label: QLabel, button: QPushButton):
+        super().__init__(widget)
+        self.widget = widget
+        self.title = title
+        self.file_prefix = file_prefix
+        self.status_label = status_label
+        self.button = button
+        self.logger = get_logger()
+        self.service = get_data_export()
+        self._path: Optional[str] = None
+        self._button_text = button.text()
+
+        self.service.export_progress.connect(self._on_progress)
+        self.service.export_completed.connect(self._on_completed)
+        self.service.export_failed.connect(self._on_failed)
+
+    def is_running(self) -> bool:
+        """Check whether this widget's export is still running."""
+        return self._path is not None
+
+    def run(self, make_source: Callable[[], ExportSource]) -> None:
+        """Start an export, or cancel the running one."""
+        if self.is_running():
+            self.service.cancel_export(self._path)
+            return
+
+        file_path, _ = QFileDialog.getSaveFileName(
+            self.widget,
+            self.title,
+            f"{self.file_prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            EXPORT_FILE_FILTER
+        )
+        if not file_path:
+            return
+
+        try:
+            # Filters are read from the widget now, on the GUI thread
+            source = make_source()
+        except Exception as e:
+            self.logger.error(f"Error preparing export: {e}")
+            QMessageBox.critical(self.widget, "Export Error", f"Failed to export: {e}")
+            return
+
+        self._path = str(Path(file_path))
+        self._button_text = self.button.text()
+        self.button.setText("Cancel Export")
+        self.status_label.setText("Exporting...")
+        self.service.start_export(source, Path(file_path))
+
+    def _on_progress(self, path: str, rows: int, total: int) -> None:
+        if path != self._path:
+            return
+        if total:
+            self.status_label.setText(f"Exporting... {rows:,}/{total:,} rows ({min(rows * 100 // total, 100)}%)")
+        else:
+            self.status_label.setText(f"Exporting... {rows:,} rows")
+
+    def _on_completed(self, result: ExportResult) -> None:
+        if str(result.path) != self._path:
+            return
+        self._finish()
+        self.status_label.setText(f"Exported {result.rows:,} rows")
+        QMessageBox.information(
+            self.widget, "Export Successful",
+            f"Successfully exported {result.rows:,} rows to:\n{result.path}"
+        )
+
+    def _on_failed(self, path: str, error: str) -> None:
+        if path != self._path:
+            return
+        self._finish()
+        self.status_label.setText(f"Export stopped: {error[:60]}")
+        QMessageBox.warning(self.widget, "Export Stopped", f"Export did not complete: {error}")
+
+    def _finish(self) -> None:
+        self._path = None
+        self.button.setText(self._button_text)
@@ -8,11 +8,15 @@ from PyQt5.QtWidgets import (
     QTabWidget, QLabel, QPushButton, QStatusBar, QMenuBar,
     QMessageBox, QApplication
 )
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QIcon
 
-from ..services import get_settings, get_logger
+from ..services import (
+    get_settings, get_logger, get_change_bus, get_data_access, get_backup_service,
+    get_log_retention, close_database
+)
 from ..services.translation import get_translation_manager, _
+from .refresh_scheduler import get_refresh_scheduler
 from .theme import ThemeManager
 from .widgets import AccountWidget, CampaignWidget, LogWidget, RecipientWidget, SettingsWidget
 from .widgets.about_widget import AboutWidget
@@ -37,13 +41,20 @@ class MainWindow(QMainWindow):
         self.setup_menu()
         self.setup_status_bar()
         
-        # Setup timer for periodic updates
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_status)
-        self.update_timer.start(30000)  # Update every 30 seconds
+        # Recount only when the counted tables change, off the GUI thread
+        get_refresh_scheduler().register(
+            self, self.status_label.setText, prepare=lambda: self.get_application_status
+        )
+        get_change_bus().entities_changed.connect(self.on_data_changed)
+        
+        # Periodic online database snapshots
+        get_backup_service().start_schedule()
+        
+        # Daily archival of old send logs
+        get_log_retention().start_schedule()
         
         # Initial status update
-        self.update_status()
+        get_refresh_scheduler().request(self)
         
         self.logger.info("Main window initialized")
     
@@ -202,15 +213,10 @@ class MainWindow(QMainWindow):
         }
         return theme_formats.get(theme, theme.title())
     
-    def update_status(self):
-        """Update status bar with current application status."""
-        try:
-            # Get current status information
-            status_info = self.get_application_status()
-            self.status_label.setText(status_info)
-        except Exception as e:
-            self.logger.error(f"Error updating status: {e}")
-            self.status_label.setText(_("common.error"))
+    def on_data_changed(self, changes):
+        """Update the status bar when accounts, campaigns or recipients change."""
+        if changes.touches("accounts", "campaigns", "recipients"):
+            get_refresh_scheduler().request(self)
     
     def get_application_status(self):
         """Get current application status information."""
@@ -291,7 +297,7 @@ class MainWindow(QMainWindow):
         self.theme_label.setText(f"{_('app.theme')}: {formatted_theme}")
         
         # Update status bar
-        self.update_status()
+        get_refresh_scheduler().request(self)
         
         # Force refresh all widgets
         self.refresh_all_widgets()
@@ -320,4 +326,9 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         """Handle window close event."""
         self.logger.info("Application closing")
+        get_backup_service().stop_schedule()
+        get_log_retention().stop_schedule()
+        get_data_access().shutdown()
+        # Flushes counted sends, drains the write queues and truncates the WAL
+        close_database()
         event.accept()
@@ -0,0 +1,173 @@
+"""
+Central, visibility-aware refresh scheduling for GUI widgets.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from PyQt5.QtCore import QEvent, QObject, QTimer
+from PyQt5.QtWidgets import QWidget
+
+from ..services import get_logger
+from ..services.data_access import get_data_access
+
+
+@dataclass
+class RefreshTask:
+    """A widget refresh registered with the scheduler."""
+    owner: QWidget
+    apply: Callable[..., None]
+    prepare: Optional[Callable[[], Optional[Callable[[], Any]]]] = None
+    interval_ms: Optional[int] = None
+    next_due: Optional[float] = None
+    pending: bool = False
+    running: bool = False
+
+
+class RefreshScheduler(QObject):
+    """Runs widget refreshes from one timer, only while the widget can be seen.
+
+    Widgets register an ``apply`` callback, optionally with a ``prepare``
+    callback that returns a query job to run on the data access pool first (its
+    result is passed to ``apply``). Requests made while a widget is hidden or
+    the window is minimized are held until it is shown again, repeated
+    requests before the next tick collapse into one run, and a task never has
+    more than one job in flight.
+    """
+
+    def __init__(self, tick_ms: int = 100):
+        super().__init__()
+        self.logger = get_logger()
+        self.tick_ms = tick_ms
+        self._tasks: Dict[int, RefreshTask] = {}
+        self._watched_windows = set()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._tick)
+
+    def register(
+        self,
+        owner: QWidget,
+        apply: Callable[..., None],
+        prepare: Optional[Callable[[], Optional[Callable[[], Any]]]] = None,
+        interval_ms: Optional[int] = None
+    ) -> RefreshTask:
+        """Register a widget refresh, optionally repeating every ``interval_ms`` while visible."""
+        task = RefreshTask(owner, apply, prepare, interval_ms)
+        if interval_ms:
+            task.next_due = time.monotonic() + interval_ms / 1000
+        if id(owner) not in self._tasks:
+            owner.installEventFilter(self)
+            owner.destroyed.connect(lambda *_, key=id(owner): self._tasks.pop(key, None))
+        self._tasks[id(owner)] = task
+        self._reschedule()
+        return task
+
+    def unregister(self, owner: QWidget) -> None:
+        """Stop refreshing a widget."""
+        task = self._tasks.pop(id(owner), None)
+        if task is not None:
+            owner.removeEventFilter(self)
+
+    def request(self, owner: QWidget) -> None:
+        """Ask for a refresh of a widget on the next tick it is visible."""
+        task = self._tasks.get(id(owner))
+        if task is None:
+            return
+        task.pending = True
+        self._reschedule()
+
+    def is_active(self, owner: QWidget) -> bool:
+        """Check whether a widget is on screen (shown and its window not minimized)."""
+        window = owner.window()
+        if window not in self._watched_windows:
+            window.installEventFilter(self)
+            self._watched_windows.add(window)
+            window.destroyed.connect(lambda *_, w=window: self._watched_windows.discard(w))
+        return owner.isVisible() and not window.isMinimized()
+
+    def eventFilter(self, obj, event):
+        if event.type() in (QEvent.Show, QEvent.WindowStateChange):
+            # Run refreshes that were held back while hidden
+            self._reschedule()
+        return False
+
+    # Scheduling
+
+    def _reschedule(self) -> None:
+        now = time.monotonic()
+        delay = None
+        for task in self._tasks.values():
+            if task.running or not self.is_active(task.owner):
+                continue
+            if task.pending:
+                delay = self.tick_ms
+                break
+            if task.next_due is not None:
+                wait = max(self.tick_ms, int((task.next_due - now) * 1000))
+                delay = wait if delay is None else min(delay, wait)
+
+        if delay is None:
+            # Nothing visible to refresh; stay idle until a request or show event
+            self._timer.stop()
+        elif not self._timer.isActive() or self._timer.remainingTime() > delay:
+            self._timer.start(delay)
+
+    def _tick(self) -> None:
+        now = time.monotonic()
+        for task in list(self._tasks.values()):
+            if task.running or not self.is_active(task.owner):
+                continue
+            due = task.next_due is not None and task.next_due <= now
+            if task.pending or due:
+                self._run(task, now)
+        self._reschedule()
+
+    def _run(self, task: RefreshTask, now: float) -> None:
+        task.pending = False
+        if task.interval_ms:
+            task.next_due = now + task.interval_ms / 1000
+
+        try:
+            if task.prepare is None:
+                task.apply()
+                return
+            job = task.prepare()
+        except Exception as e:
+            self.logger.error(f"Error refreshing {type(task.owner).__name__}: {e}")
+            return
+
+        if job is not None:
+            task.running = True
+            get_data_access().submit(
+                job,
+                on_result=lambda result: self._on_job_finished(task, result, None),
+                on_error=lambda error: self._on_job_finished(task, None, error)
+            )
+
+    def _on_job_finished(self, task: RefreshTask, result: Any, error: Optional[Exception]) -> None:
+        task.running = False
+        if id(task.owner) not in self._tasks:
+            return
+        if error is not None:
+            self.logger.error(f"Error refreshing {type(task.owner).__name__}: {error}")
+        else:
+            try:
+                task.apply(result)
+            except Exception as e:
+                self.logger.error(f"Error applying refresh for {type(task.owner).__name__}: {e}")
+        self._reschedule()
+
+
+# Global refresh scheduler instance
+_refresh_scheduler: Optional[RefreshScheduler] = None
+
+
+def get_refresh_scheduler() -> RefreshScheduler:
+    """Get the global refresh scheduler instance."""
+    global _refresh_scheduler
+    if _refresh_scheduler is None:
+        _refresh_scheduler = RefreshScheduler()
+    return _refresh_scheduler
@@ -0,0 +1,404 @@
+"""
+Paged table models and delegates for large database-backed tables.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+from PyQt5.QtGui import QColor
+from PyQt5.QtWidgets import QStyledItemDelegate, QStyle
+from sqlalchemy import String, cast, func, or_
+from sqlmodel import select
+
+from ..services import get_logger
+from ..services.db import get_session
+from ..services.data_access import get_data_access
+
+
+# Custom role carrying the raw status key used by StatusColorDelegate
+STATUS_ROLE = Qt.UserRole + 1
+
+
+@dataclass
+class TableColumn:
+    """Column definition for a paged table model."""
+    header: str
+    value: Callable[[Any], str]
+    sort_key: Any = None
+    alignment: int = Qt.AlignLeft | Qt.AlignVCenter
+    status: Optional[Callable[[Any], Any]] = None
+
+
+class RowTableModel(QAbstractTableModel):
+    """Read-only table model rendering loaded row objects through column definitions.
+
+    Queries run on the data access pool; ``rows_loaded`` is emitted once a
+    reload or refresh has been applied.
+    """
+
+    rows_loaded = pyqtSignal()
+
+    def __init__(self, columns: List[TableColumn], page_size: int = 200, parent=None):
+        super().__init__(parent)
+        self.logger = get_logger()
+        self.columns = columns
+        self.page_size = page_size
+
+        self._rows: List[Any] = []
+        self._exhausted = False
+        self._query = None
+
+    # Qt model interface
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.columns)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.columns[section].header
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+
+        obj = self._rows[index.row()]
+        column = self.columns[index.column()]
+
+        if role == Qt.DisplayRole:
+            try:
+                return column.value(obj)
+            except Exception as e:
+                self.logger.debug(f"Error rendering column {column.header}: {e}")
+                return ""
+        if role == Qt.UserRole:
+            return obj.id
+        if role == Qt.TextAlignmentRole:
+            return column.alignment
+        if role == STATUS_ROLE and column.status:
+            return column.status(obj)
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and not self._exhausted and not self.is_loading()
+
+    # Public helpers
+
+    def set_headers(self, headers: List[str]) -> None:
+        """Replace column headers, e.g. after a language change."""
+        for column, header in zip(self.columns, headers):
+            column.header = header
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(self.columns) - 1)
+
+    def row_object(self, row: int) -> Optional[Any]:
+        """Get the loaded object for a row."""
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def row_id(self, row: int) -> Optional[int]:
+        """Get the database id for a row."""
+        obj = self.row_object(row)
+        return obj.id if obj is not None else None
+
+    def is_loading(self) -> bool:
+        """Check whether a query for this model is in flight."""
+        return self._query is not None
+
+    def cancel_loading(self) -> None:
+        """Cancel the in-flight query, if any."""
+        if self._query is not None:
+            self._query.cancel()
+            self._query = None
+
+    def _submit(self, job: Callable[[], Any], on_result: Callable[[Any], None]) -> None:
+        """Run a query in the background, replacing any query still in flight."""
+        self.cancel_loading()
+
+        def finished(result):
+            self._query = None
+            on_result(result)
+
+        def failed(error):
+            self._query = None
+            self.logger.error(f"Error loading rows: {error}")
+
+        self._query = get_data_access().submit(job, on_result=finished, on_error=failed)
+
+    def _append_rows(self, rows: List[Any]) -> None:
+        if len(rows) < self.page_size:
+            self._exhausted = True
+        if not rows:
+            return
+
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+
+class PagedTableModel(RowTableModel):
+    """Table model that fetches rows from the database one page at a time.
+
+    Sorting and search filtering are pushed down to SQL, so only the rows
+    the view actually scrolls to are ever loaded into memory.
+    """
+
+    def __init__(
+        self,
+        entity: Any,
+        columns: List[TableColumn],
+        base_filters: Optional[List[Any]] = None,
+        search_columns: Optional[List[Any]] = None,
+        page_size: int = 200,
+        parent=None
+    ):
+        super().__init__(columns, page_size, parent)
+        self.entity = entity
+        self.base_filters = base_filters or []
+        self.search_columns = search_columns or []
+
+        self._total = 0
+        self._search_text = ""
+        self._sort_column: Optional[int] = None
+        self._sort_order = Qt.AscendingOrder
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._exhausted or self.is_loading():
+            return
+        offset = len(self._rows)
+        self._submit(lambda: self._fetch_rows(offset, self.page_size), self._append_rows)
+
+    def sort(self, column: int, order=Qt.AscendingOrder):
+        if column < 0:
+            column = None
+        elif self.columns[column].sort_key is None:
+            return
+        self._sort_column = column
+        self._sort_order = order
+        self.reload()
+
+    # Public helpers
+
+    def reload(self) -> None:
+        """Discard loaded rows and fetch the first page again."""
+        self.cancel_loading()
+        self.beginResetModel()
+        self._rows = []
+        self._exhausted = False
+        self.endResetModel()
+        self._submit(lambda: (self._count_rows(), self._fetch_rows(0, self.page_size)), self._apply_first_page)
+
+    def refresh(self) -> None:
+        """Re-read the currently loaded window, keeping selection when rows are unchanged."""
+        self._submit(self.fetch_window, self.apply_fetched)
+
+    def fetch_window(self) -> Tuple[str, List[Any], int, int]:
+        """Query the loaded window and total count; safe to call off the GUI thread."""
+        window = max(self.page_size, len(self._rows))
+        return ("window", self._fetch_rows(0, window), self._count_rows(), window)
+
+    def fetch_changes(self, changes: Optional[Any]) -> Optional[Tuple]:
+        """Query what a data-change notification affects; safe to call off the GUI thread."""
+        if changes is None:
+            return None
+        if changes.has_membership_changes():
+            return self.fetch_window()
+
+        loaded_ids = {row.id for row in self._rows}
+        changed_ids = [row_id for row_id in changes.updated if row_id in loaded_ids]
+        if not changed_ids:
+            # An unloaded row may now match the filters of a fully loaded table
+            if changes.updated and self._exhausted:
+                return self.fetch_window()
+            return None
+
+        rows = self._fetch_rows_by_id(changed_ids)
+        if len(rows) != len(changed_ids):
+            # Some rows no longer match the filters
+            return self.fetch_window()
+        return ("rows", rows)
+
+    def apply_fetched(self, fetched: Optional[Tuple]) -> None:
+        """Apply the result of fetch_window or fetch_changes on the GUI thread."""
+        if fetched is None:
+            return
+
+        if fetched[0] == "rows":
+            positions = {row.id: position for position, row in enumerate(self._rows)}
+            for row in fetched[1]:
+                position = positions.get(row.id)
+                if position is not None:
+                    self._rows[position] = row
+                    self.dataChanged.emit(self.index(position, 0), self.index(position, len(self.columns) - 1))
+            return
+
+        _, rows, total, window = fetched
+        if [row.id for row in rows] != [row.id for row in self._rows]:
+            # A page still loading would be appended at the wrong offset
+            self.cancel_loading()
+            self.beginResetModel()
+            self._rows = rows
+            self._total = total
+            self._exhausted = len(rows) < window
+            self.endResetModel()
+        else:
+            self._rows = rows
+            self._total = total
+            if rows:
+                self.dataChanged.emit(
+                    self.index(0, 0),
+                    self.index(len(rows) - 1, len(self.columns) - 1)
+                )
+        self.rows_loaded.emit()
+
+    def _apply_first_page(self, result: Tuple[int, List[Any]]) -> None:
+        self._total, rows = result
+        self._append_rows(rows)
+        self.rows_loaded.emit()
+
+    def set_search_text(self, text: str) -> None:
+        """Filter rows by search text in SQL and reload."""
+        text = text.strip()
+        if text == self._search_text:
+            return
+        self._search_text = text
+        self.reload()
+
+    def total_count(self) -> int:
+        """Get the number of rows matching the current filters."""
+        return self._total
+
+    # Query building
+
+    def build_conditions(self) -> List[Any]:
+        """Get WHERE conditions for the current filter state."""
+        conditions = list(self.base_filters)
+        search_condition = self.build_search_condition(self._search_text)
+        if search_condition is not None:
+            conditions.append(search_condition)
+        return conditions
+
+    def build_search_condition(self, text: str) -> Optional[Any]:
+        """Build the SQL condition for a search string."""
+        if not text or not self.search_columns:
+            return None
+        pattern = f"%{text}%"
+        return or_(*[cast(column, String).ilike(pattern) for column in self.search_columns])
+
+    def build_order_by(self) -> List[Any]:
+        """Get ORDER BY clauses for the current sort state."""
+        if self._sort_column is None:
+            return [self.entity.id]
+        key = self.columns[self._sort_column].sort_key
+        if self._sort_order == Qt.DescendingOrder:
+            return [key.desc(), self.entity.id.desc()]
+        return [key.asc(), self.entity.id.asc()]
+
+    def _select_rows(self):
+        statement = select(self.entity)
+        for condition in self.build_conditions():
+            statement = statement.where(condition)
+        return statement
+
+    def _fetch_rows(self, offset: int, limit: int) -> List[Any]:
+        try:
+            with get_session() as session:
+                statement = self._select_rows().order_by(*self.build_order_by()).offset(offset).limit(limit)
+                return list(session.exec(statement).all())
+        except Exception as e:
+            self.logger.error(f"Error fetching {self.entity.__name__} rows: {e}")
+            return []
+
+    def _fetch_rows_by_id(self, ids: List[int]) -> List[Any]:
+        try:
+            with get_session() as session:
+                return list(session.exec(self._select_rows().where(self.entity.id.in_(ids))).all())
+        except Exception as e:
+            self.logger.error(f"Error fetching {self.entity.__name__} rows: {e}")
+            return []
+
+    def _count_rows(self) -> int:
+        try:
+            with get_session() as session:
+                statement = select(func.count(self.entity.id))
+                for condition in self.build_conditions():
+                    statement = statement.where(condition)
+                return session.exec(statement).one() or 0
+        except Exception as e:
+            self.logger.error(f"Error counting {self.entity.__name__} rows: {e}")
+            return 0
+
+
+class KeysetTableModel(RowTableModel):
+    """Table model that pages with a keyset cursor instead of OFFSET.
+
+    ``fetch_page(after, limit)`` returns the rows following the cursor of the
+    last loaded row, so deep pages cost the same as the first one.
+    """
+
+    def __init__(
+        self,
+        columns: List[TableColumn],
+        fetch_page: Callable[[Optional[Any], int], List[Any]],
+        cursor: Callable[[Any], Any],
+        page_size: int = 200,
+        parent=None
+    ):
+        super().__init__(columns, page_size, parent)
+        self.fetch_page = fetch_page
+        self.cursor = cursor
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._exhausted or self.is_loading():
+            return
+
+        after = self.cursor(self._rows[-1]) if self._rows else None
+        self._submit(lambda: self.fetch_page(after, self.page_size), self._append_rows)
+
+    def reload(self) -> None:
+        """Discard loaded rows and fetch the first page again."""
+        self.cancel_loading()
+        self.beginResetModel()
+        self._rows = []
+        self._exhausted = False
+        self.endResetModel()
+
+        def first_page(rows):
+            self._append_rows(rows)
+            self.rows_loaded.emit()
+
+        self._submit(lambda: self.fetch_page(None, self.page_size), first_page)
+
+    def loaded_count(self) -> int:
+        """Get the number of rows loaded so far."""
+        return len(self._rows)
+
+
+class StatusColorDelegate(QStyledItemDelegate):
+    """Delegate that paints status cells as coloured badges."""
+
+    def __init__(self, colors: Dict[Any, QColor], parent=None):
+        super().__init__(parent)
+        self.colors = colors
+
+    def paint(self, painter, option, index):
+        color = self.colors.get(index.data(STATUS_ROLE))
+        if color is None or option.state & QStyle.State_Selected:
+            super().paint(painter, option, index)
+            return
+
+        painter.save()
+        painter.fillRect(option.rect, color)
+        painter.setPen(QColor(Qt.white))
+        painter.drawText(option.rect, Qt.AlignCenter, index.data(Qt.DisplayRole) or "")
+        painter.restore()
@@ -5,7 +5,7 @@ Account management widgets.
 from typing import Optional, List, Dict, Any
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-    QLabel, QLineEdit, QPushButton, QTableWidget, QTableWidgetItem,
+    QLabel, QLineEdit, QPushButton, QTableView,
     QHeaderView, QGroupBox, QComboBox, QCheckBox, QSpinBox,
     QMessageBox, QDialog, QDialogButtonBox, QFormLayout,
     QTextEdit, QFileDialog, QProgressBar, QAbstractItemView
@@ -15,11 +15,23 @@ from PyQt5.QtGui import QFont, QIcon, QPalette, QColor
 
 from ...models import Account, AccountStatus, ProxyType
 from ...models.base import SoftDeleteMixin
-from ...services import get_logger, get_session
+from ...services import get_logger, get_session, get_change_bus, ChangeSet
 from ...services.translation import _, get_translation_manager
 from ...services.warmup_manager import get_warmup_manager
 from ...core import TelegramClientManager
 from ...services.db import get_session as db_get_session
+from ...services.data_access import get_data_access
+from ..table_models import PagedTableModel, TableColumn, StatusColorDelegate
+from ..refresh_scheduler import get_refresh_scheduler
+
+
+ACCOUNT_STATUS_COLORS = {
+    AccountStatus.ONLINE: QColor(34, 197, 94),  # Green
+    AccountStatus.ERROR: QColor(239, 68, 68),  # Red
+    AccountStatus.OFFLINE: QColor(107, 114, 128),  # Gray
+    AccountStatus.CONNECTING: QColor(245, 158, 11),  # Orange
+    AccountStatus.SUSPENDED: QColor(156, 163, 175),  # Light gray
+}
 
 
 class ProgressDialog(QDialog):
@@ -803,10 +815,10 @@ class AccountListWidget(QWidget):
         self.setup_ui()
         self.load_accounts()
         
-        # Setup refresh timer
-        self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self.refresh_accounts)
-        self.refresh_timer.start(30000)  # Refresh every 30 seconds
+        # Reload rows only when the accounts table changes, and only while visible
+        self._pending_changes = ChangeSet()
+        get_refresh_scheduler().register(self, self._apply_refresh, prepare=self._prepare_refresh)
+        get_change_bus().entities_changed.connect(self.on_data_changed)
     
     def setup_ui(self):
         """Set up the UI."""
@@ -868,12 +880,14 @@ class AccountListWidget(QWidget):
         layout.addLayout(search_layout)
         
         # Accounts table
-        self.accounts_table = QTableWidget()
-        self.accounts_table.setColumnCount(8)
-        self.accounts_table.setHorizontalHeaderLabels([
-            "Name", "Phone", "Status", "Messages Sent", "Success Rate", 
-            "Last Activity", "Warmup", "Actions"
-        ])
+        self.accounts_table = QTableView()
+        self.accounts_model = self._create_accounts_model()
+        self.accounts_model.rows_loaded.connect(self.on_rows_loaded)
+        self.accounts_table.setModel(self.accounts_model)
+        self.accounts_table.setItemDelegateForColumn(2, StatusColorDelegate(ACCOUNT_STATUS_COLORS, self.accounts_table))
+        self.accounts_table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.accounts_table.setSortingEnabled(True)
+        self.accounts_table.verticalHeader().setVisible(False)
         
         # Configure table
         header = self.accounts_table.horizontalHeader()
@@ -886,14 +900,14 @@ class AccountListWidget(QWidget):
         header.setSectionResizeMode(6, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(7, QHeaderView.ResizeToContents)
         
-        self.accounts_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.accounts_table.setSelectionMode(QTableWidget.SingleSelection)
+        self.accounts_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.accounts_table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.accounts_table.setAlternatingRowColors(True)
-        self.accounts_table.itemSelectionChanged.connect(self.on_selection_changed)
+        self.accounts_table.selectionModel().selectionChanged.connect(lambda *_: self.on_selection_changed())
         
         # Set custom styling for black and gray alternating rows
         self.accounts_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 alternate-background-color: #2d2d2d;
                 background-color: #1a1a1a;
                 gridline-color: #404040;
@@ -901,25 +915,25 @@ class AccountListWidget(QWidget):
                 selection-background-color: #0078d4;
                 selection-color: white;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 8px;
                 border: none;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #0078d4 !important;
                 color: white !important;
             }
-            QTableWidget::item:alternate {
+            QTableView::item:alternate {
                 background-color: #2d2d2d;
             }
-            QTableWidget::item:alternate:selected {
+            QTableView::item:alternate:selected {
                 background-color: #0078d4 !important;
                 color: white !important;
             }
         """)
         
         # Connect cell clicked signal for actions
-        self.accounts_table.cellClicked.connect(self.on_cell_clicked)
+        self.accounts_table.clicked.connect(lambda index: self.on_cell_clicked(index.row(), index.column()))
         
         layout.addWidget(self.accounts_table)
         
@@ -927,131 +941,81 @@ class AccountListWidget(QWidget):
         self.status_label = QLabel("Ready")
         layout.addWidget(self.status_label)
     
+    def _create_accounts_model(self) -> PagedTableModel:
+        """Create the paged model backing the accounts table."""
+        center = Qt.AlignCenter
+        columns = [
+            TableColumn("Name", lambda a: a.name, Account.name),
+            TableColumn("Phone", lambda a: a.phone_number, Account.phone_number),
+            TableColumn("Status", lambda a: a.status.value.title(), Account.status, center, lambda a: a.status),
+            TableColumn("Messages Sent", lambda a: str(a.total_messages_sent), Account.total_messages_sent, center),
+            TableColumn("Success Rate", lambda a: f"{a.get_success_rate():.1f}%", None, center),
+            TableColumn(
+                "Last Activity",
+                lambda a: a.last_activity.strftime("%Y-%m-%d %H:%M") if a.last_activity else "Never",
+                Account.last_activity, center
+            ),
+            TableColumn(
+                "Warmup",
+                lambda a: "Complete" if a.is_warmup_complete() else f"{a.warmup_messages_sent}/{a.warmup_target_messages}",
+                Account.warmup_messages_sent, center
+            ),
+            TableColumn("Actions", lambda a: "Connect | Test | Authorize", None, center),
+        ]
+        return PagedTableModel(
+            Account,
+            columns,
+            base_filters=[Account.is_deleted == False],
+            search_columns=[Account.name, Account.phone_number, Account.status, Account.notes],
+            parent=self
+        )
+    
+    def on_rows_loaded(self):
+        """Show the number of matching accounts once the model has loaded."""
+        self.status_label.setText(f"Loaded {self.accounts_model.total_count()} accounts")
+    
     def load_accounts(self):
         """Load accounts from database."""
         try:
-            session = db_get_session()
-            try:
-                from ...models import Account
-                from sqlmodel import select
-                accounts = session.exec(select(Account).where(Account.is_deleted == False)).all()
-            finally:
-                session.close()
-            
-            self.accounts_table.setRowCount(len(accounts))
-            
-            for row, account in enumerate(accounts):
-                # Name - Disabled text field
-                name_item = QTableWidgetItem(account.name)
-                name_item.setFlags(name_item.flags() & ~Qt.ItemIsEditable | Qt.ItemIsSelectable)
-                # Store account ID in the name item for selection handling
-                name_item.setData(Qt.UserRole, account.id)
-                self.accounts_table.setItem(row, 0, name_item)
-                
-                # Phone - Disabled text field
-                phone_item = QTableWidgetItem(account.phone_number)
-                phone_item.setFlags(phone_item.flags() & ~Qt.ItemIsEditable | Qt.ItemIsSelectable)
-                self.accounts_table.setItem(row, 1, phone_item)
-                
-                # Status - Enhanced button-like appearance
-                status_item = QTableWidgetItem(account.status.value.title())
-                status_item.setFlags(status_item.flags() & ~Qt.ItemIsEditable | Qt.ItemIsSelectable)
-                
-                # Set status-specific styling with button-like appearance
-                if account.status == AccountStatus.ONLINE:
-                    status_item.setBackground(QColor(34, 197, 94))  # Green
-                    status_item.setForeground(Qt.white)
-                elif account.status == AccountStatus.ERROR:
-                    status_item.setBackground(QColor(239, 68, 68))  # Red
-                    status_item.setForeground(Qt.white)
-                elif account.status == AccountStatus.OFFLINE:
-                    status_item.setBackground(QColor(107, 114, 128))  # Gray
-                    status_item.setForeground(Qt.white)
-                elif account.status == AccountStatus.CONNECTING:
-                    status_item.setBackground(QColor(245, 158, 11))  # Orange
-                    status_item.setForeground(Qt.white)
-                elif account.status == AccountStatus.SUSPENDED:
-                    status_item.setBackground(QColor(156, 163, 175))  # Light gray
-                    status_item.setForeground(Qt.white)
-                
-                # Center align status text
-                status_item.setTextAlignment(Qt.AlignCenter)
-                self.accounts_table.setItem(row, 2, status_item)
-                
-                # Messages sent - Disabled text field
-                messages_item = QTableWidgetItem(str(account.total_messages_sent))
-                messages_item.setFlags(messages_item.flags() & ~Qt.ItemIsEditable | Qt.ItemIsSelectable)
-                messages_item.setTextAlignment(Qt.AlignCenter)
-                self.accounts_table.setItem(row, 3, messages_item)
-                
-                # Success rate - Disabled text field
-                success_rate = account.get_success_rate()
-                success_item = QTableWidgetItem(f"{success_rate:.1f}%")
-                success_item.setFlags(success_item.flags() & ~Qt.ItemIsEditable | Qt.ItemIsSelectable)
-                success_item.setTextAlignment(Qt.AlignCenter)
-                self.accounts_table.setItem(row, 4, success_item)
-                
-                # Last activity - Disabled text field
-                last_activity = account.last_activity.strftime("%Y-%m-%d %H:%M") if account.last_activity else "Never"
-                activity_item = QTableWidgetItem(last_activity)
-                activity_item.setFlags(activity_item.flags() & ~Qt.ItemIsEditable | Qt.ItemIsSelectable)
-                activity_item.setTextAlignment(Qt.AlignCenter)
-                self.accounts_table.setItem(row, 5, activity_item)
-                
-                # Warmup status - Disabled text field
-                warmup_status = "Complete" if account.is_warmup_complete() else f"{account.warmup_messages_sent}/{account.warmup_target_messages}"
-                warmup_item = QTableWidgetItem(warmup_status)
-                warmup_item.setFlags(warmup_item.flags() & ~Qt.ItemIsEditable | Qt.ItemIsSelectable)
-                warmup_item.setTextAlignment(Qt.AlignCenter)
-                self.accounts_table.setItem(row, 6, warmup_item)
-                
-                # Actions - Create action buttons
-                actions_item = QTableWidgetItem("Connect | Test | Authorize")
-                actions_item.setFlags(actions_item.flags() & ~Qt.ItemIsEditable | Qt.ItemIsSelectable)
-                actions_item.setTextAlignment(Qt.AlignCenter)
-                actions_item.setData(Qt.UserRole, account.id)  # Store account ID for actions
-                self.accounts_table.setItem(row, 7, actions_item)
-            
-            self.status_label.setText(f"Loaded {len(accounts)} accounts")
-            
-            # Apply search filter if there's search text
-            self.filter_accounts()
-            
+            self.accounts_model.reload()
         except Exception as e:
             self.logger.error(f"Error loading accounts: {e}")
             self.status_label.setText(f"Error loading accounts: {e}")
     
     def refresh_accounts(self):
         """Refresh accounts data."""
-        self.load_accounts()
+        try:
+            self.accounts_model.refresh()
+        except Exception as e:
+            self.logger.error(f"Error refreshing accounts: {e}")
+    
+    def on_data_changed(self, changes):
+        """Queue committed accounts changes for the next visible refresh."""
+        if not changes.touches("accounts"):
+            return
+        self._pending_changes.merge(ChangeSet(accounts=changes["accounts"]))
+        get_refresh_scheduler().request(self)
+    
+    def _prepare_refresh(self):
+        """Take the queued changes and return the query job for the worker pool."""
+        changes, self._pending_changes = self._pending_changes, ChangeSet()
+        table_changes = changes.get("accounts")
+        if table_changes is None:
+            return None
+        return lambda: self.accounts_model.fetch_changes(table_changes)
+    
+    def _apply_refresh(self, fetched):
+        """Apply re-read rows on the GUI thread."""
+        self.accounts_model.apply_fetched(fetched)
     
     def filter_accounts(self):
         """Filter accounts based on search text."""
-        search_text = self.search_edit.text().lower().strip()
-        
-        if not search_text:
-            # Show all accounts
-            for row in range(self.accounts_table.rowCount()):
-                self.accounts_table.setRowHidden(row, False)
-            return
-        
-        # Filter accounts (exclude Actions column - column 7)
-        for row in range(self.accounts_table.rowCount()):
-            should_show = False
-            
-            # Check all columns except Actions column for search text
-            for col in range(self.accounts_table.columnCount() - 1):  # Exclude last column (Actions)
-                item = self.accounts_table.item(row, col)
-                if item and search_text in item.text().lower():
-                    should_show = True
-                    break
-            
-            self.accounts_table.setRowHidden(row, not should_show)
+        self.accounts_model.set_search_text(self.search_edit.text().lower())
     
     def on_cell_clicked(self, row, column):
         """Handle cell click events."""
         if column == 7:  # Actions column
-            account_id = self.accounts_table.item(row, 0).data(Qt.UserRole)
+            account_id = self.accounts_model.row_id(row)
             if account_id is not None:
                 self.show_action_menu(row, column, account_id)
         else:
@@ -1065,7 +1029,7 @@ class AccountListWidget(QWidget):
         from PyQt5.QtWidgets import QMenu
         
         # Get account name for display
-        account_name = self.accounts_table.item(row, 0).text()
+        account_name = self.accounts_model.row_object(row).name
         
         # Create context menu
         menu = QMenu(self)
@@ -1084,7 +1048,7 @@ class AccountListWidget(QWidget):
         
         # Show menu at cursor position
         menu.exec_(self.accounts_table.mapToGlobal(
-            self.accounts_table.visualItemRect(self.accounts_table.item(row, column)).bottomLeft()
+            self.accounts_table.visualRect(self.accounts_model.index(row, column)).bottomLeft()
         ))
     
     def connect_account(self, account_id, account_name):
@@ -1101,83 +1065,101 @@ class AccountListWidget(QWidget):
     
     def _start_telegram_operation(self, operation, account_id, account_name):
         """Start a Telegram operation in a worker thread."""
-        try:
-            # Get account details from database
-            session = db_get_session()
-            try:
-                from ...models import Account
-                from sqlmodel import select
-                account = session.exec(select(Account).where(Account.id == account_id)).first()
-                if not account:
-                    QMessageBox.warning(self, "Error", "Account not found!")
-                    return
-                
-                # Get API credentials from settings
-                from ...services import get_settings
-                settings = get_settings()
-                
-                if not settings.telegram_api_id or not settings.telegram_api_hash:
-                    QMessageBox.warning(
-                        self, 
-                        "API Credentials Required", 
-                        "Please configure your Telegram API ID and API Hash in Settings first."
-                    )
-                    return
-                
-                # Create progress dialog
-                progress_dialog = ProgressDialog(
-                    self, 
-                    f"{operation.title()} Account",
-                    f"{operation.title()}ing {account_name}..."
-                )
-                
-                # Create worker thread
-                self.worker = TelegramWorker(
-                    operation=operation,
-                    account_id=account_id,
-                    account_name=account_name,
-                    api_id=settings.telegram_api_id,
-                    api_hash=settings.telegram_api_hash,
-                    phone_number=account.phone_number,
-                    session_path=account.session_path,
-                    proxy_config=None  # TODO: Add proxy support
-                )
-                
-                # Connect signals
-                self.worker.finished.connect(
-                    lambda msg, success: self._on_operation_finished(progress_dialog, msg, success, account_id, account_name)
-                )
-                self.worker.progress.connect(
-                    lambda msg: progress_dialog.update_status(f"{operation.title()}ing {account_name}...\n{msg}")
-                )
-                
-                # Connect code required signal for authorization
-                if operation == "authorize":
-                    self.worker.code_required.connect(
-                        lambda phone: self._handle_code_required(progress_dialog, account_id, account_name, phone)
-                    )
-                
-                # Show progress dialog
-                progress_dialog.show()
-                
-                # Connect cancel button to stop worker
-                progress_dialog.cancel_button.clicked.connect(self.worker.stop)
-                
-                # Start worker
-                self.worker.start()
-                
-                # Set up timeout timer (30 seconds)
-                timeout_timer = QTimer()
-                timeout_timer.setSingleShot(True)
-                timeout_timer.timeout.connect(lambda: self._handle_timeout(progress_dialog, operation, account_name))
-                timeout_timer.start(30000)  # 30 seconds timeout
-                
-            finally:
-                session.close()
-                
-        except Exception as e:
+        # Get account details off the GUI thread
+        self._with_account(
+            account_id,
+            lambda account: self._run_telegram_operation(operation, account_id, account_name, account),
+            operation
+        )
+    
+    def _load_account(self, account_id):
+        """Load an account by ID; runs on the data access pool."""
+        with db_get_session() as session:
+            return session.get(Account, account_id)
+    
+    def _with_account(self, account_id, on_loaded, operation):
+        """Load an account off the GUI thread, then pass it to ``on_loaded``."""
+        def show_error(e):
             self.logger.error(f"Error starting {operation} operation: {e}")
             QMessageBox.critical(self, "Error", f"Failed to start {operation}: {e}")
+        
+        def start(account):
+            if not account:
+                QMessageBox.warning(self, "Error", "Account not found!")
+                return
+            try:
+                on_loaded(account)
+            except Exception as e:
+                show_error(e)
+        
+        get_data_access().submit(
+            lambda: self._load_account(account_id),
+            on_result=start,
+            on_error=show_error,
+            key=("account", account_id)
+        )
+    
+    def _run_telegram_operation(self, operation, account_id, account_name, account):
+        """Start a Telegram operation for a loaded account."""
+        # Get API credentials from settings
+        from ...services import get_settings
+        settings = get_settings()
+        
+        if not settings.telegram_api_id or not settings.telegram_api_hash:
+            QMessageBox.warning(
+                self, 
+                "API Credentials Required", 
+                "Please configure your Telegram API ID and API Hash in Settings first."
+            )
+            return
+        
+        # Create progress dialog
+        progress_dialog = ProgressDialog(
+            self, 
+            f"{operation.title()} Account",
+            f"{operation.title()}ing {account_name}..."
+        )
+        
+        # Create worker thread
+        self.worker = TelegramWorker(
+            operation=operation,
+            account_id=account_id,
+            account_name=account_name,
+            api_id=settings.telegram_api_id,
+            api_hash=settings.telegram_api_hash,
+            phone_number=account.phone_number,
+            session_path=account.session_path,
+            proxy_config=None  # TODO: Add proxy support
+        )
+        
+        # Connect signals
+        self.worker.finished.connect(
+            lambda msg, success: self._on_operation_finished(progress_dialog, msg, success, account_id, account_name)
+        )
+        self.worker.progress.connect(
+            lambda msg: progress_dialog.update_status(f"{operation.title()}ing {account_name}...\n{msg}")
+        )
+        
+        # Connect code required signal for authorization
+        if operation == "authorize":
+            self.worker.code_required.connect(
+                lambda phone: self._handle_code_required(progress_dialog, account_id, account_name, phone)
+            )
+        
+        # Show progress dialog
+        progress_dialog.show()
+        
+        # Connect cancel button to stop worker
+        progress_dialog.cancel_button.clicked.connect(self.worker.stop)
+        
+        # Start worker
+        self.worker.start()
+        
+        # Set up timeout timer (30 seconds)
+        timeout_timer = QTimer()
+        timeout_timer.setSingleShot(True)
+        timeout_timer.timeout.connect(lambda: self._handle_timeout(progress_dialog, operation, account_name))
+        timeout_timer.start(30000)  # 30 seconds timeout
     
     def _handle_timeout(self, progress_dialog, operation, account_name):
         """Handle operation timeout."""
@@ -1213,88 +1195,80 @@ class AccountListWidget(QWidget):
     
     def _start_telegram_operation_with_code(self, operation, account_id, account_name, verification_code, password=None, phone_code_hash=None):
         """Start a Telegram operation with verification code."""
-        try:
-            # Get account details from database
-            session = db_get_session()
-            try:
-                from ...models import Account
-                from sqlmodel import select
-                account = session.exec(select(Account).where(Account.id == account_id)).first()
-                if not account:
-                    QMessageBox.warning(self, "Error", "Account not found!")
-                    return
-                
-                # Get API credentials from settings
-                from ...services import get_settings
-                settings = get_settings()
-                
-                # Create progress dialog
-                progress_dialog = ProgressDialog(
-                    self, 
-                    f"{operation.title()} Account",
-                    f"Verifying code for {account_name}..."
-                )
-                
-                # Create worker thread with code
-                self.worker = TelegramWorker(
-                    operation=operation,
-                    account_id=account_id,
-                    account_name=account_name,
-                    api_id=settings.telegram_api_id,
-                    api_hash=settings.telegram_api_hash,
-                    phone_number=account.phone_number,
-                    session_path=account.session_path,
-                    proxy_config=None,
-                    verification_code=verification_code,
-                    password=password,
-                    phone_code_hash=phone_code_hash
-                )
-                
-                # Connect signals
-                self.worker.finished.connect(
-                    lambda msg, success: self._on_operation_finished(progress_dialog, msg, success, account_id, account_name)
-                )
-                self.worker.progress.connect(
-                    lambda msg: progress_dialog.update_status(f"Verifying code for {account_name}...\n{msg}")
-                )
-                
-                # Show progress dialog
-                progress_dialog.show()
-                
-                # Connect cancel button to stop worker
-                progress_dialog.cancel_button.clicked.connect(self.worker.stop)
-                
-                # Start worker
-                self.worker.start()
-                
-                # Set up timeout timer (30 seconds)
-                timeout_timer = QTimer()
-                timeout_timer.setSingleShot(True)
-                timeout_timer.timeout.connect(lambda: self._handle_timeout(progress_dialog, operation, account_name))
-                timeout_timer.start(30000)  # 30 seconds timeout
-                
-            finally:
-                session.close()
-                
-        except Exception as e:
-            self.logger.error(f"Error starting {operation} operation with code: {e}")
-            QMessageBox.critical(self, "Error", f"Failed to start {operation}: {e}")
+        # Get account details off the GUI thread
+        self._with_account(
+            account_id,
+            lambda account: self._run_telegram_operation_with_code(
+                operation, account_id, account_name, account, verification_code, password, phone_code_hash
+            ),
+            operation
+        )
+    
+    def _run_telegram_operation_with_code(self, operation, account_id, account_name, account, verification_code, password, phone_code_hash):
+        """Start a Telegram operation with verification code for a loaded account."""
+        # Get API credentials from settings
+        from ...services import get_settings
+        settings = get_settings()
+        
+        # Create progress dialog
+        progress_dialog = ProgressDialog(
+            self, 
+            f"{operation.title()} Account",
+            f"Verifying code for {account_name}..."
+        )
+        
+        # Create worker thread with code
+        self.worker = TelegramWorker(
+            operation=operation,
+            account_id=account_id,
+            account_name=account_name,
+            api_id=settings.telegram_api_id,
+            api_hash=settings.telegram_api_hash,
+            phone_number=account.phone_number,
+            session_path=account.session_path,
+            proxy_config=None,
+            verification_code=verification_code,
+            password=password,
+            phone_code_hash=phone_code_hash
+        )
+        
+        # Connect signals
+        self.worker.finished.connect(
+            lambda msg, success: self._on_operation_finished(progress_dialog, msg, success, account_id, account_name)
+        )
+        self.worker.progress.connect(
+            lambda msg: progress_dialog.update_status(f"Verifying code for {account_name}...\n{msg}")
+        )
+        
+        # Show progress dialog
+        progress_dialog.show()
+        
+        # Connect cancel button to stop worker
+        progress_dialog.cancel_button.clicked.connect(self.worker.stop)
+        
+        # Start worker
+        self.worker.start()
+        
+        # Set up timeout timer (30 seconds)
+        timeout_timer = QTimer()
+        timeout_timer.setSingleShot(True)
+        timeout_timer.timeout.connect(lambda: self._handle_timeout(progress_dialog, operation, account_name))
+        timeout_timer.start(30000)  # 30 seconds timeout
     
     def _update_account_status(self, account_id, status):
-        """Update account status in database."""
-        try:
-            session = db_get_session()
-            try:
-                from ...models import Account
-                from sqlmodel import select
-                account = session.exec(select(Account).where(Account.id == account_id)).first()
-                if account:
-                    account.status = status
-                    session.commit()
-            finally:
-                session.close()
-        except Exception as e:
-            self.logger.error(f"Error updating account status: {e}")
+        """Update account status in database off the GUI thread."""
+        get_data_access().submit(
+            lambda: self._store_account_status(account_id, status),
+            on_error=lambda e: self.logger.error(f"Error updating account status: {e}")
+        )
+    
+    def _store_account_status(self, account_id, status):
+        """Write an account's status; runs on the data access pool."""
+        with db_get_session() as session:
+            account = session.get(Account, account_id)
+            if account:
+                account.status = status
+                session.commit()
     
     def _on_operation_finished(self, progress_dialog, message, success, account_id=None, account_name=None):
         """Handle operation completion."""
@@ -1338,18 +1312,13 @@ class AccountListWidget(QWidget):
         if has_selection:
             row = selected_rows[0].row()
             self.logger.debug(f"Selected row: {row}")
-            # Try to get account ID from the first column (Name column)
-            name_item = self.accounts_table.item(row, 0)
-            if name_item:
-                account_id = name_item.data(Qt.UserRole)
-                self.logger.debug(f"Account ID for row {row}: {account_id}")
-                if account_id is not None:
-                    # Emit signal with account ID for further processing
-                    self.account_selected.emit(account_id)
-                else:
-                    self.logger.warning(f"No account ID found for row {row}")
+            account_id = self.accounts_model.row_id(row)
+            self.logger.debug(f"Account ID for row {row}: {account_id}")
+            if account_id is not None:
+                # Emit signal with account ID for further processing
+                self.account_selected.emit(account_id)
             else:
-                self.logger.warning(f"No name item found for row {row}")
+                self.logger.warning(f"No account ID found for row {row}")
     
     def add_account(self):
         """Add new account."""
@@ -1364,17 +1333,18 @@ class AccountListWidget(QWidget):
             return
         
         row = selected_rows[0].row()
-        account_id = self.accounts_table.item(row, 0).data(Qt.UserRole)
-        
-        # Load account from database
-        session = db_get_session()
-        try:
-            from ...models import Account
-            from sqlmodel import select
-            account = session.exec(select(Account).where(Account.id == account_id)).first()
-        finally:
-            session.close()
-        
+        account_id = self.accounts_model.row_id(row)
+        
+        # Load account off the GUI thread, then open the dialog
+        get_data_access().submit(
+            lambda: self._load_account(account_id),
+            on_result=self._open_account_dialog,
+            on_error=lambda e: self.logger.error(f"Error loading account: {e}"),
+            key=("account", account_id)
+        )
+    
+    def _open_account_dialog(self, account):
+        """Open the edit dialog for a loaded account."""
         if account:
             dialog = AccountDialog(self, account)
             if dialog.exec_() == QDialog.Accepted:
@@ -1387,8 +1357,8 @@ class AccountListWidget(QWidget):
             return
         
         row = selected_rows[0].row()
-        account_name = self.accounts_table.item(row, 0).text()
-        account_id = self.accounts_table.item(row, 0).data(Qt.UserRole)
+        account_name = self.accounts_model.row_object(row).name
+        account_id = self.accounts_model.row_id(row)
         
         reply = QMessageBox.question(
             self, 
@@ -1398,24 +1368,30 @@ class AccountListWidget(QWidget):
         )
         
         if reply == QMessageBox.Yes:
-            try:
-                session = db_get_session()
-                try:
-                    from ...models import Account
-                    from sqlmodel import select
-                    account = session.exec(select(Account).where(Account.id == account_id)).first()
-                    if account:
-                        account.soft_delete()
-                        session.commit()
-                finally:
-                    session.close()
-                
-                self.logger.info(f"Account deleted: {account_name}")
-                self.load_accounts()
-                
-            except Exception as e:
-                self.logger.error(f"Error deleting account: {e}")
-                QMessageBox.critical(self, "Error", f"Failed to delete account: {e}")
+            get_data_access().submit(
+                lambda: self._delete_account(account_id),
+                on_result=lambda _deleted: self._on_account_deleted(account_name),
+                on_error=self._on_delete_error
+            )
+    
+    def _delete_account(self, account_id):
+        """Soft-delete an account; runs on the data access pool."""
+        with db_get_session() as session:
+            account = session.get(Account, account_id)
+            if account:
+                account.soft_delete()
+                session.commit()
+            return account is not None
+    
+    def _on_account_deleted(self, account_name):
+        """Reload accounts after a delete."""
+        self.logger.info(f"Account deleted: {account_name}")
+        self.load_accounts()
+    
+    def _on_delete_error(self, error):
+        """Report a failed account delete."""
+        self.logger.error(f"Error deleting account: {error}")
+        QMessageBox.critical(self, "Error", f"Failed to delete account: {error}")
     
     def on_language_changed(self, language: str):
         """Handle language change."""
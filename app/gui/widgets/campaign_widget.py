@@ -5,7 +5,7 @@ Campaign management widgets.
 from typing import Optional, List, Dict, Any
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-    QLabel, QLineEdit, QPushButton, QTableWidget, QTableWidgetItem,
+    QLabel, QLineEdit, QPushButton, QTableView, QAbstractItemView,
     QHeaderView, QGroupBox, QComboBox, QCheckBox, QSpinBox,
     QMessageBox, QDialog, QDialogButtonBox, QFormLayout,
     QTextEdit, QDateTimeEdit, QProgressBar, QTabWidget, QFileDialog
@@ -14,10 +14,23 @@ from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QDateTime
 from PyQt5.QtGui import QFont, QIcon, QColor
 
 from ...models import Campaign, CampaignStatus, CampaignType, MessageType
-from ...services import get_logger, get_campaign_manager
+from ...services import get_logger, get_campaign_manager, get_change_bus, ChangeSet
 from ...services.db import get_session
+from ...services.data_access import get_data_access
+from ...services.recipient_segments import RecipientSegment
 from ...services.translation import _, get_translation_manager
 from ...core import SpintaxProcessor
+from ..table_models import PagedTableModel, TableColumn, StatusColorDelegate
+from ..refresh_scheduler import get_refresh_scheduler
+
+
+CAMPAIGN_STATUS_COLORS = {
+    CampaignStatus.RUNNING: QColor(34, 197, 94),  # Green
+    CampaignStatus.PAUSED: QColor(245, 158, 11),  # Orange
+    CampaignStatus.COMPLETED: QColor(59, 130, 246),  # Blue
+    CampaignStatus.ERROR: QColor(239, 68, 68),  # Red
+    CampaignStatus.DRAFT: QColor(107, 114, 128),  # Gray
+}
 
 
 class CampaignDialog(QDialog):
@@ -312,7 +325,6 @@ class CampaignDialog(QDialog):
         self.help_button.show()
         
         # Use a timer to position the button after the dialog is fully rendered
-        from PyQt5.QtCore import QTimer
         QTimer.singleShot(100, self.position_help_button)
     
     def resizeEvent(self, event):
@@ -563,6 +575,14 @@ class CampaignDialog(QDialog):
                 QMessageBox.warning(self, _("common.error"), _("campaigns.message_required"))
                 return
             
+            # Filters are compiled to SQL when the campaign runs; reject ones that can't be
+            if self.campaign:
+                try:
+                    RecipientSegment.validate_filters(self.campaign.recipient_filters)
+                except ValueError as e:
+                    QMessageBox.warning(self, _("common.error"), f"Invalid recipient filters: {e}")
+                    return
+            
             # Create or update campaign
             if self.campaign:
                 # Update existing campaign
@@ -673,6 +693,7 @@ class CampaignListWidget(QWidget):
         self.logger = get_logger()
         self.campaign_manager = get_campaign_manager()
         self.translation_manager = get_translation_manager()
+        self._button_state_query = None
         
         # Connect language change signal
         self.translation_manager.language_changed.connect(self.on_language_changed)
@@ -688,10 +709,10 @@ class CampaignListWidget(QWidget):
         self.campaign_manager.campaign_progress_updated.connect(self.on_campaign_progress_updated)
         self.campaign_manager.campaign_error.connect(self.on_campaign_error)
         
-        # Setup refresh timer
-        self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self.refresh_campaigns)
-        self.refresh_timer.start(5000)  # Refresh every 5 seconds
+        # Reload rows only when the campaigns table changes, and only while visible
+        self._pending_changes = ChangeSet()
+        get_refresh_scheduler().register(self, self._apply_refresh, prepare=self._prepare_refresh)
+        get_change_bus().entities_changed.connect(self.on_data_changed)
     
     def setup_ui(self):
         """Set up the UI."""
@@ -780,12 +801,14 @@ class CampaignListWidget(QWidget):
         layout.addLayout(search_layout)
         
         # Campaigns table
-        self.campaigns_table = QTableWidget()
-        self.campaigns_table.setColumnCount(9)
-        self.campaigns_table.setHorizontalHeaderLabels([
-            _("common.name"), _("common.status"), _("campaigns.recipients"), _("common.sent"), _("common.failed"), _("common.progress"), 
-            _("campaigns.start_time"), _("campaigns.last_activity"), _("common.actions")
-        ])
+        self.campaigns_table = QTableView()
+        self.campaigns_model = self._create_campaigns_model()
+        self.campaigns_model.rows_loaded.connect(self.on_rows_loaded)
+        self.campaigns_table.setModel(self.campaigns_model)
+        self.campaigns_table.setItemDelegateForColumn(1, StatusColorDelegate(CAMPAIGN_STATUS_COLORS, self.campaigns_table))
+        self.campaigns_table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.campaigns_table.setSortingEnabled(True)
+        self.campaigns_table.verticalHeader().setVisible(False)
         
         # Configure table
         header = self.campaigns_table.horizontalHeader()
@@ -799,14 +822,14 @@ class CampaignListWidget(QWidget):
         header.setSectionResizeMode(7, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(8, QHeaderView.ResizeToContents)
         
-        self.campaigns_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.campaigns_table.setSelectionMode(QTableWidget.SingleSelection)
+        self.campaigns_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.campaigns_table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.campaigns_table.setAlternatingRowColors(True)
-        self.campaigns_table.itemSelectionChanged.connect(self.on_selection_changed)
+        self.campaigns_table.selectionModel().selectionChanged.connect(lambda *_: self.on_selection_changed())
         
         # Set custom styling for black and gray alternating rows
         self.campaigns_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 alternate-background-color: #2d2d2d;
                 background-color: #1a1a1a;
                 gridline-color: #404040;
@@ -814,25 +837,25 @@ class CampaignListWidget(QWidget):
                 selection-background-color: #0078d4;
                 selection-color: white;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 8px;
                 border: none;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #0078d4 !important;
                 color: white !important;
             }
-            QTableWidget::item:alternate {
+            QTableView::item:alternate {
                 background-color: #2d2d2d;
             }
-            QTableWidget::item:alternate:selected {
+            QTableView::item:alternate:selected {
                 background-color: #0078d4 !important;
                 color: white !important;
             }
         """)
         
         # Connect cell clicked signal for actions
-        self.campaigns_table.cellClicked.connect(self.on_cell_clicked)
+        self.campaigns_table.clicked.connect(lambda index: self.on_cell_clicked(index.row(), index.column()))
         
         layout.addWidget(self.campaigns_table)
         
@@ -840,131 +863,74 @@ class CampaignListWidget(QWidget):
         self.status_label = QLabel(_("campaigns.ready"))
         layout.addWidget(self.status_label)
     
+    def _create_campaigns_model(self) -> PagedTableModel:
+        """Create the paged model backing the campaigns table."""
+        center = Qt.AlignCenter
+        columns = [
+            TableColumn(_("common.name"), lambda c: c.name, Campaign.name),
+            TableColumn(_("common.status"), lambda c: c.status.value.title(), Campaign.status, center, lambda c: c.status),
+            TableColumn(_("campaigns.recipients"), lambda c: str(c.total_recipients), Campaign.total_recipients, center),
+            TableColumn(_("common.sent"), lambda c: str(c.sent_count), Campaign.sent_count, center),
+            TableColumn(_("common.failed"), lambda c: str(c.failed_count), Campaign.failed_count, center),
+            TableColumn(_("common.progress"), lambda c: f"{c.progress_percentage:.1f}%", None, center),
+            TableColumn(
+                _("campaigns.start_time"),
+                lambda c: c.start_time.strftime("%Y-%m-%d %H:%M") if c.start_time else _("campaigns.not_scheduled"),
+                Campaign.start_time, center
+            ),
+            TableColumn(
+                _("campaigns.last_activity"),
+                lambda c: c.last_activity.strftime("%Y-%m-%d %H:%M") if c.last_activity else _("campaigns.never"),
+                Campaign.last_activity, center
+            ),
+            TableColumn(_("common.actions"), self._get_actions_text, None, center),
+        ]
+        return PagedTableModel(
+            Campaign,
+            columns,
+            base_filters=[Campaign.is_deleted == False],
+            search_columns=[Campaign.name, Campaign.status, Campaign.description],
+            parent=self
+        )
+    
+    def _get_actions_text(self, campaign: Campaign) -> str:
+        """Get the actions cell text for a campaign based on its status."""
+        actions = []
+        
+        # Status-based action logic according to specifications
+        if campaign.status == CampaignStatus.COMPLETED:
+            actions.append(_("campaigns.duplicate_campaign"))
+        elif campaign.status in [CampaignStatus.FAILED, CampaignStatus.INCOMPLETED]:
+            actions.append(_("common.retry"))
+        elif campaign.status == CampaignStatus.ERROR:
+            actions.append(_("common.retry"))
+        elif campaign.status == CampaignStatus.DRAFT:
+            if campaign.total_recipients > 0:
+                actions.append(_("common.start"))  # Only for DRAFT with recipients
+            else:
+                actions.append(_("campaigns.assign_recipients"))  # For DRAFT without recipients
+        elif campaign.status == CampaignStatus.SCHEDULED:
+            # No actions for SCHEDULED (will start automatically)
+            pass
+        elif campaign.status == CampaignStatus.RUNNING:
+            actions.append(_("common.pause"))  # Only for RUNNING
+            actions.append(_("common.stop"))   # Only for RUNNING
+        elif campaign.status == CampaignStatus.PAUSED:
+            actions.append(_("common.start"))  # Only for PAUSED
+            actions.append(_("common.resume")) # Only for PAUSED
+        elif campaign.status == CampaignStatus.STOPPED:
+            actions.append(_("common.retry"))  # Only for STOPPED
+        
+        return " | ".join(actions) if actions else _("campaigns.no_actions")
+    
+    def on_rows_loaded(self):
+        """Show the number of matching campaigns once the model has loaded."""
+        self.status_label.setText(_("campaigns.loaded_campaigns").format(count=self.campaigns_model.total_count()))
+    
     def load_campaigns(self):
         """Load campaigns from database."""
         try:
-            session = get_session()
-            try:
-                from ...models import Campaign
-                from sqlmodel import select
-                campaigns = session.exec(select(Campaign).where(Campaign.is_deleted == False)).all()
-            finally:
-                session.close()
-            
-            self.campaigns_table.setRowCount(len(campaigns))
-            
-            for row, campaign in enumerate(campaigns):
-                # Name - Disabled text field
-                name_item = QTableWidgetItem(campaign.name)
-                name_item.setFlags(name_item.flags() & ~Qt.ItemIsEditable | Qt.ItemIsSelectable)
-                # Store campaign ID in the name item for selection handling
-                name_item.setData(Qt.UserRole, campaign.id)
-                self.campaigns_table.setItem(row, 0, name_item)
-                
-                # Status - Enhanced button-like appearance
-                status_item = QTableWidgetItem(campaign.status.value.title())
-                status_item.setFlags(status_item.flags() & ~Qt.ItemIsEditable | Qt.ItemIsSelectable)
-                
-                # Set status-specific styling with button-like appearance
-                if campaign.status == CampaignStatus.RUNNING:
-                    status_item.setBackground(QColor(34, 197, 94))  # Green
-                    status_item.setForeground(Qt.white)
-                elif campaign.status == CampaignStatus.PAUSED:
-                    status_item.setBackground(QColor(245, 158, 11))  # Orange
-                    status_item.setForeground(Qt.white)
-                elif campaign.status == CampaignStatus.COMPLETED:
-                    status_item.setBackground(QColor(59, 130, 246))  # Blue
-                    status_item.setForeground(Qt.white)
-                elif campaign.status == CampaignStatus.ERROR:
-                    status_item.setBackground(QColor(239, 68, 68))  # Red
-                    status_item.setForeground(Qt.white)
-                elif campaign.status == CampaignStatus.DRAFT:
-                    status_item.setBackground(QColor(107, 114, 128))  # Gray
-                    status_item.setForeground(Qt.white)
-                
-                # Center align status text
-                status_item.setTextAlignment(Qt.AlignCenter)
-                self.campaigns_table.setItem(row, 1, status_item)
-                
-                # Recipients - Disabled text field
-                recipients_item = QTableWidgetItem(str(campaign.total_recipients))
-                recipients_item.setFlags(recipients_item.flags() & ~Qt.ItemIsEditable | Qt.ItemIsSelectable)
-                recipients_item.setTextAlignment(Qt.AlignCenter)
-                self.campaigns_table.setItem(row, 2, recipients_item)
-                
-                # Sent - Disabled text field
-                sent_item = QTableWidgetItem(str(campaign.sent_count))
-                sent_item.setFlags(sent_item.flags() & ~Qt.ItemIsEditable | Qt.ItemIsSelectable)
-                sent_item.setTextAlignment(Qt.AlignCenter)
-                self.campaigns_table.setItem(row, 3, sent_item)
-                
-                # Failed - Disabled text field
-                failed_item = QTableWidgetItem(str(campaign.failed_count))
-                failed_item.setFlags(failed_item.flags() & ~Qt.ItemIsEditable | Qt.ItemIsSelectable)
-                failed_item.setTextAlignment(Qt.AlignCenter)
-                self.campaigns_table.setItem(row, 4, failed_item)
-                
-                # Progress - Disabled text field
-                progress = f"{campaign.progress_percentage:.1f}%"
-                progress_item = QTableWidgetItem(progress)
-                progress_item.setFlags(progress_item.flags() & ~Qt.ItemIsEditable | Qt.ItemIsSelectable)
-                progress_item.setTextAlignment(Qt.AlignCenter)
-                self.campaigns_table.setItem(row, 5, progress_item)
-                
-                # Start time - Disabled text field
-                start_time = campaign.start_time.strftime("%Y-%m-%d %H:%M") if campaign.start_time else _("campaigns.not_scheduled")
-                start_item = QTableWidgetItem(start_time)
-                start_item.setFlags(start_item.flags() & ~Qt.ItemIsEditable | Qt.ItemIsSelectable)
-                start_item.setTextAlignment(Qt.AlignCenter)
-                self.campaigns_table.setItem(row, 6, start_item)
-                
-                # Last activity - Disabled text field
-                last_activity = campaign.last_activity.strftime("%Y-%m-%d %H:%M") if campaign.last_activity else _("campaigns.never")
-                activity_item = QTableWidgetItem(last_activity)
-                activity_item.setFlags(activity_item.flags() & ~Qt.ItemIsEditable | Qt.ItemIsSelectable)
-                activity_item.setTextAlignment(Qt.AlignCenter)
-                self.campaigns_table.setItem(row, 7, activity_item)
-                
-                # Actions - Create action buttons based on status
-                actions = []
-                is_running = self.campaign_manager.is_campaign_running(campaign.id)
-                
-                # Status-based action logic according to specifications
-                if campaign.status == CampaignStatus.COMPLETED:
-                    actions.append(_("campaigns.duplicate_campaign"))
-                elif campaign.status in [CampaignStatus.FAILED, CampaignStatus.INCOMPLETED]:
-                    actions.append(_("common.retry"))
-                elif campaign.status == CampaignStatus.ERROR:
-                    actions.append(_("common.retry"))
-                elif campaign.status == CampaignStatus.DRAFT:
-                    if campaign.total_recipients > 0:
-                        actions.append(_("common.start"))  # Only for DRAFT with recipients
-                    else:
-                        actions.append(_("campaigns.assign_recipients"))  # For DRAFT without recipients
-                elif campaign.status == CampaignStatus.SCHEDULED:
-                    # No actions for SCHEDULED (will start automatically)
-                    pass
-                elif campaign.status == CampaignStatus.RUNNING:
-                    actions.append(_("common.pause"))  # Only for RUNNING
-                    actions.append(_("common.stop"))   # Only for RUNNING
-                elif campaign.status == CampaignStatus.PAUSED:
-                    actions.append(_("common.start"))  # Only for PAUSED
-                    actions.append(_("common.resume")) # Only for PAUSED
-                elif campaign.status == CampaignStatus.STOPPED:
-                    actions.append(_("common.retry"))  # Only for STOPPED
-                
-                actions_text = " | ".join(actions) if actions else _("campaigns.no_actions")
-                actions_item = QTableWidgetItem(actions_text)
-                actions_item.setFlags(actions_item.flags() & ~Qt.ItemIsEditable | Qt.ItemIsSelectable)
-                actions_item.setTextAlignment(Qt.AlignCenter)
-                actions_item.setData(Qt.UserRole, campaign.id)  # Store campaign ID for actions
-                self.campaigns_table.setItem(row, 8, actions_item)
-            
-            self.status_label.setText(_("campaigns.loaded_campaigns").format(count=len(campaigns)))
-            
-            # Apply search filter if there's search text
-            self.filter_campaigns()
-            
+            self.campaigns_model.reload()
         except Exception as e:
             self.logger.error(f"Error loading campaigns: {e}")
             self.status_label.setText(_("campaigns.error_loading_campaigns").format(error=str(e)))
@@ -987,7 +953,7 @@ class CampaignListWidget(QWidget):
             return
         
         row = selected_rows[0].row()
-        campaign_id = self.campaigns_table.item(row, 0).data(Qt.UserRole)
+        campaign_id = self.campaigns_model.row_id(row)
         
         if not campaign_id:
             self.start_button.setEnabled(False)
@@ -1002,142 +968,164 @@ class CampaignListWidget(QWidget):
             self.stop_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
             return
         
-        # Get campaign from database
+        # Load the campaign off the GUI thread; a newer selection supersedes this one
+        if self._button_state_query is not None:
+            self._button_state_query.cancel()
+        self._button_state_query = get_data_access().submit(
+            lambda: self._load_button_state(campaign_id),
+            on_result=lambda state: self._apply_button_states(campaign_id, *state),
+            on_error=self._on_button_state_error,
+            key=("campaign_button_state", campaign_id)
+        )
+    
+    def _load_button_state(self, campaign_id):
+        """Load the campaign and whether it can be retried; runs on the data access pool."""
+        with get_session() as session:
+            campaign = session.get(Campaign, campaign_id)
+        can_retry = self.campaign_manager.can_retry_campaign(campaign_id) if campaign else False
+        return campaign, can_retry
+    
+    def _on_button_state_error(self, error):
+        """Disable action buttons when the campaign could not be loaded."""
+        self._button_state_query = None
+        self.logger.error(f"Error updating button states: {error}")
+        self._apply_button_states(None, None, False)
+    
+    def _apply_button_states(self, campaign_id, campaign, can_retry):
+        """Enable action buttons according to the loaded campaign's status."""
+        self._button_state_query = None
         try:
-            with get_session() as session:
-                campaign = session.get(Campaign, campaign_id)
-                if not campaign:
-                    self.start_button.setEnabled(False)
-                    self.start_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.retry_button.setEnabled(False)
-                    self.retry_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.duplicate_button.setEnabled(False)
-                    self.duplicate_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.pause_button.setEnabled(False)
-                    self.pause_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.stop_button.setEnabled(False)
-                    self.stop_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    return
-                
-                # Update button states based on campaign status
-                is_running = self.campaign_manager.is_campaign_running(campaign_id)
-                can_retry = self.campaign_manager.can_retry_campaign(campaign_id)
-                
-                # Status-based button enabling according to specifications
-                if campaign.status == CampaignStatus.COMPLETED:
-                    self.start_button.setEnabled(False)
-                    self.start_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.retry_button.setEnabled(False)
-                    self.retry_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.duplicate_button.setEnabled(True)
-                    self.duplicate_button.setStyleSheet("QPushButton { background-color: #8b5cf6; color: white; }")  # Purple
-                    self.pause_button.setEnabled(False)
-                    self.pause_button.setText(_("common.pause"))  # Reset text
-                    self.pause_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.stop_button.setEnabled(False)
-                    self.stop_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                elif campaign.status in [CampaignStatus.FAILED, CampaignStatus.INCOMPLETED]:
-                    self.start_button.setEnabled(False)
-                    self.start_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.retry_button.setEnabled(True)
-                    self.retry_button.setStyleSheet("QPushButton { background-color: #f59e0b; color: white; }")  # Yellow/Orange
-                    self.duplicate_button.setEnabled(False)
-                    self.duplicate_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.pause_button.setEnabled(False)
-                    self.pause_button.setText(_("common.pause"))  # Reset text
-                    self.pause_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.stop_button.setEnabled(False)
-                    self.stop_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                elif campaign.status == CampaignStatus.ERROR:
-                    self.start_button.setEnabled(False)
-                    self.start_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.retry_button.setEnabled(True)
-                    self.retry_button.setStyleSheet("QPushButton { background-color: #f59e0b; color: white; }")  # Yellow/Orange
-                    self.duplicate_button.setEnabled(False)
-                    self.duplicate_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.pause_button.setEnabled(False)
-                    self.pause_button.setText(_("common.pause"))  # Reset text
-                    self.pause_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.stop_button.setEnabled(False)
-                    self.stop_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                elif campaign.status == CampaignStatus.DRAFT:
-                    if campaign.total_recipients > 0:
-                        self.start_button.setEnabled(True)  # Only for DRAFT with recipients
-                        self.start_button.setStyleSheet("QPushButton { background-color: #3b82f6; color: white; }")  # Blue
-                    else:
-                        self.start_button.setEnabled(False)  # Disabled for DRAFT without recipients
-                        self.start_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.retry_button.setEnabled(False)  # Never for DRAFT
-                    self.retry_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.duplicate_button.setEnabled(False)
-                    self.duplicate_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.pause_button.setEnabled(False)
-                    self.pause_button.setText(_("common.pause"))  # Reset text
-                    self.pause_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.stop_button.setEnabled(False)
-                    self.stop_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                elif campaign.status == CampaignStatus.SCHEDULED:
-                    self.start_button.setEnabled(False)  # Not for SCHEDULED
-                    self.start_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.retry_button.setEnabled(False)  # Not for SCHEDULED
-                    self.retry_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.duplicate_button.setEnabled(False)
-                    self.duplicate_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.pause_button.setEnabled(False)
-                    self.pause_button.setText(_("common.pause"))  # Reset text
-                    self.pause_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.stop_button.setEnabled(False)
-                    self.stop_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                elif campaign.status == CampaignStatus.RUNNING:
-                    self.start_button.setEnabled(False)  # Not for RUNNING
-                    self.start_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.retry_button.setEnabled(False)  # Not for RUNNING
-                    self.retry_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.duplicate_button.setEnabled(False)
-                    self.duplicate_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.pause_button.setEnabled(True)  # Only for RUNNING
-                    self.pause_button.setText(_("common.pause"))  # Pause text
-                    self.pause_button.setStyleSheet("QPushButton { background-color: #6b7280; color: white; }")  # Gray
-                    self.stop_button.setEnabled(True)  # Only for RUNNING
-                    self.stop_button.setStyleSheet("QPushButton { background-color: #6b7280; color: white; }")  # Gray
-                elif campaign.status == CampaignStatus.PAUSED:
-                    self.start_button.setEnabled(True)  # Only for PAUSED
+            if not campaign:
+                self.start_button.setEnabled(False)
+                self.start_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.retry_button.setEnabled(False)
+                self.retry_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.duplicate_button.setEnabled(False)
+                self.duplicate_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.pause_button.setEnabled(False)
+                self.pause_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.stop_button.setEnabled(False)
+                self.stop_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                return
+            
+            # Update button states based on campaign status
+            is_running = self.campaign_manager.is_campaign_running(campaign_id)
+            
+            # Status-based button enabling according to specifications
+            if campaign.status == CampaignStatus.COMPLETED:
+                self.start_button.setEnabled(False)
+                self.start_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.retry_button.setEnabled(False)
+                self.retry_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.duplicate_button.setEnabled(True)
+                self.duplicate_button.setStyleSheet("QPushButton { background-color: #8b5cf6; color: white; }")  # Purple
+                self.pause_button.setEnabled(False)
+                self.pause_button.setText(_("common.pause"))  # Reset text
+                self.pause_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.stop_button.setEnabled(False)
+                self.stop_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+            elif campaign.status in [CampaignStatus.FAILED, CampaignStatus.INCOMPLETED]:
+                self.start_button.setEnabled(False)
+                self.start_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.retry_button.setEnabled(True)
+                self.retry_button.setStyleSheet("QPushButton { background-color: #f59e0b; color: white; }")  # Yellow/Orange
+                self.duplicate_button.setEnabled(False)
+                self.duplicate_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.pause_button.setEnabled(False)
+                self.pause_button.setText(_("common.pause"))  # Reset text
+                self.pause_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.stop_button.setEnabled(False)
+                self.stop_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+            elif campaign.status == CampaignStatus.ERROR:
+                self.start_button.setEnabled(False)
+                self.start_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.retry_button.setEnabled(True)
+                self.retry_button.setStyleSheet("QPushButton { background-color: #f59e0b; color: white; }")  # Yellow/Orange
+                self.duplicate_button.setEnabled(False)
+                self.duplicate_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.pause_button.setEnabled(False)
+                self.pause_button.setText(_("common.pause"))  # Reset text
+                self.pause_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.stop_button.setEnabled(False)
+                self.stop_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+            elif campaign.status == CampaignStatus.DRAFT:
+                if campaign.total_recipients > 0:
+                    self.start_button.setEnabled(True)  # Only for DRAFT with recipients
                     self.start_button.setStyleSheet("QPushButton { background-color: #3b82f6; color: white; }")  # Blue
-                    self.retry_button.setEnabled(False)  # Not for PAUSED
-                    self.retry_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.duplicate_button.setEnabled(False)
-                    self.duplicate_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.pause_button.setEnabled(True)  # Only for PAUSED
-                    self.pause_button.setText(_("common.resume"))  # Resume text
-                    self.pause_button.setStyleSheet("QPushButton { background-color: #10b981; color: white; }")  # Green
-                    self.stop_button.setEnabled(False)  # Not for PAUSED
-                    self.stop_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                elif campaign.status == CampaignStatus.STOPPED:
-                    self.start_button.setEnabled(False)  # Not for STOPPED
-                    self.start_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.retry_button.setEnabled(True)  # Only for STOPPED
-                    self.retry_button.setStyleSheet("QPushButton { background-color: #f59e0b; color: white; }")  # Yellow/Orange
-                    self.duplicate_button.setEnabled(False)
-                    self.duplicate_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.pause_button.setEnabled(False)
-                    self.pause_button.setText(_("common.pause"))  # Reset text
-                    self.pause_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.stop_button.setEnabled(False)  # Not for STOPPED
-                    self.stop_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
                 else:
-                    # For any other statuses, disable all action buttons
-                    self.start_button.setEnabled(False)
+                    self.start_button.setEnabled(False)  # Disabled for DRAFT without recipients
                     self.start_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.retry_button.setEnabled(False)
-                    self.retry_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.duplicate_button.setEnabled(False)
-                    self.duplicate_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.pause_button.setEnabled(False)
-                    self.pause_button.setText(_("common.pause"))  # Reset text
-                    self.pause_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                    self.stop_button.setEnabled(False)
-                    self.stop_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
-                
+                self.retry_button.setEnabled(False)  # Never for DRAFT
+                self.retry_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.duplicate_button.setEnabled(False)
+                self.duplicate_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.pause_button.setEnabled(False)
+                self.pause_button.setText(_("common.pause"))  # Reset text
+                self.pause_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.stop_button.setEnabled(False)
+                self.stop_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+            elif campaign.status == CampaignStatus.SCHEDULED:
+                self.start_button.setEnabled(False)  # Not for SCHEDULED
+                self.start_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.retry_button.setEnabled(False)  # Not for SCHEDULED
+                self.retry_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.duplicate_button.setEnabled(False)
+                self.duplicate_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.pause_button.setEnabled(False)
+                self.pause_button.setText(_("common.pause"))  # Reset text
+                self.pause_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.stop_button.setEnabled(False)
+                self.stop_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+            elif campaign.status == CampaignStatus.RUNNING:
+                self.start_button.setEnabled(False)  # Not for RUNNING
+                self.start_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.retry_button.setEnabled(False)  # Not for RUNNING
+                self.retry_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.duplicate_button.setEnabled(False)
+                self.duplicate_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.pause_button.setEnabled(True)  # Only for RUNNING
+                self.pause_button.setText(_("common.pause"))  # Pause text
+                self.pause_button.setStyleSheet("QPushButton { background-color: #6b7280; color: white; }")  # Gray
+                self.stop_button.setEnabled(True)  # Only for RUNNING
+                self.stop_button.setStyleSheet("QPushButton { background-color: #6b7280; color: white; }")  # Gray
+            elif campaign.status == CampaignStatus.PAUSED:
+                self.start_button.setEnabled(True)  # Only for PAUSED
+                self.start_button.setStyleSheet("QPushButton { background-color: #3b82f6; color: white; }")  # Blue
+                self.retry_button.setEnabled(False)  # Not for PAUSED
+                self.retry_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.duplicate_button.setEnabled(False)
+                self.duplicate_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.pause_button.setEnabled(True)  # Only for PAUSED
+                self.pause_button.setText(_("common.resume"))  # Resume text
+                self.pause_button.setStyleSheet("QPushButton { background-color: #10b981; color: white; }")  # Green
+                self.stop_button.setEnabled(False)  # Not for PAUSED
+                self.stop_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+            elif campaign.status == CampaignStatus.STOPPED:
+                self.start_button.setEnabled(False)  # Not for STOPPED
+                self.start_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.retry_button.setEnabled(True)  # Only for STOPPED
+                self.retry_button.setStyleSheet("QPushButton { background-color: #f59e0b; color: white; }")  # Yellow/Orange
+                self.duplicate_button.setEnabled(False)
+                self.duplicate_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.pause_button.setEnabled(False)
+                self.pause_button.setText(_("common.pause"))  # Reset text
+                self.pause_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.stop_button.setEnabled(False)  # Not for STOPPED
+                self.stop_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+            else:
+                # For any other statuses, disable all action buttons
+                self.start_button.setEnabled(False)
+                self.start_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.retry_button.setEnabled(False)
+                self.retry_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.duplicate_button.setEnabled(False)
+                self.duplicate_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.pause_button.setEnabled(False)
+                self.pause_button.setText(_("common.pause"))  # Reset text
+                self.pause_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+                self.stop_button.setEnabled(False)
+                self.stop_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
+            
         except Exception as e:
             self.logger.error(f"Error updating button states: {e}")
             self.start_button.setEnabled(False)
@@ -1151,37 +1139,58 @@ class CampaignListWidget(QWidget):
             self.stop_button.setEnabled(False)
             self.stop_button.setStyleSheet("QPushButton { background-color: #6b7280; color: #9ca3af; }")  # Gray
     
+    def _load_campaign(self, campaign_id):
+        """Load a campaign by ID; runs on the data access pool."""
+        with get_session() as session:
+            return session.get(Campaign, campaign_id)
+    
+    def _with_campaign(self, campaign_id, on_loaded, on_error=None):
+        """Load a campaign off the GUI thread, then pass it (or None) to ``on_loaded``."""
+        def show_error(e):
+            self.logger.error(f"Error loading campaign {campaign_id}: {e}")
+            QMessageBox.critical(self, _("campaigns.error"), f"Error: {str(e)}")
+        
+        get_data_access().submit(
+            lambda: self._load_campaign(campaign_id),
+            on_result=on_loaded,
+            on_error=on_error or show_error,
+            key=("campaign", campaign_id)
+        )
+    
     def refresh_campaigns(self):
         """Refresh campaigns data."""
-        self.load_campaigns()
+        try:
+            self.campaigns_model.refresh()
+        except Exception as e:
+            self.logger.error(f"Error refreshing campaigns: {e}")
+    
+    def on_data_changed(self, changes):
+        """Queue committed campaigns changes for the next visible refresh."""
+        if not changes.touches("campaigns"):
+            return
+        self._pending_changes.merge(ChangeSet(campaigns=changes["campaigns"]))
+        get_refresh_scheduler().request(self)
+    
+    def _prepare_refresh(self):
+        """Take the queued changes and return the query job for the worker pool."""
+        changes, self._pending_changes = self._pending_changes, ChangeSet()
+        table_changes = changes.get("campaigns")
+        if table_changes is None:
+            return None
+        return lambda: self.campaigns_model.fetch_changes(table_changes)
+    
+    def _apply_refresh(self, fetched):
+        """Apply re-read rows on the GUI thread."""
+        self.campaigns_model.apply_fetched(fetched)
     
     def filter_campaigns(self):
         """Filter campaigns based on search text."""
-        search_text = self.search_edit.text().lower().strip()
-        
-        if not search_text:
-            # Show all campaigns
-            for row in range(self.campaigns_table.rowCount()):
-                self.campaigns_table.setRowHidden(row, False)
-            return
-        
-        # Filter campaigns (exclude Actions column - column 8)
-        for row in range(self.campaigns_table.rowCount()):
-            should_show = False
-            
-            # Check all columns except Actions column for search text
-            for col in range(self.campaigns_table.columnCount() - 1):  # Exclude last column (Actions)
-                item = self.campaigns_table.item(row, col)
-                if item and search_text in item.text().lower():
-                    should_show = True
-                    break
-            
-            self.campaigns_table.setRowHidden(row, not should_show)
+        self.campaigns_model.set_search_text(self.search_edit.text().lower())
     
     def on_cell_clicked(self, row, column):
         """Handle cell click events."""
         if column == 8:  # Actions column
-            campaign_id = self.campaigns_table.item(row, 0).data(Qt.UserRole)
+            campaign_id = self.campaigns_model.row_id(row)
             if campaign_id is not None:
                 self.show_action_menu(row, column, campaign_id)
         else:
@@ -1192,23 +1201,19 @@ class CampaignListWidget(QWidget):
     
     def show_action_menu(self, row, column, campaign_id):
         """Show action menu for campaign actions."""
+        # Get available actions from the current campaign status, loaded off the GUI thread
+        self._with_campaign(
+            campaign_id,
+            lambda campaign: self._show_action_menu(row, column, campaign_id, campaign)
+        )
+    
+    def _show_action_menu(self, row, column, campaign_id, campaign):
+        """Show the action menu for a loaded campaign."""
         from PyQt5.QtWidgets import QMenu
         
-        # Get campaign name for display
-        campaign_name = self.campaigns_table.item(row, 0).text()
-        
         # Create context menu
         menu = QMenu(self)
         
-        # Get available actions
-        session = get_session()
-        try:
-            from ...models import Campaign
-            from sqlmodel import select
-            campaign = session.exec(select(Campaign).where(Campaign.id == campaign_id)).first()
-        finally:
-            session.close()
-        
         if campaign:
             # Status-based action menu logic (matching the table actions)
             if campaign.status == CampaignStatus.COMPLETED:
@@ -1243,7 +1248,7 @@ class CampaignListWidget(QWidget):
         
         # Show menu at cursor position
         menu.exec_(self.campaigns_table.mapToGlobal(
-            self.campaigns_table.visualItemRect(self.campaigns_table.item(row, column)).bottomLeft()
+            self.campaigns_table.visualRect(self.campaigns_model.index(row, column)).bottomLeft()
         ))
     
     def start_campaign_by_id(self, campaign_id):
@@ -1288,25 +1293,30 @@ class CampaignListWidget(QWidget):
     
     def duplicate_campaign_by_id(self, campaign_id):
         """Duplicate campaign by ID."""
-        # Check if campaign is completed
-        try:
-            with get_session() as session:
-                campaign = session.get(Campaign, campaign_id)
-                if not campaign:
-                    QMessageBox.warning(self, _("campaigns.campaign_not_found"), _("campaigns.campaign_not_found_message"))
-                    return
-                
-                if campaign.status != CampaignStatus.COMPLETED:
-                    QMessageBox.warning(
-                        self, 
-                        _("campaigns.cannot_duplicate"), 
-                        _("campaigns.cannot_duplicate_message").format(status=campaign.status.value.title())
-                    )
-                    return
+        # Check the campaign status off the GUI thread before confirming
+        self._with_campaign(
+            campaign_id,
+            lambda campaign: self._confirm_duplicate(campaign_id, campaign),
+            on_error=self._on_duplicate_check_error
+        )
+    
+    def _on_duplicate_check_error(self, error):
+        """Report a campaign that could not be loaded for duplication."""
+        self.logger.error(f"Error checking campaign status: {error}")
+        QMessageBox.warning(self, _("campaigns.error_checking_status"), _("campaigns.error_checking_status_message"))
+    
+    def _confirm_duplicate(self, campaign_id, campaign):
+        """Duplicate a loaded campaign after checking it is completed and confirming."""
+        if not campaign:
+            QMessageBox.warning(self, _("campaigns.campaign_not_found"), _("campaigns.campaign_not_found_message"))
+            return
         
-        except Exception as e:
-            self.logger.error(f"Error checking campaign status: {e}")
-            QMessageBox.warning(self, _("campaigns.error_checking_status"), _("campaigns.error_checking_status_message"))
+        if campaign.status != CampaignStatus.COMPLETED:
+            QMessageBox.warning(
+                self, 
+                _("campaigns.cannot_duplicate"), 
+                _("campaigns.cannot_duplicate_message").format(status=campaign.status.value.title())
+            )
             return
         
         # Confirm duplication
@@ -1374,36 +1384,17 @@ class CampaignListWidget(QWidget):
         self.edit_button.setEnabled(has_selection)
         self.delete_button.setEnabled(has_selection)
         
-        # Update action button states
+        # Update action button states (loaded off the GUI thread)
         self.update_button_states()
         
         if has_selection:
             row = selected_rows[0].row()
-            # Try to get campaign ID from the first column (Name column)
-            name_item = self.campaigns_table.item(row, 0)
-            if name_item:
-                campaign_id = name_item.data(Qt.UserRole)
-                if campaign_id is not None:
-                    # Emit signal with campaign ID for further processing
-                    self.campaign_selected.emit(campaign_id)
-                    
-                    # Load campaign to check available actions
-                    session = get_session()
-                    try:
-                        from ...models import Campaign
-                        from sqlmodel import select
-                        campaign = session.exec(select(Campaign).where(Campaign.id == campaign_id)).first()
-                    finally:
-                        session.close()
-                    
-                    if campaign:
-                        self.start_button.setEnabled(campaign.can_start())
-                        self.pause_button.setEnabled(campaign.can_pause())
-                        self.stop_button.setEnabled(campaign.can_stop())
-                else:
-                    self.logger.warning(f"No campaign ID found for row {row}")
+            campaign_id = self.campaigns_model.row_id(row)
+            if campaign_id is not None:
+                # Emit signal with campaign ID for further processing
+                self.campaign_selected.emit(campaign_id)
             else:
-                self.logger.warning(f"No name item found for row {row}")
+                self.logger.warning(f"No campaign ID found for row {row}")
     
     def create_campaign(self):
         """Create new campaign."""
@@ -1418,17 +1409,13 @@ class CampaignListWidget(QWidget):
             return
         
         row = selected_rows[0].row()
-        campaign_id = self.campaigns_table.item(row, 0).data(Qt.UserRole)
-        
-        # Load campaign from database
-        session = get_session()
-        try:
-            from ...models import Campaign
-            from sqlmodel import select
-            campaign = session.exec(select(Campaign).where(Campaign.id == campaign_id)).first()
-        finally:
-            session.close()
+        campaign_id = self.campaigns_model.row_id(row)
         
+        # Load campaign off the GUI thread, then open the dialog
+        self._with_campaign(campaign_id, self._open_campaign_dialog)
+    
+    def _open_campaign_dialog(self, campaign):
+        """Open the edit dialog for a loaded campaign."""
         if campaign:
             dialog = CampaignDialog(self, campaign)
             if dialog.exec_() == QDialog.Accepted:
@@ -1442,48 +1429,49 @@ class CampaignListWidget(QWidget):
             return
         
         row = selected_rows[0].row()
-        campaign_id = self.campaigns_table.item(row, 0).data(Qt.UserRole)
+        campaign_id = self.campaigns_model.row_id(row)
         
         if not campaign_id:
             QMessageBox.warning(self, _("campaigns.invalid_campaign"), _("campaigns.invalid_campaign_message"))
             return
         
-        # Get campaign status to determine action
+        # Get campaign status off the GUI thread to determine action
+        self._with_campaign(campaign_id, lambda campaign: self._start_or_resume(campaign_id, campaign))
+    
+    def _start_or_resume(self, campaign_id, campaign):
+        """Start a loaded draft campaign or resume a paused one."""
+        if not campaign:
+            QMessageBox.warning(self, _("campaigns.invalid_campaign"), _("campaigns.invalid_campaign_message"))
+            return
+        
         try:
-            with get_session() as session:
-                campaign = session.get(Campaign, campaign_id)
-                if not campaign:
-                    QMessageBox.warning(self, _("campaigns.invalid_campaign"), _("campaigns.invalid_campaign_message"))
-                    return
-                
-                if campaign.status == CampaignStatus.DRAFT:
-                    if campaign.total_recipients > 0:
-                        # Start the campaign
-                        success = self.campaign_manager.start_campaign(campaign_id)
-                        if success:
-                            QMessageBox.information(self, _("campaigns.campaign_started"), _("campaigns.campaign_started_message"))
-                            self.refresh_campaigns()
-                        else:
-                            QMessageBox.warning(self, _("campaigns.start_failed"), _("campaigns.start_failed_message"))
-                    else:
-                        # No recipients assigned - open edit dialog
-                        QMessageBox.information(
-                            self, 
-                            _("campaigns.assign_recipients"), 
-                            _("campaigns.assign_recipients_message")
-                        )
-                        self.edit_campaign()  # Open edit dialog to assign recipients
-                elif campaign.status == CampaignStatus.PAUSED:
-                    # Resume the campaign
-                    success = self.campaign_manager.resume_campaign(campaign_id)
+            if campaign.status == CampaignStatus.DRAFT:
+                if campaign.total_recipients > 0:
+                    # Start the campaign
+                    success = self.campaign_manager.start_campaign(campaign_id)
                     if success:
-                        QMessageBox.information(self, _("campaigns.campaign_resumed"), _("campaigns.campaign_resumed_message"))
+                        QMessageBox.information(self, _("campaigns.campaign_started"), _("campaigns.campaign_started_message"))
                         self.refresh_campaigns()
                     else:
-                        QMessageBox.warning(self, _("campaigns.resume_failed"), _("campaigns.resume_failed_message"))
+                        QMessageBox.warning(self, _("campaigns.start_failed"), _("campaigns.start_failed_message"))
                 else:
-                    QMessageBox.warning(self, _("campaigns.invalid_action"), _("campaigns.invalid_action_message"))
-                    
+                    # No recipients assigned - open edit dialog
+                    QMessageBox.information(
+                        self, 
+                        _("campaigns.assign_recipients"), 
+                        _("campaigns.assign_recipients_message")
+                    )
+                    self.edit_campaign()  # Open edit dialog to assign recipients
+            elif campaign.status == CampaignStatus.PAUSED:
+                # Resume the campaign
+                success = self.campaign_manager.resume_campaign(campaign_id)
+                if success:
+                    QMessageBox.information(self, _("campaigns.campaign_resumed"), _("campaigns.campaign_resumed_message"))
+                    self.refresh_campaigns()
+                else:
+                    QMessageBox.warning(self, _("campaigns.resume_failed"), _("campaigns.resume_failed_message"))
+            else:
+                QMessageBox.warning(self, _("campaigns.invalid_action"), _("campaigns.invalid_action_message"))
         except Exception as e:
             QMessageBox.critical(self, _("campaigns.error"), f"Error: {str(e)}")
     
@@ -1495,7 +1483,7 @@ class CampaignListWidget(QWidget):
             return
         
         row = selected_rows[0].row()
-        campaign_id = self.campaigns_table.item(row, 0).data(Qt.UserRole)
+        campaign_id = self.campaigns_model.row_id(row)
         
         if not campaign_id:
             QMessageBox.warning(self, _("campaigns.invalid_campaign"), _("campaigns.invalid_campaign_message"))
@@ -1540,53 +1528,13 @@ class CampaignListWidget(QWidget):
             return
         
         row = selected_rows[0].row()
-        campaign_id = self.campaigns_table.item(row, 0).data(Qt.UserRole)
+        campaign_id = self.campaigns_model.row_id(row)
         
         if not campaign_id:
             QMessageBox.warning(self, _("campaigns.invalid_campaign"), _("campaigns.invalid_campaign_message"))
             return
         
-        # Check if campaign is completed
-        try:
-            with get_session() as session:
-                campaign = session.get(Campaign, campaign_id)
-                if not campaign:
-                    QMessageBox.warning(self, _("campaigns.campaign_not_found"), _("campaigns.campaign_not_found_message"))
-                    return
-                
-                if campaign.status != CampaignStatus.COMPLETED:
-                    QMessageBox.warning(
-                        self, 
-                        _("campaigns.cannot_duplicate"), 
-                        _("campaigns.cannot_duplicate_message").format(status=campaign.status.value.title())
-                    )
-                    return
-        
-        except Exception as e:
-            self.logger.error(f"Error checking campaign status: {e}")
-            QMessageBox.warning(self, _("campaigns.error_checking_status"), _("campaigns.error_checking_status_message"))
-            return
-        
-        # Confirm duplication
-        reply = QMessageBox.question(
-            self, 
-            _("campaigns.duplicate_campaign"), 
-            _("campaigns.duplicate_campaign_message").format(name=campaign.name),
-            QMessageBox.Yes | QMessageBox.No
-        )
-        
-        if reply == QMessageBox.Yes:
-            # Duplicate the campaign
-            new_campaign_id = self.campaign_manager.duplicate_campaign(campaign_id)
-            if new_campaign_id:
-                QMessageBox.information(
-                    self, 
-                    _("campaigns.campaign_duplicated"), 
-                    _("campaigns.campaign_duplicated_message").format(id=new_campaign_id)
-                )
-                self.refresh_campaigns()
-            else:
-                QMessageBox.warning(self, _("campaigns.duplication_failed"), _("campaigns.duplication_failed_message"))
+        self.duplicate_campaign_by_id(campaign_id)
     
     def pause_campaign(self):
         """Pause or resume selected campaign based on current status."""
@@ -1596,39 +1544,40 @@ class CampaignListWidget(QWidget):
             return
         
         row = selected_rows[0].row()
-        campaign_id = self.campaigns_table.item(row, 0).data(Qt.UserRole)
+        campaign_id = self.campaigns_model.row_id(row)
         
         if not campaign_id:
             QMessageBox.warning(self, _("campaigns.invalid_campaign"), _("campaigns.invalid_campaign_message"))
             return
         
-        # Get campaign status to determine action
+        # Get campaign status off the GUI thread to determine action
+        self._with_campaign(campaign_id, lambda campaign: self._pause_or_resume(campaign_id, campaign))
+    
+    def _pause_or_resume(self, campaign_id, campaign):
+        """Pause a loaded running campaign or resume a paused one."""
+        if not campaign:
+            QMessageBox.warning(self, _("campaigns.invalid_campaign"), _("campaigns.invalid_campaign_message"))
+            return
+        
         try:
-            with get_session() as session:
-                campaign = session.get(Campaign, campaign_id)
-                if not campaign:
-                    QMessageBox.warning(self, _("campaigns.invalid_campaign"), _("campaigns.invalid_campaign_message"))
-                    return
-                
-                if campaign.status == CampaignStatus.RUNNING:
-                    # Pause the campaign
-                    success = self.campaign_manager.pause_campaign(campaign_id)
-                    if success:
-                        QMessageBox.information(self, _("campaigns.campaign_paused"), _("campaigns.campaign_paused_message"))
-                        self.refresh_campaigns()
-                    else:
-                        QMessageBox.warning(self, _("campaigns.pause_failed"), _("campaigns.pause_failed_message"))
-                elif campaign.status == CampaignStatus.PAUSED:
-                    # Resume the campaign
-                    success = self.campaign_manager.resume_campaign(campaign_id)
-                    if success:
-                        QMessageBox.information(self, _("campaigns.campaign_resumed"), _("campaigns.campaign_resumed_message"))
-                        self.refresh_campaigns()
-                    else:
-                        QMessageBox.warning(self, _("campaigns.resume_failed"), _("campaigns.resume_failed_message"))
+            if campaign.status == CampaignStatus.RUNNING:
+                # Pause the campaign
+                success = self.campaign_manager.pause_campaign(campaign_id)
+                if success:
+                    QMessageBox.information(self, _("campaigns.campaign_paused"), _("campaigns.campaign_paused_message"))
+                    self.refresh_campaigns()
+                else:
+                    QMessageBox.warning(self, _("campaigns.pause_failed"), _("campaigns.pause_failed_message"))
+            elif campaign.status == CampaignStatus.PAUSED:
+                # Resume the campaign
+                success = self.campaign_manager.resume_campaign(campaign_id)
+                if success:
+                    QMessageBox.information(self, _("campaigns.campaign_resumed"), _("campaigns.campaign_resumed_message"))
+                    self.refresh_campaigns()
                 else:
-                    QMessageBox.warning(self, _("campaigns.invalid_action"), _("campaigns.invalid_action_message"))
-                    
+                    QMessageBox.warning(self, _("campaigns.resume_failed"), _("campaigns.resume_failed_message"))
+            else:
+                QMessageBox.warning(self, _("campaigns.invalid_action"), _("campaigns.invalid_action_message"))
         except Exception as e:
             QMessageBox.critical(self, _("campaigns.error"), f"Error: {str(e)}")
     
@@ -1640,7 +1589,7 @@ class CampaignListWidget(QWidget):
             return
         
         row = selected_rows[0].row()
-        campaign_id = self.campaigns_table.item(row, 0).data(Qt.UserRole)
+        campaign_id = self.campaigns_model.row_id(row)
         
         if not campaign_id:
             QMessageBox.warning(self, _("campaigns.invalid_campaign"), _("campaigns.invalid_campaign_message"))
@@ -1701,8 +1650,8 @@ class CampaignListWidget(QWidget):
             return
         
         row = selected_rows[0].row()
-        campaign_name = self.campaigns_table.item(row, 0).text()
-        campaign_id = self.campaigns_table.item(row, 0).data(Qt.UserRole)
+        campaign_name = self.campaigns_model.row_object(row).name
+        campaign_id = self.campaigns_model.row_id(row)
         
         reply = QMessageBox.question(
             self, 
@@ -1712,24 +1661,30 @@ class CampaignListWidget(QWidget):
         )
         
         if reply == QMessageBox.Yes:
-            try:
-                session = get_session()
-                try:
-                    from ...models import Campaign
-                    from sqlmodel import select
-                    campaign = session.exec(select(Campaign).where(Campaign.id == campaign_id)).first()
-                    if campaign:
-                        campaign.soft_delete()
-                        session.commit()
-                finally:
-                    session.close()
-                
-                self.logger.info(f"Campaign deleted: {campaign_name}")
-                self.load_campaigns()
-                
-            except Exception as e:
-                self.logger.error(f"Error deleting campaign: {e}")
-                QMessageBox.critical(self, "Error", f"Failed to delete campaign: {e}")
+            get_data_access().submit(
+                lambda: self._delete_campaign(campaign_id),
+                on_result=lambda _deleted: self._on_campaign_deleted(campaign_name),
+                on_error=self._on_delete_error
+            )
+    
+    def _delete_campaign(self, campaign_id):
+        """Soft-delete a campaign; runs on the data access pool."""
+        with get_session() as session:
+            campaign = session.get(Campaign, campaign_id)
+            if campaign:
+                campaign.soft_delete()
+                session.commit()
+            return campaign is not None
+    
+    def _on_campaign_deleted(self, campaign_name):
+        """Reload campaigns after a delete."""
+        self.logger.info(f"Campaign deleted: {campaign_name}")
+        self.load_campaigns()
+    
+    def _on_delete_error(self, error):
+        """Report a failed campaign delete."""
+        self.logger.error(f"Error deleting campaign: {error}")
+        QMessageBox.critical(self, "Error", f"Failed to delete campaign: {error}")
     
     def on_language_changed(self, language: str):
         """Handle language change."""
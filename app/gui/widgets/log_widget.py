@@ -5,10 +5,11 @@ Log viewing widgets.
 from typing import Optional, List, Dict, Any
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-    QLabel, QLineEdit, QPushButton, QTableWidget, QTableWidgetItem,
+    QLabel, QLineEdit, QPushButton, QTableView, QAbstractItemView,
+    QPlainTextEdit,
     QHeaderView, QGroupBox, QComboBox, QCheckBox, QSpinBox,
-    QMessageBox, QDialog, QDialogButtonBox, QFormLayout,
-    QTextEdit, QDateTimeEdit, QProgressBar, QTabWidget,
+    QDialog, QDialogButtonBox, QFormLayout,
+    QDateTimeEdit, QProgressBar, QTabWidget,
     QSplitter, QListWidget, QListWidgetItem
 )
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QDateTime, QThread
@@ -16,11 +17,35 @@ from PyQt5.QtGui import QFont, QIcon, QTextCursor, QColor
 
 from ...services import get_logger, get_settings
 from ...services.translation import _, get_translation_manager
+from ...services.log_tail import LogTailer, LogLineBuffer
+from ...services.send_log_query import SendLogFilter, get_send_log_query
+from ...services.data_access import get_data_access
+from ...services.data_export import send_log_source
 from ...models import SendLog, SendStatus
+from ..table_models import KeysetTableModel, TableColumn, StatusColorDelegate
+from ..refresh_scheduler import get_refresh_scheduler
+from ..export_runner import ExportRunner
 import os
 from datetime import datetime, timedelta
 
 
+SEND_STATUS_COLORS = {
+    SendStatus.SENT: QColor(76, 175, 80),  # Green
+    SendStatus.FAILED: QColor(244, 67, 54),  # Red
+    SendStatus.RATE_LIMITED: QColor(255, 152, 0),  # Orange
+    SendStatus.SKIPPED: QColor(33, 150, 243),  # Blue
+    SendStatus.PENDING: QColor(158, 158, 158),  # Gray
+}
+
+SEND_STATUS_ICONS = {
+    SendStatus.SENT: "✅",
+    SendStatus.FAILED: "❌",
+    SendStatus.RATE_LIMITED: "⏰",
+    SendStatus.SKIPPED: "⏭️",
+    SendStatus.PENDING: "⏳",
+}
+
+
 class LogViewer(QWidget):
     """Real-time log viewer widget."""
     
@@ -29,7 +54,6 @@ class LogViewer(QWidget):
         self.logger = get_logger()
         self.settings = get_settings()
         self.translation_manager = get_translation_manager()
-        self.filtered_logs = []  # Initialize filtered logs list
         
         # Connect language change signal
         self.translation_manager.language_changed.connect(self.on_language_changed)
@@ -74,10 +98,11 @@ class LogViewer(QWidget):
         
         layout.addLayout(header_layout)
         
-        # Log display
-        self.log_text = QTextEdit()
+        # Log display (bounded: oldest blocks are dropped past the limit)
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setFont(QFont("Consolas", 9))
+        self.log_text.setMaximumBlockCount(self.settings.log_viewer_max_lines)
         layout.addWidget(self.log_text)
         
         # Status bar
@@ -87,106 +112,73 @@ class LogViewer(QWidget):
     def setup_log_monitoring(self):
         """Set up log file monitoring."""
         self.log_file_path = self.settings.get_log_file_path()
-        self.last_position = 0
+        self.log_buffer = LogLineBuffer(self.settings.log_viewer_max_lines)
+        self.tailer = LogTailer(self.log_file_path)
         
-        # Setup timer for checking log file
-        self.log_timer = QTimer()
-        self.log_timer.timeout.connect(self.check_log_file)
-        self.log_timer.start(1000)  # Check every second
+        # Check the log file every second while the viewer is visible
+        get_refresh_scheduler().register(self, self.check_log_file, interval_ms=1000)
         
         # Load existing logs
         self.load_existing_logs()
     
+    def get_level_filter(self) -> Optional[str]:
+        """Get the selected log level name, or None for all levels."""
+        level_mapping = {
+            _("logs.debug"): "DEBUG",
+            _("logs.info"): "INFO", 
+            _("logs.warning"): "WARNING",
+            _("logs.error"): "ERROR",
+            _("logs.critical"): "CRITICAL"
+        }
+        return level_mapping.get(self.level_combo.currentText())
+    
     def load_existing_logs(self):
-        """Load existing log content."""
+        """Load the tail of the log file into the buffer."""
         try:
-            if self.log_file_path.exists():
-                with open(self.log_file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    self.log_text.setPlainText(content)
-                    self.last_position = len(content)
-                    
-                    # Scroll to bottom
-                    cursor = self.log_text.textCursor()
-                    cursor.movePosition(QTextCursor.End)
-                    self.log_text.setTextCursor(cursor)
+            self.log_buffer.clear()
+            # Roughly enough bytes to fill the buffer without reading the whole file
+            self.tailer.open(tail_bytes=self.settings.log_viewer_max_lines * 200)
+            self.log_buffer.append(self.tailer.poll())
+            self.filter_logs()
         except Exception as e:
             self.logger.error(f"Error loading existing logs: {e}")
     
     def check_log_file(self):
         """Check for new log entries."""
         try:
-            if not self.log_file_path.exists():
+            new_lines = self.tailer.poll()
+            if not new_lines:
                 return
             
-            with open(self.log_file_path, 'r', encoding='utf-8') as f:
-                f.seek(self.last_position)
-                new_content = f.read()
+            level = self.get_level_filter()
+            parsed = self.log_buffer.append(new_lines)
+            visible = [text for line_level, text in parsed if level is None or line_level == level]
+            
+            if visible:
+                self.log_text.appendPlainText('\n'.join(visible))
                 
-                if new_content:
-                    # Filter by level if not "All"
-                    level_filter = self.level_combo.currentText()
-                    if level_filter != _("logs.all"):
-                        filtered_lines = []
-                        for line in new_content.split('\n'):
-                            if level_filter in line:
-                                filtered_lines.append(line)
-                        new_content = '\n'.join(filtered_lines)
-                    
-                    if new_content.strip():
-                        # Append new content
-                        self.log_text.append(new_content)
-                        self.last_position = f.tell()
-                        
-                        # Auto-scroll if enabled
-                        if self.auto_scroll_check.isChecked():
-                            self.scroll_to_bottom()
-                        
-                        # Update status
-                        self.status_label.setText(f"Last updated: {datetime.now().strftime('%H:%M:%S')}")
+                # Auto-scroll if enabled
+                if self.auto_scroll_check.isChecked():
+                    self.scroll_to_bottom()
+                
+                # Update status
+                self.status_label.setText(f"Last updated: {datetime.now().strftime('%H:%M:%S')}")
         
         except Exception as e:
             self.logger.error(f"Error checking log file: {e}")
     
     def filter_logs(self):
-        """Filter logs by level."""
+        """Filter buffered logs by level."""
         try:
-            if not self.log_file_path.exists():
-                return
-            
-            level = self.level_combo.currentText()
-            
-            with open(self.log_file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            if level == _("logs.all"):
-                # Show all logs
-                self.log_text.setPlainText(content)
-            else:
-                # Filter by level - map UI level names to log level names
-                level_mapping = {
-                    _("logs.debug"): "DEBUG",
-                    _("logs.info"): "INFO", 
-                    _("logs.warning"): "WARNING",
-                    _("logs.error"): "ERROR",
-                    _("logs.critical"): "CRITICAL"
-                }
-                
-                log_level = level_mapping.get(level, level)
-                filtered_lines = []
-                for line in content.split('\n'):
-                    if log_level in line:
-                        filtered_lines.append(line)
-                self.log_text.setPlainText('\n'.join(filtered_lines))
+            level = self.get_level_filter()
+            self.log_text.setPlainText('\n'.join(self.log_buffer.lines(level)))
             
             # Auto-scroll to bottom if enabled
             if self.auto_scroll_check.isChecked():
-                cursor = self.log_text.textCursor()
-                cursor.movePosition(QTextCursor.End)
-                self.log_text.setTextCursor(cursor)
+                self.scroll_to_bottom()
             
             # Update status
-            self.status_label.setText(f"Filtered by level: {level}")
+            self.status_label.setText(f"Filtered by level: {self.level_combo.currentText()}")
             
         except Exception as e:
             self.logger.error(f"Error filtering logs: {e}")
@@ -207,15 +199,15 @@ class LogViewer(QWidget):
             if self.log_file_path.exists():
                 with open(self.log_file_path, 'w', encoding='utf-8') as f:
                     f.write("")  # Clear the file
-                self.last_position = 0  # Reset position to beginning
+                self.tailer.open()  # Follow from the (now empty) start
         except Exception as e:
             self.logger.error(f"Error clearing log file: {e}")
         
         # Reset filter to "All" to show all new logs
         self.level_combo.setCurrentText(_("logs.all"))
         
-        # Clear the filtered logs list to reset filtering
-        self.filtered_logs = []
+        # Drop buffered lines so filtering starts fresh
+        self.log_buffer.clear()
         
         self.status_label.setText("Logs cleared - file and display cleared")
     
@@ -245,6 +237,7 @@ class SendLogWidget(QWidget):
         super().__init__(parent)
         self.logger = get_logger()
         self.translation_manager = get_translation_manager()
+        self.query_service = get_send_log_query()
         self.campaigns_loaded = False  # Flag to prevent duplicate campaign loading
         self.updating_campaigns = False  # Flag to prevent signal loops
         
@@ -382,12 +375,14 @@ class SendLogWidget(QWidget):
                 border-color: #2196F3;
             }
         """)
+        self.from_date_edit.dateTimeChanged.connect(self.filter_logs)
         filters_layout.addWidget(self.from_date_edit)
         
         self.to_date_edit = QDateTimeEdit()
         self.to_date_edit.setDateTime(QDateTime.currentDateTime())
         self.to_date_edit.setCalendarPopup(True)
         self.to_date_edit.setStyleSheet(self.from_date_edit.styleSheet())
+        self.to_date_edit.dateTimeChanged.connect(self.filter_logs)
         filters_layout.addWidget(self.to_date_edit)
         
         filters_layout.addStretch()
@@ -485,16 +480,22 @@ class SendLogWidget(QWidget):
         layout.addWidget(search_widget)
         
         # Send logs table
-        self.logs_table = QTableWidget()
-        self.logs_table.setColumnCount(8)
-        self.logs_table.setHorizontalHeaderLabels([
-            _("logs.timestamp"), _("logs.campaign"), _("logs.account"), _("logs.recipient"), _("logs.status"), 
-            _("logs.error_message"), _("logs.duration"), _("logs.retry_count")
-        ])
+        self.logs_table = QTableView()
+        self.logs_model = KeysetTableModel(
+            self._create_log_columns(),
+            fetch_page=lambda after, limit: self.query_service.fetch_page(self.get_current_filters(), after, limit),
+            cursor=lambda row: row.cursor,
+            parent=self
+        )
+        self.logs_model.rowsInserted.connect(lambda *_: self.update_log_count())
+        self.logs_model.rows_loaded.connect(self.update_log_count)
+        self.logs_table.setModel(self.logs_model)
+        self.logs_table.setItemDelegateForColumn(4, StatusColorDelegate(SEND_STATUS_COLORS, self.logs_table))
+        self.logs_table.verticalHeader().setVisible(False)
         
         # Enhanced table styling
         self.logs_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #1a1a1a;
                 alternate-background-color: #2d2d2d;
                 gridline-color: #404040;
@@ -504,15 +505,15 @@ class SendLogWidget(QWidget):
                 selection-background-color: #2196F3;
                 selection-color: #ffffff;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 12px 8px;
                 border: none;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #2196F3 !important;
                 color: #ffffff !important;
             }
-            QTableWidget::item:alternate:selected {
+            QTableView::item:alternate:selected {
                 background-color: #2196F3 !important;
                 color: #ffffff !important;
             }
@@ -545,10 +546,9 @@ class SendLogWidget(QWidget):
         header.setSectionResizeMode(6, QHeaderView.ResizeToContents) # Duration
         header.setSectionResizeMode(7, QHeaderView.ResizeToContents) # Retry Count
         
-        self.logs_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.logs_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.logs_table.setAlternatingRowColors(True)
-        self.logs_table.setSelectionMode(QTableWidget.SingleSelection)
-        self.logs_table.setSortingEnabled(True)
+        self.logs_table.setSelectionMode(QAbstractItemView.SingleSelection)
         
         layout.addWidget(self.logs_table)
         
@@ -567,6 +567,9 @@ class SendLogWidget(QWidget):
         self.status_label = QLabel(f"📋 {_('logs.ready_no_logs')}")
         self.status_label.setStyleSheet("color: #cccccc; font-size: 11px;")
         status_layout.addWidget(self.status_label)
+        self.export_runner = ExportRunner(
+            self, "Export Send Logs", "send_logs", self.status_label, self.export_button
+        )
         
         status_layout.addStretch()
         
@@ -577,158 +580,61 @@ class SendLogWidget(QWidget):
         
         layout.addWidget(status_widget)
     
+    def _create_log_columns(self) -> List[TableColumn]:
+        """Create column definitions for the send logs table."""
+        return [
+            TableColumn(_("logs.timestamp"), lambda log: log.created_at.strftime("%Y-%m-%d %H:%M:%S")),
+            TableColumn(_("logs.campaign"), lambda log: log.campaign_name or "Unknown"),
+            TableColumn(_("logs.account"), lambda log: log.account_name or "Unknown"),
+            TableColumn(_("logs.recipient"), lambda log: log.get_recipient_text()),
+            TableColumn(
+                _("logs.status"),
+                lambda log: f"{SEND_STATUS_ICONS.get(log.status, '')} {log.status.value.title()}".strip(),
+                alignment=Qt.AlignCenter,
+                status=lambda log: log.status
+            ),
+            TableColumn(_("logs.error_message"), lambda log: log.get_error_summary()),
+            TableColumn(_("logs.duration"), lambda log: str(log.duration_ms) if log.duration_ms else "N/A"),
+            TableColumn(_("logs.retry_count"), lambda log: str(log.retry_count)),
+        ]
+    
+    def get_current_filters(self) -> SendLogFilter:
+        """Build send log filters from the current UI state."""
+        # Map UI status names to enum values
+        status_mapping = {
+            _("logs.sent"): "sent",
+            _("logs.failed"): "failed", 
+            _("logs.rate_limited"): "rate_limited",
+            _("logs.skipped"): "skipped",
+            _("logs.pending"): "pending"
+        }
+        campaign_filter = self.campaign_combo.currentText()
+        
+        return SendLogFilter(
+            status=status_mapping.get(self.status_combo.currentText()),
+            campaign_name=campaign_filter if campaign_filter != _("logs.all") else None,
+            date_from=self.from_date_edit.dateTime().toPyDateTime(),
+            date_to=self.to_date_edit.dateTime().toPyDateTime(),
+            search_text=self.search_edit.text().strip() or None
+        )
+    
     def load_send_logs(self):
         """Load send logs from database."""
         try:
-            from ...services.db import get_session
-            from ...models import SendLog, Campaign, Account
-            from sqlmodel import select, and_
-            
-            session = get_session()
-            try:
-                # Build query with filters and eager loading
-                from sqlalchemy.orm import selectinload
-                
-                query = select(SendLog).options(
-                    selectinload(SendLog.campaign),
-                    selectinload(SendLog.account),
-                    selectinload(SendLog.recipient)
+            # Update campaign combo with available campaigns (only if not already loaded)
+            if not self.campaigns_loaded:
+                self.logger.debug("Updating campaign combo - not loaded yet")
+                get_data_access().submit(
+                    self._load_campaign_names,
+                    on_result=self.update_campaign_combo,
+                    on_error=lambda e: self.logger.error(f"Error updating campaign combo: {e}"),
+                    key="log_campaign_names"
                 )
-                
-                # Status filter
-                status_filter = self.status_combo.currentText()
-                if status_filter != _("logs.all"):
-                    # Map UI status names to enum values
-                    status_mapping = {
-                        _("logs.sent"): "sent",
-                        _("logs.failed"): "failed", 
-                        _("logs.rate_limited"): "rate_limited",
-                        _("logs.skipped"): "skipped",
-                        _("logs.pending"): "pending"
-                    }
-                    if status_filter in status_mapping:
-                        query = query.where(SendLog.status == status_mapping[status_filter])
-                
-                # Date range filter
-                from_date = self.from_date_edit.dateTime().toPyDateTime()
-                to_date = self.to_date_edit.dateTime().toPyDateTime()
-                query = query.where(and_(SendLog.created_at >= from_date, SendLog.created_at <= to_date))
-                
-                # Campaign filter
-                campaign_filter = self.campaign_combo.currentText()
-                if campaign_filter != _("logs.all"):
-                    query = query.join(Campaign).where(Campaign.name == campaign_filter)
-                
-                # Execute query and load all data within session
-                logs = session.exec(query.order_by(SendLog.created_at.desc()).limit(1000)).all()
-                
-                # Update campaign combo with available campaigns (only if not already loaded)
-                if not self.campaigns_loaded:
-                    self.logger.debug("Updating campaign combo - not loaded yet")
-                    self.update_campaign_combo(session)
-                else:
-                    self.logger.debug("Campaign combo already loaded, skipping update")
-                
-                # Process logs within session context
-                self.logs_table.setRowCount(len(logs))
-                
-                for row, log in enumerate(logs):
-                    # Timestamp
-                    timestamp = log.created_at.strftime("%Y-%m-%d %H:%M:%S")
-                    timestamp_item = QTableWidgetItem(timestamp)
-                    timestamp_item.setFlags(timestamp_item.flags() & ~Qt.ItemIsEditable)
-                    self.logs_table.setItem(row, 0, timestamp_item)
-                    
-                    # Campaign - access within session
-                    campaign_name = "Unknown"
-                    if log.campaign:
-                        campaign_name = log.campaign.name
-                    campaign_item = QTableWidgetItem(campaign_name)
-                    campaign_item.setFlags(campaign_item.flags() & ~Qt.ItemIsEditable)
-                    self.logs_table.setItem(row, 1, campaign_item)
-                    
-                    # Account - access within session
-                    account_name = "Unknown"
-                    if log.account:
-                        account_name = log.account.name
-                    account_item = QTableWidgetItem(account_name)
-                    account_item.setFlags(account_item.flags() & ~Qt.ItemIsEditable)
-                    self.logs_table.setItem(row, 2, account_item)
-                    
-                    # Recipient - access within session
-                    recipient_info = f"ID: {log.recipient_id}"
-                    if log.recipient:
-                        recipient_info = log.recipient.get_display_name()
-                    recipient_item = QTableWidgetItem(recipient_info)
-                    recipient_item.setFlags(recipient_item.flags() & ~Qt.ItemIsEditable)
-                    self.logs_table.setItem(row, 3, recipient_item)
-                    
-                    # Status with enhanced styling
-                    status_text = log.status.value.title()
-                    status_item = QTableWidgetItem(status_text)
-                    status_item.setTextAlignment(Qt.AlignCenter)
-                    status_item.setFlags(status_item.flags() & ~Qt.ItemIsEditable)
-                    
-                    # Enhanced status styling
-                    if log.status == SendStatus.SENT:
-                        status_item.setBackground(QColor(76, 175, 80))  # Green
-                        status_item.setForeground(QColor(255, 255, 255))  # White text
-                        status_text = f"✅ {status_text}"
-                    elif log.status == SendStatus.FAILED:
-                        status_item.setBackground(QColor(244, 67, 54))  # Red
-                        status_item.setForeground(QColor(255, 255, 255))  # White text
-                        status_text = f"❌ {status_text}"
-                    elif log.status == SendStatus.RATE_LIMITED:
-                        status_item.setBackground(QColor(255, 152, 0))  # Orange
-                        status_item.setForeground(QColor(255, 255, 255))  # White text
-                        status_text = f"⏰ {status_text}"
-                    elif log.status == SendStatus.SKIPPED:
-                        status_item.setBackground(QColor(33, 150, 243))  # Blue
-                        status_item.setForeground(QColor(255, 255, 255))  # White text
-                        status_text = f"⏭️ {status_text}"
-                    elif log.status == SendStatus.PENDING:
-                        status_item.setBackground(QColor(158, 158, 158))  # Gray
-                        status_item.setForeground(QColor(255, 255, 255))  # White text
-                        status_text = f"⏳ {status_text}"
-                    
-                    status_item.setText(status_text)
-                    self.logs_table.setItem(row, 4, status_item)
-                    
-                    # Error message
-                    error_msg = log.get_error_summary() if log.error_message else ""
-                    error_item = QTableWidgetItem(error_msg)
-                    error_item.setFlags(error_item.flags() & ~Qt.ItemIsEditable)
-                    self.logs_table.setItem(row, 5, error_item)
-                    
-                    # Duration
-                    duration = str(log.duration_ms) if log.duration_ms else "N/A"
-                    duration_item = QTableWidgetItem(duration)
-                    duration_item.setFlags(duration_item.flags() & ~Qt.ItemIsEditable)
-                    self.logs_table.setItem(row, 6, duration_item)
-                    
-                    # Retry count
-                    retry_item = QTableWidgetItem(str(log.retry_count))
-                    retry_item.setFlags(retry_item.flags() & ~Qt.ItemIsEditable)
-                    self.logs_table.setItem(row, 7, retry_item)
-                
-            finally:
-                session.close()
-            
-            # Update status and count
-            log_count = len(logs)
-            self.status_label.setText(f"📋 {_('logs.loaded_successfully').format(count=log_count)}")
-            self.log_count_label.setText(f"{log_count} {_('logs.logs')}")
-            
-            # Update status indicator
-            if log_count > 0:
-                self.status_indicator.setText("🟢 Active")
-                self.status_indicator.setStyleSheet("color: #4CAF50; font-weight: bold;")
             else:
-                self.status_indicator.setText("🟡 No Data")
-                self.status_indicator.setStyleSheet("color: #FF9800; font-weight: bold;")
+                self.logger.debug("Campaign combo already loaded, skipping update")
             
-            # Apply search filter if there's search text
-            self.filter_logs_by_search()
+            # Only the first page is queried; further pages load as the view scrolls
+            self.logs_model.reload()
             
         except Exception as e:
             self.logger.error(f"Error loading send logs: {e}")
@@ -737,6 +643,21 @@ class SendLogWidget(QWidget):
             self.status_indicator.setText("🔴 Error")
             self.status_indicator.setStyleSheet("color: #F44336; font-weight: bold;")
     
+    def update_log_count(self):
+        """Update status labels with the number of loaded logs."""
+        log_count = self.logs_model.loaded_count()
+        more = "+" if self.logs_model.canFetchMore() else ""
+        self.status_label.setText(f"📋 {_('logs.loaded_successfully').format(count=f'{log_count}{more}')}")
+        self.log_count_label.setText(f"{log_count}{more} {_('logs.logs')}")
+        
+        # Update status indicator
+        if log_count > 0:
+            self.status_indicator.setText("🟢 Active")
+            self.status_indicator.setStyleSheet("color: #4CAF50; font-weight: bold;")
+        else:
+            self.status_indicator.setText("🟡 No Data")
+            self.status_indicator.setStyleSheet("color: #FF9800; font-weight: bold;")
+    
     def refresh_send_logs(self):
         """Refresh send logs."""
         self.load_send_logs()
@@ -746,52 +667,31 @@ class SendLogWidget(QWidget):
         if not self.updating_campaigns:
             self.load_send_logs()
     
-    def filter_logs_by_search(self):
-        """Filter logs based on search text."""
-        search_text = self.search_edit.text().lower().strip()
-        
-        if not search_text:
-            # Show all logs
-            for row in range(self.logs_table.rowCount()):
-                self.logs_table.setRowHidden(row, False)
-            return
-        
-        # Filter logs (exclude Actions column - column 7)
-        for row in range(self.logs_table.rowCount()):
-            should_show = False
-            
-            # Check all columns except Actions column for search text
-            for col in range(self.logs_table.columnCount() - 1):  # Exclude last column (Actions)
-                item = self.logs_table.item(row, col)
-                if item and search_text in item.text().lower():
-                    should_show = True
-                    break
-            
-            self.logs_table.setRowHidden(row, not should_show)
-    
     def refresh_campaigns(self):
         """Refresh campaign list from database."""
         self.campaigns_loaded = False
         self.load_send_logs()
     
-    def update_campaign_combo(self, session):
+    def _load_campaign_names(self):
+        """Load campaign names for the filter combo; runs on the data access pool."""
+        from sqlmodel import select
+        from ...models import Campaign
+        from ...services.db import get_session
+        with get_session() as session:
+            return list(session.exec(select(Campaign.name).order_by(Campaign.name)).all())
+    
+    def update_campaign_combo(self, campaign_names):
         """Update campaign combo with available campaigns."""
         try:
-            from sqlmodel import select
-            from ...models import Campaign
-            
             # Set flag to prevent signal loops
             self.updating_campaigns = True
             
-            # Get all campaigns
-            campaigns = session.exec(select(Campaign).order_by(Campaign.name)).all()
-            
             # Store current selection
             current_selection = self.campaign_combo.currentText()
             
             # Get current items to avoid unnecessary updates
             current_items = [self.campaign_combo.itemText(i) for i in range(self.campaign_combo.count())]
-            expected_items = [_("logs.all")] + [campaign.name for campaign in campaigns if campaign.name]
+            expected_items = [_("logs.all")] + [name for name in campaign_names if name]
             
             # Only update if the items have changed
             if set(current_items) != set(expected_items):
@@ -801,10 +701,10 @@ class SendLogWidget(QWidget):
                 
                 # Add unique campaigns only
                 seen_campaigns = set()
-                for campaign in campaigns:
-                    if campaign.name and campaign.name not in seen_campaigns:
-                        self.campaign_combo.addItem(campaign.name)
-                        seen_campaigns.add(campaign.name)
+                for name in campaign_names:
+                    if name and name not in seen_campaigns:
+                        self.campaign_combo.addItem(name)
+                        seen_campaigns.add(name)
                 
                 # Restore selection if it still exists
                 if current_selection in [self.campaign_combo.itemText(i) for i in range(self.campaign_combo.count())]:
@@ -826,52 +726,8 @@ class SendLogWidget(QWidget):
             self.updating_campaigns = False
 
     def export_logs(self):
-        """Export logs to CSV."""
-        try:
-            from PyQt5.QtWidgets import QFileDialog
-            import csv
-            
-            file_path, _ = QFileDialog.getSaveFileName(
-                self,
-                "Export Send Logs",
-                f"send_logs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                "CSV Files (*.csv)"
-            )
-            
-            if file_path:
-                with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                    writer = csv.writer(csvfile)
-                    
-                    # Write header
-                    writer.writerow([
-                        "Timestamp", "Campaign", "Account", "Recipient", "Status",
-                        "Error Message", "Duration (ms)", "Retry Count"
-                    ])
-                    
-                    # Write data
-                    for row in range(self.logs_table.rowCount()):
-                        row_data = []
-                        for col in range(self.logs_table.columnCount()):
-                            item = self.logs_table.item(row, col)
-                            row_data.append(item.text() if item else "")
-                        writer.writerow(row_data)
-                
-                exported_count = self.logs_table.rowCount()
-                self.logger.info(f"Send logs exported to: {file_path}")
-                
-                # Update status
-                self.status_label.setText(f"📊 {_('logs.exported_successfully').format(count=exported_count)}")
-                
-                QMessageBox.information(
-                    self, 
-                    _("logs.export_successful"), 
-                    _("logs.exported_successfully").format(count=exported_count)
-                )
-        
-        except Exception as e:
-            self.logger.error(f"Error exporting logs: {e}")
-            self.status_label.setText(f"❌ Export failed: {str(e)[:30]}...")
-            QMessageBox.critical(self, _("logs.export_failed"), _("logs.export_failed").format(error=str(e)))
+        """Export all logs matching the current filters in the background."""
+        self.export_runner.run(lambda: send_log_source(self.get_current_filters()))
     
     def on_language_changed(self, language: str):
         """Handle language change."""
@@ -883,10 +739,7 @@ class SendLogWidget(QWidget):
         self.export_button.setText(f"📊 {_('logs.export_logs')}")
         
         # Update table headers
-        self.logs_table.setHorizontalHeaderLabels([
-            _("logs.timestamp"), _("logs.campaign"), _("logs.account"), _("logs.recipient"), _("logs.status"), 
-            _("logs.error_message"), _("logs.duration"), _("logs.retry_count")
-        ])
+        self.logs_model.set_headers([column.header for column in self._create_log_columns()])
         
         # Update status bar
         self.status_label.setText(f"📋 {_('logs.ready_no_logs')}")
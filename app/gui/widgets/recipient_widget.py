@@ -6,21 +6,35 @@ from typing import Optional, List, Dict, Any
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QLineEdit, QPushButton, QTableWidget, QTableWidgetItem,
+    QTableView, QAbstractItemView,
     QHeaderView, QGroupBox, QComboBox, QCheckBox, QSpinBox,
     QMessageBox, QDialog, QDialogButtonBox, QFormLayout,
     QTextEdit, QFileDialog, QProgressBar, QTabWidget
 )
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QFont, QIcon, QColor
+from sqlmodel import select
 
 from ...models import Recipient, RecipientList, RecipientSource, RecipientStatus, RecipientType
-from ...services import get_logger
+from ...services import get_logger, get_recipient_search, get_change_bus, ChangeSet
 from ...services.db import get_session
+from ...services.data_access import get_data_access
 from ...services.translation import _, get_translation_manager
+from ...services.data_export import recipient_source
+from ..table_models import PagedTableModel, TableColumn, StatusColorDelegate
+from ..export_runner import ExportRunner
+from ..refresh_scheduler import get_refresh_scheduler
 import csv
 import pandas as pd
 
 
+RECIPIENT_STATUS_COLORS = {
+    RecipientStatus.ACTIVE: QColor(34, 197, 94),  # Green
+    RecipientStatus.BLOCKED: QColor(239, 68, 68),  # Red
+    RecipientStatus.INACTIVE: QColor(107, 114, 128),  # Gray
+}
+
+
 class RecipientDialog(QDialog):
     """Dialog for adding/editing recipients."""
     
@@ -451,9 +465,10 @@ class CSVImportDialog(QDialog):
         
         # Buttons
         buttons = QDialogButtonBox(
-            QDialogButtonBox.Import | QDialogButtonBox.Cancel
+            QDialogButtonBox.Ok | QDialogButtonBox.Cancel
         )
-        buttons.button(QDialogButtonBox.Import).setText("Import")
+        self.import_button = buttons.button(QDialogButtonBox.Ok)
+        self.import_button.setText("Import")
         buttons.accepted.connect(self.import_recipients)
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
@@ -521,78 +536,141 @@ class CSVImportDialog(QDialog):
             QMessageBox.warning(self, "Error", f"Failed to load preview: {e}")
     
     def import_recipients(self):
-        """Import recipients from CSV."""
-        try:
-            file_path = self.file_path_edit.text()
-            if not file_path:
-                QMessageBox.warning(self, "No File", "Please select a CSV file first")
-                return
-            
-            # Check if all required mappings are set
-            required_columns = ["username", "user_id", "phone_number"]
-            has_identifier = False
-            
-            for col in required_columns:
-                if self.column_mappings[col].currentText() != "-- Select Column --":
-                    has_identifier = True
-                    break
-            
-            if not has_identifier:
-                QMessageBox.warning(self, "Mapping Error", "Please map at least one identifier column (username, user_id, or phone_number)")
-                return
+        """Import recipients from CSV on the data access pool."""
+        file_path = self.file_path_edit.text()
+        if not file_path:
+            QMessageBox.warning(self, "No File", "Please select a CSV file first")
+            return
+        
+        # Check if all required mappings are set
+        required_columns = ["username", "user_id", "phone_number"]
+        has_identifier = False
+        
+        for col in required_columns:
+            if self.column_mappings[col].currentText() != "-- Select Column --":
+                has_identifier = True
+                break
+        
+        if not has_identifier:
+            QMessageBox.warning(self, "Mapping Error", "Please map at least one identifier column (username, user_id, or phone_number)")
+            return
+        
+        # Read the combos here; the import itself runs off the GUI thread
+        mappings = {
+            field: combo.currentText() for field, combo in self.column_mappings.items()
+            if combo.currentText() != "-- Select Column --"
+        }
+        self.import_button.setEnabled(False)
+        get_data_access().submit(
+            lambda: self._import_csv(file_path, mappings),
+            on_result=self._on_imported,
+            on_error=self._on_import_error
+        )
+    
+    def _import_csv(self, file_path: str, mappings: Dict[str, str]):
+        """Read, dedupe and store recipients from a CSV file; runs on the data access pool."""
+        required_columns = ["username", "user_id", "phone_number"]
+        
+        # Read CSV
+        df = pd.read_csv(file_path)
+        
+        # Create recipients
+        recipients = []
+        for _, row in df.iterrows():
+            recipient_data = {}
             
-            # Read CSV
-            df = pd.read_csv(file_path)
+            # Map columns
+            for field, column in mappings.items():
+                value = row[column]
+                if pd.notna(value) and str(value).strip():
+                    recipient_data[field] = str(value).strip()
             
-            # Create recipients
-            recipients = []
-            for _, row in df.iterrows():
-                recipient_data = {}
-                
-                # Map columns
-                for field, combo in self.column_mappings.items():
-                    if combo.currentText() != "-- Select Column --":
-                        value = row[combo.currentText()]
-                        if pd.notna(value) and str(value).strip():
-                            recipient_data[field] = str(value).strip()
+            # Create recipient if has at least one identifier
+            if any(recipient_data.get(field) for field in required_columns):
+                recipient = Recipient(
+                    username=recipient_data.get("username"),
+                    user_id=int(recipient_data["user_id"]) if recipient_data.get("user_id") and recipient_data["user_id"].isdigit() else None,
+                    phone_number=recipient_data.get("phone_number"),
+                    first_name=recipient_data.get("first_name"),
+                    last_name=recipient_data.get("last_name"),
+                    email=recipient_data.get("email"),
+                    bio=recipient_data.get("bio"),
+                    source=RecipientSource.CSV_IMPORT
+                )
                 
-                # Create recipient if has at least one identifier
-                if any(recipient_data.get(field) for field in required_columns):
-                    recipient = Recipient(
-                        username=recipient_data.get("username"),
-                        user_id=int(recipient_data["user_id"]) if recipient_data.get("user_id") and recipient_data["user_id"].isdigit() else None,
-                        phone_number=recipient_data.get("phone_number"),
-                        first_name=recipient_data.get("first_name"),
-                        last_name=recipient_data.get("last_name"),
-                        email=recipient_data.get("email"),
-                        bio=recipient_data.get("bio"),
-                        source=RecipientSource.CSV_IMPORT
-                    )
-                    
-                    # Set tags using proper JSON serialization
-                    if recipient_data.get("tags"):
-                        tags_list = [tag.strip() for tag in recipient_data["tags"].split(",") if tag.strip()]
-                        recipient.set_tags_list(tags_list)
-                    else:
-                        recipient.set_tags_list([])
-                    recipients.append(recipient)
-            
-            # Save to database
-            session = get_session()
-            try:
-                session.add_all(recipients)
-                session.commit()
-            finally:
-                session.close()
-            
-            self.logger.info(f"Imported {len(recipients)} recipients from CSV")
-            self.recipients_imported.emit(recipients)
-            QMessageBox.information(self, "Import Complete", f"Successfully imported {len(recipients)} recipients")
-            self.accept()
+                # Set tags using proper JSON serialization
+                if recipient_data.get("tags"):
+                    tags_list = [tag.strip() for tag in recipient_data["tags"].split(",") if tag.strip()]
+                    recipient.set_tags_list(tags_list)
+                else:
+                    recipient.set_tags_list([])
+                recipients.append(recipient)
         
-        except Exception as e:
-            self.logger.error(f"Error importing recipients: {e}")
-            QMessageBox.critical(self, "Import Error", f"Failed to import recipients: {e}")
+        # Save to database, skipping recipients already stored or repeated in the file
+        session = get_session()
+        try:
+            parsed = len(recipients)
+            recipients = self._new_recipients(session, recipients)
+            session.add_all(recipients)
+            session.commit()
+        finally:
+            session.close()
+        return recipients, parsed - len(recipients)
+    
+    def _on_imported(self, result):
+        """Report a finished CSV import and close the dialog."""
+        recipients, skipped = result
+        self.logger.info(f"Imported {len(recipients)} recipients from CSV ({skipped} duplicates skipped)")
+        self.recipients_imported.emit(recipients)
+        message = f"Successfully imported {len(recipients)} recipients"
+        if skipped:
+            message += f"\n{skipped} duplicates were skipped"
+        QMessageBox.information(self, "Import Complete", message)
+        self.accept()
+    
+    def _on_import_error(self, error):
+        """Report a failed CSV import and let the user try again."""
+        self.logger.error(f"Error importing recipients: {error}")
+        self.import_button.setEnabled(True)
+        QMessageBox.critical(self, "Import Error", f"Failed to import recipients: {error}")
+
+    @staticmethod
+    def _new_recipients(session, recipients: List[Recipient]) -> List[Recipient]:
+        """Drop recipients whose identifier is already stored or appears earlier in the list."""
+        by_identifier = {}
+        for recipient in recipients:
+            by_identifier.setdefault(recipient.get_identifier(), recipient)
+        identifiers = list(by_identifier)
+        for start in range(0, len(identifiers), 500):
+            chunk = identifiers[start:start + 500]
+            existing = session.exec(
+                select(Recipient.identifier).where(Recipient.is_deleted == False, Recipient.identifier.in_(chunk))
+            ).all()
+            for identifier in existing:
+                by_identifier.pop(identifier, None)
+        return list(by_identifier.values())
+
+
+class RecipientTableModel(PagedTableModel):
+    """Paged recipient model that searches through the FTS5 index."""
+    
+    def __init__(self, columns, **kwargs):
+        super().__init__(Recipient, columns, **kwargs)
+        self.search_index = get_recipient_search()
+    
+    def build_search_condition(self, text: str):
+        """Match recipients via the FTS index, falling back to LIKE."""
+        if not self.search_index.is_available():
+            return super().build_search_condition(text)
+        return self.search_index.match_condition(text)
+    
+    def build_order_by(self):
+        """Order search results by relevance unless a column sort is active."""
+        if (self._search_text and self._sort_column is None
+                and self.search_index.is_available()
+                and self.search_index.build_match_query(self._search_text)):
+            return [self.search_index.rank_column(), Recipient.id]
+        return super().build_order_by()
 
 
 class RecipientListWidget(QWidget):
@@ -612,10 +690,10 @@ class RecipientListWidget(QWidget):
         self.setup_ui()
         self.load_recipients()
         
-        # Setup refresh timer
-        self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self.refresh_recipients)
-        self.refresh_timer.start(30000)  # Refresh every 30 seconds
+        # Reload rows only when the recipients table changes, and only while visible
+        self._pending_changes = ChangeSet()
+        get_refresh_scheduler().register(self, self._apply_refresh, prepare=self._prepare_refresh)
+        get_change_bus().entities_changed.connect(self.on_data_changed)
     
     def setup_ui(self):
         """Set up the UI."""
@@ -638,8 +716,9 @@ class RecipientListWidget(QWidget):
         self.import_button.clicked.connect(self.import_csv)
         header_layout.addWidget(self.import_button)
         
-        self.export_button = QPushButton("Export CSV")
-        self.export_button.clicked.connect(self.export_csv)
+        self.export_button = QPushButton("Export")
+        self.export_button.setToolTip("Export the recipients matching the search to CSV, JSON Lines or Parquet")
+        self.export_button.clicked.connect(self.export_recipients)
         header_layout.addWidget(self.export_button)
         
         self.edit_button = QPushButton("Edit Recipient")
@@ -672,11 +751,14 @@ class RecipientListWidget(QWidget):
         layout.addLayout(search_layout)
         
         # Recipients table
-        self.recipients_table = QTableWidget()
-        self.recipients_table.setColumnCount(8)
-        self.recipients_table.setHorizontalHeaderLabels([
-            "Type", "Display Name", "Username/Group", "ID", "Phone", "Source", "Status", "Messages"
-        ])
+        self.recipients_table = QTableView()
+        self.recipients_model = self._create_recipients_model()
+        self.recipients_model.rows_loaded.connect(self.on_rows_loaded)
+        self.recipients_table.setModel(self.recipients_model)
+        self.recipients_table.setItemDelegateForColumn(6, StatusColorDelegate(RECIPIENT_STATUS_COLORS, self.recipients_table))
+        self.recipients_table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.recipients_table.setSortingEnabled(True)
+        self.recipients_table.verticalHeader().setVisible(False)
         
         # Configure table
         header = self.recipients_table.horizontalHeader()
@@ -689,14 +771,14 @@ class RecipientListWidget(QWidget):
         header.setSectionResizeMode(6, QHeaderView.ResizeToContents)  # Status
         header.setSectionResizeMode(7, QHeaderView.ResizeToContents)  # Messages
         
-        self.recipients_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.recipients_table.setSelectionMode(QTableWidget.SingleSelection)
+        self.recipients_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.recipients_table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.recipients_table.setAlternatingRowColors(True)
-        self.recipients_table.itemSelectionChanged.connect(self.on_selection_changed)
+        self.recipients_table.selectionModel().selectionChanged.connect(lambda *_: self.on_selection_changed())
         
         # Set custom styling for black and gray alternating rows
         self.recipients_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 alternate-background-color: #2d2d2d;
                 background-color: #1a1a1a;
                 gridline-color: #404040;
@@ -704,136 +786,124 @@ class RecipientListWidget(QWidget):
                 selection-background-color: #0078d4;
                 selection-color: white;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 8px;
                 border: none;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #0078d4 !important;
                 color: white !important;
             }
-            QTableWidget::item:alternate {
+            QTableView::item:alternate {
                 background-color: #2d2d2d;
             }
-            QTableWidget::item:alternate:selected {
+            QTableView::item:alternate:selected {
                 background-color: #0078d4 !important;
                 color: white !important;
             }
         """)
         
         # Connect cell clicked signal for actions
-        self.recipients_table.cellClicked.connect(self.on_cell_clicked)
+        self.recipients_table.clicked.connect(lambda index: self.on_cell_clicked(index.row(), index.column()))
         
         layout.addWidget(self.recipients_table)
         
         # Status bar
         self.status_label = QLabel("Ready")
         layout.addWidget(self.status_label)
+        
+        self.export_runner = ExportRunner(self, "Export Recipients", "recipients", self.status_label, self.export_button)
+    
+    def _create_recipients_model(self) -> PagedTableModel:
+        """Create the paged model backing the recipients table."""
+        center = Qt.AlignCenter
+        columns = [
+            TableColumn("Type", self._get_type_text, Recipient.recipient_type, center),
+            TableColumn("Display Name", lambda r: r.get_display_name(), Recipient.display_label),
+            TableColumn("Username/Group", self._get_username_text, None),
+            TableColumn("ID", self._get_id_text, None, center),
+            TableColumn(
+                "Phone",
+                lambda r: (r.phone_number or "") if r.recipient_type.value == "USER" else "",
+                Recipient.phone_number, center
+            ),
+            TableColumn("Source", lambda r: r.source.value.title(), Recipient.source, center),
+            TableColumn("Status", lambda r: r.status.value.title(), Recipient.status, center, lambda r: r.status),
+            TableColumn(
+                "Messages",
+                lambda r: f"{r.total_messages_sent}/{r.total_messages_sent + r.total_messages_failed}",
+                Recipient.total_messages_sent, center
+            ),
+        ]
+        return RecipientTableModel(
+            columns,
+            base_filters=[Recipient.is_deleted == False],
+            search_columns=[
+                Recipient.display_label, Recipient.first_name, Recipient.last_name,
+                Recipient.username, Recipient.phone_number, Recipient.email,
+                Recipient.group_title, Recipient.group_username,
+                Recipient.tags, Recipient.notes
+            ],
+            parent=self
+        )
+    
+    def _get_type_text(self, recipient: Recipient) -> str:
+        """Get the type cell text for a recipient."""
+        if recipient.recipient_type.value == "GROUP":
+            return "👥 Group"
+        elif recipient.recipient_type.value == "CHANNEL":
+            return "📢 Channel"
+        return "👤 User"
+    
+    def _get_username_text(self, recipient: Recipient) -> str:
+        """Get the username/group cell text for a recipient."""
+        if recipient.recipient_type.value in ["GROUP", "CHANNEL"]:
+            return f"@{recipient.group_username}" if recipient.group_username else ""
+        return f"@{recipient.username}" if recipient.username else ""
+    
+    def _get_id_text(self, recipient: Recipient) -> str:
+        """Get the ID cell text for a recipient."""
+        if recipient.recipient_type.value in ["GROUP", "CHANNEL"]:
+            return str(recipient.group_id) if recipient.group_id else ""
+        return str(recipient.user_id) if recipient.user_id else ""
+    
+    def on_rows_loaded(self):
+        """Show the number of matching recipients once the model has loaded."""
+        self.status_label.setText(f"Loaded {self.recipients_model.total_count()} recipients")
     
     def load_recipients(self):
         """Load recipients from database."""
         try:
-            session = get_session()
-            try:
-                from ...models import Recipient
-                from sqlmodel import select
-                recipients = session.exec(select(Recipient).where(Recipient.is_deleted == False)).all()
-            finally:
-                session.close()
-            
-            self.recipients_table.setRowCount(len(recipients))
-            
-            for row, recipient in enumerate(recipients):
-                # Type - Disabled text field
-                if recipient.recipient_type.value == "GROUP":
-                    type_text = "👥 Group"
-                elif recipient.recipient_type.value == "CHANNEL":
-                    type_text = "📢 Channel"
-                else:
-                    type_text = "👤 User"
-                
-                type_item = QTableWidgetItem(type_text)
-                type_item.setFlags(type_item.flags() & ~Qt.ItemIsEditable | Qt.ItemIsSelectable)
-                type_item.setTextAlignment(Qt.AlignCenter)
-                self.recipients_table.setItem(row, 0, type_item)
-                
-                # Display name - Disabled text field
-                display_name_item = QTableWidgetItem(recipient.get_display_name())
-                display_name_item.setFlags(display_name_item.flags() & ~Qt.ItemIsEditable | Qt.ItemIsSelectable)
-                # Store recipient ID in the display name item for selection handling
-                display_name_item.setData(Qt.UserRole, recipient.id)
-                self.recipients_table.setItem(row, 1, display_name_item)
-                
-                # Username/Group - Disabled text field
-                if recipient.recipient_type.value in ["GROUP", "CHANNEL"]:
-                    username = f"@{recipient.group_username}" if recipient.group_username else ""
-                else:
-                    username = f"@{recipient.username}" if recipient.username else ""
-                username_item = QTableWidgetItem(username)
-                username_item.setFlags(username_item.flags() & ~Qt.ItemIsEditable | Qt.ItemIsSelectable)
-                self.recipients_table.setItem(row, 2, username_item)
-                
-                # ID - Disabled text field
-                if recipient.recipient_type.value in ["GROUP", "CHANNEL"]:
-                    id_text = str(recipient.group_id) if recipient.group_id else ""
-                else:
-                    id_text = str(recipient.user_id) if recipient.user_id else ""
-                id_item = QTableWidgetItem(id_text)
-                id_item.setFlags(id_item.flags() & ~Qt.ItemIsEditable | Qt.ItemIsSelectable)
-                id_item.setTextAlignment(Qt.AlignCenter)
-                self.recipients_table.setItem(row, 3, id_item)
-                
-                # Phone - Disabled text field (only for users)
-                phone_text = recipient.phone_number if recipient.recipient_type.value == "USER" else ""
-                phone_item = QTableWidgetItem(phone_text or "")
-                phone_item.setFlags(phone_item.flags() & ~Qt.ItemIsEditable | Qt.ItemIsSelectable)
-                phone_item.setTextAlignment(Qt.AlignCenter)
-                self.recipients_table.setItem(row, 4, phone_item)
-                
-                # Source - Disabled text field
-                source_item = QTableWidgetItem(recipient.source.value.title())
-                source_item.setFlags(source_item.flags() & ~Qt.ItemIsEditable | Qt.ItemIsSelectable)
-                source_item.setTextAlignment(Qt.AlignCenter)
-                self.recipients_table.setItem(row, 5, source_item)
-                
-                # Status - Enhanced button-like appearance
-                status_item = QTableWidgetItem(recipient.status.value.title())
-                status_item.setFlags(status_item.flags() & ~Qt.ItemIsEditable | Qt.ItemIsSelectable)
-                
-                # Set status-specific styling with button-like appearance
-                if recipient.status == RecipientStatus.ACTIVE:
-                    status_item.setBackground(QColor(34, 197, 94))  # Green
-                    status_item.setForeground(Qt.white)
-                elif recipient.status == RecipientStatus.BLOCKED:
-                    status_item.setBackground(QColor(239, 68, 68))  # Red
-                    status_item.setForeground(Qt.white)
-                elif recipient.status == RecipientStatus.INACTIVE:
-                    status_item.setBackground(QColor(107, 114, 128))  # Gray
-                    status_item.setForeground(Qt.white)
-                
-                # Center align status text
-                status_item.setTextAlignment(Qt.AlignCenter)
-                self.recipients_table.setItem(row, 6, status_item)
-                
-                # Messages - Disabled text field
-                messages = f"{recipient.total_messages_sent}/{recipient.total_messages_sent + recipient.total_messages_failed}"
-                messages_item = QTableWidgetItem(messages)
-                messages_item.setFlags(messages_item.flags() & ~Qt.ItemIsEditable | Qt.ItemIsSelectable)
-                messages_item.setTextAlignment(Qt.AlignCenter)
-                self.recipients_table.setItem(row, 7, messages_item)
-            
-            self.status_label.setText(f"Loaded {len(recipients)} recipients")
-            
-            # Apply search filter if there's search text
-            self.filter_recipients()
-            
+            self.recipients_model.reload()
         except Exception as e:
             self.logger.error(f"Error loading recipients: {e}")
             self.status_label.setText(f"Error loading recipients: {e}")
     
     def refresh_recipients(self):
         """Refresh recipients data."""
-        self.load_recipients()
+        try:
+            self.recipients_model.refresh()
+        except Exception as e:
+            self.logger.error(f"Error refreshing recipients: {e}")
+    
+    def on_data_changed(self, changes):
+        """Queue committed recipients changes for the next visible refresh."""
+        if not changes.touches("recipients"):
+            return
+        self._pending_changes.merge(ChangeSet(recipients=changes["recipients"]))
+        get_refresh_scheduler().request(self)
+    
+    def _prepare_refresh(self):
+        """Take the queued changes and return the query job for the worker pool."""
+        changes, self._pending_changes = self._pending_changes, ChangeSet()
+        table_changes = changes.get("recipients")
+        if table_changes is None:
+            return None
+        return lambda: self.recipients_model.fetch_changes(table_changes)
+    
+    def _apply_refresh(self, fetched):
+        """Apply re-read rows on the GUI thread."""
+        self.recipients_model.apply_fetched(fetched)
     
     def on_cell_clicked(self, row, column):
         """Handle cell click events."""
@@ -852,17 +922,12 @@ class RecipientListWidget(QWidget):
         
         if has_selection:
             row = selected_rows[0].row()
-            # Try to get recipient ID from the first column (Display Name column)
-            display_name_item = self.recipients_table.item(row, 0)
-            if display_name_item:
-                recipient_id = display_name_item.data(Qt.UserRole)
-                if recipient_id is not None:
-                    # Emit signal with recipient ID for further processing
-                    self.recipient_selected.emit(recipient_id)
-                else:
-                    self.logger.warning(f"No recipient ID found for row {row}")
+            recipient_id = self.recipients_model.row_id(row)
+            if recipient_id is not None:
+                # Emit signal with recipient ID for further processing
+                self.recipient_selected.emit(recipient_id)
             else:
-                self.logger.warning(f"No display name item found for row {row}")
+                self.logger.warning(f"No recipient ID found for row {row}")
     
     def add_recipient(self):
         """Add new recipient."""
@@ -877,22 +942,26 @@ class RecipientListWidget(QWidget):
             return
         
         row = selected_rows[0].row()
-        # Get recipient ID from the display name item (column 1)
-        display_name_item = self.recipients_table.item(row, 1)
-        if not display_name_item:
+        recipient_id = self.recipients_model.row_id(row)
+        if recipient_id is None:
             QMessageBox.warning(self, "Selection Error", "No recipient selected")
             return
-        recipient_id = display_name_item.data(Qt.UserRole)
-        
-        # Load recipient from database
-        session = get_session()
-        try:
-            from ...models import Recipient
-            from sqlmodel import select
-            recipient = session.exec(select(Recipient).where(Recipient.id == recipient_id)).first()
-        finally:
-            session.close()
         
+        # Load the recipient off the GUI thread, then open the dialog
+        get_data_access().submit(
+            lambda: self._load_recipient(recipient_id),
+            on_result=self._open_recipient_dialog,
+            on_error=lambda e: self.logger.error(f"Error loading recipient: {e}"),
+            key=("recipient", recipient_id)
+        )
+    
+    def _load_recipient(self, recipient_id):
+        """Load a recipient by ID; runs on the data access pool."""
+        with get_session() as session:
+            return session.get(Recipient, recipient_id)
+    
+    def _open_recipient_dialog(self, recipient):
+        """Open the edit dialog for a loaded recipient."""
         if recipient:
             dialog = RecipientDialog(self, recipient)
             if dialog.exec_() == QDialog.Accepted:
@@ -911,13 +980,12 @@ class RecipientListWidget(QWidget):
             return
         
         row = selected_rows[0].row()
-        # Get recipient name from display name item (column 1)
-        display_name_item = self.recipients_table.item(row, 1)
-        if not display_name_item:
+        recipient = self.recipients_model.row_object(row)
+        if recipient is None:
             QMessageBox.warning(self, "Selection Error", "No recipient selected")
             return
-        recipient_name = display_name_item.text()
-        recipient_id = display_name_item.data(Qt.UserRole)
+        recipient_name = recipient.get_display_name()
+        recipient_id = recipient.id
         
         reply = QMessageBox.question(
             self, 
@@ -927,143 +995,38 @@ class RecipientListWidget(QWidget):
         )
         
         if reply == QMessageBox.Yes:
-            try:
-                session = get_session()
-                try:
-                    from ...models import Recipient
-                    from sqlmodel import select
-                    recipient = session.exec(select(Recipient).where(Recipient.id == recipient_id)).first()
-                    if recipient:
-                        recipient.soft_delete()
-                        session.commit()
-                finally:
-                    session.close()
-                
-                self.logger.info(f"Recipient deleted: {recipient_name}")
-                self.load_recipients()
-                
-            except Exception as e:
-                self.logger.error(f"Error deleting recipient: {e}")
-                QMessageBox.critical(self, "Error", f"Failed to delete recipient: {e}")
-    
-    def export_csv(self):
-        """Export recipients to CSV file."""
-        try:
-            # Open file dialog to select save location
-            file_path, _ = QFileDialog.getSaveFileName(
-                self, "Export Recipients", "recipients.csv", "CSV Files (*.csv)"
+            get_data_access().submit(
+                lambda: self._delete_recipient(recipient_id),
+                on_result=lambda _deleted: self._on_recipient_deleted(recipient_name),
+                on_error=self._on_delete_error
             )
-            
-            if not file_path:
-                return
-            
-            # Get all recipients from database
-            session = get_session()
-            try:
-                from ...models import Recipient
-                from sqlmodel import select
-                recipients = session.exec(select(Recipient).where(Recipient.is_deleted == False)).all()
-            finally:
-                session.close()
-            
-            # Prepare data for export
-            export_data = []
-            for recipient in recipients:
-                data = {
-                    'id': recipient.id,
-                    'recipient_type': recipient.recipient_type,
-                    'display_name': recipient.get_display_name(),
-                    'username': recipient.username or '',
-                    'user_id': recipient.user_id or '',
-                    'phone_number': recipient.phone_number or '',
-                    'first_name': recipient.first_name or '',
-                    'last_name': recipient.last_name or '',
-                    'email': recipient.email or '',
-                    'bio': recipient.bio or '',
-                    'group_id': recipient.group_id or '',
-                    'group_title': recipient.group_title or '',
-                    'group_username': recipient.group_username or '',
-                    'group_type': recipient.group_type or '',
-                    'member_count': recipient.member_count or '',
-                    'source': recipient.source,
-                    'status': recipient.status,
-                    'tags': ', '.join(recipient.get_tags_list()),
-                    'notes': recipient.notes or '',
-                    'created_at': recipient.created_at.isoformat() if recipient.created_at else '',
-                    'updated_at': recipient.updated_at.isoformat() if recipient.updated_at else ''
-                }
-                export_data.append(data)
-            
-            # Create DataFrame and export to CSV
-            df = pd.DataFrame(export_data)
-            df.to_csv(file_path, index=False)
-            
-            QMessageBox.information(
-                self, "Export Successful", 
-                f"Successfully exported {len(export_data)} recipients to:\n{file_path}"
-            )
-            
-        except Exception as e:
-            self.logger.error(f"Error exporting recipients: {e}")
-            QMessageBox.critical(self, "Export Error", f"Failed to export recipients: {e}")
+    
+    def _delete_recipient(self, recipient_id):
+        """Soft-delete a recipient; runs on the data access pool."""
+        with get_session() as session:
+            recipient = session.get(Recipient, recipient_id)
+            if recipient:
+                recipient.soft_delete()
+                session.commit()
+            return recipient is not None
+    
+    def _on_recipient_deleted(self, recipient_name):
+        """Reload recipients after a delete."""
+        self.logger.info(f"Recipient deleted: {recipient_name}")
+        self.load_recipients()
+    
+    def _on_delete_error(self, error):
+        """Report a failed recipient delete."""
+        self.logger.error(f"Error deleting recipient: {error}")
+        QMessageBox.critical(self, "Error", f"Failed to delete recipient: {error}")
+    
+    def export_recipients(self):
+        """Export the recipients matching the current search in the background."""
+        self.export_runner.run(lambda: recipient_source(self.recipients_model.build_conditions()))
     
     def filter_recipients(self):
         """Filter recipients based on search text."""
-        search_text = self.search_edit.text().lower()
-        
-        if not search_text:
-            # Show all rows if no search text
-            for row in range(self.recipients_table.rowCount()):
-                self.recipients_table.setRowHidden(row, False)
-            return
-        
-        # Filter rows based on search text
-        for row in range(self.recipients_table.rowCount()):
-            should_show = False
-            
-            # Check all columns except the last one (Actions column)
-            for col in range(self.recipients_table.columnCount() - 1):
-                item = self.recipients_table.item(row, col)
-                if item and search_text in item.text().lower():
-                    should_show = True
-                    break
-            
-            # Also check tags and notes (stored in UserRole data)
-            if not should_show:
-                # Check if search text matches tags or notes
-                display_name_item = self.recipients_table.item(row, 0)
-                if display_name_item:
-                    recipient_id = display_name_item.data(Qt.UserRole)
-                    if recipient_id:
-                        # Get recipient data to check tags and notes
-                        session = get_session()
-                        try:
-                            from ...models import Recipient
-                            from sqlmodel import select
-                            recipient = session.exec(
-                                select(Recipient).where(Recipient.id == recipient_id)
-                            ).first()
-                            
-                            if recipient:
-                                # Check tags
-                                tags_text = ', '.join(recipient.get_tags_list()).lower()
-                                if search_text in tags_text:
-                                    should_show = True
-                                
-                                # Check notes
-                                if not should_show and recipient.notes:
-                                    if search_text in recipient.notes.lower():
-                                        should_show = True
-                                
-                                # Check email
-                                if not should_show and recipient.email:
-                                    if search_text in recipient.email.lower():
-                                        should_show = True
-                                        
-                        finally:
-                            session.close()
-            
-            self.recipients_table.setRowHidden(row, not should_show)
+        self.recipients_model.set_search_text(self.search_edit.text().lower())
     
     def on_language_changed(self, language: str):
         """Handle language change."""
@@ -18,6 +18,7 @@ from ...services.logger import reload_logger
 from ...services.translation import _, get_translation_manager
 from ...services.warmup_manager import get_warmup_manager
 from ...models import Account
+from ..refresh_scheduler import get_refresh_scheduler
 
 
 class SettingsWidget(QWidget):
@@ -34,17 +35,14 @@ class SettingsWidget(QWidget):
         # Connect language change signal
         self.translation_manager.language_changed.connect(self.on_language_changed)
         
-        # Setup warmup status timer
-        from PyQt5.QtCore import QTimer
-        self.warmup_timer = QTimer()
-        self.warmup_timer.timeout.connect(self.update_warmup_status)
-        self.warmup_timer.start(10000)  # Update every 10 seconds
-        
         self.setup_ui()
         self.load_settings()
         
-        # Initial warmup status update
+        # Initial warmup status update, then every 10 seconds while visible
         self.update_warmup_status()
+        get_refresh_scheduler().register(
+            self, self.set_warmup_status, prepare=lambda: self.get_warmup_status, interval_ms=10000
+        )
     
     def setup_ui(self):
         """Set up the UI."""
@@ -278,9 +276,10 @@ class SettingsWidget(QWidget):
         warmup_layout.addLayout(warmup_controls_layout)
         
         # Warmup settings info
+        warmup_help = _('settings.warmup_help').replace('\\n', '<br>')
         self.warmup_info = QLabel(f"""
         <b>{_('settings.warmup_description')}:</b><br>
-        {_('settings.warmup_help').replace('\\n', '<br>')}
+        {warmup_help}
         """)
         self.warmup_info.setWordWrap(True)
         self.warmup_info.setStyleSheet("QLabel { background-color: #2d2d2d; color: #ffffff; padding: 10px; border-radius: 5px; border: 1px solid #404040; }")
@@ -293,9 +292,10 @@ class SettingsWidget(QWidget):
         log_layout = QVBoxLayout(log_group)
         
         # Log management info
+        log_help = _('settings.log_management_help').replace('\\n', '<br>')
         log_info = QLabel(f"""
         <b>{_('settings.log_management_description')}:</b><br>
-        {_('settings.log_management_help').replace('\\n', '<br>')}
+        {log_help}
         """)
         log_info.setWordWrap(True)
         log_info.setStyleSheet("QLabel { background-color: #2d2d2d; color: #ffffff; padding: 10px; border-radius: 5px; border: 1px solid #404040; }")
@@ -693,9 +693,10 @@ RETRY_DELAY_SECONDS={self.settings.retry_delay_seconds}
             
             # Update warmup info
             if hasattr(self, 'warmup_info'):
+                warmup_help = _('settings.warmup_help').replace('\\n', '<br>')
                 self.warmup_info.setText(f"""
                 <b>{_('settings.warmup_description')}:</b><br>
-                {_('settings.warmup_help').replace('\\n', '<br>')}
+                {warmup_help}
                 """)
                 
         except Exception as e:
@@ -885,50 +886,61 @@ RETRY_DELAY_SECONDS={self.settings.retry_delay_seconds}
                             log_file.unlink()
                             deleted_files.append(log_file.name)
                 
-                # Also clear send logs from database
-                from ...services.db import get_session
-                from ...models import SendLog
-                
-                with get_session() as session:
-                    # Count existing logs
-                    log_count = session.query(SendLog).count()
-                    
-                    # Delete all send logs
-                    session.query(SendLog).delete()
-                    session.commit()
-                
-                # Format size for display
-                if total_size > 1024 * 1024:
-                    size_str = f"{total_size / (1024 * 1024):.1f} MB"
-                elif total_size > 1024:
-                    size_str = f"{total_size / 1024:.1f} KB"
-                else:
-                    size_str = f"{total_size} bytes"
+                # Archived send logs
+                from ...services.log_archive import get_send_log_archive
+                total_size += get_send_log_archive().clear()
                 
-                # Show success message
-                message = f"{_('settings.logs_deleted_successfully')}\n\n"
-                message += f"{_('settings.files_deleted')}: {len(deleted_files)}\n"
-                message += f"{_('settings.database_logs_deleted')}: {log_count}\n"
-                message += f"{_('settings.space_freed')}: {size_str}"
+                # Also clear send logs from database, in chunks so running campaigns keep writing
+                from ...services import get_data_access, get_log_retention
                 
-                QMessageBox.information(
-                    self,
-                    _("settings.logs_deleted_successfully"),
-                    message
+                get_data_access().submit(
+                    get_log_retention().purge,
+                    on_result=lambda log_count: self._on_logs_deleted(deleted_files, total_size, log_count),
+                    on_error=self._on_delete_logs_error
                 )
                 
-                self.logger.info(f"Deleted {len(deleted_files)} log files and {log_count} database logs, freed {size_str}")
-                
         except Exception as e:
-            self.logger.error(f"Error deleting logs: {e}")
-            QMessageBox.critical(
-                self,
-                _("common.error"),
-                _("settings.error_deleting_logs").format(error=str(e))
-            )
+            self._on_delete_logs_error(e)
+    
+    def _on_logs_deleted(self, deleted_files: list, total_size: int, log_count: int):
+        """Report deleted log files and database logs."""
+        # Format size for display
+        if total_size > 1024 * 1024:
+            size_str = f"{total_size / (1024 * 1024):.1f} MB"
+        elif total_size > 1024:
+            size_str = f"{total_size / 1024:.1f} KB"
+        else:
+            size_str = f"{total_size} bytes"
+        
+        # Show success message
+        message = f"{_('settings.logs_deleted_successfully')}\n\n"
+        message += f"{_('settings.files_deleted')}: {len(deleted_files)}\n"
+        message += f"{_('settings.database_logs_deleted')}: {log_count}\n"
+        message += f"{_('settings.space_freed')}: {size_str}"
+        
+        QMessageBox.information(
+            self,
+            _("settings.logs_deleted_successfully"),
+            message
+        )
+        
+        self.logger.info(f"Deleted {len(deleted_files)} log files and {log_count} database logs, freed {size_str}")
+    
+    def _on_delete_logs_error(self, e: Exception):
+        """Report a failure to delete logs."""
+        self.logger.error(f"Error deleting logs: {e}")
+        QMessageBox.critical(
+            self,
+            _("common.error"),
+            _("settings.error_deleting_logs").format(error=str(e))
+        )
     
     def update_warmup_status(self):
         """Update warmup status display."""
+        self.set_warmup_status(self.get_warmup_status())
+    
+    def get_warmup_status(self) -> str:
+        """Build the warmup status text; safe to call off the GUI thread."""
         try:
             from ...services.db import get_session
             warmup_manager = get_warmup_manager()
@@ -948,8 +960,12 @@ RETRY_DELAY_SECONDS={self.settings.retry_delay_seconds}
                 if in_progress_accounts > 0:
                     status_text += f", {in_progress_accounts} {_('settings.in_progress')}"
                 
-                self.warmup_status_label.setText(status_text)
+                return status_text
                 
         except Exception as e:
             self.logger.error(f"Error updating warmup status: {e}")
-            self.warmup_status_label.setText(f"{_('settings.warmup_status')}: {_('common.error')}")
+            return f"{_('settings.warmup_status')}: {_('common.error')}"
+    
+    def set_warmup_status(self, status_text: str):
+        """Show warmup status text."""
+        self.warmup_status_label.setText(status_text)
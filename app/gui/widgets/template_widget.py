@@ -5,7 +5,7 @@ Template management widgets.
 from typing import Optional, List, Dict, Any
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-    QLabel, QLineEdit, QPushButton, QTableWidget, QTableWidgetItem,
+    QLabel, QLineEdit, QPushButton, QTableView,
     QHeaderView, QGroupBox, QComboBox, QCheckBox, QSpinBox,
     QMessageBox, QDialog, QDialogButtonBox, QFormLayout,
     QTextEdit, QFileDialog, QAbstractItemView
@@ -16,8 +16,18 @@ from PyQt5.QtGui import QFont, QIcon, QColor
 from ...models import MessageTemplate
 from ...services import get_logger
 from ...services.db import get_session
+from ...services.data_access import get_data_access
+from ...services.data_export import template_source
 from ...services.translation import _, get_translation_manager
 from ...core import SpintaxProcessor
+from ..table_models import PagedTableModel, TableColumn, StatusColorDelegate
+from ..export_runner import ExportRunner
+
+
+SPINTAX_COLORS = {
+    True: QColor(34, 197, 94),  # Green
+    False: QColor(107, 114, 128),  # Gray
+}
 
 
 class TemplateDialog(QDialog):
@@ -481,8 +491,9 @@ class TemplateListWidget(QWidget):
         self.import_button.clicked.connect(self.import_csv)
         header_layout.addWidget(self.import_button)
         
-        self.export_button = QPushButton("Export CSV")
-        self.export_button.clicked.connect(self.export_csv)
+        self.export_button = QPushButton("Export")
+        self.export_button.setToolTip("Export the templates matching the search to CSV, JSON Lines or Parquet")
+        self.export_button.clicked.connect(self.export_templates)
         header_layout.addWidget(self.export_button)
         
         self.edit_button = QPushButton("Edit Template")
@@ -524,11 +535,14 @@ class TemplateListWidget(QWidget):
         layout.addLayout(search_layout)
         
         # Templates table
-        self.templates_table = QTableWidget()
-        self.templates_table.setColumnCount(6)
-        self.templates_table.setHorizontalHeaderLabels([
-            "Name", "Description", "Message Preview", "Spintax", "Tags", "Actions"
-        ])
+        self.templates_table = QTableView()
+        self.templates_model = self._create_templates_model()
+        self.templates_model.rows_loaded.connect(self.on_rows_loaded)
+        self.templates_table.setModel(self.templates_model)
+        self.templates_table.setItemDelegateForColumn(3, StatusColorDelegate(SPINTAX_COLORS, self.templates_table))
+        self.templates_table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.templates_table.setSortingEnabled(True)
+        self.templates_table.verticalHeader().setVisible(False)
         
         # Configure table
         header = self.templates_table.horizontalHeader()
@@ -539,14 +553,14 @@ class TemplateListWidget(QWidget):
         header.setSectionResizeMode(4, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(5, QHeaderView.ResizeToContents)
         
-        self.templates_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.templates_table.setSelectionMode(QTableWidget.SingleSelection)
+        self.templates_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.templates_table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.templates_table.setAlternatingRowColors(True)
-        self.templates_table.itemSelectionChanged.connect(self.on_selection_changed)
+        self.templates_table.selectionModel().selectionChanged.connect(lambda *_: self.on_selection_changed())
         
         # Set custom styling for black and gray alternating rows
         self.templates_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 alternate-background-color: #2d2d2d;
                 background-color: #1a1a1a;
                 gridline-color: #404040;
@@ -554,99 +568,70 @@ class TemplateListWidget(QWidget):
                 selection-background-color: #0078d4;
                 selection-color: white;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 8px;
                 border: none;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #0078d4 !important;
                 color: white !important;
             }
-            QTableWidget::item:alternate {
+            QTableView::item:alternate {
                 background-color: #2d2d2d;
             }
-            QTableWidget::item:alternate:selected {
+            QTableView::item:alternate:selected {
                 background-color: #0078d4 !important;
                 color: white !important;
             }
         """)
         
         # Connect cell clicked signal for actions
-        self.templates_table.cellClicked.connect(self.on_cell_clicked)
+        self.templates_table.clicked.connect(lambda index: self.on_cell_clicked(index.row(), index.column()))
         
         layout.addWidget(self.templates_table)
         
         # Status bar
         self.status_label = QLabel("Ready")
         layout.addWidget(self.status_label)
+        
+        self.export_runner = ExportRunner(self, "Export Templates", "templates", self.status_label, self.export_button)
+    
+    def _create_templates_model(self) -> PagedTableModel:
+        """Create the paged model backing the templates table."""
+        columns = [
+            TableColumn("Name", lambda t: t.name, MessageTemplate.name),
+            TableColumn("Description", lambda t: t.description or "", MessageTemplate.description),
+            TableColumn(
+                "Message Preview",
+                lambda t: t.body[:100] + "..." if len(t.body) > 100 else t.body,
+                MessageTemplate.body
+            ),
+            TableColumn(
+                "Spintax", lambda t: "Yes" if t.use_spintax else "No",
+                MessageTemplate.use_spintax, Qt.AlignCenter, lambda t: t.use_spintax
+            ),
+            TableColumn("Tags", lambda t: ", ".join(t.get_tags_list()) or "No tags", None),
+            TableColumn("Actions", lambda t: "Edit | Delete | Preview", None, Qt.AlignCenter),
+        ]
+        return PagedTableModel(
+            MessageTemplate,
+            columns,
+            base_filters=[MessageTemplate.is_deleted == False],
+            search_columns=[
+                MessageTemplate.name, MessageTemplate.description,
+                MessageTemplate.body, MessageTemplate.tags
+            ],
+            parent=self
+        )
+    
+    def on_rows_loaded(self):
+        """Show the number of matching templates once the model has loaded."""
+        self.status_label.setText(f"Loaded {self.templates_model.total_count()} templates")
     
     def load_templates(self):
         """Load templates from database."""
         try:
-            session = get_session()
-            try:
-                from ...models import MessageTemplate
-                from sqlmodel import select
-                templates = session.exec(select(MessageTemplate).where(MessageTemplate.is_deleted == False)).all()
-            finally:
-                session.close()
-            
-            self.templates_table.setRowCount(len(templates))
-            
-            for row, template in enumerate(templates):
-                # Name - Disabled text field
-                name_item = QTableWidgetItem(template.name)
-                name_item.setFlags(name_item.flags() & ~Qt.ItemIsEditable | Qt.ItemIsSelectable)
-                # Store template ID in the name item for selection handling
-                name_item.setData(Qt.UserRole, template.id)
-                self.templates_table.setItem(row, 0, name_item)
-                
-                # Description - Disabled text field
-                description_item = QTableWidgetItem(template.description or "")
-                description_item.setFlags(description_item.flags() & ~Qt.ItemIsEditable | Qt.ItemIsSelectable)
-                self.templates_table.setItem(row, 1, description_item)
-                
-                # Message Preview - Disabled text field
-                message_preview = template.body[:100] + "..." if len(template.body) > 100 else template.body
-                message_item = QTableWidgetItem(message_preview)
-                message_item.setFlags(message_item.flags() & ~Qt.ItemIsEditable | Qt.ItemIsSelectable)
-                self.templates_table.setItem(row, 2, message_item)
-                
-                # Spintax - Enhanced button-like appearance
-                spintax_item = QTableWidgetItem("Yes" if template.use_spintax else "No")
-                spintax_item.setFlags(spintax_item.flags() & ~Qt.ItemIsEditable | Qt.ItemIsSelectable)
-                
-                # Set spintax-specific styling
-                if template.use_spintax:
-                    spintax_item.setBackground(QColor(34, 197, 94))  # Green
-                    spintax_item.setForeground(Qt.white)
-                else:
-                    spintax_item.setBackground(QColor(107, 114, 128))  # Gray
-                    spintax_item.setForeground(Qt.white)
-                
-                # Center align spintax text
-                spintax_item.setTextAlignment(Qt.AlignCenter)
-                self.templates_table.setItem(row, 3, spintax_item)
-                
-                # Tags - Disabled text field
-                tags_list = template.get_tags_list()
-                tags_text = ", ".join(tags_list) if tags_list else "No tags"
-                tags_item = QTableWidgetItem(tags_text)
-                tags_item.setFlags(tags_item.flags() & ~Qt.ItemIsEditable | Qt.ItemIsSelectable)
-                self.templates_table.setItem(row, 4, tags_item)
-                
-                # Actions - Create action buttons
-                actions_item = QTableWidgetItem("Edit | Delete | Preview")
-                actions_item.setFlags(actions_item.flags() & ~Qt.ItemIsEditable | Qt.ItemIsSelectable)
-                actions_item.setTextAlignment(Qt.AlignCenter)
-                actions_item.setData(Qt.UserRole, template.id)  # Store template ID for actions
-                self.templates_table.setItem(row, 5, actions_item)
-            
-            self.status_label.setText(f"Loaded {len(templates)} templates")
-            
-            # Apply search filter if there's search text
-            self.filter_templates()
-            
+            self.templates_model.reload()
         except Exception as e:
             self.logger.error(f"Error loading templates: {e}")
             self.status_label.setText(f"Error loading templates: {e}")
@@ -654,7 +639,7 @@ class TemplateListWidget(QWidget):
     def on_cell_clicked(self, row, column):
         """Handle cell click events."""
         if column == 5:  # Actions column
-            template_id = self.templates_table.item(row, 0).data(Qt.UserRole)
+            template_id = self.templates_model.row_id(row)
             if template_id is not None:
                 self.show_action_menu(row, column, template_id)
         else:
@@ -668,7 +653,7 @@ class TemplateListWidget(QWidget):
         from PyQt5.QtWidgets import QMenu
         
         # Get template name for display
-        template_name = self.templates_table.item(row, 0).text()
+        template_name = self.templates_model.row_object(row).name
         
         # Create context menu
         menu = QMenu(self)
@@ -687,19 +672,27 @@ class TemplateListWidget(QWidget):
         
         # Show menu at cursor position
         menu.exec_(self.templates_table.mapToGlobal(
-            self.templates_table.visualItemRect(self.templates_table.item(row, column)).bottomLeft()
+            self.templates_table.visualRect(self.templates_model.index(row, column)).bottomLeft()
         ))
     
     def edit_template_by_id(self, template_id):
         """Edit template by ID."""
-        session = get_session()
-        try:
-            from ...models import MessageTemplate
-            from sqlmodel import select
-            template = session.exec(select(MessageTemplate).where(MessageTemplate.id == template_id)).first()
-        finally:
-            session.close()
-        
+        # Load the template off the GUI thread, then open the dialog
+        get_data_access().submit(
+            lambda: self._load_template(template_id),
+            on_result=self._open_template_dialog,
+            on_error=lambda e: self.logger.error(f"Error loading template: {e}"),
+            key=("template", template_id)
+        )
+    
+    def _load_template(self, template_id):
+        """Load a template by ID; runs on the data access pool."""
+        from ...models import MessageTemplate
+        with get_session() as session:
+            return session.get(MessageTemplate, template_id)
+    
+    def _open_template_dialog(self, template):
+        """Open the edit dialog for a loaded template."""
         if template:
             dialog = TemplateDialog(self, template)
             if dialog.exec_() == QDialog.Accepted:
@@ -707,14 +700,15 @@ class TemplateListWidget(QWidget):
     
     def delete_template_by_id(self, template_id):
         """Delete template by ID."""
-        session = get_session()
-        try:
-            from ...models import MessageTemplate
-            from sqlmodel import select
-            template = session.exec(select(MessageTemplate).where(MessageTemplate.id == template_id)).first()
-        finally:
-            session.close()
-        
+        get_data_access().submit(
+            lambda: self._load_template(template_id),
+            on_result=self._confirm_delete_template,
+            on_error=lambda e: self.logger.error(f"Error loading template: {e}"),
+            key=("template", template_id)
+        )
+    
+    def _confirm_delete_template(self, template):
+        """Ask before deleting a loaded template."""
         if template:
             reply = QMessageBox.question(
                 self, 
@@ -724,25 +718,46 @@ class TemplateListWidget(QWidget):
             )
             
             if reply == QMessageBox.Yes:
-                try:
-                    template.soft_delete()
-                    session.commit()
-                    self.logger.info(f"Template deleted: {template.name}")
-                    self.load_templates()
-                except Exception as e:
-                    self.logger.error(f"Error deleting template: {e}")
-                    QMessageBox.critical(self, "Error", f"Failed to delete template: {e}")
+                self._submit_delete(template.id, template.name)
+    
+    def _submit_delete(self, template_id, template_name):
+        """Soft-delete a template off the GUI thread, then reload."""
+        get_data_access().submit(
+            lambda: self._delete_template(template_id),
+            on_result=lambda _deleted: self._on_template_deleted(template_name),
+            on_error=self._on_delete_error
+        )
+    
+    def _delete_template(self, template_id):
+        """Soft-delete a template; runs on the data access pool."""
+        with get_session() as session:
+            template = session.get(MessageTemplate, template_id)
+            if template:
+                template.soft_delete()
+                session.commit()
+            return template is not None
+    
+    def _on_template_deleted(self, template_name):
+        """Reload templates after a delete."""
+        self.logger.info(f"Template deleted: {template_name}")
+        self.load_templates()
+    
+    def _on_delete_error(self, error):
+        """Report a failed template delete."""
+        self.logger.error(f"Error deleting template: {error}")
+        QMessageBox.critical(self, "Error", f"Failed to delete template: {error}")
     
     def preview_template_by_id(self, template_id):
         """Preview template by ID."""
-        session = get_session()
-        try:
-            from ...models import MessageTemplate
-            from sqlmodel import select
-            template = session.exec(select(MessageTemplate).where(MessageTemplate.id == template_id)).first()
-        finally:
-            session.close()
-        
+        get_data_access().submit(
+            lambda: self._load_template(template_id),
+            on_result=self._show_template_preview,
+            on_error=lambda e: self.logger.error(f"Error loading template: {e}"),
+            key=("template", template_id)
+        )
+    
+    def _show_template_preview(self, template):
+        """Show a preview of a loaded template."""
         if template:
             preview_text = f"Template: {template.name}\n\n"
             preview_text += f"Description: {template.description or 'No description'}\n\n"
@@ -764,17 +779,12 @@ class TemplateListWidget(QWidget):
         
         if has_selection:
             row = selected_rows[0].row()
-            # Try to get template ID from the first column (Name column)
-            name_item = self.templates_table.item(row, 0)
-            if name_item:
-                template_id = name_item.data(Qt.UserRole)
-                if template_id is not None:
-                    # Emit signal with template ID for further processing
-                    self.template_selected.emit(template_id)
-                else:
-                    self.logger.warning(f"No template ID found for row {row}")
+            template_id = self.templates_model.row_id(row)
+            if template_id is not None:
+                # Emit signal with template ID for further processing
+                self.template_selected.emit(template_id)
             else:
-                self.logger.warning(f"No name item found for row {row}")
+                self.logger.warning(f"No template ID found for row {row}")
     
     def add_template(self):
         """Add new template."""
@@ -789,21 +799,7 @@ class TemplateListWidget(QWidget):
             return
         
         row = selected_rows[0].row()
-        template_id = self.templates_table.item(row, 0).data(Qt.UserRole)
-        
-        # Load template from database
-        session = get_session()
-        try:
-            from ...models import MessageTemplate
-            from sqlmodel import select
-            template = session.exec(select(MessageTemplate).where(MessageTemplate.id == template_id)).first()
-        finally:
-            session.close()
-        
-        if template:
-            dialog = TemplateDialog(self, template)
-            if dialog.exec_() == QDialog.Accepted:
-                self.load_templates()
+        self.edit_template_by_id(self.templates_model.row_id(row))
     
     def delete_template(self):
         """Delete selected template."""
@@ -812,8 +808,8 @@ class TemplateListWidget(QWidget):
             return
         
         row = selected_rows[0].row()
-        template_name = self.templates_table.item(row, 0).text()
-        template_id = self.templates_table.item(row, 0).data(Qt.UserRole)
+        template_name = self.templates_model.row_object(row).name
+        template_id = self.templates_model.row_id(row)
         
         reply = QMessageBox.question(
             self, 
@@ -823,24 +819,7 @@ class TemplateListWidget(QWidget):
         )
         
         if reply == QMessageBox.Yes:
-            try:
-                session = get_session()
-                try:
-                    from ...models import MessageTemplate
-                    from sqlmodel import select
-                    template = session.exec(select(MessageTemplate).where(MessageTemplate.id == template_id)).first()
-                    if template:
-                        template.soft_delete()
-                        session.commit()
-                finally:
-                    session.close()
-                
-                self.logger.info(f"Template deleted: {template_name}")
-                self.load_templates()
-                
-            except Exception as e:
-                self.logger.error(f"Error deleting template: {e}")
-                QMessageBox.critical(self, "Error", f"Failed to delete template: {e}")
+            self._submit_delete(template_id, template_name)
     
     def import_csv(self):
         """Import templates from CSV file."""
@@ -917,84 +896,13 @@ class TemplateListWidget(QWidget):
             self.logger.error(f"Error importing CSV: {e}")
             QMessageBox.critical(self, "Import Error", f"Failed to import CSV: {e}")
     
-    def export_csv(self):
-        """Export templates to CSV file."""
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, "Export Templates to CSV", "templates.csv", "CSV Files (*.csv)"
-        )
-        
-        if not file_path:
-            return
-        
-        try:
-            import pandas as pd
-            
-            # Get all templates
-            session = get_session()
-            try:
-                templates = session.query(MessageTemplate).filter(
-                    MessageTemplate.deleted_at.is_(None)
-                ).all()
-                
-                if not templates:
-                    QMessageBox.information(self, "No Data", "No templates to export.")
-                    return
-                
-                # Prepare data for export
-                data = []
-                for template in templates:
-                    data.append({
-                        'name': template.name,
-                        'description': template.description or '',
-                        'body': template.body,
-                        'use_spintax': template.use_spintax,
-                        'spintax_text': template.spintax_text or '',
-                        'category': template.category,
-                        'is_active': template.is_active,
-                        'tags': ', '.join(template.get_tags_list()) if template.get_tags_list() else '',
-                        'created_at': template.created_at.isoformat() if template.created_at else '',
-                        'updated_at': template.updated_at.isoformat() if template.updated_at else ''
-                    })
-                
-                # Create DataFrame and export
-                df = pd.DataFrame(data)
-                df.to_csv(file_path, index=False)
-                
-                self.logger.info(f"Exported {len(templates)} templates to CSV")
-                QMessageBox.information(
-                    self, "Export Successful", 
-                    f"Successfully exported {len(templates)} templates to CSV file."
-                )
-                
-            finally:
-                session.close()
-                
-        except Exception as e:
-            self.logger.error(f"Error exporting CSV: {e}")
-            QMessageBox.critical(self, "Export Error", f"Failed to export CSV: {e}")
+    def export_templates(self):
+        """Export the templates matching the current search in the background."""
+        self.export_runner.run(lambda: template_source(self.templates_model.build_conditions()))
     
     def filter_templates(self):
         """Filter templates based on search text."""
-        search_text = self.search_edit.text().lower().strip()
-        
-        if not search_text:
-            # Show all templates
-            for row in range(self.templates_table.rowCount()):
-                self.templates_table.setRowHidden(row, False)
-            return
-        
-        # Filter templates (exclude Actions column - column 5)
-        for row in range(self.templates_table.rowCount()):
-            should_show = False
-            
-            # Check all columns except Actions column for search text
-            for col in range(self.templates_table.columnCount() - 1):  # Exclude last column (Actions)
-                item = self.templates_table.item(row, col)
-                if item and search_text in item.text().lower():
-                    should_show = True
-                    break
-            
-            self.templates_table.setRowHidden(row, not should_show)
+        self.templates_model.set_search_text(self.search_edit.text().lower())
     
     def on_language_changed(self, language: str):
         """Handle language change."""
@@ -15,6 +15,7 @@ from PyQt5.QtGui import QFont, QIcon
 
 from ...services import get_logger
 from ...services.db import get_session
+from ...services.data_access import get_data_access
 from ...services.translation import _, get_translation_manager
 from ...models import Account, Recipient, MessageTemplate
 from ...core.telethon_client import TelegramClientManager
@@ -125,6 +126,7 @@ class TestingWidget(QWidget):
         self.spintax_processor = SpintaxProcessor()
         self.translation_manager = get_translation_manager()
         self.recent_tests = []  # Store recent tests in memory
+        self._template_query = None
         
         # Connect language change signal
         self.translation_manager.language_changed.connect(self.on_language_changed)
@@ -358,67 +360,102 @@ class TestingWidget(QWidget):
     
     def load_data(self):
         """Load accounts, recipients, and templates."""
-        try:
-            with get_session() as session:
-                # Load accounts
-                accounts = session.query(Account).filter(Account.deleted_at.is_(None)).all()
-                self.account_combo.clear()
-                self.logger.info(f"Loading {len(accounts)} accounts for testing")
-                for account in accounts:
-                    status_icon = "🟢" if account.status == "ONLINE" else "🔴"
-                    self.account_combo.addItem(f"{status_icon} {account.phone_number}", account.id)
-                    self.logger.debug(f"Added account: {account.phone_number} (ID: {account.id})")
-                
-                # Load recipients
-                recipients = session.query(Recipient).filter(Recipient.deleted_at.is_(None)).all()
-                self.recipient_combo.clear()
-                for recipient in recipients:
-                    if recipient.recipient_type == "USER":
-                        icon = "👤"
-                        name = recipient.username or recipient.first_name or recipient.phone_number or f"User {recipient.id}"
-                    elif recipient.recipient_type == "GROUP":
-                        icon = "👥"
-                        name = recipient.group_title or recipient.group_username or f"Group {recipient.id}"
-                    else:  # CHANNEL
-                        icon = "📢"
-                        name = recipient.group_title or recipient.group_username or f"Channel {recipient.id}"
-                    
-                    identifier = recipient.get_identifier()
-                    self.recipient_combo.addItem(f"{icon} {name} ({identifier})", identifier)
-                
-                # Load templates
-                templates = session.query(MessageTemplate).filter(MessageTemplate.deleted_at.is_(None)).all()
-                self.template_combo.clear()
-                self.template_combo.addItem("None", None)
-                for template in templates:
-                    self.template_combo.addItem(template.name, template.id)
+        get_data_access().submit(
+            self._query_data,
+            on_result=self._populate_combos,
+            on_error=self._on_load_error,
+            key="testing_widget_data"
+        )
+    
+    def _query_data(self):
+        """Build combo box items for accounts, recipients and templates; runs on the data access pool."""
+        with get_session() as session:
+            # Load accounts
+            accounts = []
+            for account in session.query(Account).filter(Account.deleted_at.is_(None)).all():
+                status_icon = "🟢" if account.status == "ONLINE" else "🔴"
+                accounts.append((f"{status_icon} {account.phone_number}", account.id))
+            
+            # Load recipients
+            recipients = []
+            for recipient in session.query(Recipient).filter(Recipient.deleted_at.is_(None)).all():
+                if recipient.recipient_type == "USER":
+                    icon = "👤"
+                    name = recipient.username or recipient.first_name or recipient.phone_number or f"User {recipient.id}"
+                elif recipient.recipient_type == "GROUP":
+                    icon = "👥"
+                    name = recipient.group_title or recipient.group_username or f"Group {recipient.id}"
+                else:  # CHANNEL
+                    icon = "📢"
+                    name = recipient.group_title or recipient.group_username or f"Channel {recipient.id}"
                 
-        except Exception as e:
-            self.logger.error(f"Error loading data: {e}")
-            QMessageBox.critical(self, "Error", f"Failed to load data: {e}")
+                identifier = recipient.get_identifier()
+                recipients.append((f"{icon} {name} ({identifier})", identifier))
+            
+            # Load templates
+            templates = [
+                (template.name, template.id)
+                for template in session.query(MessageTemplate).filter(MessageTemplate.deleted_at.is_(None)).all()
+            ]
+        
+        return accounts, recipients, templates
+    
+    def _populate_combos(self, data):
+        """Fill the combo boxes with loaded items."""
+        accounts, recipients, templates = data
+        
+        self.account_combo.clear()
+        self.logger.info(f"Loading {len(accounts)} accounts for testing")
+        for text, account_id in accounts:
+            self.account_combo.addItem(text, account_id)
+        
+        self.recipient_combo.clear()
+        for text, identifier in recipients:
+            self.recipient_combo.addItem(text, identifier)
+        
+        self.template_combo.clear()
+        self.template_combo.addItem("None", None)
+        for name, template_id in templates:
+            self.template_combo.addItem(name, template_id)
+    
+    def _on_load_error(self, error):
+        """Report a failed data load."""
+        self.logger.error(f"Error loading data: {error}")
+        QMessageBox.critical(self, "Error", f"Failed to load data: {error}")
     
     def on_template_changed(self, template_name):
         """Handle template selection change."""
         if template_name == "None":
             return
         
-        try:
-            template_id = self.template_combo.currentData()
-            if not template_id:
-                return
-            
+        template_id = self.template_combo.currentData()
+        if not template_id:
+            return
+        
+        def query_template():
             with get_session() as session:
-                template = session.get(MessageTemplate, template_id)
-                if template:
-                    # Use spintax text if available, otherwise use body
-                    message_text = template.spintax_text or template.body
-                    self.message_edit.setPlainText(message_text)
-                    
-                    # Show template info
-                    self.logger.info(f"Loaded template: {template.name}")
-                    
-        except Exception as e:
-            self.logger.error(f"Error loading template: {e}")
+                return session.get(MessageTemplate, template_id)
+        
+        # A newer selection supersedes a template still loading
+        if self._template_query is not None:
+            self._template_query.cancel()
+        self._template_query = get_data_access().submit(
+            query_template,
+            on_result=self._show_template,
+            on_error=lambda e: self.logger.error(f"Error loading template: {e}"),
+            key=("template", template_id)
+        )
+    
+    def _show_template(self, template):
+        """Put a loaded template's text into the message editor."""
+        self._template_query = None
+        if template:
+            # Use spintax text if available, otherwise use body
+            message_text = template.spintax_text or template.body
+            self.message_edit.setPlainText(message_text)
+            
+            # Show template info
+            self.logger.info(f"Loaded template: {template.name}")
     
     def send_test_message(self):
         """Send test message."""
@@ -4,10 +4,11 @@ Database models for the Telegram Multi-Account Message Sender.
 
 from .base import BaseModel, TimestampMixin, UUIDMixin, SoftDeleteMixin, JSONFieldMixin
 from .account import Account, AccountStatus, ProxyType
-from .campaign import Campaign, CampaignStatus, CampaignType, MessageType
+from .campaign import Campaign, CampaignProgress, CampaignStatus, CampaignType, MessageType
 from .recipient import Recipient, RecipientList, RecipientListRecipient, RecipientSource, RecipientStatus, RecipientType
 from .template import MessageTemplate, TemplateType, TemplateCategory
-from .send_log import SendLog, SendStatus
+from .send_log import MessageBody, SendErrorCode, SendLog, SendLogErrorRollup, SendLogRollup, SendStatus
+from .tag import EntityTag
 
 __all__ = [
     # Base classes
@@ -24,6 +25,7 @@ __all__ = [
     
     # Campaign models
     "Campaign",
+    "CampaignProgress",
     "CampaignStatus", 
     "CampaignType",
     "MessageType",
@@ -43,5 +45,12 @@ __all__ = [
     
     # Send log models
     "SendLog",
+    "MessageBody",
+    "SendLogRollup",
+    "SendLogErrorRollup",
     "SendStatus",
+    "SendErrorCode",
+    
+    # Tag index
+    "EntityTag",
 ]
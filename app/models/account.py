@@ -7,9 +7,9 @@ from typing import Dict, List, Optional, Any
 from enum import Enum
 
 from sqlmodel import Field, Relationship
-from sqlalchemy import JSON
+from sqlalchemy import Index, text
 
-from .base import BaseModel, SoftDeleteMixin, JSONFieldMixin
+from .base import BaseModel, JSONList, SoftDeleteMixin, JSONFieldMixin
 
 
 class AccountStatus(str, Enum):
@@ -33,6 +33,14 @@ class Account(BaseModel, SoftDeleteMixin, JSONFieldMixin, table=True):
     """Telegram account model."""
     
     __tablename__ = "accounts"
+    __table_args__ = (
+        # Accounts available for sending, by connection status
+        Index(
+            "ix_accounts_available_status", "status",
+            sqlite_where=text("is_deleted = 0 AND is_active = 1"),
+            postgresql_where=text("NOT is_deleted AND is_active")
+        ),
+    )
     
     # Basic account info
     name: str = Field(index=True)
@@ -71,7 +79,7 @@ class Account(BaseModel, SoftDeleteMixin, JSONFieldMixin, table=True):
     # Additional settings
     is_active: bool = Field(default=True)
     notes: Optional[str] = Field(default=None)
-    tags: Optional[str] = Field(default=None, sa_column=JSON)
+    tags: Optional[List[str]] = Field(default=None, sa_type=JSONList)
     
     # Statistics
     total_messages_sent: int = Field(default=0)
@@ -143,18 +151,8 @@ class Account(BaseModel, SoftDeleteMixin, JSONFieldMixin, table=True):
     
     def get_tags(self) -> List[str]:
         """Get tags as a list."""
-        if self.tags is None:
-            return []
-        try:
-            import json
-            return json.loads(self.tags) if isinstance(self.tags, str) else self.tags
-        except (json.JSONDecodeError, TypeError):
-            return []
+        return list(self.tags or [])
     
     def set_tags(self, tags: List[str]) -> None:
         """Set tags from a list."""
-        if not tags:
-            self.tags = None
-        else:
-            import json
-            self.tags = json.dumps(tags)
+        self.tags = list(tags) if tags else None
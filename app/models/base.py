@@ -6,9 +6,17 @@ from datetime import datetime
 from typing import Any, Dict, Optional
 from uuid import uuid4
 
+from sqlalchemy import JSON
+from sqlalchemy.ext.mutable import MutableDict, MutableList
 from sqlmodel import Field, SQLModel
 
 
+# JSON column types: values are parsed once when a row loads, in-place changes are
+# tracked, and None is stored as SQL NULL rather than JSON null
+JSONList = MutableList.as_mutable(JSON(none_as_null=True))
+JSONDict = MutableDict.as_mutable(JSON(none_as_null=True))
+
+
 class BaseModel(SQLModel):
     """Base model with common fields."""
     
@@ -6,10 +6,10 @@ from datetime import datetime
 from typing import Dict, List, Optional, Any
 from enum import Enum
 
-from sqlmodel import Field, Relationship
-from sqlalchemy import JSON
+from sqlmodel import Field, Relationship, SQLModel
+from sqlalchemy import Index, text
 
-from .base import BaseModel, SoftDeleteMixin, JSONFieldMixin
+from .base import BaseModel, JSONDict, JSONList, SoftDeleteMixin, JSONFieldMixin
 
 
 class CampaignStatus(str, Enum):
@@ -48,6 +48,13 @@ class Campaign(BaseModel, SoftDeleteMixin, JSONFieldMixin, table=True):
     """Campaign model for managing message campaigns."""
     
     __tablename__ = "campaigns"
+    __table_args__ = (
+        # Scheduled campaigns that are due, and running campaigns
+        Index(
+            "ix_campaigns_live_status_start", "status", "start_time",
+            sqlite_where=text("is_deleted = 0"), postgresql_where=text("NOT is_deleted")
+        ),
+    )
     
     # Basic campaign info
     name: str = Field(index=True)
@@ -67,8 +74,8 @@ class Campaign(BaseModel, SoftDeleteMixin, JSONFieldMixin, table=True):
     
     # A/B Testing
     use_ab_testing: bool = Field(default=False)
-    ab_variants: Optional[str] = Field(default=None, sa_column=JSON)
-    ab_split_percentages: Optional[str] = Field(default=None, sa_column=JSON)
+    ab_variants: Optional[List[Dict[str, Any]]] = Field(default=None, sa_type=JSONList)
+    ab_split_percentages: Optional[List[float]] = Field(default=None, sa_type=JSONList)
     
     # Scheduling
     start_time: Optional[datetime] = Field(default=None)
@@ -83,13 +90,13 @@ class Campaign(BaseModel, SoftDeleteMixin, JSONFieldMixin, table=True):
     
     # Account selection
     account_selection_strategy: str = Field(default="round_robin")  # round_robin, random, weighted
-    account_weights: Optional[str] = Field(default=None, sa_column=JSON)
+    account_weights: Optional[Dict[str, float]] = Field(default=None, sa_type=JSONDict)
     max_concurrent_accounts: int = Field(default=3)
     
     # Recipients
     recipient_source: str = Field(default="manual")  # manual, csv, channel, group
     recipient_list_id: Optional[int] = Field(default=None, foreign_key="recipientlists.id")
-    recipient_filters: Optional[str] = Field(default=None, sa_column=JSON)
+    recipient_filters: Optional[Dict[str, Any]] = Field(default=None, sa_type=JSONDict)
     
     # Safety and compliance
     dry_run: bool = Field(default=False)
@@ -111,7 +118,7 @@ class Campaign(BaseModel, SoftDeleteMixin, JSONFieldMixin, table=True):
     
     # Additional settings
     is_active: bool = Field(default=True)
-    tags: Optional[str] = Field(default=None, sa_column=JSON)
+    tags: Optional[List[str]] = Field(default=None, sa_type=JSONList)
     notes: Optional[str] = Field(default=None)
     
     # Relationships
@@ -195,90 +202,54 @@ class Campaign(BaseModel, SoftDeleteMixin, JSONFieldMixin, table=True):
     
     def get_ab_variants_list(self) -> List[Dict[str, Any]]:
         """Get A/B variants as a list."""
-        if self.ab_variants is None:
-            return []
-        try:
-            import json
-            return json.loads(self.ab_variants) if isinstance(self.ab_variants, str) else self.ab_variants
-        except (json.JSONDecodeError, TypeError):
-            return []
+        return list(self.ab_variants or [])
     
     def set_ab_variants_list(self, variants: List[Dict[str, Any]]) -> None:
         """Set A/B variants from a list."""
-        if not variants:
-            self.ab_variants = None
-        else:
-            import json
-            self.ab_variants = json.dumps(variants)
+        self.ab_variants = list(variants) if variants else None
     
     def get_ab_split_percentages_list(self) -> List[float]:
         """Get A/B split percentages as a list."""
-        if self.ab_split_percentages is None:
-            return []
-        try:
-            import json
-            return json.loads(self.ab_split_percentages) if isinstance(self.ab_split_percentages, str) else self.ab_split_percentages
-        except (json.JSONDecodeError, TypeError):
-            return []
+        return list(self.ab_split_percentages or [])
     
     def set_ab_split_percentages_list(self, percentages: List[float]) -> None:
         """Set A/B split percentages from a list."""
-        if not percentages:
-            self.ab_split_percentages = None
-        else:
-            import json
-            self.ab_split_percentages = json.dumps(percentages)
+        self.ab_split_percentages = list(percentages) if percentages else None
     
     def get_account_weights_dict(self) -> Dict[int, float]:
         """Get account weights as a dictionary."""
-        if self.account_weights is None:
-            return {}
-        try:
-            import json
-            return json.loads(self.account_weights) if isinstance(self.account_weights, str) else self.account_weights
-        except (json.JSONDecodeError, TypeError):
-            return {}
+        return dict(self.account_weights or {})
     
     def set_account_weights_dict(self, weights: Dict[int, float]) -> None:
         """Set account weights from a dictionary."""
-        if not weights:
-            self.account_weights = None
-        else:
-            import json
-            self.account_weights = json.dumps(weights)
+        self.account_weights = dict(weights) if weights else None
     
     def get_recipient_filters_dict(self) -> Dict[str, Any]:
         """Get recipient filters as a dictionary."""
-        if self.recipient_filters is None:
-            return {}
-        try:
-            import json
-            return json.loads(self.recipient_filters) if isinstance(self.recipient_filters, str) else self.recipient_filters
-        except (json.JSONDecodeError, TypeError):
-            return {}
+        return dict(self.recipient_filters or {})
     
     def set_recipient_filters_dict(self, filters: Dict[str, Any]) -> None:
         """Set recipient filters from a dictionary."""
-        if not filters:
-            self.recipient_filters = None
-        else:
-            import json
-            self.recipient_filters = json.dumps(filters)
+        self.recipient_filters = dict(filters) if filters else None
     
     def get_tags_list(self) -> List[str]:
         """Get tags as a list."""
-        if self.tags is None:
-            return []
-        try:
-            import json
-            return json.loads(self.tags) if isinstance(self.tags, str) else self.tags
-        except (json.JSONDecodeError, TypeError):
-            return []
+        return list(self.tags or [])
     
     def set_tags_list(self, tags: List[str]) -> None:
         """Set tags from a list."""
-        if not tags:
-            self.tags = None
-        else:
-            import json
-            self.tags = json.dumps(tags)
+        self.tags = list(tags) if tags else None
+
+
+class CampaignProgress(SQLModel, table=True):
+    """Recipients a campaign has sent to or failed for, kept so a stopped or retried run can resume."""
+    
+    __tablename__ = "campaign_progress"
+    
+    campaign_id: int = Field(primary_key=True, foreign_key="campaigns.id")
+    # Recipient ids as serialized IdBitmaps (app.utils.bitmap)
+    sent_recipients: Optional[bytes] = Field(default=None)
+    failed_recipients: Optional[bytes] = Field(default=None)
+    # Fingerprint of the recipient list the progress belongs to
+    recipient_hash: Optional[str] = Field(default=None)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
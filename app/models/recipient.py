@@ -7,9 +7,10 @@ from typing import Dict, List, Optional, Any
 from enum import Enum
 
 from sqlmodel import Field, Relationship
-from sqlalchemy import JSON
+from sqlalchemy import Computed, Index, String, func, inspect, or_, select, text
+from sqlalchemy.orm import object_session
 
-from .base import BaseModel, SoftDeleteMixin, JSONFieldMixin
+from .base import BaseModel, JSONDict, JSONList, SoftDeleteMixin, JSONFieldMixin
 
 
 class RecipientType(str, Enum):
@@ -35,10 +36,62 @@ class RecipientStatus(str, Enum):
     UNKNOWN = "unknown"
 
 
+# SQL versions of Recipient.get_identifier/get_display_name for generated columns;
+# comparing with '' or 0 is false for NULL too, matching Python truthiness
+_IS_GROUP = "recipient_type IN ('GROUP', 'CHANNEL')"
+
+IDENTIFIER_SQL = (
+    f"CASE WHEN {_IS_GROUP} THEN "
+    "CASE WHEN group_username != '' THEN '@' || group_username "
+    "WHEN group_id != 0 THEN CAST(group_id AS TEXT) "
+    "ELSE 'group_' || id END "
+    "WHEN username != '' THEN '@' || username "
+    "WHEN user_id != 0 THEN CAST(user_id AS TEXT) "
+    "WHEN phone_number != '' THEN phone_number "
+    "ELSE 'recipient_' || id END"
+)
+
+DISPLAY_LABEL_SQL = (
+    f"CASE WHEN {_IS_GROUP} THEN "
+    "CASE WHEN group_title != '' THEN group_title "
+    "WHEN group_username != '' THEN '@' || group_username "
+    "WHEN group_id != 0 THEN 'Group ' || group_id "
+    "ELSE 'Unknown Group' END "
+    "WHEN display_name != '' THEN display_name "
+    "WHEN first_name != '' AND last_name != '' THEN first_name || ' ' || last_name "
+    "WHEN first_name != '' THEN first_name "
+    "WHEN username != '' THEN '@' || username "
+    "WHEN user_id != 0 THEN 'User ' || user_id "
+    "ELSE 'Unknown' END"
+)
+
+
 class Recipient(BaseModel, SoftDeleteMixin, JSONFieldMixin, table=True):
     """Individual recipient model."""
     
     __tablename__ = "recipients"
+    __table_args__ = (
+        # Live recipients by status, e.g. the recipients of a campaign
+        Index(
+            "ix_recipients_live_status", "status",
+            sqlite_where=text("is_deleted = 0"), postgresql_where=text("NOT is_deleted")
+        ),
+        # Live recipients with custom fields by status, the only candidates for custom field filters
+        Index(
+            "ix_recipients_live_custom_fields", "status",
+            sqlite_where=text("is_deleted = 0 AND custom_fields IS NOT NULL"),
+            postgresql_where=text("NOT is_deleted AND custom_fields IS NOT NULL")
+        ),
+        # Live recipients by identifier and by display label, for dedupe, lookups and sorting
+        Index(
+            "ix_recipients_live_identifier", "identifier",
+            sqlite_where=text("is_deleted = 0"), postgresql_where=text("NOT is_deleted")
+        ),
+        Index(
+            "ix_recipients_live_display_label", "display_label",
+            sqlite_where=text("is_deleted = 0"), postgresql_where=text("NOT is_deleted")
+        ),
+    )
     
     # Basic info
     recipient_type: RecipientType = Field(default=RecipientType.USER)
@@ -64,12 +117,12 @@ class Recipient(BaseModel, SoftDeleteMixin, JSONFieldMixin, table=True):
     # Status and metadata
     status: RecipientStatus = Field(default=RecipientStatus.ACTIVE)
     source: RecipientSource = Field(default=RecipientSource.MANUAL)
-    source_metadata: Optional[str] = Field(default=None, sa_column=JSON)
+    source_metadata: Optional[Dict[str, Any]] = Field(default=None, sa_type=JSONDict)
     
     # Organization
-    tags: Optional[str] = Field(default=None, sa_column=JSON)
+    tags: Optional[List[str]] = Field(default=None, sa_type=JSONList)
     notes: Optional[str] = Field(default=None)
-    custom_fields: Optional[str] = Field(default=None, sa_column=JSON)
+    custom_fields: Optional[Dict[str, Any]] = Field(default=None, sa_type=JSONDict)
     
     # Statistics
     total_messages_sent: int = Field(default=0)
@@ -77,12 +130,30 @@ class Recipient(BaseModel, SoftDeleteMixin, JSONFieldMixin, table=True):
     last_message_sent: Optional[datetime] = Field(default=None)
     last_message_failed: Optional[datetime] = Field(default=None)
     
+    # Generated by the database from the fields above (read-only)
+    identifier: Optional[str] = Field(
+        default=None, sa_type=String, sa_column_args=[Computed(text(IDENTIFIER_SQL), persisted=False)]
+    )
+    display_label: Optional[str] = Field(
+        default=None, sa_type=String, sa_column_args=[Computed(text(DISPLAY_LABEL_SQL), persisted=False)]
+    )
+    
     # Relationships
     send_logs: List["SendLog"] = Relationship(back_populates="recipient")
     recipient_lists: List["RecipientListRecipient"] = Relationship(back_populates="recipient")
     
+    def _generated(self, name: str) -> Optional[str]:
+        """Get a generated column's value if it was loaded and nothing changed since."""
+        value = self.__dict__.get(name)
+        if value is None or inspect(self).modified:
+            return None
+        return value
+    
     def get_display_name(self) -> str:
         """Get display name for the recipient."""
+        stored = self._generated("display_label")
+        if stored is not None:
+            return stored
         if self.recipient_type == RecipientType.GROUP or self.recipient_type == RecipientType.CHANNEL:
             if self.group_title:
                 return self.group_title
@@ -110,6 +181,9 @@ class Recipient(BaseModel, SoftDeleteMixin, JSONFieldMixin, table=True):
     
     def get_identifier(self) -> str:
         """Get unique identifier for the recipient."""
+        stored = self._generated("identifier")
+        if stored is not None:
+            return stored
         if self.recipient_type == RecipientType.GROUP or self.recipient_type == RecipientType.CHANNEL:
             if self.group_username:
                 return f"@{self.group_username}"
@@ -154,57 +228,27 @@ class Recipient(BaseModel, SoftDeleteMixin, JSONFieldMixin, table=True):
     
     def get_tags_list(self) -> List[str]:
         """Get tags as a list."""
-        if self.tags is None:
-            return []
-        try:
-            import json
-            return json.loads(self.tags) if isinstance(self.tags, str) else self.tags
-        except (json.JSONDecodeError, TypeError):
-            return []
+        return list(self.tags or [])
     
     def set_tags_list(self, tags: List[str]) -> None:
         """Set tags from a list."""
-        if not tags:
-            self.tags = None
-        else:
-            import json
-            self.tags = json.dumps(tags)
+        self.tags = list(tags) if tags else None
     
     def get_source_metadata_dict(self) -> Dict[str, Any]:
         """Get source metadata as a dictionary."""
-        if self.source_metadata is None:
-            return {}
-        try:
-            import json
-            return json.loads(self.source_metadata) if isinstance(self.source_metadata, str) else self.source_metadata
-        except (json.JSONDecodeError, TypeError):
-            return {}
+        return dict(self.source_metadata or {})
     
     def set_source_metadata_dict(self, metadata: Dict[str, Any]) -> None:
         """Set source metadata from a dictionary."""
-        if not metadata:
-            self.source_metadata = None
-        else:
-            import json
-            self.source_metadata = json.dumps(metadata)
+        self.source_metadata = dict(metadata) if metadata else None
     
     def get_custom_fields_dict(self) -> Dict[str, Any]:
         """Get custom fields as a dictionary."""
-        if self.custom_fields is None:
-            return {}
-        try:
-            import json
-            return json.loads(self.custom_fields) if isinstance(self.custom_fields, str) else self.custom_fields
-        except (json.JSONDecodeError, TypeError):
-            return {}
+        return dict(self.custom_fields or {})
     
     def set_custom_fields_dict(self, fields: Dict[str, Any]) -> None:
         """Set custom fields from a dictionary."""
-        if not fields:
-            self.custom_fields = None
-        else:
-            import json
-            self.custom_fields = json.dumps(fields)
+        self.custom_fields = dict(fields) if fields else None
 
 
 class RecipientList(BaseModel, SoftDeleteMixin, JSONFieldMixin, table=True):
@@ -219,10 +263,10 @@ class RecipientList(BaseModel, SoftDeleteMixin, JSONFieldMixin, table=True):
     # Metadata
     source: RecipientSource = Field(default=RecipientSource.MANUAL)
     source_file_path: Optional[str] = Field(default=None)
-    import_metadata: Optional[str] = Field(default=None, sa_column=JSON)
+    import_metadata: Optional[Dict[str, Any]] = Field(default=None, sa_type=JSONDict)
     
     # Organization
-    tags: Optional[str] = Field(default=None, sa_column=JSON)
+    tags: Optional[List[str]] = Field(default=None, sa_type=JSONList)
     notes: Optional[str] = Field(default=None)
     
     # Statistics
@@ -241,59 +285,61 @@ class RecipientList(BaseModel, SoftDeleteMixin, JSONFieldMixin, table=True):
     
     def update_statistics(self) -> None:
         """Update recipient statistics."""
-        self.total_recipients = len(self.recipients)
-        self.active_recipients = sum(1 for r in self.recipients if r.recipient.is_contactable())
+        self.total_recipients = self.get_recipient_count()
+        self.active_recipients = self.get_active_recipient_count()
         self.last_updated = datetime.utcnow()
     
     def get_recipient_count(self) -> int:
         """Get total recipient count."""
-        return len(self.recipients)
+        return self._count_members()
     
     def get_active_recipient_count(self) -> int:
         """Get active recipient count."""
-        return sum(1 for r in self.recipients if r.recipient.is_contactable())
+        return self._count_members(
+            Recipient.status == RecipientStatus.ACTIVE,
+            Recipient.is_deleted == False,
+            # Same as is_contactable: comparisons with NULL are never true
+            or_(Recipient.username != "", Recipient.user_id != 0, Recipient.phone_number != "")
+        )
+    
+    def _count_members(self, *conditions: Any) -> int:
+        """Count list members in the database instead of loading every association."""
+        session = object_session(self)
+        if session is None or self.id is None:
+            members = [link.recipient for link in self.recipients]
+            return sum(1 for r in members if not conditions or r.is_contactable())
+        statement = select(func.count()).select_from(RecipientListRecipient).where(
+            RecipientListRecipient.recipient_list_id == self.id
+        )
+        if conditions:
+            statement = statement.join(Recipient, Recipient.id == RecipientListRecipient.recipient_id).where(*conditions)
+        return session.execute(statement).scalar_one()
     
     def get_tags_list(self) -> List[str]:
         """Get tags as a list."""
-        if self.tags is None:
-            return []
-        try:
-            import json
-            return json.loads(self.tags) if isinstance(self.tags, str) else self.tags
-        except (json.JSONDecodeError, TypeError):
-            return []
+        return list(self.tags or [])
     
     def set_tags_list(self, tags: List[str]) -> None:
         """Set tags from a list."""
-        if not tags:
-            self.tags = None
-        else:
-            import json
-            self.tags = json.dumps(tags)
+        self.tags = list(tags) if tags else None
     
     def get_import_metadata_dict(self) -> Dict[str, Any]:
         """Get import metadata as a dictionary."""
-        if self.import_metadata is None:
-            return {}
-        try:
-            import json
-            return json.loads(self.import_metadata) if isinstance(self.import_metadata, str) else self.import_metadata
-        except (json.JSONDecodeError, TypeError):
-            return {}
+        return dict(self.import_metadata or {})
     
     def set_import_metadata_dict(self, metadata: Dict[str, Any]) -> None:
         """Set import metadata from a dictionary."""
-        if not metadata:
-            self.import_metadata = None
-        else:
-            import json
-            self.import_metadata = json.dumps(metadata)
+        self.import_metadata = dict(metadata) if metadata else None
 
 
 class RecipientListRecipient(BaseModel, table=True):
     """Association table for recipient lists and recipients."""
     
     __tablename__ = "recipientlist_recipients"
+    __table_args__ = (
+        # Members of a list; the primary key leads with id, so it can't serve these lookups
+        Index("ix_recipientlist_recipients_list_recipient", "recipient_list_id", "recipient_id"),
+    )
     
     recipient_list_id: int = Field(foreign_key="recipientlists.id", primary_key=True)
     recipient_id: int = Field(foreign_key="recipients.id", primary_key=True)
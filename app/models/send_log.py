@@ -6,10 +6,10 @@ from datetime import datetime
 from typing import Dict, Optional, Any
 from enum import Enum
 
-from sqlmodel import Field, Relationship
-from sqlalchemy import JSON
+from sqlmodel import Field, Relationship, SQLModel
+from sqlalchemy import Index
 
-from .base import BaseModel, JSONFieldMixin
+from .base import BaseModel, JSONDict, JSONFieldMixin
 
 
 class SendStatus(str, Enum):
@@ -23,10 +23,49 @@ class SendStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+class SendErrorCode(str, Enum):
+    """Stable reason a send failed, independent of the error message wording."""
+    FLOOD_WAIT = "flood_wait"
+    PEER_FLOOD = "peer_flood"
+    SLOW_MODE = "slow_mode"
+    PRIVACY_RESTRICTED = "privacy_restricted"
+    BLOCKED = "blocked"
+    PEER_NOT_FOUND = "peer_not_found"
+    PEER_DEACTIVATED = "peer_deactivated"
+    WRITE_FORBIDDEN = "write_forbidden"
+    INVALID_MESSAGE = "invalid_message"
+    ACCOUNT_BANNED = "account_banned"
+    AUTH = "auth"
+    CLIENT_NOT_READY = "client_not_ready"
+    NETWORK = "network"
+    UNKNOWN = "unknown"
+
+
+class MessageBody(SQLModel, table=True):
+    """A distinct message text, stored once and referenced by every send log that sent it."""
+    
+    __tablename__ = "message_bodies"
+    
+    id: Optional[int] = Field(default=None, primary_key=True)
+    # Digest of the text, see services.message_bodies.body_hash
+    content_hash: str = Field(index=True, unique=True)
+    text: str
+
+
 class SendLog(BaseModel, JSONFieldMixin, table=True):
     """Send log model for tracking message sending activities."""
     
     __tablename__ = "send_logs"
+    __table_args__ = (
+        # Keyset pagination of the log viewer, newest first
+        Index("ix_send_logs_created_at_id", "created_at", "id"),
+        Index("ix_send_logs_status_created_at", "status", "created_at"),
+        Index("ix_send_logs_campaign_created_at", "campaign_id", "created_at"),
+        Index("ix_send_logs_account_created_at", "account_id", "created_at"),
+        # Covers the "already sent to" lookup when a campaign resumes
+        Index("ix_send_logs_campaign_status_recipient", "campaign_id", "status", "recipient_id"),
+        Index("ix_send_logs_error_code_created_at", "error_code", "created_at"),
+    )
     
     # Campaign and account info
     campaign_id: Optional[int] = Field(foreign_key="campaigns.id", index=True, default=None)
@@ -39,8 +78,8 @@ class SendLog(BaseModel, JSONFieldMixin, table=True):
     recipient_identifier: Optional[str] = Field(default=None)
     sent_at: Optional[datetime] = Field(default=None)
     
-    # Message details
-    message_text: str
+    # Message details; the text itself lives in message_bodies
+    message_body_id: Optional[int] = Field(default=None, foreign_key="message_bodies.id")
     message_type: str = Field(default="text")
     media_path: Optional[str] = Field(default=None)
     caption: Optional[str] = Field(default=None)
@@ -48,7 +87,7 @@ class SendLog(BaseModel, JSONFieldMixin, table=True):
     # Status and timing
     status: SendStatus = Field(default=SendStatus.PENDING)
     error_message: Optional[str] = Field(default=None)
-    error_code: Optional[str] = Field(default=None)
+    error_code: Optional[SendErrorCode] = Field(default=None)
     
     # Timing
     scheduled_at: Optional[datetime] = Field(default=None)
@@ -67,15 +106,29 @@ class SendLog(BaseModel, JSONFieldMixin, table=True):
     telegram_error_code: Optional[str] = Field(default=None)
     
     # Additional metadata
-    log_metadata: Optional[str] = Field(default=None, sa_column=JSON)
-    user_agent: Optional[str] = Field(default=None)
-    ip_address: Optional[str] = Field(default=None)
+    log_metadata: Optional[Dict[str, Any]] = Field(default=None, sa_type=JSONDict)
     
     # Relationships
     campaign: Optional["Campaign"] = Relationship(back_populates="send_logs")
     account: "Account" = Relationship(back_populates="send_logs")
     recipient: Optional["Recipient"] = Relationship(back_populates="send_logs")
+    message_body: Optional[MessageBody] = Relationship()
+    
+    def __init__(self, **data):
+        # Not a column: turned into message_body_id when the log is first flushed
+        message_text = data.pop("message_text", None)
+        super().__init__(**data)
+        self._message_text = message_text
+    
+    @property
+    def message_text(self) -> str:
+        """Get the message text, from the referenced body once the log is stored."""
+        pending = self.__dict__.get("_message_text")
+        if pending is not None:
+            return pending
+        return self.message_body.text if self.message_body else ""
     
+
     def start_sending(self) -> None:
         """Mark the send as started."""
         self.status = SendStatus.SENDING
@@ -92,7 +145,7 @@ class SendLog(BaseModel, JSONFieldMixin, table=True):
             duration = self.completed_at - self.started_at
             self.duration_ms = int(duration.total_seconds() * 1000)
     
-    def mark_failed(self, error_message: str, error_code: Optional[str] = None, telegram_error_code: Optional[str] = None) -> None:
+    def mark_failed(self, error_message: str, error_code: Optional[SendErrorCode] = None, telegram_error_code: Optional[str] = None) -> None:
         """Mark the send as failed."""
         self.status = SendStatus.FAILED
         self.completed_at = datetime.utcnow()
@@ -162,8 +215,43 @@ class SendLog(BaseModel, JSONFieldMixin, table=True):
         
         summary = self.error_message
         if self.error_code:
-            summary += f" (Code: {self.error_code})"
+            summary += f" (Code: {SendErrorCode(self.error_code).value})"
         if self.telegram_error_code:
             summary += f" (Telegram: {self.telegram_error_code})"
         
         return summary
+
+
+class SendLogRollup(SQLModel, table=True):
+    """Send log counts per campaign, account, hour and status, kept up to date as logs are written."""
+    
+    __tablename__ = "send_log_rollups"
+    __table_args__ = (
+        Index("ix_send_log_rollups_account_hour", "account_id", "hour"),
+    )
+    
+    # 0 stands for logs without a campaign (e.g. warmup), so every key column is set
+    campaign_id: int = Field(primary_key=True)
+    account_id: int = Field(primary_key=True)
+    # Hour of completion, or of creation for logs that haven't completed
+    hour: datetime = Field(primary_key=True)
+    status: SendStatus = Field(primary_key=True)
+    
+    count: int = Field(default=0)
+    duration_ms_total: int = Field(default=0)
+    duration_count: int = Field(default=0)
+
+
+class SendLogErrorRollup(SQLModel, table=True):
+    """Failed send log counts per campaign, account and error code."""
+    
+    __tablename__ = "send_log_error_rollups"
+    __table_args__ = (
+        Index("ix_send_log_error_rollups_error_code", "error_code"),
+    )
+    
+    campaign_id: int = Field(primary_key=True)
+    account_id: int = Field(primary_key=True)
+    error_code: SendErrorCode = Field(primary_key=True)
+    
+    count: int = Field(default=0)
@@ -0,0 +1,22 @@
+"""
+Tag index model shared by all taggable entities.
+"""
+
+from sqlmodel import Field, SQLModel
+from sqlalchemy import Index
+
+
+class EntityTag(SQLModel, table=True):
+    """One tag of one entity, mirrored from the entity's JSON ``tags`` column by triggers."""
+    
+    __tablename__ = "entity_tags"
+    __table_args__ = (
+        # Tags of an entity, for replacing them when the entity changes
+        Index("ix_entity_tags_entity", "entity_type", "entity_id"),
+        {"sqlite_with_rowid": False},
+    )
+    
+    # The primary key is the (tag, entity_type, entity_id) lookup index
+    tag: str = Field(primary_key=True)
+    entity_type: str = Field(primary_key=True)  # table name of the entity
+    entity_id: int = Field(primary_key=True)
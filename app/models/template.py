@@ -7,9 +7,8 @@ from typing import Dict, List, Optional, Any
 from enum import Enum
 
 from sqlmodel import Field, Relationship
-from sqlalchemy import JSON
 
-from .base import BaseModel, SoftDeleteMixin, JSONFieldMixin
+from .base import BaseModel, JSONDict, JSONList, SoftDeleteMixin, JSONFieldMixin
 
 
 class TemplateType(str, Enum):
@@ -53,17 +52,17 @@ class MessageTemplate(BaseModel, SoftDeleteMixin, JSONFieldMixin, table=True):
     caption: Optional[str] = Field(default=None)
     
     # Variables and personalization
-    variables: Optional[str] = Field(default=None, sa_column=JSON)
-    variable_descriptions: Optional[str] = Field(default=None, sa_column=JSON)
+    variables: Optional[List[str]] = Field(default=None, sa_type=JSONList)
+    variable_descriptions: Optional[Dict[str, str]] = Field(default=None, sa_type=JSONDict)
     use_spintax: bool = Field(default=False)
     spintax_text: Optional[str] = Field(default=None)
     
     # A/B Testing
     use_ab_testing: bool = Field(default=False)
-    ab_variants: Optional[str] = Field(default=None, sa_column=JSON)
+    ab_variants: Optional[List[Dict[str, Any]]] = Field(default=None, sa_type=JSONList)
     
     # Organization
-    tags: Optional[str] = Field(default=None, sa_column=JSON)
+    tags: Optional[List[str]] = Field(default=None, sa_type=JSONList)
     notes: Optional[str] = Field(default=None)
     
     # Usage statistics
@@ -141,20 +140,11 @@ class MessageTemplate(BaseModel, SoftDeleteMixin, JSONFieldMixin, table=True):
     
     def get_tags_list(self) -> List[str]:
         """Get tags as a list."""
-        if self.tags:
-            import json
-            if isinstance(self.tags, str):
-                try:
-                    return json.loads(self.tags)
-                except (json.JSONDecodeError, TypeError):
-                    return []
-            return self.tags if isinstance(self.tags, list) else []
-        return []
+        return list(self.tags or [])
     
     def set_tags_list(self, tags: List[str]) -> None:
         """Set tags from a list."""
-        import json
-        self.tags = json.dumps(tags) if tags else None
+        self.tags = list(tags) if tags else None
     
     def get_ab_variant(self, recipient_id: int) -> Dict[str, Any]:
         """Get A/B test variant for a recipient."""
@@ -9,11 +9,27 @@ from .db import (
     initialize_database, 
     get_session, 
     get_async_session,
+    dispose_async_engine,
+    get_db_writer,
     close_database,
     health_check,
     backup_database,
     restore_database
 )
+from .async_repository import get_async_repository, AsyncRepository
+from .db_backup import get_backup_service, DatabaseBackupService, BackupResult
+from .log_retention import get_log_retention, LogRetentionManager, RetentionResult
+from .send_log_rollups import get_send_log_rollups, SendLogRollups
+from .send_errors import classify_send_error, classify_error_message, send_failure, SendError
+from .message_bodies import get_message_bodies, MessageBodyStore
+from .send_counters import get_send_counters, SendCounters
+from .recipient_search import get_recipient_search, RecipientSearchService
+from .recipient_audience import get_recipient_audience, RecipientAudienceService
+from .recipient_segments import RecipientSegment
+from .entity_tags import get_entity_tags, EntityTagIndex
+from .data_access import get_data_access, DataAccessService, QueryHandle
+from .data_export import get_data_export, DataExportService, ExportResult, ExportSource
+from .change_bus import get_change_bus, DataChangeBus, ChangeSet, TableChanges
 from .campaign_manager import get_campaign_manager, CampaignManager
 
 __all__ = [
@@ -32,11 +48,69 @@ __all__ = [
     "initialize_database",
     "get_session",
     "get_async_session", 
+    "dispose_async_engine",
+    "get_db_writer",
+    "get_async_repository",
+    "AsyncRepository",
     "close_database",
     "health_check",
     "backup_database",
     "restore_database",
     
+    # Backups
+    "get_backup_service",
+    "DatabaseBackupService",
+    "BackupResult",
+    
+    # Log retention
+    "get_log_retention",
+    "LogRetentionManager",
+    "RetentionResult",
+    
+    # Report rollups
+    "get_send_log_rollups",
+    "SendLogRollups",
+    
+    # Send errors
+    "classify_send_error",
+    "classify_error_message",
+    "send_failure",
+    "SendError",
+    
+    # Message bodies
+    "get_message_bodies",
+    "MessageBodyStore",
+    
+    # Send counters
+    "get_send_counters",
+    "SendCounters",
+    
+    # Background data access
+    "get_data_access",
+    "DataAccessService",
+    "QueryHandle",
+    
+    # Data export
+    "get_data_export",
+    "DataExportService",
+    "ExportResult",
+    "ExportSource",
+    
+    # Change notifications
+    "get_change_bus",
+    "DataChangeBus",
+    "ChangeSet",
+    "TableChanges",
+    
+    # Search
+    "get_recipient_search",
+    "get_recipient_audience",
+    "RecipientSearchService",
+    "RecipientAudienceService",
+    "RecipientSegment",
+    "get_entity_tags",
+    "EntityTagIndex",
+    
     # Campaign Management
     "get_campaign_manager",
     "CampaignManager",
@@ -0,0 +1,147 @@
+"""
+Async queries and writes for the campaign and warmup engines.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, List, Optional, Set
+
+from sqlmodel import Session, select
+
+from ..models import Account, Campaign, CampaignProgress, CampaignStatus, Recipient, SendLog, SendStatus
+from .db import get_async_session, get_db_writer
+from .logger import get_logger
+from .recipient_segments import DEFAULT_BATCH_SIZE, RecipientSegment
+
+
+class AsyncRepository:
+    """Database access for code running on an asyncio event loop.
+
+    Reads go through an async session, so the loop keeps serving other sends
+    while SQLite works. Writes are handed to the single writer queue and
+    awaited, which keeps one writer per database file. Objects are returned
+    detached; change them through ``update_campaign`` or ``write``.
+    """
+
+    def __init__(self):
+        self.logger = get_logger()
+
+    # Reads
+
+    async def get_campaign(self, campaign_id: int) -> Optional[Campaign]:
+        """Get a campaign by id."""
+        async with get_async_session() as session:
+            return await session.get(Campaign, campaign_id)
+
+    async def get_campaign_status(self, campaign_id: int) -> Optional[CampaignStatus]:
+        """Get only the status of a campaign."""
+        async with get_async_session() as session:
+            result = await session.exec(select(Campaign.status).where(Campaign.id == campaign_id))
+            return result.first()
+
+    async def get_account(self, account_id: int) -> Optional[Account]:
+        """Get an account by id."""
+        async with get_async_session() as session:
+            return await session.get(Account, account_id)
+
+    async def count_campaign_recipients(self, campaign: Campaign) -> int:
+        """Count the recipients a campaign sends to."""
+        segment = RecipientSegment.for_campaign(campaign)
+        async with get_async_session() as session:
+            result = await session.exec(segment.select_count())
+            return result.one() or 0
+
+    async def iter_campaign_recipients(
+        self,
+        campaign: Campaign,
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> AsyncIterator[Recipient]:
+        """Stream the recipients a campaign sends to in id order, reading one batch at a time."""
+        segment = RecipientSegment.for_campaign(campaign)
+        after_id = 0
+        while True:
+            # A short read per batch, so no transaction stays open between sends
+            async with get_async_session() as session:
+                result = await session.exec(segment.select_page(after_id, batch_size))
+                batch = list(result.all())
+            for recipient in batch:
+                yield recipient
+            if len(batch) < batch_size:
+                return
+            after_id = batch[-1].id
+
+    async def get_campaign_recipients(self, campaign: Campaign) -> List[Recipient]:
+        """Get the recipients a campaign sends to."""
+        return [recipient async for recipient in self.iter_campaign_recipients(campaign)]
+
+    async def get_sent_recipient_ids(self, campaign_id: int, since: Optional[datetime] = None) -> Set[int]:
+        """Get ids of recipients a campaign has sent to successfully, optionally only logged since a time."""
+        query = select(SendLog.recipient_id).where(
+            SendLog.campaign_id == campaign_id,
+            SendLog.status == SendStatus.SENT,
+            SendLog.recipient_id.is_not(None)
+        )
+        if since is not None:
+            query = query.where(SendLog.created_at >= since)
+        async with get_async_session() as session:
+            result = await session.exec(query)
+            return set(result.all())
+
+    async def get_campaign_progress(self, campaign_id: int) -> Optional[CampaignProgress]:
+        """Get the saved sent/failed recipients of a campaign."""
+        async with get_async_session() as session:
+            return await session.get(CampaignProgress, campaign_id)
+
+    async def get_available_accounts(self) -> List[Account]:
+        """Get active, online accounts."""
+        async with get_async_session() as session:
+            result = await session.exec(
+                select(Account).where(
+                    Account.is_deleted == False,
+                    Account.status == "ONLINE",
+                    Account.is_active == True
+                )
+            )
+            return list(result.all())
+
+    # Writes
+
+    async def write(self, job: Callable[[Session], Any], table: Optional[str] = None) -> Any:
+        """Run ``job(session)`` on the writer queue for ``table`` and wait for its commit."""
+        return await asyncio.wrap_future(get_db_writer(table).submit(job))
+
+    async def add(self, *objects: Any) -> None:
+        """Insert ORM objects through the writer queue of their table."""
+        tables = {type(obj).__tablename__ for obj in objects}
+        # Send logs may live in their own database with their own queue
+        table = tables.pop() if len(tables) == 1 else None
+        await asyncio.wrap_future(get_db_writer(table).add(*objects))
+
+    async def update_campaign(
+        self,
+        campaign_id: int,
+        only_if_status: Optional[CampaignStatus] = None,
+        **values: Any
+    ) -> bool:
+        """Set campaign fields, optionally only while it has a given status."""
+        def update(session: Session) -> bool:
+            campaign = session.get(Campaign, campaign_id)
+            if campaign is None or (only_if_status is not None and campaign.status != only_if_status):
+                return False
+            for name, value in values.items():
+                setattr(campaign, name, value)
+            return True
+
+        return await self.write(update)
+
+
+# Global async repository instance
+_async_repository: Optional[AsyncRepository] = None
+
+
+def get_async_repository() -> AsyncRepository:
+    """Get the global async repository instance."""
+    global _async_repository
+    if _async_repository is None:
+        _async_repository = AsyncRepository()
+    return _async_repository
@@ -4,15 +4,25 @@ Campaign management service for handling campaign execution, scheduling, and sta
 
 import asyncio
 import threading
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from PyQt5.QtCore import QObject, pyqtSignal, QTimer
 
-from ..models import Campaign, CampaignStatus, Account, Recipient, SendLog, SendStatus
+from ..models import Campaign, CampaignProgress, CampaignStatus, Account, Recipient, SendErrorCode, SendLog, SendStatus
 from ..services import get_logger, get_session
+from .db import dispose_async_engine
+from .async_repository import get_async_repository
+from .send_errors import classify_error_message, send_failure
+from .send_counters import get_send_counters
 from ..core.engine import MessageEngine, CampaignRunner
 from ..core.telethon_client import TelegramClientManager
 from ..core.spintax import SpintaxProcessor
+from ..utils.bitmap import IdBitmap
+
+
+# Save sent/failed recipients of a running campaign after this many recipients
+PROGRESS_SAVE_EVERY = 100
 
 
 class CampaignManager(QObject):
@@ -39,14 +49,9 @@ class CampaignManager(QObject):
         self._campaign_tasks: Dict[int, threading.Thread] = {}
         self._campaign_status: Dict[int, str] = {}
         
-        # Track sent recipients per campaign to avoid resending
-        self._sent_recipients: Dict[int, set] = {}  # campaign_id -> set of recipient_ids
-        self._campaign_recipient_hashes: Dict[int, str] = {}  # campaign_id -> recipient_list_hash
-        
-        # Setup timer for status updates
-        self.status_timer = QTimer()
-        self.status_timer.timeout.connect(self._update_campaign_status)
-        self.status_timer.start(5000)  # Update every 5 seconds
+        # Pick up campaign status changes as they are committed
+        from .change_bus import get_change_bus
+        get_change_bus().entities_changed.connect(self._on_data_changed)
         
         # Setup timer for scheduled campaigns
         self.scheduler_timer = QTimer()
@@ -79,12 +84,23 @@ class CampaignManager(QObject):
                 # Check if this is a retry and handle accordingly
                 is_retry = campaign.status in [CampaignStatus.COMPLETED, CampaignStatus.STOPPED, CampaignStatus.ERROR]
                 recipients_changed = False
+                progress = session.get(CampaignProgress, campaign_id) or CampaignProgress(campaign_id=campaign_id)
+                try:
+                    current_hash = self._calculate_recipient_hash(campaign)
+                except ValueError as e:
+                    # No recipient list for its source, or filters that don't compile
+                    self.logger.error(f"Campaign {campaign_id} cannot be started: {e}")
+                    if campaign.status == CampaignStatus.SCHEDULED:
+                        # Otherwise the scheduler would try again every minute
+                        campaign.status = CampaignStatus.ERROR
+                        session.add(campaign)
+                        session.commit()
+                    self.campaign_error.emit(campaign_id, f"Cannot start campaign: {e}")
+                    return False
                 
                 if is_retry:
                     # Check if recipients have changed
-                    current_hash = self._calculate_recipient_hash(campaign)
-                    stored_hash = self._campaign_recipient_hashes.get(campaign_id)
-                    recipients_changed = current_hash != stored_hash
+                    recipients_changed = current_hash != progress.recipient_hash
                     
                     if not recipients_changed and campaign.failed_count == 0:
                         self.logger.warning(f"Campaign {campaign_id} has no failed messages and recipients unchanged - no retry needed")
@@ -104,16 +120,15 @@ class CampaignManager(QObject):
                     campaign.failed_count = 0
                     campaign.skipped_count = 0
                     campaign.progress_percentage = 0.0
-                    # Clear sent recipients tracking for this campaign
-                    self._sent_recipients[campaign_id] = set()
+                    # Recipients already sent to are still skipped; earlier failures no longer apply
+                    progress.failed_recipients = None
                 
                 campaign.start_time_actual = datetime.utcnow()
                 campaign.last_activity = datetime.utcnow()
-                session.commit()
-                
                 # Store recipient hash for change detection
-                current_hash = self._calculate_recipient_hash(campaign)
-                self._campaign_recipient_hashes[campaign_id] = current_hash
+                progress.recipient_hash = current_hash
+                session.add(progress)
+                session.commit()
                 
                 # Mark as running BEFORE starting thread to prevent race conditions
                 self._running_campaigns[campaign_id] = True
@@ -300,8 +315,8 @@ class CampaignManager(QObject):
                 
                 # Can retry if recipients have changed
                 current_hash = self._calculate_recipient_hash(campaign)
-                stored_hash = self._campaign_recipient_hashes.get(campaign_id)
-                if current_hash != stored_hash:
+                progress = session.get(CampaignProgress, campaign_id)
+                if current_hash != (progress.recipient_hash if progress else None):
                     return True
                 
                 return False
@@ -381,66 +396,46 @@ class CampaignManager(QObject):
             return None
     
     def _calculate_recipient_hash(self, campaign: Campaign) -> str:
-        """Calculate hash of current recipient list for a campaign."""
+        """Get the fingerprint of a campaign's current recipients."""
         try:
-            import hashlib
-            
-            # Get current recipients
-            recipients = self._get_campaign_recipients_sync(campaign)
-            
-            # Create hash from recipient IDs
-            recipient_ids = sorted([r.id for r in recipients])
-            hash_input = f"{campaign.id}_{len(recipient_ids)}_{'_'.join(map(str, recipient_ids))}"
-            
-            return hashlib.md5(hash_input.encode()).hexdigest()
-            
+            from .recipient_audience import get_recipient_audience
+            from .recipient_segments import RecipientSegment
+            return get_recipient_audience().fingerprint(RecipientSegment.for_campaign(campaign))
+        except ValueError:
+            # Recipients that can't be resolved must not compare as unchanged
+            raise
         except Exception as e:
             self.logger.error(f"Error calculating recipient hash: {e}")
             return ""
     
-    def _get_campaign_recipients_sync(self, campaign: Campaign) -> List[Recipient]:
-        """Get recipients for a campaign synchronously."""
-        try:
-            with get_session() as session:
-                from sqlmodel import select
-                
-                # Get recipients based on campaign settings
-                if campaign.recipient_source == "manual":
-                    # Get all active recipients
-                    query = select(Recipient).where(
-                        Recipient.is_deleted == False,
-                        Recipient.status == "active"
-                    )
-                else:
-                    # For other sources, return empty for now
-                    return []
-                
-                recipients = session.exec(query).all()
-                return list(recipients)
-                
-        except Exception as e:
-            self.logger.error(f"Error getting recipients: {e}")
-            return []
+    async def _load_progress(self, campaign_id: int) -> Tuple[IdBitmap, IdBitmap]:
+        """Load the recipients a campaign has sent to and failed for, to resume where it stopped."""
+        repository = get_async_repository()
+        progress = await repository.get_campaign_progress(campaign_id)
+        sent = IdBitmap.from_bytes(progress.sent_recipients if progress else None)
+        failed = IdBitmap.from_bytes(progress.failed_recipients if progress else None)
+        # Sends logged after the progress was saved (all of them, if it never was)
+        since = progress.updated_at if progress and progress.sent_recipients is not None else None
+        sent.update(await repository.get_sent_recipient_ids(campaign_id, since))
+        return sent, failed
     
-    async def _get_sent_recipients(self, campaign_id: int) -> set:
-        """Get recipients that have already been sent to successfully."""
+    async def _save_progress(self, campaign_id: int, sent: IdBitmap, failed: IdBitmap) -> None:
+        """Save the recipients a run has sent to and failed for."""
+        saved_at = datetime.utcnow()
+        sent_data = sent.to_bytes()
+        failed_data = failed.to_bytes()
+        
+        def save(session):
+            progress = session.get(CampaignProgress, campaign_id) or CampaignProgress(campaign_id=campaign_id)
+            progress.sent_recipients = sent_data
+            progress.failed_recipients = failed_data
+            progress.updated_at = saved_at
+            session.add(progress)
+        
         try:
-            with get_session() as session:
-                from sqlmodel import select
-                from ..models import SendLog, SendStatus
-                
-                # Get all successful send logs for this campaign
-                query = select(SendLog.recipient_id).where(
-                    SendLog.campaign_id == campaign_id,
-                    SendLog.status == SendStatus.SENT
-                )
-                
-                sent_recipient_ids = session.exec(query).all()
-                return set(sent_recipient_ids)
-                
+            await get_async_repository().write(save)
         except Exception as e:
-            self.logger.error(f"Error getting sent recipients: {e}")
-            return set()
+            self.logger.error(f"Error saving progress of campaign {campaign_id}: {e}")
     
     def _run_campaign_thread(self, campaign_id: int):
         """Run campaign in a separate thread."""
@@ -463,193 +458,205 @@ class CampaignManager(QObject):
     async def _run_campaign_async(self, campaign_id: int):
         """Run campaign asynchronously."""
         self.logger.info(f"Campaign {campaign_id} execution started")
+        repository = get_async_repository()
+        # This run's own bitmaps; a run started after a quick pause and resume loads its own
+        sent_recipients: Optional[IdBitmap] = None
+        failed_recipients: Optional[IdBitmap] = None
         try:
-            with get_session() as session:
-                campaign = session.get(Campaign, campaign_id)
-                if not campaign:
-                    return
-                
-                # Get recipients
-                recipients = await self._get_campaign_recipients(campaign)
-                if not recipients:
-                    self.logger.warning(f"No recipients found for campaign {campaign_id}")
-                    campaign.status = CampaignStatus.COMPLETED
-                    campaign.end_time_actual = datetime.utcnow()
-                    session.commit()
-                    self.campaign_completed.emit(campaign_id)
-                    return
-                
-                # Update total recipients
-                campaign.total_recipients = len(recipients)
-                session.commit()
+            campaign = await repository.get_campaign(campaign_id)
+            if not campaign:
+                return
+            
+            # Size the audience; recipients are streamed while sending
+            try:
+                total_recipients = await self._count_campaign_recipients(campaign)
+            except ValueError as e:
+                self.logger.error(f"Cannot resolve recipients for campaign {campaign_id}: {e}")
+                await repository.update_campaign(
+                    campaign_id,
+                    status=CampaignStatus.ERROR,
+                    end_time_actual=datetime.utcnow()
+                )
+                self.campaign_error.emit(campaign_id, str(e))
+                return
+            if not total_recipients:
+                self.logger.warning(f"No recipients found for campaign {campaign_id}")
+                await repository.update_campaign(
+                    campaign_id,
+                    status=CampaignStatus.COMPLETED,
+                    end_time_actual=datetime.utcnow()
+                )
+                self.campaign_completed.emit(campaign_id)
+                return
+            
+            # Update total recipients
+            await repository.update_campaign(campaign_id, total_recipients=total_recipients)
+            
+            # Get available accounts
+            accounts = await self._get_available_accounts()
+            if not accounts:
+                self.logger.error(f"No available accounts for campaign {campaign_id}")
+                await repository.update_campaign(campaign_id, status=CampaignStatus.ERROR)
+                self.campaign_error.emit(campaign_id, "No available accounts")
+                return
+            
+            # For campaign execution, we'll create new clients in the thread
+            # This avoids the asyncio event loop conflict
+            ready_accounts = []
+            for account in accounts:
+                # Check if account is online (handle both string and enum)
+                account_status = str(account.status).split('.')[-1] if hasattr(account.status, 'value') else str(account.status)
+                if account_status == "ONLINE":
+                    ready_accounts.append(account)
+                else:
+                    self.logger.warning(f"Account {account.name} (ID: {account.id}) is not online (status: {account_status}) - skipping")
+            
+            if not ready_accounts:
+                self.logger.error(f"No ready accounts for campaign {campaign_id}")
+                await repository.update_campaign(
+                    campaign_id,
+                    status=CampaignStatus.ERROR,
+                    end_time_actual=datetime.utcnow()
+                )
+                self.campaign_error.emit(campaign_id, "No ready accounts")
                 
-                # Get available accounts
-                accounts = await self._get_available_accounts()
-                if not accounts:
-                    self.logger.error(f"No available accounts for campaign {campaign_id}")
-                    campaign.status = CampaignStatus.ERROR
-                    session.commit()
-                    self.campaign_error.emit(campaign_id, "No available accounts")
-                    return
-                
-                # For campaign execution, we'll create new clients in the thread
-                # This avoids the asyncio event loop conflict
-                ready_accounts = []
-                for account in accounts:
-                    # Check if account is online (handle both string and enum)
-                    account_status = str(account.status).split('.')[-1] if hasattr(account.status, 'value') else str(account.status)
-                    if account_status == "ONLINE":
-                        ready_accounts.append(account)
-                    else:
-                        self.logger.warning(f"Account {account.name} (ID: {account.id}) is not online (status: {account_status}) - skipping")
-                
-                if not ready_accounts:
-                    self.logger.error(f"No ready accounts for campaign {campaign_id}")
-                    campaign.status = CampaignStatus.ERROR
-                    campaign.end_time_actual = datetime.utcnow()
-                    session.commit()
-                    self.campaign_error.emit(campaign_id, "No ready accounts")
+                # Create error log
+                await self._create_error_log(campaign, "No ready accounts available")
+                return
+            
+            # Use only ready accounts
+            accounts = ready_accounts
+            
+            # Recipients sent to in earlier runs are skipped; ones that failed are retried
+            sent_recipients, failed_recipients = await self._load_progress(campaign_id)
+            
+            # Process recipients
+            sent_count = campaign.sent_count  # Start with existing count
+            failed_count = campaign.failed_count  # Start with existing count
+            skipped_count = campaign.skipped_count  # Start with existing count
+            
+            position = 0
+            async for recipient in repository.iter_campaign_recipients(campaign):
+                position += 1
+                # Check if campaign should continue
+                if await repository.get_campaign_status(campaign_id) != CampaignStatus.RUNNING:
+                    break
+                
+                # Skip if already sent successfully
+                if recipient.id in sent_recipients:
+                    self.logger.debug(f"Skipping already sent recipient {recipient.get_display_name()}")
+                    continue
+                
+                try:
+                    # Select account
+                    account = self._select_account(accounts, campaign)
+                    if not account:
+                        skipped_count += 1
+                        continue
                     
-                    # Create error log
-                    await self._create_error_log(campaign, "No ready accounts available")
-                    return
-                
-                # Use only ready accounts
-                accounts = ready_accounts
-                
-                # Initialize sent recipients tracking for this campaign
-                if campaign_id not in self._sent_recipients:
-                    self._sent_recipients[campaign_id] = set()
-                
-                # Get already sent recipients from database
-                already_sent = await self._get_sent_recipients(campaign_id)
-                self._sent_recipients[campaign_id].update(already_sent)
-                
-                # Process recipients
-                sent_count = campaign.sent_count  # Start with existing count
-                failed_count = campaign.failed_count  # Start with existing count
-                skipped_count = campaign.skipped_count  # Start with existing count
-                
-                for i, recipient in enumerate(recipients):
-                    # Check if campaign should continue
-                    with get_session() as check_session:
-                        check_campaign = check_session.get(Campaign, campaign_id)
-                        if check_campaign.status != CampaignStatus.RUNNING:
-                            break
+                    # Prepare message
+                    message_text = self._prepare_message(campaign, recipient)
+                    media_path = campaign.get_effective_media_path(recipient.id)
                     
-                    # Skip if already sent successfully
-                    if recipient.id in self._sent_recipients[campaign_id]:
-                        self.logger.debug(f"Skipping already sent recipient {recipient.get_display_name()}")
-                        continue
+                    # Send message
+                    send_started = time.perf_counter()
+                    result = await self._send_message(account, recipient, message_text, media_path)
+                    latency_ms = (time.perf_counter() - send_started) * 1000
+                    get_send_counters().record(account.id, recipient.id, result["success"])
                     
-                    try:
-                        # Select account
-                        account = self._select_account(accounts, campaign)
-                        if not account:
-                            skipped_count += 1
-                            continue
-                        
-                        # Prepare message
-                        message_text = self._prepare_message(campaign, recipient)
-                        media_path = campaign.get_effective_media_path(recipient.id)
-                        
-                        # Send message
-                        result = await self._send_message(account, recipient, message_text, media_path)
-                        
-                        # Update counts and tracking
-                        if result["success"]:
-                            sent_count += 1
-                            self._sent_recipients[campaign_id].add(recipient.id)
-                            self.logger.info(f"Sent message to {recipient.get_display_name()}")
-                        else:
+                    # Update counts and tracking
+                    if result["success"]:
+                        sent_count += 1
+                        sent_recipients.add(recipient.id)
+                        if recipient.id in failed_recipients:
+                            # Retried successfully; its earlier failure no longer counts
+                            failed_recipients.discard(recipient.id)
+                            failed_count = max(failed_count - 1, 0)
+                        self.logger.log_send_event(
+                            "sent", account.id, recipient.id, "Message sent",
+                            campaign_id=campaign_id, latency_ms=latency_ms
+                        )
+                    else:
+                        if recipient.id not in failed_recipients:
+                            # Failing again on a retry still counts the recipient once
                             failed_count += 1
-                            self.logger.warning(f"Failed to send message to {recipient.get_display_name()}: {result.get('error', 'Unknown error')}")
-                        
-                        # Create send log
-                        await self._create_send_log(campaign, account, recipient, result)
-                        self.logger.debug(f"Created send log for campaign {campaign_id}, account {account.id}, recipient {recipient.id}")
-                        
-                        # Update campaign progress
-                        progress = ((i + 1) / len(recipients)) * 100
-                        await self._update_campaign_progress(campaign_id, sent_count, failed_count, skipped_count, progress)
-                        
-                        # Rate limiting
-                        if i < len(recipients) - 1:  # Don't sleep after last message
-                            await asyncio.sleep(60 / campaign.messages_per_minute)
-                        
-                    except Exception as e:
-                        self.logger.error(f"Error processing recipient {recipient.id}: {e}")
+                            failed_recipients.add(recipient.id)
+                        self.logger.log_send_event(
+                            "failed", account.id, recipient.id, result.get('error', 'Unknown error'),
+                            campaign_id=campaign_id, latency_ms=latency_ms
+                        )
+                    
+                    # Create send log
+                    await self._create_send_log(campaign, account, recipient, message_text, result)
+                    self.logger.debug(f"Created send log for campaign {campaign_id}, account {account.id}, recipient {recipient.id}")
+                    
+                    # Update campaign progress
+                    # Recipients added during the run can take the position past the initial count
+                    progress = min(position / total_recipients, 1.0) * 100
+                    await self._update_campaign_progress(campaign_id, sent_count, failed_count, skipped_count, progress)
+                    if position % PROGRESS_SAVE_EVERY == 0:
+                        await self._save_progress(campaign_id, sent_recipients, failed_recipients)
+                    
+                    # Rate limiting
+                    if position < total_recipients:  # Don't sleep after last message
+                        await asyncio.sleep(60 / campaign.messages_per_minute)
+                    
+                except Exception as e:
+                    self.logger.error(f"Error processing recipient {recipient.id}: {e}")
+                    if recipient.id not in sent_recipients and recipient.id not in failed_recipients:
                         failed_count += 1
-                
-                # Mark campaign as completed
-                with get_session() as final_session:
-                    final_campaign = final_session.get(Campaign, campaign_id)
-                    if final_campaign.status == CampaignStatus.RUNNING:
-                        # Determine final status based on results
-                        if failed_count > 0 and sent_count == 0:
-                            # All messages failed
-                            final_campaign.status = CampaignStatus.FAILED
-                        elif failed_count > 0 and sent_count > 0:
-                            # Some messages failed
-                            final_campaign.status = CampaignStatus.INCOMPLETED
-                        else:
-                            # All messages sent successfully
-                            final_campaign.status = CampaignStatus.COMPLETED
-                        
-                        final_campaign.end_time_actual = datetime.utcnow()
-                        final_campaign.sent_count = sent_count
-                        final_campaign.failed_count = failed_count
-                        final_campaign.skipped_count = skipped_count
-                        final_campaign.progress_percentage = 100.0
-                        final_campaign.last_activity = datetime.utcnow()
-                        final_session.commit()
-                        
-                        self.logger.info(f"Completed campaign {campaign_id}: {sent_count} sent, {failed_count} failed, {skipped_count} skipped")
-                        self.campaign_completed.emit(campaign_id)
-                
+                        failed_recipients.add(recipient.id)
+            
+            # Mark campaign as completed
+            # Determine final status based on results
+            if failed_count > 0 and sent_count == 0:
+                # All messages failed
+                final_status = CampaignStatus.FAILED
+            elif failed_count > 0 and sent_count > 0:
+                # Some messages failed
+                final_status = CampaignStatus.INCOMPLETED
+            else:
+                # All messages sent successfully
+                final_status = CampaignStatus.COMPLETED
+            
+            completed = await repository.update_campaign(
+                campaign_id,
+                only_if_status=CampaignStatus.RUNNING,
+                status=final_status,
+                end_time_actual=datetime.utcnow(),
+                sent_count=sent_count,
+                failed_count=failed_count,
+                skipped_count=skipped_count,
+                progress_percentage=100.0,
+                last_activity=datetime.utcnow()
+            )
+            if completed:
+                self.logger.info(f"Completed campaign {campaign_id}: {sent_count} sent, {failed_count} failed, {skipped_count} skipped")
+                self.campaign_completed.emit(campaign_id)
+            
         except Exception as e:
             self.logger.error(f"Error running campaign {campaign_id}: {e}")
             self.campaign_error.emit(campaign_id, str(e))
+        finally:
+            if sent_recipients is not None:
+                await self._save_progress(campaign_id, sent_recipients, failed_recipients)
+            await dispose_async_engine()
     
-    async def _get_campaign_recipients(self, campaign: Campaign) -> List[Recipient]:
-        """Get recipients for a campaign."""
+    async def _count_campaign_recipients(self, campaign: Campaign) -> int:
+        """Count recipients for a campaign."""
         try:
-            with get_session() as session:
-                from sqlmodel import select
-                
-                # Get recipients based on campaign settings
-                if campaign.recipient_source == "manual":
-                    # Get all active recipients
-                    query = select(Recipient).where(
-                        Recipient.is_deleted == False,
-                        Recipient.status == "active"
-                    )
-                else:
-                    # For other sources, return empty for now
-                    return []
-                
-                recipients = session.exec(query).all()
-                return list(recipients)
-                
+            return await get_async_repository().count_campaign_recipients(campaign)
+        except ValueError:
+            # An unusable recipient spec is an error, not an empty audience
+            raise
         except Exception as e:
-            self.logger.error(f"Error getting recipients: {e}")
-            return []
+            self.logger.error(f"Error counting recipients: {e}")
+            return 0
     
     async def _get_available_accounts(self) -> List[Account]:
         """Get available accounts for sending."""
         try:
-            with get_session() as session:
-                from sqlmodel import select
-                
-                query = select(Account).where(
-                    Account.is_deleted == False,
-                    Account.status == "ONLINE",
-                    Account.is_active == True
-                )
-                
-                accounts = session.exec(query).all()
-                return list(accounts)
-                
+            return await get_async_repository().get_available_accounts()
         except Exception as e:
             self.logger.error(f"Error getting accounts: {e}")
             return []
@@ -704,23 +711,23 @@ class CampaignManager(QObject):
                     phone=account.phone_number,
                     password=account.session_password
                 )
-            except SessionPasswordNeededError:
+            except SessionPasswordNeededError as e:
                 await client.disconnect()
-                return {"success": False, "error": "Session password needed"}
+                return send_failure("Session password needed", e)
             except Exception as e:
                 await client.disconnect()
-                return {"success": False, "error": f"Failed to start client: {e}"}
+                return send_failure(f"Failed to start client: {e}", e, SendErrorCode.CLIENT_NOT_READY)
             
             if not client.is_connected():
                 await client.disconnect()
-                return {"success": False, "error": "Account not connected"}
+                return send_failure("Account not connected", code=SendErrorCode.CLIENT_NOT_READY)
             
             # Get entity
             try:
                 entity = await client.get_entity(recipient.get_identifier())
             except Exception as e:
                 await client.disconnect()
-                return {"success": False, "error": f"Failed to get entity: {e}"}
+                return send_failure(f"Failed to get entity: {e}", e, SendErrorCode.PEER_NOT_FOUND)
             
             # Send message
             try:
@@ -751,91 +758,104 @@ class CampaignManager(QObject):
                 
             except Exception as e:
                 await client.disconnect()
-                return {"success": False, "error": f"Failed to send message: {e}"}
+                return send_failure(f"Failed to send message: {e}", e)
             
         except Exception as e:
             self.logger.error(f"Error sending message: {e}")
-            return {"success": False, "error": str(e)}
+            return send_failure(str(e), e)
     
     async def _create_error_log(self, campaign: Campaign, error_message: str):
         """Create an error log entry for campaign failures."""
         try:
-            with get_session() as session:
-                send_log = SendLog(
-                    campaign_id=campaign.id,
-                    account_id=None,  # No specific account for general errors
-                    recipient_id=None,  # No specific recipient for general errors
-                    recipient_type="error",
-                    recipient_identifier=f"campaign_{campaign.id}_error",
-                    message_text=campaign.message_text or "",
-                    message_type=campaign.message_type or "text",
-                    status=SendStatus.FAILED,
-                    error_message=error_message,
-                    sent_at=datetime.utcnow(),
-                    is_warmup=False
-                )
-                
-                session.add(send_log)
-                session.commit()
-                
+            send_log = SendLog(
+                campaign_id=campaign.id,
+                account_id=None,  # No specific account for general errors
+                recipient_id=None,  # No specific recipient for general errors
+                recipient_type="error",
+                recipient_identifier=f"campaign_{campaign.id}_error",
+                message_text=campaign.message_text or "",
+                message_type=campaign.message_type or "text",
+                status=SendStatus.FAILED,
+                error_message=error_message,
+                error_code=classify_error_message(error_message),
+                sent_at=datetime.utcnow(),
+                is_warmup=False
+            )
+            await get_async_repository().add(send_log)
+            
         except Exception as e:
             self.logger.error(f"Error creating error log: {e}")
     
-    async def _create_send_log(self, campaign: Campaign, account: Account, recipient: Recipient, result: Dict[str, Any]):
+    async def _create_send_log(self, campaign: Campaign, account: Account, recipient: Recipient, message_text: str, result: Dict[str, Any]):
         """Create a send log entry."""
         try:
             self.logger.debug(f"Creating send log for campaign {campaign.id}, account {account.id}, recipient {recipient.id}, success: {result['success']}")
-            with get_session() as session:
-                send_log = SendLog(
-                    campaign_id=campaign.id,
-                    account_id=account.id,
-                    recipient_id=recipient.id,
-                    message_text=result.get("message_text", ""),
-                    status=SendStatus.SENT if result["success"] else SendStatus.FAILED,
-                    error_message=result.get("error"),
-                    sent_at=datetime.utcnow() if result["success"] else None,
-                    duration_ms=int(result.get("duration", 0) * 1000) if result.get("duration") else None
-                )
-                session.add(send_log)
-                session.commit()
+            send_log = SendLog(
+                campaign_id=campaign.id,
+                account_id=account.id,
+                recipient_id=recipient.id,
+                recipient_identifier=recipient.get_identifier(),
+                message_text=message_text,
+                status=SendStatus.SENT if result["success"] else SendStatus.FAILED,
+                error_message=result.get("error"),
+                error_code=result.get("error_code"),
+                telegram_error_code=result.get("telegram_error_code"),
+                sent_at=datetime.utcnow() if result["success"] else None,
+                duration_ms=int(result.get("duration", 0) * 1000) if result.get("duration") else None
+            )
+            # Committed by the single writer together with other queued writes
+            await get_async_repository().add(send_log)
         except Exception as e:
             self.logger.error(f"Error creating send log: {e}")
     
     async def _update_campaign_progress(self, campaign_id: int, sent: int, failed: int, skipped: int, progress: float):
         """Update campaign progress."""
         try:
-            with get_session() as session:
-                campaign = session.get(Campaign, campaign_id)
-                if campaign:
-                    campaign.sent_count = sent
-                    campaign.failed_count = failed
-                    campaign.skipped_count = skipped
-                    campaign.progress_percentage = progress
-                    campaign.last_activity = datetime.utcnow()
-                    session.commit()
-                    
-                    # Emit progress update signal
-                    progress_data = {
-                        "sent": sent,
-                        "failed": failed,
-                        "skipped": skipped,
-                        "progress": progress
-                    }
-                    self.campaign_progress_updated.emit(campaign_id, progress_data)
+            updated = await get_async_repository().update_campaign(
+                campaign_id,
+                sent_count=sent,
+                failed_count=failed,
+                skipped_count=skipped,
+                progress_percentage=progress,
+                last_activity=datetime.utcnow()
+            )
+            if updated:
+                # Emit progress update signal
+                progress_data = {
+                    "sent": sent,
+                    "failed": failed,
+                    "skipped": skipped,
+                    "progress": progress
+                }
+                self.campaign_progress_updated.emit(campaign_id, progress_data)
         except Exception as e:
             self.logger.error(f"Error updating campaign progress: {e}")
     
-    def _update_campaign_status(self):
+    def _on_data_changed(self, changes):
+        """Re-check running campaigns when campaign rows change."""
+        campaign_changes = changes.get("campaigns")
+        if campaign_changes is None:
+            return
+        if campaign_changes.full:
+            self._update_campaign_status()
+        else:
+            self._update_campaign_status(campaign_changes.inserted | campaign_changes.updated)
+    
+    def _update_campaign_status(self, campaign_ids: Optional[set] = None):
         """Update campaign status from database."""
         try:
             with get_session() as session:
                 from sqlmodel import select
                 
-                # Get all running campaigns from database
+                # Get running campaigns from database
                 query = select(Campaign).where(
                     Campaign.status == CampaignStatus.RUNNING,
                     Campaign.is_deleted == False
                 )
+                if campaign_ids is not None:
+                    if not campaign_ids:
+                        return
+                    query = query.where(Campaign.id.in_(campaign_ids))
                 running_campaigns = session.exec(query).all()
                 
                 # Check if any running campaigns are no longer in our tracking
@@ -0,0 +1,168 @@
+"""
+Data-change notification bus fed by committed database sessions.
+"""
+
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Set
+
+from PyQt5.QtCore import QObject, QTimer, Qt, pyqtSignal
+from sqlalchemy import event
+
+from .logger import get_logger
+
+
+@dataclass
+class TableChanges:
+    """Row ids changed in one table; ``full`` means the ids are unknown (bulk statements)."""
+    inserted: Set[int] = field(default_factory=set)
+    updated: Set[int] = field(default_factory=set)
+    deleted: Set[int] = field(default_factory=set)
+    full: bool = False
+
+    def merge(self, other: "TableChanges") -> None:
+        """Fold a later change into this one."""
+        self.inserted |= other.inserted
+        self.updated |= other.updated - self.inserted
+        self.deleted |= other.deleted
+        self.inserted -= other.deleted
+        self.updated -= other.deleted
+        self.full = self.full or other.full
+
+    def has_membership_changes(self) -> bool:
+        """Check whether rows were added or removed, rather than only modified."""
+        return self.full or bool(self.inserted or self.deleted)
+
+
+class ChangeSet(dict):
+    """Mapping of table name -> TableChanges for one notification."""
+
+    def merge(self, other: "ChangeSet") -> None:
+        """Fold another change set into this one."""
+        for table, changes in other.items():
+            if table in self:
+                self[table].merge(changes)
+            else:
+                self[table] = TableChanges(
+                    set(changes.inserted), set(changes.updated), set(changes.deleted), changes.full
+                )
+
+    def touches(self, *tables: str) -> bool:
+        """Check whether any of the given tables changed."""
+        return any(table in self for table in tables)
+
+
+class DataChangeBus(QObject):
+    """Publishes which rows changed after each commit.
+
+    Commits from any thread are recorded under a lock and coalesced, then
+    ``entities_changed`` is emitted once on the GUI thread, so subscribers
+    only query the database when something actually changed.
+    """
+
+    entities_changed = pyqtSignal(object)  # ChangeSet
+    _flush_requested = pyqtSignal()
+
+    def __init__(self, coalesce_ms: int = 250):
+        super().__init__()
+        self.logger = get_logger()
+        self.coalesce_ms = coalesce_ms
+        self._lock = threading.Lock()
+        self._pending = ChangeSet()
+        self._flush_scheduled = False
+        self._versions: Dict[str, int] = defaultdict(int)
+        self._installed = False
+
+        self._flush_requested.connect(self._schedule_flush, Qt.QueuedConnection)
+
+    def install(self, session_class) -> None:
+        """Hook the bus into flush/commit/rollback events of a session class."""
+        if self._installed:
+            return
+        event.listen(session_class, "after_flush", self._after_flush)
+        event.listen(session_class, "after_commit", self._after_commit)
+        event.listen(session_class, "after_soft_rollback", self._after_rollback)
+        event.listen(session_class, "do_orm_execute", self._on_orm_execute)
+        self._installed = True
+
+    def version(self, table: str) -> int:
+        """Get a counter that increases every time the table changes."""
+        return self._versions[table]
+
+    def publish(self, changes: ChangeSet) -> None:
+        """Queue changes for the next coalesced notification."""
+        if not changes:
+            return
+        with self._lock:
+            for table in changes:
+                self._versions[table] += 1
+            self._pending.merge(changes)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        self._flush_requested.emit()
+
+    # Session hooks
+
+    @staticmethod
+    def _session_changes(session) -> ChangeSet:
+        return session.info.setdefault("data_changes", ChangeSet())
+
+    def _after_flush(self, session, flush_context) -> None:
+        changes = self._session_changes(session)
+        for kind, objects in (("inserted", session.new), ("updated", session.dirty), ("deleted", session.deleted)):
+            for obj in objects:
+                table = getattr(obj, "__tablename__", None)
+                row_id = getattr(obj, "id", None)
+                if table is None or row_id is None:
+                    continue
+                if kind == "updated" and not session.is_modified(obj, include_collections=False):
+                    continue
+                table_changes = changes.setdefault(table, TableChanges())
+                getattr(table_changes, kind).add(row_id)
+
+    def _on_orm_execute(self, orm_execute_state) -> None:
+        # Bulk UPDATE/DELETE statements don't say which rows they touched
+        if orm_execute_state.is_update or orm_execute_state.is_delete:
+            mapper = orm_execute_state.bind_mapper
+            if mapper is not None:
+                changes = self._session_changes(orm_execute_state.session)
+                changes.setdefault(mapper.local_table.name, TableChanges()).full = True
+
+    def _after_commit(self, session) -> None:
+        changes = session.info.pop("data_changes", None)
+        if changes:
+            self.publish(changes)
+
+    def _after_rollback(self, session, previous_transaction) -> None:
+        # A rolled back savepoint leaves the rest of the transaction intact
+        if not previous_transaction.nested:
+            session.info.pop("data_changes", None)
+
+    # Delivery
+
+    def _schedule_flush(self) -> None:
+        QTimer.singleShot(self.coalesce_ms, self._flush)
+
+    def _flush(self) -> None:
+        with self._lock:
+            changes, self._pending = self._pending, ChangeSet()
+            self._flush_scheduled = False
+        if changes:
+            try:
+                self.entities_changed.emit(changes)
+            except Exception as e:
+                self.logger.error(f"Error publishing data changes: {e}")
+
+
+# Global data change bus instance
+_change_bus: Optional[DataChangeBus] = None
+
+
+def get_change_bus() -> DataChangeBus:
+    """Get the global data change bus instance."""
+    global _change_bus
+    if _change_bus is None:
+        _change_bus = DataChangeBus()
+    return _change_bus
@@ -0,0 +1,165 @@
+"""
+Asynchronous data access on a thread pool with cancellation and de-duplication.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from .logger import get_logger
+
+
+class QueryHandle:
+    """A caller's subscription to a submitted query."""
+
+    def __init__(
+        self,
+        query: "_Query",
+        on_result: Optional[Callable[[Any], None]],
+        on_error: Optional[Callable[[Exception], None]]
+    ):
+        self._query = query
+        self.on_result = on_result
+        self.on_error = on_error
+        self.cancelled = False
+        self.done = False
+
+    def cancel(self) -> None:
+        """Drop this caller's callbacks; the query itself is dropped once nobody waits for it."""
+        if self.done or self.cancelled:
+            return
+        self.cancelled = True
+        self._query.service._cancel(self)
+
+
+class _Query(QRunnable):
+    """A query job shared by every caller that submitted the same key."""
+
+    def __init__(self, service: "DataAccessService", key: Optional[Hashable], job: Callable[[], Any]):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.service = service
+        self.key = key
+        self.job = job
+        self.handles: List[QueryHandle] = []
+        self.started = False
+
+    def run(self):
+        with self.service._lock:
+            if not self.handles or self.service._closed:
+                return
+            self.started = True
+        try:
+            result, error = self.job(), None
+        except Exception as e:
+            result, error = None, e
+        if not self.service._closed:
+            self.service._finished.emit(self, result, error)
+
+
+class DataAccessService(QObject):
+    """Runs database reads on a QThreadPool and delivers results on the GUI thread.
+
+    Queries submitted with the same ``key`` while one is already in flight
+    share that query instead of running again. Cancelling a handle drops its
+    callbacks, and a query nobody waits for any more is taken off the pool
+    queue if it has not started yet.
+    """
+
+    _finished = pyqtSignal(object, object, object)  # query, result, error
+
+    def __init__(self, max_threads: int = 4):
+        super().__init__()
+        self.logger = get_logger()
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(max_threads)
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, _Query] = {}
+        self._queries = set()
+        self._closed = False
+        self._finished.connect(self._on_finished)
+
+    def submit(
+        self,
+        job: Callable[[], Any],
+        on_result: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        key: Optional[Hashable] = None
+    ) -> QueryHandle:
+        """Run ``job`` on the pool; callbacks run on the thread that owns the service."""
+        with self._lock:
+            query = self._in_flight.get(key) if key is not None else None
+            is_new = query is None
+            if is_new:
+                query = _Query(self, key, job)
+                self._queries.add(query)
+                if key is not None:
+                    self._in_flight[key] = query
+            handle = QueryHandle(query, on_result, on_error)
+            query.handles.append(handle)
+
+        if is_new:
+            self.pool.start(query)
+        return handle
+
+    def in_flight(self) -> int:
+        """Get the number of queries queued or running."""
+        with self._lock:
+            return len(self._queries)
+
+    def shutdown(self, timeout_ms: int = 5000) -> None:
+        """Drop queued queries and wait for running ones to finish."""
+        with self._lock:
+            self._closed = True
+            self._in_flight.clear()
+            self._queries.clear()
+        self.pool.clear()
+        self.pool.waitForDone(timeout_ms)
+
+    def _cancel(self, handle: QueryHandle) -> None:
+        query = handle._query
+        with self._lock:
+            if handle in query.handles:
+                query.handles.remove(handle)
+            if query.handles or query.started:
+                return
+            self._forget(query)
+        self.pool.tryTake(query)
+
+    def _forget(self, query: _Query) -> None:
+        self._queries.discard(query)
+        if query.key is not None and self._in_flight.get(query.key) is query:
+            del self._in_flight[query.key]
+
+    def _on_finished(self, query: _Query, result: Any, error: Optional[Exception]) -> None:
+        with self._lock:
+            handles, query.handles = query.handles, []
+            self._forget(query)
+
+        for handle in handles:
+            if handle.cancelled:
+                continue
+            handle.done = True
+            try:
+                if error is None:
+                    if handle.on_result:
+                        handle.on_result(result)
+                elif handle.on_error:
+                    handle.on_error(error)
+                else:
+                    self.logger.error(f"Error in background query: {error}")
+            except Exception as e:
+                self.logger.error(f"Error handling query result: {e}")
+
+
+# Global data access service instance
+_data_access: Optional[DataAccessService] = None
+
+
+def get_data_access() -> DataAccessService:
+    """Get the global data access service instance."""
+    global _data_access
+    if _data_access is None:
+        _data_access = DataAccessService()
+    return _data_access
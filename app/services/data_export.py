@@ -0,0 +1,378 @@
+"""
+Streaming export of send logs, recipients and templates to CSV, JSON Lines or Parquet.
+"""
+
+import csv
+import json
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from PyQt5.QtCore import QObject, pyqtSignal
+from sqlalchemy import func
+from sqlmodel import select
+
+from .logger import get_logger
+from .db import get_session
+from .send_log_query import SendLogFilter, get_send_log_query
+from ..models import MessageTemplate, Recipient
+
+
+# Format names by file extension
+EXPORT_FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".parquet": "parquet"}
+
+# File dialog filter offering every format
+EXPORT_FILE_FILTER = "CSV Files (*.csv);;JSON Lines (*.jsonl);;Parquet Files (*.parquet)"
+
+_ARROW_TYPES = {int: pa.int64(), bool: pa.bool_(), float: pa.float64(), datetime: pa.timestamp("us"), str: pa.string()}
+
+
+class ExportCancelled(Exception):
+    """Raised inside an export when it was cancelled."""
+
+
+@dataclass(frozen=True)
+class ExportColumn:
+    """One exported field: its name, how to read it from a row, and its value type."""
+    name: str
+    value: Callable[[Any], Any]
+    type: type = str
+
+
+@dataclass
+class ExportSource:
+    """Rows to export, read in batches so only one batch is in memory at a time."""
+    name: str
+    columns: List[ExportColumn]
+    # batch size -> batches of rows
+    batches: Callable[[int], Iterator[List[Any]]]
+    # Number of rows for progress, if cheap to know up front
+    count: Optional[Callable[[], int]] = None
+
+
+@dataclass
+class ExportResult:
+    """Outcome of one export."""
+    path: Path
+    file_format: str
+    rows: int = 0
+    duration_seconds: float = 0.0
+
+
+def export_format(path: Path) -> str:
+    """Get the export format for a file name, CSV unless the extension says otherwise."""
+    return EXPORT_FORMATS.get(Path(path).suffix.lower(), "csv")
+
+
+def _plain_value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+class _CsvWriter:
+    def __init__(self, path: Path, columns: List[ExportColumn]):
+        self.file = open(path, "w", newline="", encoding="utf-8")
+        self.writer = csv.writer(self.file)
+        self.writer.writerow([column.name for column in columns])
+
+    def write(self, rows: List[List[Any]]) -> None:
+        self.writer.writerows(
+            ["" if value is None else value.isoformat() if isinstance(value, datetime) else value for value in row]
+            for row in rows
+        )
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class _JsonlWriter:
+    def __init__(self, path: Path, columns: List[ExportColumn]):
+        self.file = open(path, "w", encoding="utf-8")
+        self.names = [column.name for column in columns]
+
+    def write(self, rows: List[List[Any]]) -> None:
+        self.file.writelines(
+            json.dumps(dict(zip(self.names, row)), ensure_ascii=False, default=_json_value) + "\n" for row in rows
+        )
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class _ParquetWriter:
+    # Batches are buffered into row groups of about this many rows; small groups bloat the footer
+    ROW_GROUP_ROWS = 64 * 1024
+
+    def __init__(self, path: Path, columns: List[ExportColumn]):
+        self.schema = pa.schema([pa.field(column.name, _ARROW_TYPES.get(column.type, pa.string())) for column in columns])
+        self.writer = pq.ParquetWriter(path, self.schema, compression="zstd")
+        self.pending: List[pa.Table] = []
+        self.pending_rows = 0
+
+    def write(self, rows: List[List[Any]]) -> None:
+        arrays = [
+            [self._value(row[position], field) for row in rows]
+            for position, field in enumerate(self.schema)
+        ]
+        self.pending.append(pa.Table.from_arrays(
+            [pa.array(values, type=field.type) for values, field in zip(arrays, self.schema)],
+            schema=self.schema
+        ))
+        self.pending_rows += len(rows)
+        if self.pending_rows >= self.ROW_GROUP_ROWS:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self.pending:
+            self.writer.write_table(pa.concat_tables(self.pending), row_group_size=self.pending_rows)
+        self.pending = []
+        self.pending_rows = 0
+
+    @staticmethod
+    def _value(value: Any, field: pa.Field) -> Any:
+        if value is not None and field.type == pa.string() and not isinstance(value, str):
+            return str(value)
+        return value
+
+    def close(self) -> None:
+        try:
+            self._flush()
+        finally:
+            self.writer.close()
+
+
+_WRITERS = {"csv": _CsvWriter, "jsonl": _JsonlWriter, "parquet": _ParquetWriter}
+
+
+def query_batches(statement, batch_size: int) -> Iterator[List[Any]]:
+    """Stream the rows of a select from a server-side cursor, one batch at a time."""
+    with get_session() as session:
+        result = session.exec(statement.execution_options(yield_per=batch_size))
+        # The identity map holds rows weakly, so each batch is freed once written
+        for batch in result.partitions():
+            yield list(batch)
+
+
+def _query_count(model, conditions: List[Any]) -> int:
+    with get_session() as session:
+        statement = select(func.count(model.id))
+        for condition in conditions:
+            statement = statement.where(condition)
+        return session.exec(statement).one() or 0
+
+
+def _filtered(model, conditions: List[Any]):
+    statement = select(model)
+    for condition in conditions:
+        statement = statement.where(condition)
+    return statement.order_by(model.id)
+
+
+def send_log_source(filters: SendLogFilter, include_archive: bool = True) -> ExportSource:
+    """Send logs matching the log viewer filters, continuing into the archive."""
+    query = get_send_log_query()
+
+    def batches(batch_size: int) -> Iterator[List[Any]]:
+        batch = []
+        for row in query.iter_rows(filters, batch_size=batch_size, include_archive=include_archive):
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    return ExportSource(
+        name="send_logs",
+        columns=[
+            ExportColumn("id", lambda log: log.id, int),
+            ExportColumn("created_at", lambda log: log.created_at, datetime),
+            ExportColumn("campaign", lambda log: log.campaign_name),
+            ExportColumn("account", lambda log: log.account_name),
+            ExportColumn("recipient_id", lambda log: log.recipient_id, int),
+            ExportColumn("recipient", lambda log: log.get_recipient_text()),
+            ExportColumn("status", lambda log: _plain_value(log.status)),
+            ExportColumn("error_message", lambda log: log.error_message),
+            ExportColumn("error_code", lambda log: _plain_value(log.error_code)),
+            ExportColumn("telegram_error_code", lambda log: log.telegram_error_code),
+            ExportColumn("duration_ms", lambda log: log.duration_ms, int),
+            ExportColumn("retry_count", lambda log: log.retry_count, int),
+        ],
+        batches=batches,
+        count=lambda: query.count(filters, include_archive=include_archive),
+    )
+
+
+def recipient_source(conditions: List[Any]) -> ExportSource:
+    """Recipients matching the given conditions, e.g. the recipient table's filters."""
+    return ExportSource(
+        name="recipients",
+        columns=[
+            ExportColumn("id", lambda r: r.id, int),
+            ExportColumn("recipient_type", lambda r: _plain_value(r.recipient_type)),
+            ExportColumn("display_name", lambda r: r.get_display_name()),
+            ExportColumn("username", lambda r: r.username),
+            ExportColumn("user_id", lambda r: r.user_id, int),
+            ExportColumn("phone_number", lambda r: r.phone_number),
+            ExportColumn("first_name", lambda r: r.first_name),
+            ExportColumn("last_name", lambda r: r.last_name),
+            ExportColumn("email", lambda r: r.email),
+            ExportColumn("bio", lambda r: r.bio),
+            ExportColumn("group_id", lambda r: r.group_id, int),
+            ExportColumn("group_title", lambda r: r.group_title),
+            ExportColumn("group_username", lambda r: r.group_username),
+            ExportColumn("group_type", lambda r: r.group_type),
+            ExportColumn("member_count", lambda r: r.member_count, int),
+            ExportColumn("source", lambda r: _plain_value(r.source)),
+            ExportColumn("status", lambda r: _plain_value(r.status)),
+            ExportColumn("tags", lambda r: ", ".join(r.get_tags_list())),
+            ExportColumn("notes", lambda r: r.notes),
+            ExportColumn("created_at", lambda r: r.created_at, datetime),
+            ExportColumn("updated_at", lambda r: r.updated_at, datetime),
+        ],
+        batches=lambda batch_size: query_batches(_filtered(Recipient, conditions), batch_size),
+        count=lambda: _query_count(Recipient, conditions),
+    )
+
+
+def template_source(conditions: List[Any]) -> ExportSource:
+    """Message templates matching the given conditions, e.g. the template table's filters."""
+    return ExportSource(
+        name="templates",
+        columns=[
+            ExportColumn("id", lambda t: t.id, int),
+            ExportColumn("name", lambda t: t.name),
+            ExportColumn("description", lambda t: t.description),
+            ExportColumn("body", lambda t: t.body),
+            ExportColumn("use_spintax", lambda t: t.use_spintax, bool),
+            ExportColumn("spintax_text", lambda t: t.spintax_text),
+            ExportColumn("category", lambda t: _plain_value(t.category)),
+            ExportColumn("is_active", lambda t: t.is_active, bool),
+            ExportColumn("tags", lambda t: ", ".join(t.get_tags_list())),
+            ExportColumn("created_at", lambda t: t.created_at, datetime),
+            ExportColumn("updated_at", lambda t: t.updated_at, datetime),
+        ],
+        batches=lambda batch_size: query_batches(_filtered(MessageTemplate, conditions), batch_size),
+        count=lambda: _query_count(MessageTemplate, conditions),
+    )
+
+
+class DataExportService(QObject):
+    """Writes export sources to files batch by batch.
+
+    Rows are pulled from the source one batch at a time and written out
+    before the next is read, so memory stays flat however many rows match.
+    The file is written aside and renamed when complete, so a failed or
+    cancelled export never leaves a truncated file behind.
+    """
+
+    export_progress = pyqtSignal(str, int, int)  # path, rows written, total rows (0 if unknown)
+    export_completed = pyqtSignal(object)  # ExportResult
+    export_failed = pyqtSignal(str, str)  # path, error message
+
+    def __init__(self, batch_size: int = 1000):
+        super().__init__()
+        self.logger = get_logger()
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._cancelled: Dict[str, threading.Event] = {}
+
+    def export(
+        self,
+        source: ExportSource,
+        path: Path,
+        file_format: Optional[str] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+        cancelled: Optional[threading.Event] = None
+    ) -> ExportResult:
+        """Export a source on the calling thread; the format defaults to the file extension."""
+        path = Path(path)
+        file_format = file_format or export_format(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial_path = path.with_name(path.name + ".partial")
+
+        started = time.monotonic()
+        total = source.count() if source.count and progress else 0
+        rows = 0
+        writer = _WRITERS[file_format](partial_path, source.columns)
+        try:
+            for batch in source.batches(self.batch_size):
+                if cancelled is not None and cancelled.is_set():
+                    raise ExportCancelled(f"Export to {path} was cancelled")
+                writer.write([[column.value(row) for column in source.columns] for row in batch])
+                rows += len(batch)
+                if progress:
+                    progress(rows, total)
+            writer.close()
+        except BaseException:
+            writer.close()
+            partial_path.unlink(missing_ok=True)
+            raise
+        partial_path.replace(path)
+
+        result = ExportResult(path=path, file_format=file_format, rows=rows, duration_seconds=time.monotonic() - started)
+        self.logger.info(f"Exported {rows} {source.name} to: {path} ({result.duration_seconds:.1f}s)")
+        return result
+
+    def start_export(self, source: ExportSource, path: Path, file_format: Optional[str] = None) -> Future:
+        """Export a source on a background thread, reporting progress through signals."""
+        key = str(path)
+        cancelled = threading.Event()
+        with self._lock:
+            self._cancelled[key] = cancelled
+        future: Future = Future()
+
+        def run():
+            try:
+                result = self.export(
+                    source, path, file_format,
+                    progress=lambda rows, total: self.export_progress.emit(key, rows, total),
+                    cancelled=cancelled
+                )
+                future.set_result(result)
+                self.export_completed.emit(result)
+            except Exception as e:
+                if not isinstance(e, ExportCancelled):
+                    self.logger.error(f"Error exporting {source.name}: {e}")
+                future.set_exception(e)
+                self.export_failed.emit(key, str(e))
+            finally:
+                with self._lock:
+                    if self._cancelled.get(key) is cancelled:
+                        del self._cancelled[key]
+
+        threading.Thread(target=run, name=f"export-{source.name}", daemon=True).start()
+        return future
+
+    def cancel_export(self, path: Path) -> None:
+        """Stop a running export after its current batch."""
+        with self._lock:
+            cancelled = self._cancelled.get(str(path))
+        if cancelled is not None:
+            cancelled.set()
+
+
+# Global data export service instance
+_data_export: Optional[DataExportService] = None
+
+
+def get_data_export() -> DataExportService:
+    """Get the global data export service instance."""
+    global _data_export
+    if _data_export is None:
+        _data_export = DataExportService()
+    return _data_export
@@ -3,14 +3,18 @@ Database service with SQLite initialization and session management.
 """
 
 import asyncio
+import threading
+import weakref
 from pathlib import Path
 from typing import Optional, AsyncGenerator, Any, Dict
 from contextlib import asynccontextmanager
 
 from sqlmodel import SQLModel, create_engine, Session, select
 from sqlalchemy import event
-from sqlalchemy.engine import Engine
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import QueuePool, StaticPool
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from .settings import get_settings
 from .logger import get_logger
@@ -26,6 +30,16 @@ class DatabaseService:
         self.settings = get_settings()
         self.logger = get_logger()
         self.engine: Optional[Engine] = None
+        self.write_engine: Optional[Engine] = None
+        self.writer = None
+        # Send logs in their own file get their own connection and write queue
+        self.log_write_engine: Optional[Engine] = None
+        self.log_writer = None
+        # aiosqlite connections belong to the event loop that opened them
+        self._async_engines: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncEngine]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._async_lock = threading.Lock()
         self._initialized = False
     
     def initialize(self) -> None:
@@ -45,15 +59,39 @@ class DatabaseService:
                 db_path = self.settings.get_database_path()
                 db_path.parent.mkdir(parents=True, exist_ok=True)
                 
+                connect_args = {
+                    "check_same_thread": False,
+                    "timeout": 30,
+                }
+                
+                # Pooled connections so WAL readers on different threads don't serialize
                 self.engine = create_engine(
+                    database_url,
+                    poolclass=QueuePool,
+                    pool_size=self.settings.db_pool_size,
+                    max_overflow=self.settings.db_pool_size,
+                    connect_args=connect_args,
+                    echo=self.settings.debug,
+                )
+                
+                # One dedicated connection for the write queue
+                self.write_engine = create_engine(
                     database_url,
                     poolclass=StaticPool,
-                    connect_args={
-                        "check_same_thread": False,
-                        "timeout": 30,
-                    },
+                    connect_args=connect_args,
                     echo=self.settings.debug,
                 )
+                
+                log_db_path = self.settings.get_log_database_path()
+                if log_db_path is not None:
+                    log_db_path.parent.mkdir(parents=True, exist_ok=True)
+                    # Opens the log file as its main database, so its write lock never covers app.db
+                    self.log_write_engine = create_engine(
+                        f"sqlite:///{log_db_path}",
+                        poolclass=StaticPool,
+                        connect_args=connect_args,
+                        echo=self.settings.debug,
+                    )
             else:
                 # PostgreSQL/MySQL configuration
                 self.engine = create_engine(
@@ -68,6 +106,25 @@ class DatabaseService:
             # Create all tables
             self.create_tables()
             
+            # Start the single writer for queued writes
+            if self.write_engine is not None:
+                from .db_writer import DatabaseWriter
+                self.writer = DatabaseWriter(
+                    self.write_engine,
+                    batch_size=self.settings.db_write_batch_size,
+                    checkpoint_interval=self.settings.db_checkpoint_interval_seconds,
+                )
+                self.writer.start()
+            if self.log_write_engine is not None:
+                from .db_writer import DatabaseWriter
+                self.log_writer = DatabaseWriter(
+                    self.log_write_engine,
+                    batch_size=self.settings.db_write_batch_size,
+                    checkpoint_interval=self.settings.db_checkpoint_interval_seconds,
+                    name="db-log-writer",
+                )
+                self.log_writer.start()
+            
             self._initialized = True
             self.logger.info(f"Database initialized: {database_url}")
             
@@ -80,22 +137,53 @@ class DatabaseService:
         if not self.engine:
             return
         
-        @event.listens_for(self.engine, "connect")
-        def set_sqlite_pragma(dbapi_connection, connection_record):
-            """Set SQLite pragmas for better performance and compatibility."""
-            if self.settings.database_url.startswith("sqlite:///"):
-                cursor = dbapi_connection.cursor()
-                # Enable foreign key constraints
-                cursor.execute("PRAGMA foreign_keys=ON")
-                # Set journal mode to WAL for better concurrency
-                cursor.execute("PRAGMA journal_mode=WAL")
-                # Set synchronous mode for better performance
-                cursor.execute("PRAGMA synchronous=NORMAL")
-                # Set cache size
-                cursor.execute("PRAGMA cache_size=10000")
-                # Set temp store to memory
-                cursor.execute("PRAGMA temp_store=MEMORY")
-                cursor.close()
+        for engine in filter(None, (self.engine, self.write_engine, self.log_write_engine)):
+            event.listen(engine, "connect", self._set_sqlite_pragma)
+        
+        if self.log_write_engine is not None:
+            # Readers see both files; the writers each stay on their own
+            event.listen(self.engine, "connect", self._attach_log_database)
+        
+        from .db_writer import DatabaseWriter
+        for engine in filter(None, (self.write_engine, self.log_write_engine)):
+            DatabaseWriter.configure_sqlite_engine(engine)
+        
+        # Publish committed row changes to the GUI
+        from .change_bus import get_change_bus
+        get_change_bus().install(Session)
+        
+        # Keep report rollups in step with send log writes
+        from .send_log_rollups import get_send_log_rollups
+        get_send_log_rollups().install(Session)
+        
+        # Store each sent message text once
+        from .message_bodies import get_message_bodies
+        get_message_bodies().install(Session)
+    
+    def _set_sqlite_pragma(self, dbapi_connection, connection_record):
+        """Set SQLite pragmas for better performance and compatibility."""
+        if self.settings.database_url.startswith("sqlite:///"):
+            cursor = dbapi_connection.cursor()
+            # Lets log retention shrink the file; only takes effect for new databases
+            cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            # Enable foreign key constraints
+            cursor.execute("PRAGMA foreign_keys=ON")
+            # Set journal mode to WAL for better concurrency
+            cursor.execute("PRAGMA journal_mode=WAL")
+            # Set synchronous mode for better performance
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            # Set cache size
+            cursor.execute("PRAGMA cache_size=10000")
+            # Set temp store to memory
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            # The writer thread checkpoints on a schedule instead of on commit
+            cursor.execute("PRAGMA wal_autocheckpoint=0")
+            cursor.close()
+    
+    def _attach_log_database(self, dbapi_connection, connection_record):
+        """Attach the send log database, so queries can join logs with the other tables."""
+        from .log_database import attach_log_database
+        attach_log_database(dbapi_connection, self.settings.get_log_database_path())
     
     def create_tables(self) -> None:
         """Create all database tables."""
@@ -103,15 +191,58 @@ class DatabaseService:
             raise RuntimeError("Database engine not initialized")
         
         try:
-            # Import all models to ensure they are registered with SQLModel
-            from ..models import Account, Campaign, Recipient, SendLog, MessageTemplate
-            from ..models.recipient import RecipientList, RecipientListRecipient
-            SQLModel.metadata.create_all(self.engine)
-            self.logger.info("Database tables created successfully")
+            # Versioned migrations; nothing to do when the schema is current
+            from .migrations import MigrationRunner
+            applied = MigrationRunner(self.engine).upgrade()
+            
+            # Move send logs into (or back out of) their own database file
+            self._place_log_tables()
+            
+            # Full-text search index for recipients (SQLite FTS5)
+            if self.settings.database_url.startswith("sqlite:///"):
+                from .recipient_search import get_recipient_search
+                get_recipient_search().ensure_index(self.engine)
+                # Audience fingerprint for campaign retry checks
+                from .recipient_audience import get_recipient_audience
+                get_recipient_audience().ensure_fingerprint(self.engine)
+            
+            if applied:
+                self.logger.info(f"Database schema migrated to version {applied[-1]}")
+            else:
+                self.logger.debug("Database schema is current")
         except Exception as e:
             self.logger.error(f"Failed to create database tables: {e}")
             raise
     
+    def _place_log_tables(self) -> None:
+        """Put the log tables in the database file the split setting asks for."""
+        if not self.settings.database_url.startswith("sqlite:///"):
+            return
+        from .log_database import LOG_SCHEMA, is_attached, place_log_tables
+        split = self.settings.get_log_database_path() is not None
+        log_db_path = Path(self.settings.db_log_database_path)
+        if not split and not log_db_path.exists():
+            return
+        
+        with self.engine.connect() as connection:
+            attached = is_attached(connection)
+            connection.commit()
+            if not attached:
+                # The split was turned off; attach the old log file once to move its rows back
+                connection.exec_driver_sql(f"ATTACH DATABASE ? AS {LOG_SCHEMA}", (str(log_db_path),))
+                connection.commit()
+            try:
+                moved = place_log_tables(connection, split)
+                connection.commit()
+            finally:
+                if not attached:
+                    connection.exec_driver_sql(f"DETACH DATABASE {LOG_SCHEMA}")
+                    connection.commit()
+        
+        for table, rows in moved.items():
+            where = f"log database {log_db_path}" if split else "main database"
+            self.logger.info(f"Moved {rows} rows of {table} into the {where}")
+    
     def drop_tables(self) -> None:
         """Drop all database tables (use with caution)."""
         if not self.engine:
@@ -119,6 +250,13 @@ class DatabaseService:
         
         try:
             SQLModel.metadata.drop_all(self.engine)
+            if self.log_write_engine is not None:
+                from .log_database import LOG_SCHEMA, LOG_TABLES
+                with self.engine.begin() as connection:
+                    for table in LOG_TABLES:
+                        connection.exec_driver_sql(f'DROP TABLE IF EXISTS {LOG_SCHEMA}."{table}"')
+            from .migrations import MigrationRunner
+            MigrationRunner(self.engine).reset()
             self.logger.warning("All database tables dropped")
         except Exception as e:
             self.logger.error(f"Failed to drop database tables: {e}")
@@ -131,17 +269,91 @@ class DatabaseService:
         
         return Session(self.engine)
     
+    def get_writer(self, table: Optional[str] = None):
+        """Get the single-writer queue for high-volume writes to ``table``.
+        
+        Jobs for the log tables go to the log database's own queue when the
+        split is on; a job there only sees the log tables.
+        """
+        if not self.engine:
+            raise RuntimeError("Database engine not initialized")
+        
+        from .log_database import LOG_TABLES
+        if table in LOG_TABLES and self.log_writer is not None:
+            return self.log_writer
+        if self.writer is None:
+            # Databases other than SQLite write inline through the main engine
+            from .db_writer import DatabaseWriter
+            self.writer = DatabaseWriter(self.engine)
+        return self.writer
+    
+    def get_async_engine(self) -> AsyncEngine:
+        """Get the async engine for the running event loop."""
+        if not self.engine:
+            raise RuntimeError("Database engine not initialized")
+        
+        loop = asyncio.get_running_loop()
+        with self._async_lock:
+            engine = self._async_engines.get(loop)
+            if engine is None:
+                engine = self._create_async_engine()
+                self._async_engines[loop] = engine
+            return engine
+    
+    def _create_async_engine(self) -> AsyncEngine:
+        """Create an async engine on the async driver for the configured database."""
+        url = make_url(self.settings.database_url)
+        drivers = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+        url = url.set(drivername=drivers.get(url.get_backend_name(), url.drivername))
+        
+        if url.get_backend_name() == "sqlite":
+            engine = create_async_engine(
+                url,
+                pool_size=2,
+                max_overflow=2,
+                connect_args={"timeout": 30},
+                echo=self.settings.debug,
+            )
+            event.listen(engine.sync_engine, "connect", self._set_sqlite_pragma)
+            if self.log_write_engine is not None:
+                event.listen(engine.sync_engine, "connect", self._attach_log_database)
+        else:
+            engine = create_async_engine(url, echo=self.settings.debug, pool_pre_ping=True)
+        return engine
+    
     @asynccontextmanager
-    async def get_async_session(self) -> AsyncGenerator[Session, None]:
-        """Get an async database session."""
-        session = self.get_session()
-        try:
+    async def get_async_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """Get an async database session on the running event loop."""
+        async with AsyncSession(self.get_async_engine(), expire_on_commit=False) as session:
             yield session
-        finally:
-            session.close()
+    
+    async def dispose_async_engine(self) -> None:
+        """Close the running event loop's async connections; call before the loop ends."""
+        with self._async_lock:
+            engine = self._async_engines.pop(asyncio.get_running_loop(), None)
+        if engine is not None:
+            await engine.dispose()
     
     def close(self) -> None:
         """Close database connection."""
+        # Counted sends go out through the writer before it stops
+        from .send_counters import get_send_counters
+        get_send_counters().stop()
+        if self.writer:
+            self.writer.stop()
+            self.writer = None
+        if self.log_writer:
+            self.log_writer.stop()
+            self.log_writer = None
+        with self._async_lock:
+            # Their loops dispose them; just stop handing them out
+            self._async_engines.clear()
+        if self.write_engine:
+            self.write_engine.dispose()
+            self.write_engine = None
+        if self.log_write_engine:
+            self.log_write_engine.dispose()
+            self.log_write_engine = None
         if self.engine:
             self.engine.dispose()
             self.engine = None
@@ -202,16 +414,9 @@ class DatabaseService:
         if not self.settings.database_url.startswith("sqlite:///"):
             raise NotImplementedError("Backup only supported for SQLite databases")
         
-        if backup_path is None:
-            backup_path = Path(self.settings.app_data_dir) / f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
-        
-        # For SQLite, we can simply copy the file
-        import shutil
-        db_path = self.settings.get_database_path()
-        shutil.copy2(db_path, backup_path)
-        
-        self.logger.info(f"Database backed up to: {backup_path}")
-        return backup_path
+        # Online backup; safe while campaigns keep writing
+        from .db_backup import get_backup_service
+        return get_backup_service().create_backup(backup_path).path
     
     def restore_database(self, backup_path: Path) -> None:
         """Restore database from backup."""
@@ -221,21 +426,9 @@ class DatabaseService:
         if not self.settings.database_url.startswith("sqlite:///"):
             raise NotImplementedError("Restore only supported for SQLite databases")
         
-        if not backup_path.exists():
-            raise FileNotFoundError(f"Backup file not found: {backup_path}")
-        
-        # Close current connection
-        self.close()
-        
-        # Copy backup to current database location
-        import shutil
-        db_path = self.settings.get_database_path()
-        shutil.copy2(backup_path, db_path)
-        
-        # Reinitialize
-        self.initialize()
-        
-        self.logger.info(f"Database restored from: {backup_path}")
+        # Restored in place, so the engine and the write queue keep running
+        from .db_backup import get_backup_service
+        get_backup_service().restore_backup(backup_path)
 
 
 # Global database service instance
@@ -258,12 +451,22 @@ def get_session() -> Session:
 
 
 @asynccontextmanager
-async def get_async_session() -> AsyncGenerator[Session, None]:
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     """Get an async database session."""
     async with db_service.get_async_session() as session:
         yield session
 
 
+async def dispose_async_engine() -> None:
+    """Close the async connections of the running event loop."""
+    await db_service.dispose_async_engine()
+
+
+def get_db_writer(table: Optional[str] = None):
+    """Get the database write queue for a table."""
+    return db_service.get_writer(table)
+
+
 def close_database() -> None:
     """Close database connection."""
     db_service.close()
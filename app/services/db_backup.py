@@ -0,0 +1,340 @@
+"""
+Online SQLite backups with progress reporting, verification, compression and retention.
+"""
+
+import gzip
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from .logger import get_logger
+from .settings import get_settings
+
+
+BACKUP_PATTERNS = ("backup_*.db", "backup_*.db.gz")
+
+
+def log_backup_path(backup_path: Path) -> Path:
+    """Get the path the send log database is backed up to alongside a backup."""
+    stem, dot, suffixes = Path(backup_path).name.partition(".")
+    return Path(backup_path).with_name(f"{stem}.logs{dot}{suffixes}")
+
+
+def _is_log_backup(path: Path) -> bool:
+    return path.name.partition(".")[2].startswith("logs")
+
+
+@contextmanager
+def _open_backup(backup_path: Path) -> Iterator[Path]:
+    """Give a plain database path for a backup, decompressing it to a temp file if needed."""
+    if backup_path.suffix != ".gz":
+        yield backup_path
+        return
+    with tempfile.TemporaryDirectory() as temp_dir:
+        database_path = Path(temp_dir) / backup_path.stem
+        with gzip.open(backup_path, "rb") as packed, open(database_path, "wb") as raw:
+            shutil.copyfileobj(packed, raw, 1024 * 1024)
+        yield database_path
+
+
+@dataclass
+class BackupResult:
+    """Outcome of one backup."""
+    path: Path
+    size_bytes: int
+    pages: int
+    duration_seconds: float
+    verified: bool
+    compressed: bool
+
+
+class DatabaseBackupService(QObject):
+    """Copies the live SQLite database with the online backup API.
+
+    The copy is taken in page-sized steps from a single read transaction, so
+    it is a consistent snapshot even while the write queue keeps committing
+    (WAL readers never block writers, and a held snapshot keeps the backup
+    from restarting on every write). Backups can run on a background thread
+    and on a schedule, and old snapshots are pruned to a retention count.
+    """
+
+    backup_progress = pyqtSignal(int, int)  # pages copied, total pages
+    backup_completed = pyqtSignal(object)  # BackupResult
+    backup_failed = pyqtSignal(str)  # error message
+
+    def __init__(self, pages_per_step: int = 1024):
+        super().__init__()
+        self.settings = get_settings()
+        self.logger = get_logger()
+        self.pages_per_step = pages_per_step
+        self._lock = threading.Lock()
+        self._running: Optional[Future] = None
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._run_scheduled_backup)
+
+    def backup_dir(self) -> Path:
+        """Get the directory scheduled backups are written to."""
+        return Path(self.settings.app_data_dir) / "backups"
+
+    def list_backups(self) -> List[Path]:
+        """Get backups in the backup directory, newest first."""
+        directory = self.backup_dir()
+        if not directory.exists():
+            return []
+        backups = [
+            path for pattern in BACKUP_PATTERNS for path in directory.glob(pattern)
+            if not _is_log_backup(path)
+        ]
+        return sorted(backups, key=lambda path: path.stat().st_mtime, reverse=True)
+
+    # Backup
+
+    def create_backup(
+        self,
+        backup_path: Optional[Path] = None,
+        compress: Optional[bool] = None,
+        verify: bool = True,
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> BackupResult:
+        """Back up the database on the calling thread.
+
+        With send logs split into their own file, that file is copied next to
+        the backup as well (see ``log_backup_path``), right after the main one.
+        """
+        if compress is None:
+            # An explicit path decides by its extension
+            compress = Path(backup_path).suffix == ".gz" if backup_path else self.settings.db_backup_compress
+        if backup_path is None:
+            backup_path = self.backup_dir() / f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
+            if compress:
+                backup_path = backup_path.with_name(backup_path.name + ".gz")
+        backup_path = Path(backup_path)
+        backup_path.parent.mkdir(parents=True, exist_ok=True)
+
+        started = time.monotonic()
+        pages = self._copy_database(self.settings.get_database_path(), backup_path, compress, verify, progress)
+        size_bytes = backup_path.stat().st_size
+        log_db_path = self.settings.get_log_database_path()
+        if log_db_path is not None and log_db_path.exists():
+            log_path = log_backup_path(backup_path)
+            pages += self._copy_database(log_db_path, log_path, compress, verify, progress)
+            size_bytes += log_path.stat().st_size
+
+        result = BackupResult(
+            path=backup_path,
+            size_bytes=size_bytes,
+            pages=pages,
+            duration_seconds=time.monotonic() - started,
+            verified=verify,
+            compressed=compress,
+        )
+        self.logger.info(f"Database backed up to: {backup_path} ({result.duration_seconds:.1f}s)")
+        return result
+
+    def start_backup(
+        self,
+        backup_path: Optional[Path] = None,
+        compress: Optional[bool] = None,
+        verify: bool = True
+    ) -> Future:
+        """Back up the database on a background thread; joins a backup already running."""
+        with self._lock:
+            if self._running is not None and not self._running.done():
+                return self._running
+            future: Future = Future()
+            self._running = future
+
+        def run():
+            try:
+                result = self.create_backup(backup_path, compress, verify)
+                future.set_result(result)
+                self.backup_completed.emit(result)
+            except Exception as e:
+                self.logger.error(f"Error backing up database: {e}")
+                future.set_exception(e)
+                self.backup_failed.emit(str(e))
+
+        threading.Thread(target=run, name="db-backup", daemon=True).start()
+        return future
+
+    def verify_backup(self, backup_path: Path) -> bool:
+        """Run an integrity check on a backup file and its send log file, if any."""
+        try:
+            paths = [Path(backup_path)]
+            if log_backup_path(backup_path).exists():
+                paths.append(log_backup_path(backup_path))
+            for path in paths:
+                with _open_backup(path) as database_path:
+                    connection = sqlite3.connect(database_path.resolve().as_uri() + "?mode=ro", uri=True)
+                    try:
+                        self._check_integrity(connection, path)
+                    finally:
+                        connection.close()
+            return True
+        except Exception as e:
+            self.logger.error(f"Backup verification failed for {backup_path}: {e}")
+            return False
+
+    # Restore
+
+    def restore_backup(self, backup_path: Path) -> None:
+        """Copy a verified backup over the live database without closing the engine."""
+        backup_path = Path(backup_path)
+        if not backup_path.exists():
+            raise FileNotFoundError(f"Backup file not found: {backup_path}")
+
+        targets = [(backup_path, self.settings.get_database_path())]
+        if log_backup_path(backup_path).exists():
+            # Put back into the log file even with the split off; startup moves the rows into main
+            targets.append((log_backup_path(backup_path), Path(self.settings.db_log_database_path)))
+
+        for path, database_file in targets:
+            with _open_backup(path) as database_path:
+                source = sqlite3.connect(database_path.resolve().as_uri() + "?mode=ro", uri=True)
+                target = sqlite3.connect(str(database_file), timeout=30)
+                try:
+                    self._check_integrity(source, path)
+                    # One step, so other connections see either the old or the restored database
+                    source.backup(target)
+                finally:
+                    target.close()
+                    source.close()
+
+        self._after_restore()
+        self.logger.info(f"Database restored from: {backup_path}")
+
+    def _after_restore(self) -> None:
+        """Bring the restored schema up to date and make views reload."""
+        from sqlmodel import SQLModel
+        from .db import get_db_service
+        from .change_bus import get_change_bus, ChangeSet, TableChanges
+        from .message_bodies import get_message_bodies
+
+        # Cached body ids belong to the replaced database
+        get_message_bodies().clear_cache()
+        db_service = get_db_service()
+        if db_service.engine is not None:
+            # Migrations, and log tables moved to where the split setting wants them
+            db_service.create_tables()
+        get_change_bus().publish(ChangeSet({
+            table: TableChanges(full=True) for table in SQLModel.metadata.tables
+        }))
+
+    # Retention and scheduling
+
+    def prune_backups(self, keep: Optional[int] = None) -> List[Path]:
+        """Delete all but the newest ``keep`` backups and return the deleted paths."""
+        keep = self.settings.db_backup_keep if keep is None else keep
+        removed = []
+        for path in self.list_backups()[max(keep, 0):]:
+            try:
+                path.unlink()
+                log_backup_path(path).unlink(missing_ok=True)
+                removed.append(path)
+            except OSError as e:
+                self.logger.warning(f"Could not delete old backup {path}: {e}")
+        return removed
+
+    def start_schedule(self) -> None:
+        """Back up periodically, catching up at once if the last backup is overdue."""
+        interval_hours = self.settings.db_backup_interval_hours
+        if interval_hours <= 0 or not self.settings.database_url.startswith("sqlite:///"):
+            self._timer.stop()
+            return
+        backups = self.list_backups()
+        age = time.time() - backups[0].stat().st_mtime if backups else None
+        delay = 0 if age is None else max(0.0, interval_hours * 3600 - age)
+        # Give startup a moment before the first catch-up backup
+        self._timer.start(int(max(delay, 60) * 1000))
+
+    def stop_schedule(self) -> None:
+        """Stop periodic backups."""
+        self._timer.stop()
+
+    def _run_scheduled_backup(self) -> None:
+        def prune(future: Future):
+            if future.exception() is None:
+                self.prune_backups()
+
+        self.start_backup().add_done_callback(prune)
+        self._timer.start(int(self.settings.db_backup_interval_hours * 3600 * 1000))
+
+    # Helpers
+
+    def _copy_database(
+        self,
+        source_path: Path,
+        backup_path: Path,
+        compress: bool,
+        verify: bool,
+        progress: Optional[Callable[[int, int], None]]
+    ) -> int:
+        """Copy one database file to a backup path and return its page count."""
+        # Copy next to the destination and rename, so a failed backup never leaves a partial file
+        partial_path = backup_path.with_name(backup_path.name + ".partial")
+        pages = 0
+        try:
+            source = sqlite3.connect(str(source_path), isolation_level=None, timeout=30)
+            target = sqlite3.connect(str(partial_path), isolation_level=None)
+            try:
+                # Pin one snapshot for every step of the copy
+                source.execute("BEGIN")
+                source.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchall()
+
+                def on_step(status, remaining, total):
+                    nonlocal pages
+                    pages = total
+                    self.backup_progress.emit(total - remaining, total)
+                    if progress:
+                        progress(total - remaining, total)
+
+                source.backup(target, pages=self.pages_per_step, progress=on_step)
+                source.execute("COMMIT")
+
+                # A standalone file, without -wal/-shm companions
+                target.execute("PRAGMA journal_mode=DELETE")
+                if verify:
+                    self._check_integrity(target, partial_path)
+            finally:
+                target.close()
+                source.close()
+
+            if compress:
+                with open(partial_path, "rb") as raw, gzip.open(backup_path, "wb", compresslevel=6) as packed:
+                    shutil.copyfileobj(raw, packed, 1024 * 1024)
+                partial_path.unlink()
+            else:
+                partial_path.replace(backup_path)
+        except Exception:
+            partial_path.unlink(missing_ok=True)
+            raise
+        return pages
+
+    def _check_integrity(self, connection: sqlite3.Connection, path: Path) -> None:
+        problems = [row[0] for row in connection.execute("PRAGMA integrity_check").fetchall()]
+        if problems != ["ok"]:
+            raise ValueError(f"Integrity check failed for {path}: {'; '.join(problems[:5])}")
+
+
+# Global database backup service instance
+_backup_service: Optional[DatabaseBackupService] = None
+
+
+def get_backup_service() -> DatabaseBackupService:
+    """Get the global database backup service instance."""
+    global _backup_service
+    if _backup_service is None:
+        _backup_service = DatabaseBackupService()
+    return _backup_service
@@ -0,0 +1,216 @@
+"""
+Single-writer queue for SQLite with grouped transactions and scheduled WAL checkpoints.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from .logger import get_logger
+
+
+WriteJob = Callable[[Session], Any]
+
+
+class DatabaseWriter:
+    """Applies queued write jobs on one dedicated connection and thread.
+
+    Jobs queued close together are committed in one transaction, each inside
+    its own savepoint so a failing job only rolls back itself. Because all
+    queued writes share one connection there is no lock hand-off between
+    writers, and WAL checkpoints run from this thread when the queue is idle
+    instead of stalling whichever commit crosses the auto-checkpoint limit.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        batch_size: int = 200,
+        checkpoint_interval: float = 30.0,
+        name: str = "db-writer"
+    ):
+        self.engine = engine
+        self.name = name
+        self.logger = get_logger()
+        self.batch_size = batch_size
+        self.checkpoint_interval = checkpoint_interval
+
+        self._queue: "queue.Queue[Optional[Tuple[WriteJob, Future]]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        # Guards switching submit() between queueing and writing inline
+        self._lock = threading.Lock()
+        self._accepting = False
+        self._stop_requested = False
+        self._dirty = False
+        self._last_checkpoint = time.monotonic()
+
+    @staticmethod
+    def configure_sqlite_engine(engine: Engine) -> None:
+        """Make a SQLite engine emit its own BEGIN IMMEDIATE so savepoints and early write locks work."""
+        @event.listens_for(engine, "connect")
+        def disable_pysqlite_transactions(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine, "begin")
+        def begin_immediate(connection):
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        if self._thread is not None:
+            return
+        self._accepting = True
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Apply queued writes, truncate the WAL and stop the writer thread."""
+        if self._thread is None:
+            return
+        if not self._stop_requested:
+            self._stop_requested = True
+            self._queue.put(None)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            # Still committing; writes keep going to its queue until it finishes
+            self.logger.warning(f"{self.name} still applying queued writes after {timeout}s")
+            return
+        self._thread = None
+        self._stop_requested = False
+
+    def is_running(self) -> bool:
+        """Check whether the writer thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def submit(self, job: WriteJob) -> Future:
+        """Queue ``job(session)`` for the writer; the future resolves after commit."""
+        future: Future = Future()
+        with self._lock:
+            if self._accepting:
+                self._queue.put((job, future))
+                return future
+        # No writer thread (e.g. during startup or in scripts); write inline
+        try:
+            future.set_result(self._run_inline(job))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def add(self, *objects: Any) -> Future:
+        """Queue ORM objects for insertion."""
+        def job(session: Session):
+            session.add_all(objects)
+            return objects
+        return self.submit(job)
+
+    def pending(self) -> int:
+        """Get the number of queued write jobs."""
+        return self._queue.qsize()
+
+    # Writer thread
+
+    def _run_inline(self, job: WriteJob) -> Any:
+        with Session(self.engine, expire_on_commit=False) as session:
+            result = job(session)
+            session.commit()
+            return result
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            try:
+                item = self._queue.get(timeout=self._idle_timeout())
+            except queue.Empty:
+                self._checkpoint()
+                continue
+
+            # Group everything queued while the previous batch was committing
+            batch: List[Tuple[WriteJob, Future]] = []
+            while item is not None:
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if item is None:
+                stopping = True
+
+            if batch:
+                self._write_batch(batch)
+            if time.monotonic() - self._last_checkpoint >= self.checkpoint_interval:
+                # Under sustained load, still checkpoint once per interval
+                self._checkpoint()
+
+        # Writes queued behind the stop marker are applied before submit() goes inline
+        with self._lock:
+            remaining = []
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    remaining.append(item)
+            for start in range(0, len(remaining), self.batch_size):
+                self._write_batch(remaining[start:start + self.batch_size])
+            self._checkpoint("TRUNCATE")
+            self._accepting = False
+
+    def _idle_timeout(self) -> float:
+        # Checkpoint shortly after queued writes stop, otherwise once per interval
+        remaining = self.checkpoint_interval - (time.monotonic() - self._last_checkpoint)
+        if self._dirty:
+            remaining = min(1.0, remaining)
+        return max(0.05, remaining)
+
+    def _write_batch(self, batch: List[Tuple[WriteJob, Future]]) -> None:
+        results = []
+        try:
+            with Session(self.engine, expire_on_commit=False) as session:
+                for job, future in batch:
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    savepoint = session.begin_nested()
+                    try:
+                        result = job(session)
+                        savepoint.commit()
+                        results.append((future, result))
+                    except Exception as e:
+                        savepoint.rollback()
+                        future.set_exception(e)
+                session.commit()
+        except Exception as e:
+            # Includes failing to begin, e.g. "database is locked"; no job in the batch was committed
+            self.logger.error(f"Error committing {len(batch)} queued writes: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self._dirty = True
+        for future, result in results:
+            future.set_result(result)
+
+    def _checkpoint(self, mode: str = "PASSIVE") -> None:
+        self._last_checkpoint = time.monotonic()
+        try:
+            # Run outside any transaction on the writer's own connection
+            connection = self.engine.raw_connection()
+            try:
+                cursor = connection.cursor()
+                busy, log_pages, checkpointed = cursor.execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+                cursor.close()
+            finally:
+                connection.close()
+            # Retry soon if readers kept part of the WAL from being copied back
+            self._dirty = busy != 0 or checkpointed < log_pages
+        except Exception as e:
+            self.logger.error(f"Error running WAL checkpoint: {e}")
@@ -0,0 +1,95 @@
+"""
+Normalized tag index, kept in sync with the JSON ``tags`` columns by SQLite triggers.
+"""
+
+from typing import Any, Iterable
+
+from sqlalchemy import and_
+from sqlalchemy.engine import Connection
+from sqlmodel import select
+
+from .logger import get_logger
+from ..models import Account, Campaign, EntityTag, MessageTemplate, Recipient, RecipientList
+
+
+TAG_TABLE = EntityTag.__tablename__
+
+# Models whose tags are indexed; entity_type is the model's table name
+TAGGED_MODELS = (Account, Campaign, MessageTemplate, Recipient, RecipientList)
+
+
+def _insert_tags(table: str, row: str, source: str = "") -> str:
+    # Only string tags are indexed; malformed JSON indexes nothing
+    return (
+        f"INSERT OR IGNORE INTO {TAG_TABLE} (tag, entity_type, entity_id) "
+        f"SELECT value, '{table}', {row}.id FROM {source}json_each("
+        f"CASE WHEN json_valid({row}.tags) THEN {row}.tags END) WHERE type = 'text';"
+    )
+
+
+def _delete_tags(table: str, row: str) -> str:
+    return f"DELETE FROM {TAG_TABLE} WHERE entity_type = '{table}' AND entity_id = {row}.id;"
+
+
+class EntityTagIndex:
+    """Tags of accounts, campaigns, templates, recipients and recipient lists in one indexed table.
+
+    Triggers replace an entity's rows whenever its ``tags`` column is
+    written, so every writer (ORM, Core or raw SQL) keeps the index exact,
+    and tag filters become primary-key range lookups instead of parsing
+    each row's JSON.
+    """
+
+    def __init__(self):
+        self.logger = get_logger()
+
+    def ensure_index(self, connection: Connection) -> None:
+        """Create the sync triggers for every tagged table and fill the index."""
+        for model in TAGGED_MODELS:
+            table = model.__tablename__
+            connection.exec_driver_sql(
+                f"CREATE TRIGGER IF NOT EXISTS {table}_tags_ai AFTER INSERT ON {table} "
+                f"WHEN new.tags IS NOT NULL BEGIN {_insert_tags(table, 'new')} END"
+            )
+            connection.exec_driver_sql(
+                f"CREATE TRIGGER IF NOT EXISTS {table}_tags_ad AFTER DELETE ON {table} "
+                f"WHEN old.tags IS NOT NULL BEGIN {_delete_tags(table, 'old')} END"
+            )
+            connection.exec_driver_sql(
+                f"CREATE TRIGGER IF NOT EXISTS {table}_tags_au AFTER UPDATE OF id, tags ON {table} BEGIN "
+                f"{_delete_tags(table, 'old')} {_insert_tags(table, 'new')} END"
+            )
+        self.rebuild(connection)
+
+    def rebuild(self, connection: Connection) -> None:
+        """Recompute the index from the tags columns."""
+        connection.exec_driver_sql(f"DELETE FROM {TAG_TABLE}")
+        for model in TAGGED_MODELS:
+            table = model.__tablename__
+            connection.exec_driver_sql(_insert_tags(table, table, source=f"{table}, "))
+        count = connection.exec_driver_sql(f"SELECT COUNT(*) FROM {TAG_TABLE}").scalar()
+        self.logger.info(f"Indexed {count} entity tags")
+
+    @staticmethod
+    def tagged(model: Any, tags: Iterable[str], match_all: bool = False):
+        """Condition on ``model`` matching entities with any (or all) of the tags."""
+        def with_tags(*matching: str):
+            return model.id.in_(select(EntityTag.entity_id).where(
+                EntityTag.tag.in_(matching),
+                EntityTag.entity_type == model.__tablename__
+            ))
+
+        tags = sorted({str(tag) for tag in tags})
+        if match_all and len(tags) > 1:
+            # One primary-key range per tag, intersected
+            return and_(*(with_tags(tag) for tag in tags))
+        return with_tags(*tags)
+
+
+# Global entity tag index instance
+entity_tags = EntityTagIndex()
+
+
+def get_entity_tags() -> EntityTagIndex:
+    """Get entity tag index instance."""
+    return entity_tags
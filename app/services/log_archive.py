@@ -0,0 +1,220 @@
+"""
+Date-partitioned Parquet archive of send logs moved out of the database.
+"""
+
+import json
+from datetime import date, datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from .logger import get_logger
+from .settings import get_settings
+from .send_log_query import SendLogFilter, SendLogRow
+from ..models import SendErrorCode, SendLog, SendStatus
+
+
+# Names of related rows are kept with each archived log, so reports don't need the live tables
+NAME_COLUMNS = ["campaign_name", "account_name", "recipient_name"]
+
+# Archived logs keep their text rather than a reference to a body that may be pruned
+BODY_COLUMN = "message_body_id"
+
+_ARROW_TYPES = {int: pa.int64(), bool: pa.bool_(), float: pa.float64(), datetime: pa.timestamp("us")}
+
+
+def _arrow_type(column) -> pa.DataType:
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return pa.string()
+    return _ARROW_TYPES.get(python_type, pa.string())
+
+
+ARCHIVE_SCHEMA = pa.schema(
+    [pa.field(column.name, _arrow_type(column)) for column in SendLog.__table__.columns if column.name != BODY_COLUMN]
+    + [pa.field("message_text", pa.string())]
+    + [pa.field(name, pa.string()) for name in NAME_COLUMNS]
+)
+
+# Free-text search covers the same fields as the log viewer
+SEARCH_COLUMNS = ["error_message", "recipient_identifier", "recipient_name", "campaign_name", "account_name"]
+
+
+def _archive_value(value: Any, field: pa.Field) -> Any:
+    """Convert a database value to what the archive column stores."""
+    if value is None:
+        return None
+    if isinstance(value, Enum):
+        return value.value
+    if field.type == pa.string() and not isinstance(value, str):
+        return json.dumps(value, default=str)
+    if pa.types.is_timestamp(field.type) and not isinstance(value, datetime):
+        return None
+    return value
+
+
+class SendLogArchive:
+    """Compressed Parquet files of archived send logs, one directory per day.
+
+    Files live in ``<archive_dir>/date=YYYY-MM-DD/``, so a date-bounded
+    report only opens the days it covers. Each archived chunk gets its own
+    file named after its id range, which makes re-archiving the same rows
+    after an interrupted run overwrite rather than duplicate them.
+    """
+
+    def __init__(self, archive_dir: Optional[Path] = None):
+        self.settings = get_settings()
+        self.logger = get_logger()
+        self.archive_dir = Path(archive_dir or Path(self.settings.app_data_dir) / "archive" / "send_logs")
+
+    # Writing
+
+    def write_rows(self, rows: List[Dict[str, Any]]) -> List[Path]:
+        """Write send log rows (column name -> value) into their day partitions."""
+        by_day: Dict[date, List[Dict[str, Any]]] = {}
+        for row in rows:
+            by_day.setdefault(row["created_at"].date(), []).append(row)
+
+        written = []
+        for day, day_rows in sorted(by_day.items()):
+            columns = {
+                field.name: [_archive_value(row.get(field.name), field) for row in day_rows]
+                for field in ARCHIVE_SCHEMA
+            }
+            table = pa.Table.from_pydict(columns, schema=ARCHIVE_SCHEMA)
+
+            partition = self.archive_dir / f"date={day.isoformat()}"
+            partition.mkdir(parents=True, exist_ok=True)
+            ids = columns["id"]
+            path = partition / f"part-{min(ids)}-{max(ids)}.parquet"
+            # Written aside and renamed, so readers never see a half-written file
+            partial_path = path.with_name(path.name + ".partial")
+            pq.write_table(table, partial_path, compression="zstd")
+            partial_path.replace(path)
+            written.append(path)
+        return written
+
+    def clear(self) -> int:
+        """Delete every archived file and return the bytes freed."""
+        freed = 0
+        for path in self.archive_dir.glob("date=*/*.parquet"):
+            freed += path.stat().st_size
+            path.unlink()
+        for partition in self.archive_dir.glob("date=*"):
+            if partition.is_dir() and not any(partition.iterdir()):
+                partition.rmdir()
+        return freed
+
+    # Reading
+
+    def partitions(self, date_from: Optional[datetime] = None, date_to: Optional[datetime] = None) -> List[Tuple[date, Path]]:
+        """Get day partitions overlapping the range, newest first."""
+        if not self.archive_dir.exists():
+            return []
+        partitions = []
+        for path in self.archive_dir.glob("date=*"):
+            try:
+                day = date.fromisoformat(path.name.split("=", 1)[1])
+            except ValueError:
+                continue
+            if date_from and day < date_from.date():
+                continue
+            if date_to and day > date_to.date():
+                continue
+            partitions.append((day, path))
+        return sorted(partitions, reverse=True)
+
+    def read_table(self, filters: SendLogFilter, before: Optional[Tuple[datetime, int]] = None) -> Iterator[pa.Table]:
+        """Yield matching rows one day at a time, newest day first, each sorted newest first."""
+        for day, partition in self.partitions(filters.date_from, filters.date_to):
+            if before is not None and day > before[0].date():
+                continue
+            files = sorted(partition.glob("*.parquet"))
+            if not files:
+                continue
+            table = pa.concat_tables(pq.read_table(path, schema=ARCHIVE_SCHEMA) for path in files)
+            mask = self._filter_mask(table, filters, before)
+            if mask is not None:
+                table = table.filter(mask)
+            if table.num_rows:
+                yield table.sort_by([("created_at", "descending"), ("id", "descending")])
+
+    def iter_rows(self, filters: SendLogFilter, before: Optional[Tuple[datetime, int]] = None) -> Iterator[SendLogRow]:
+        """Iterate over matching archived logs newest first, as log viewer rows."""
+        for table in self.read_table(filters, before):
+            for record in table.to_pylist():
+                yield SendLogRow(
+                    id=record["id"],
+                    created_at=record["created_at"],
+                    campaign_name=record["campaign_name"],
+                    account_name=record["account_name"],
+                    recipient_id=record["recipient_id"],
+                    recipient_name=record["recipient_name"],
+                    recipient_identifier=record["recipient_identifier"],
+                    status=SendStatus(record["status"]) if record["status"] else None,
+                    error_message=record["error_message"],
+                    error_code=SendErrorCode(record["error_code"]) if record["error_code"] else None,
+                    telegram_error_code=record["telegram_error_code"],
+                    duration_ms=record["duration_ms"],
+                    retry_count=record["retry_count"] or 0,
+                )
+
+    def count(self, filters: SendLogFilter, before: Optional[Tuple[datetime, int]] = None) -> int:
+        """Count matching archived logs, optionally only those older than a (created_at, id) cursor."""
+        return sum(table.num_rows for table in self.read_table(filters, before))
+
+    def _filter_mask(self, table: pa.Table, filters: SendLogFilter, before: Optional[Tuple[datetime, int]]):
+        conditions = []
+        if filters.status:
+            conditions.append(pc.equal(table["status"], SendStatus(filters.status).value))
+        if filters.campaign_id is not None:
+            conditions.append(pc.equal(table["campaign_id"], filters.campaign_id))
+        if filters.campaign_name:
+            conditions.append(pc.equal(table["campaign_name"], filters.campaign_name))
+        if filters.account_id is not None:
+            conditions.append(pc.equal(table["account_id"], filters.account_id))
+        if filters.date_from:
+            conditions.append(pc.greater_equal(table["created_at"], filters.date_from))
+        if filters.date_to:
+            conditions.append(pc.less_equal(table["created_at"], filters.date_to))
+        if before is not None:
+            created_at, log_id = before
+            conditions.append(pc.or_(
+                pc.less(table["created_at"], created_at),
+                pc.and_(pc.equal(table["created_at"], created_at), pc.less(table["id"], log_id))
+            ))
+
+        search_text = (filters.search_text or "").strip()
+        if search_text:
+            matches = [
+                pc.fill_null(pc.match_substring(table[name], search_text, ignore_case=True), False)
+                for name in SEARCH_COLUMNS
+            ]
+            condition = matches[0]
+            for match in matches[1:]:
+                condition = pc.or_(condition, match)
+            conditions.append(condition)
+
+        if not conditions:
+            return None
+        mask = conditions[0]
+        for condition in conditions[1:]:
+            mask = pc.and_(mask, condition)
+        return pc.fill_null(mask, False)
+
+
+# Global send log archive instance
+_send_log_archive: Optional[SendLogArchive] = None
+
+
+def get_send_log_archive() -> SendLogArchive:
+    """Get the global send log archive instance."""
+    global _send_log_archive
+    if _send_log_archive is None:
+        _send_log_archive = SendLogArchive()
+    return _send_log_archive
@@ -0,0 +1,100 @@
+"""
+Separate SQLite database file for append-heavy tables, attached to every reading connection.
+"""
+
+from pathlib import Path
+from typing import Dict, Optional
+
+from sqlalchemy import MetaData, Table, inspect
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import CreateTable, Index
+from sqlalchemy.sql.elements import conv
+from sqlmodel import SQLModel
+
+
+# Schema name the log database is attached under
+LOG_SCHEMA = "logs"
+
+# Tables written on every send; they move to the log database when the split is on
+LOG_TABLES = ("send_logs", "send_log_rollups", "send_log_error_rollups", "message_bodies")
+
+
+def attach_log_database(dbapi_connection, path: Path) -> None:
+    """Attach the log database to a raw SQLite connection with its own WAL."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"ATTACH DATABASE ? AS {LOG_SCHEMA}", (str(path),))
+    # Only takes effect while the file is still empty
+    cursor.execute(f"PRAGMA {LOG_SCHEMA}.auto_vacuum=INCREMENTAL")
+    cursor.execute(f"PRAGMA {LOG_SCHEMA}.journal_mode=WAL")
+    cursor.execute(f"PRAGMA {LOG_SCHEMA}.synchronous=NORMAL")
+    cursor.close()
+
+
+def is_attached(connection: Connection) -> bool:
+    """Check whether the log database is attached to this connection."""
+    return any(row[1] == LOG_SCHEMA for row in connection.exec_driver_sql("PRAGMA database_list"))
+
+
+def table_schema(connection: Connection, table_name: str) -> Optional[str]:
+    """Get the schema holding a table: "main", the log schema, or None if it doesn't exist."""
+    if inspect(connection).has_table(table_name):
+        return "main"
+    if is_attached(connection) and inspect(connection).has_table(table_name, schema=LOG_SCHEMA):
+        return LOG_SCHEMA
+    return None
+
+
+def log_table(table: Table) -> Table:
+    """Get a copy of a model table placed in the log schema."""
+    placed = table.to_metadata(MetaData(), schema=LOG_SCHEMA)
+    # The copy would name column indexes after the schema too; keep the model's names
+    names = {tuple(column.name for column in index.columns): index.name for index in table.indexes}
+    for index in placed.indexes:
+        index.name = conv(names[tuple(column.name for column in index.columns)])
+    return placed
+
+
+def create_index(connection: Connection, index: Index) -> None:
+    """Create a model index if missing, in whichever database holds its table."""
+    if table_schema(connection, index.table.name) == LOG_SCHEMA:
+        placed = {placed.name: placed for placed in log_table(index.table).indexes}
+        index = placed[index.name]
+    index.create(connection, checkfirst=True)
+
+
+def place_log_tables(connection: Connection, split: bool) -> Dict[str, int]:
+    """Move log tables into the attached log database, or back into main.
+
+    Rows are copied before the old table is dropped, all inside the caller's
+    transaction. Returns the number of rows moved per table.
+    """
+    moved = {}
+    # Send logs reference message bodies: move them out of main first and back in last
+    for name in (LOG_TABLES if split else reversed(LOG_TABLES)):
+        table = SQLModel.metadata.tables[name]
+        source, target = ("main", LOG_SCHEMA) if split else (LOG_SCHEMA, "main")
+        inspector = inspect(connection)
+        if not inspector.has_table(name, schema=None if source == "main" else source):
+            continue
+
+        if split:
+            placed = log_table(table)
+            if not inspector.has_table(name, schema=LOG_SCHEMA):
+                # Foreign keys can't point into another database file
+                connection.execute(CreateTable(placed, include_foreign_key_constraints=[]))
+            for index in placed.indexes:
+                index.create(connection, checkfirst=True)
+        else:
+            # The baseline migration created an empty table in main
+            table.create(connection, checkfirst=True)
+            for index in table.indexes:
+                index.create(connection, checkfirst=True)
+
+        source_columns = {column["name"] for column in inspector.get_columns(name, schema=source)}
+        columns = ", ".join(f'"{column.name}"' for column in table.columns if column.name in source_columns)
+        # Ids are shared by both copies of a restored database, so the same id is the same row
+        moved[name] = connection.exec_driver_sql(
+            f'INSERT OR REPLACE INTO {target}."{name}" ({columns}) SELECT {columns} FROM {source}."{name}"'
+        ).rowcount
+        connection.exec_driver_sql(f'DROP TABLE {source}."{name}"')
+    return moved
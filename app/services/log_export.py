@@ -0,0 +1,191 @@
+"""
+Time-range export of application logs using sparse timestamp indexes.
+"""
+
+import bisect
+import gzip
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, IO, Iterator, List, Optional
+
+
+# Log lines start with "%Y-%m-%d %H:%M:%S"; fixed width, so strings sort chronologically
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+TIMESTAMP_LENGTH = 19
+TIMESTAMP_PATTERN = re.compile(rb"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+
+
+def line_timestamp(line: bytes) -> Optional[str]:
+    """Get the timestamp prefix of a log line, or None for continuation lines."""
+    if TIMESTAMP_PATTERN.match(line):
+        return line[:TIMESTAMP_LENGTH].decode("ascii")
+    return None
+
+
+@dataclass
+class SegmentIndex:
+    """Sparse timestamp -> byte offset index for one log file."""
+    size: int = 0
+    first_ts: Optional[str] = None
+    last_ts: Optional[str] = None
+    timestamps: List[str] = field(default_factory=list)
+    offsets: List[int] = field(default_factory=list)
+
+    def overlaps(self, start: str, end: str) -> bool:
+        """Check whether the segment may contain lines in [start, end]."""
+        if self.first_ts is None:
+            return False
+        return self.first_ts <= end and self.last_ts >= start
+
+    def seek_offset(self, start: str) -> int:
+        """Get the offset of the last indexed line strictly before ``start``."""
+        position = bisect.bisect_left(self.timestamps, start) - 1
+        return self.offsets[position] if position >= 0 else 0
+
+    def to_dict(self) -> Dict:
+        return {
+            "size": self.size,
+            "first_ts": self.first_ts,
+            "last_ts": self.last_ts,
+            "timestamps": self.timestamps,
+            "offsets": self.offsets,
+        }
+
+
+class LogExporter:
+    """Exports log lines within a time window from the live and rotated log files.
+
+    Each segment gets a sparse index (one entry per ``index_interval`` bytes)
+    built once and cached on disk by inode, so later exports seek straight to
+    the window instead of scanning. Gzip-compressed segments are skipped by
+    their time bounds and otherwise streamed from the start.
+    """
+
+    def __init__(self, log_file: Path, index_interval: int = 64 * 1024):
+        self.log_file = Path(log_file)
+        self.index_interval = index_interval
+        self.cache_file = self.log_file.parent / ".log_index.json"
+        self._indexes: Dict[str, SegmentIndex] = {}
+        self._load_cache()
+
+    def segments(self) -> List[Path]:
+        """Get log segments ordered oldest first (app.log.N ... app.log)."""
+        rotated = []
+        for path in self.log_file.parent.glob(self.log_file.name + ".*"):
+            suffix = path.name[len(self.log_file.name) + 1:]
+            number = suffix[:-3] if suffix.endswith(".gz") else suffix
+            if number.isdigit():
+                rotated.append((int(number), path))
+        segments = [path for _, path in sorted(rotated, reverse=True)]
+        if self.log_file.exists():
+            segments.append(self.log_file)
+        return segments
+
+    def export(self, start_time: Optional[datetime], end_time: Optional[datetime], output: IO[bytes]) -> int:
+        """Write lines between start_time and end_time (inclusive) to output; return the line count."""
+        start = start_time.strftime(TIMESTAMP_FORMAT) if start_time else "0000"
+        end = end_time.strftime(TIMESTAMP_FORMAT) if end_time else "9999"
+
+        count = 0
+        for path in self.segments():
+            index = self.get_index(path)
+            if not index.overlaps(start, end):
+                continue
+            for line in self._read_window(path, index, start, end):
+                output.write(line)
+                count += 1
+
+        self._save_cache()
+        return count
+
+    def get_index(self, path: Path) -> SegmentIndex:
+        """Get the sparse index for a segment, extending it if the file grew."""
+        stat = path.stat()
+        key = f"{stat.st_dev}:{stat.st_ino}"
+        index = self._indexes.get(key)
+
+        if index is None or stat.st_size < index.size:
+            index = SegmentIndex()
+        if stat.st_size > index.size:
+            if path.suffix == ".gz":
+                self._index_gzip(path, index)
+            else:
+                self._index_plain(path, index)
+            index.size = stat.st_size
+
+        self._indexes[key] = index
+        return index
+
+    def _index_plain(self, path: Path, index: SegmentIndex) -> None:
+        next_checkpoint = index.offsets[-1] + self.index_interval if index.offsets else 0
+        with open(path, "rb") as f:
+            f.seek(index.size)
+            offset = index.size
+            for line in f:
+                timestamp = line_timestamp(line)
+                if timestamp is not None:
+                    if index.first_ts is None:
+                        index.first_ts = timestamp
+                    index.last_ts = timestamp
+                    if offset >= next_checkpoint:
+                        index.timestamps.append(timestamp)
+                        index.offsets.append(offset)
+                        next_checkpoint = offset + self.index_interval
+                offset += len(line)
+
+    def _index_gzip(self, path: Path, index: SegmentIndex) -> None:
+        # Compressed segments cannot be seeked cheaply; record only their bounds
+        with gzip.open(path, "rb") as f:
+            for line in f:
+                timestamp = line_timestamp(line)
+                if timestamp is not None:
+                    if index.first_ts is None:
+                        index.first_ts = timestamp
+                    index.last_ts = timestamp
+
+    def _read_window(self, path: Path, index: SegmentIndex, start: str, end: str) -> Iterator[bytes]:
+        if path.suffix == ".gz":
+            opener, offset = gzip.open, 0
+        else:
+            opener, offset = open, index.seek_offset(start)
+
+        with opener(path, "rb") as f:
+            f.seek(offset)
+            in_window = False
+            for line in f:
+                timestamp = line_timestamp(line)
+                if timestamp is not None:
+                    if timestamp > end:
+                        return
+                    in_window = timestamp >= start
+                # Continuation lines (tracebacks) follow their record
+                if in_window:
+                    yield line
+
+    def _load_cache(self) -> None:
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self._indexes = {key: SegmentIndex(**value) for key, value in data.items()}
+        except (OSError, ValueError, TypeError):
+            self._indexes = {}
+
+    def _save_cache(self) -> None:
+        # Only keep indexes of files that still exist
+        live_keys = set()
+        for path in self.segments():
+            stat = path.stat()
+            live_keys.add(f"{stat.st_dev}:{stat.st_ino}")
+        data = {key: index.to_dict() for key, index in self._indexes.items() if key in live_keys}
+
+        try:
+            tmp_file = self.cache_file.with_suffix(".tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_file, self.cache_file)
+        except OSError:
+            pass
@@ -0,0 +1,234 @@
+"""
+Send log retention: archive old logs to Parquet and trim them from the database in chunks.
+"""
+
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from sqlalchemy import delete, or_, and_, text
+from sqlmodel import Session, select
+
+from .db import get_session, get_db_writer
+from .logger import get_logger
+from .message_bodies import get_message_bodies
+from .settings import get_settings
+from ..models import Account, Campaign, MessageBody, Recipient, SendLog
+
+
+@dataclass
+class RetentionResult:
+    """Outcome of one retention run."""
+    cutoff: Optional[datetime]
+    archived: int = 0
+    deleted: int = 0
+    files: List[Path] = field(default_factory=list)
+    bodies_deleted: int = 0
+    pages_freed: int = 0
+    duration_seconds: float = 0.0
+
+
+class LogRetentionManager(QObject):
+    """Keeps ``send_logs`` down to the last ``log_retention_days`` days.
+
+    Older logs are read in chunks, written to the Parquet archive, and only
+    then deleted; each chunk's delete is one small job on the write queue, so
+    campaign writes interleave with a long cleanup instead of waiting for it.
+    Freed pages are returned to the filesystem with incremental vacuum where
+    the database was created with incremental auto-vacuum.
+    """
+
+    retention_completed = pyqtSignal(object)  # RetentionResult
+    retention_failed = pyqtSignal(str)  # error message
+
+    def __init__(self, chunk_size: Optional[int] = None, vacuum_step_pages: int = 1024):
+        super().__init__()
+        self.settings = get_settings()
+        self.logger = get_logger()
+        self.chunk_size = chunk_size or self.settings.log_retention_chunk_size
+        self.vacuum_step_pages = vacuum_step_pages
+        self._lock = threading.Lock()
+        self._running: Optional[Future] = None
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._run_scheduled)
+
+    def cutoff(self, retention_days: Optional[int] = None) -> Optional[datetime]:
+        """Get the time before which logs are archived, or None when retention is off."""
+        days = self.settings.log_retention_days if retention_days is None else retention_days
+        if days <= 0:
+            return None
+        return datetime.utcnow() - timedelta(days=days)
+
+    def run(self, retention_days: Optional[int] = None) -> RetentionResult:
+        """Archive and delete logs older than the retention period, on the calling thread."""
+        from .log_archive import get_send_log_archive
+        archive = get_send_log_archive()
+
+        started = time.monotonic()
+        result = RetentionResult(cutoff=self.cutoff(retention_days))
+        if result.cutoff is None:
+            return result
+
+        after: Optional[Tuple[datetime, int]] = None
+        while True:
+            rows = self._fetch_chunk(result.cutoff, after)
+            if not rows:
+                break
+            # Only delete what is safely on disk
+            result.files.extend(archive.write_rows(rows))
+            result.archived += len(rows)
+            result.deleted += self._delete_ids([row["id"] for row in rows])
+            after = (rows[-1]["created_at"], rows[-1]["id"])
+
+        if result.deleted:
+            result.bodies_deleted = get_message_bodies().prune()
+            result.pages_freed = self.incremental_vacuum()
+        result.duration_seconds = time.monotonic() - started
+        self.logger.info(
+            f"Archived {result.archived} send logs older than {result.cutoff:%Y-%m-%d} "
+            f"into {len(set(result.files))} files ({result.duration_seconds:.1f}s)"
+        )
+        return result
+
+    def start_run(self, retention_days: Optional[int] = None) -> Future:
+        """Run retention on a background thread; joins a run already in progress."""
+        with self._lock:
+            if self._running is not None and not self._running.done():
+                return self._running
+            future: Future = Future()
+            self._running = future
+
+        def run():
+            try:
+                result = self.run(retention_days)
+                future.set_result(result)
+                self.retention_completed.emit(result)
+            except Exception as e:
+                self.logger.error(f"Error archiving send logs: {e}")
+                future.set_exception(e)
+                self.retention_failed.emit(str(e))
+
+        threading.Thread(target=run, name="log-retention", daemon=True).start()
+        return future
+
+    def purge(self, before: Optional[datetime] = None) -> int:
+        """Delete logs (all of them, or those older than ``before``) in chunks, without archiving."""
+        deleted = 0
+        while True:
+            query = select(SendLog.id).order_by(SendLog.id).limit(self.chunk_size)
+            if before is not None:
+                query = query.where(SendLog.created_at < before)
+            with get_session() as session:
+                ids = list(session.exec(query).all())
+            if not ids:
+                break
+            deleted += self._delete_ids(ids)
+        if before is None:
+            # Nothing left for the report rollups to summarize
+            from .send_log_rollups import get_send_log_rollups
+            get_send_log_rollups().clear()
+        if deleted:
+            get_message_bodies().prune()
+            self.incremental_vacuum()
+        return deleted
+
+    def incremental_vacuum(self) -> int:
+        """Return free pages to the filesystem in small write-queue jobs; returns pages freed."""
+        # The writer for send logs holds the file they live in
+        writer = get_db_writer(SendLog.__tablename__)
+        auto_vacuum = writer.submit(lambda session: session.execute(text("PRAGMA auto_vacuum")).scalar()).result()
+        if auto_vacuum != 2:
+            # Without incremental auto-vacuum, free pages are reused by new rows instead
+            return 0
+
+        def vacuum_step(session: Session) -> int:
+            cursor = session.connection().connection.cursor()
+            try:
+                free_pages = cursor.execute("PRAGMA freelist_count").fetchone()[0]
+                pages = min(free_pages, self.vacuum_step_pages)
+                # sqlite3 steps a statement once, and each step frees one page
+                for _ in range(pages):
+                    cursor.execute("PRAGMA incremental_vacuum")
+                return pages
+            finally:
+                cursor.close()
+
+        freed = 0
+        while True:
+            pages = writer.submit(vacuum_step).result()
+            freed += pages
+            if pages < self.vacuum_step_pages:
+                return freed
+
+    # Scheduling
+
+    def start_schedule(self) -> None:
+        """Run retention once a day, the first time shortly after startup."""
+        if self.settings.log_retention_days <= 0 or not self.settings.database_url.startswith("sqlite:///"):
+            self._timer.stop()
+            return
+        self._timer.start(5 * 60 * 1000)
+
+    def stop_schedule(self) -> None:
+        """Stop scheduled retention runs."""
+        self._timer.stop()
+
+    def _run_scheduled(self) -> None:
+        self.start_run()
+        self._timer.start(24 * 60 * 60 * 1000)
+
+    # Helpers
+
+    def _fetch_chunk(self, cutoff: datetime, after: Optional[Tuple[datetime, int]]) -> List[dict]:
+        """Read the next oldest logs before the cutoff with the names they refer to."""
+        query = (
+            select(
+                *SendLog.__table__.columns,
+                Campaign.name.label("campaign_name"),
+                Account.name.label("account_name"),
+                Recipient.display_label.label("recipient_name"),
+                MessageBody.text.label("message_text"),
+            )
+            .select_from(SendLog)
+            .outerjoin(Campaign, SendLog.campaign_id == Campaign.id)
+            .outerjoin(Account, SendLog.account_id == Account.id)
+            .outerjoin(Recipient, SendLog.recipient_id == Recipient.id)
+            .outerjoin(MessageBody, SendLog.message_body_id == MessageBody.id)
+            .where(SendLog.created_at < cutoff)
+        )
+        if after is not None:
+            created_at, log_id = after
+            query = query.where(or_(
+                SendLog.created_at > created_at,
+                and_(SendLog.created_at == created_at, SendLog.id > log_id)
+            ))
+        query = query.order_by(SendLog.created_at, SendLog.id).limit(self.chunk_size)
+
+        with get_session() as session:
+            return [dict(row) for row in session.execute(query).mappings().all()]
+
+    def _delete_ids(self, ids: List[int]) -> int:
+        """Delete one chunk of logs through the write queue."""
+        def delete_chunk(session: Session) -> int:
+            return session.execute(delete(SendLog).where(SendLog.id.in_(ids))).rowcount
+
+        return get_db_writer(SendLog.__tablename__).submit(delete_chunk).result()
+
+
+# Global log retention manager instance
+_log_retention: Optional[LogRetentionManager] = None
+
+
+def get_log_retention() -> LogRetentionManager:
+    """Get the global log retention manager instance."""
+    global _log_retention
+    if _log_retention is None:
+        _log_retention = LogRetentionManager()
+    return _log_retention
@@ -0,0 +1,144 @@
+"""
+Incremental, rotation-aware log file tailing with a bounded line buffer.
+"""
+
+import os
+import re
+from collections import deque
+from pathlib import Path
+from typing import Deque, IO, List, Optional, Tuple
+
+
+# Matches the file handler format: "<asctime> - <name> - <levelname> - ..."
+LEVEL_PATTERN = re.compile(
+    r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}(?:,\d+)? - \S+ - (DEBUG|INFO|WARNING|ERROR|CRITICAL) - "
+)
+
+
+def parse_level(line: str) -> Optional[str]:
+    """Get the level name of a formatted log line, or None for continuation lines."""
+    match = LEVEL_PATTERN.match(line)
+    return match.group(1) if match else None
+
+
+class LogTailer:
+    """Follows a log file by inode and byte offset across rotations.
+
+    The file handle stays open between polls; each poll costs one ``stat``
+    plus a read of whatever was appended since the previous poll.
+    """
+
+    def __init__(self, path: Path, chunk_size: int = 64 * 1024):
+        self.path = Path(path)
+        self.chunk_size = chunk_size
+        self._file: Optional[IO[bytes]] = None
+        self._identity: Optional[Tuple[int, int]] = None
+        self._offset = 0
+        self._partial = b""
+
+    def open(self, tail_bytes: Optional[int] = None) -> None:
+        """Start following the file, optionally from only its last ``tail_bytes``."""
+        self.close()
+        try:
+            self._file = open(self.path, "rb")
+        except FileNotFoundError:
+            return
+
+        stat = os.fstat(self._file.fileno())
+        self._identity = (stat.st_dev, stat.st_ino)
+        self._offset = 0
+        if tail_bytes is not None and stat.st_size > tail_bytes:
+            # Start at the first full line inside the tail window
+            self._file.seek(stat.st_size - tail_bytes)
+            self._file.readline()
+            self._offset = self._file.tell()
+
+    def close(self) -> None:
+        """Stop following the file."""
+        if self._file:
+            self._file.close()
+        self._file = None
+        self._identity = None
+        self._offset = 0
+        self._partial = b""
+
+    def poll(self) -> List[str]:
+        """Return complete lines appended since the last poll."""
+        if self._file is None:
+            self.open()
+            if self._file is None:
+                return []
+
+        lines = []
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            # Rotated away and not recreated yet; drain what was written
+            return self._read_lines()
+
+        if (stat.st_dev, stat.st_ino) != self._identity:
+            # Rotated: finish the old file, then follow the new one from the start
+            lines.extend(self._read_lines(flush=True))
+            self.open()
+        elif stat.st_size < self._offset:
+            # Truncated in place
+            self._file.seek(0)
+            self._offset = 0
+            self._partial = b""
+
+        lines.extend(self._read_lines())
+        return lines
+
+    def _read_lines(self, flush: bool = False) -> List[str]:
+        if self._file is None:
+            return []
+
+        self._file.seek(self._offset)
+        data = self._partial
+        while True:
+            chunk = self._file.read(self.chunk_size)
+            if not chunk:
+                break
+            data += chunk
+        self._offset = self._file.tell()
+
+        if flush:
+            complete, self._partial = data, b""
+        else:
+            cut = data.rfind(b"\n") + 1
+            complete, self._partial = data[:cut], data[cut:]
+
+        return complete.decode("utf-8", errors="replace").splitlines()
+
+
+class LogLineBuffer:
+    """Fixed-size ring buffer of parsed log lines."""
+
+    def __init__(self, max_lines: int = 5000):
+        self._lines: Deque[Tuple[str, str]] = deque(maxlen=max_lines)
+        self._last_level = "INFO"
+
+    def append(self, lines: List[str]) -> List[Tuple[str, str]]:
+        """Parse and add lines, returning them as (level, text) pairs."""
+        parsed = []
+        for line in lines:
+            level = parse_level(line)
+            if level is None:
+                # Tracebacks and wrapped messages inherit the level of their record
+                level = self._last_level
+            else:
+                self._last_level = level
+            parsed.append((level, line))
+        self._lines.extend(parsed)
+        return parsed
+
+    def lines(self, level: Optional[str] = None) -> List[str]:
+        """Get buffered lines, optionally only those of one level."""
+        return [text for line_level, text in self._lines if level is None or line_level == level]
+
+    def clear(self) -> None:
+        """Drop all buffered lines."""
+        self._lines.clear()
+
+    def __len__(self) -> int:
+        return len(self._lines)
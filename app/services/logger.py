@@ -2,15 +2,21 @@
 Logging service with rich console output and file logging.
 """
 
+import atexit
+import copy
+import json
 import logging
 import logging.handlers
+import queue
 import sys
+from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime
 
 from rich.console import Console
 from rich.logging import RichHandler
+from rich.markup import escape
 from rich.traceback import install
 
 from .settings import get_settings, LogLevel
@@ -34,6 +40,100 @@ class ColoredFormatter(logging.Formatter):
         return super().format(record)
 
 
+@dataclass(frozen=True)
+class LogEvent:
+    """Structured log record for Telegram, campaign and send events.
+    
+    Passed as the log message itself so text is only rendered by the
+    handlers that actually emit it, on the listener thread.
+    """
+    category: str
+    event: str
+    message: str = ""
+    account_id: Optional[int] = None
+    campaign_id: Optional[int] = None
+    recipient_id: Optional[int] = None
+    latency_ms: Optional[float] = None
+    
+    STYLES = {
+        "telegram": "bold blue",
+        "campaign": "bold green",
+        "rate_limit": "bold yellow",
+        "safety": "bold red",
+        "performance": "bold magenta",
+    }
+    SEND_STYLES = {
+        "sent": "bold green",
+        "failed": "bold red",
+        "rate_limited": "bold yellow",
+        "skipped": "bold blue",
+        "pending": "bold cyan",
+    }
+    
+    def _label(self) -> str:
+        return self.category.replace("_", " ").title()
+    
+    def _body(self) -> str:
+        parts = [f"[{self.event}]"]
+        if self.campaign_id is not None:
+            parts.append(f"campaign={self.campaign_id}")
+        if self.account_id is not None:
+            parts.append(f"account={self.account_id}")
+        if self.recipient_id is not None:
+            parts.append(f"recipient={self.recipient_id}")
+        if self.latency_ms is not None:
+            parts.append(f"latency={self.latency_ms:.0f}ms")
+        body = " ".join(parts)
+        return f"{body}: {self.message}" if self.message else body
+    
+    def __str__(self) -> str:
+        return f"{self._label()} {self._body()}"
+    
+    def to_markup(self) -> str:
+        """Render with rich console markup."""
+        if self.category == "send":
+            style = self.SEND_STYLES.get(self.event.lower(), "white")
+        else:
+            style = self.STYLES.get(self.category, "white")
+        return f"[{style}]{self._label()}[/{style}] {escape(self._body())}"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Get non-empty fields as a dict."""
+        return {key: value for key, value in asdict(self).items() if value not in (None, "")}
+
+
+class ConsoleFormatter(logging.Formatter):
+    """Formatter rendering structured events with rich markup."""
+    
+    def format(self, record):
+        if isinstance(record.msg, LogEvent):
+            return record.msg.to_markup()
+        return super().format(record)
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Compact one-object-per-line formatter for the structured event sink."""
+    
+    def format(self, record):
+        data = {"ts": round(record.created, 3), "lvl": record.levelname}
+        if isinstance(record.msg, LogEvent):
+            data.update(record.msg.to_dict())
+        else:
+            data["msg"] = record.getMessage()
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+class LazyQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that defers formatting of structured events to the listener."""
+    
+    def prepare(self, record):
+        if isinstance(record.msg, LogEvent) and not record.exc_info:
+            return copy.copy(record)
+        return super().prepare(record)
+
+
 class AppLogger:
     """Application logger with rich console and file output."""
     
@@ -41,6 +141,7 @@ class AppLogger:
         self.name = name
         self.settings = get_settings()
         self.console = Console()
+        self._exporter = None
         self._setup_logging()
     
     def _setup_logging(self):
@@ -63,8 +164,10 @@ class AppLogger:
         if self.settings.debug:
             self.logger.setLevel(logging.DEBUG)
         
-        # Clear existing handlers
+        # Stop a previous pipeline and clear existing handlers
+        self._stop_listener()
         self.logger.handlers.clear()
+        handlers = []
         
         # Console handler with rich formatting
         console_handler = RichHandler(
@@ -75,12 +178,12 @@ class AppLogger:
             markup=True,
         )
         console_handler.setLevel(getattr(logging, log_level))
-        console_formatter = logging.Formatter(
+        console_formatter = ConsoleFormatter(
             fmt="%(message)s",
             datefmt="[%X]"
         )
         console_handler.setFormatter(console_formatter)
-        self.logger.addHandler(console_handler)
+        handlers.append(console_handler)
         
         # File handler for general logs
         if self.settings.log_to_file:
@@ -97,7 +200,7 @@ class AppLogger:
                 datefmt='%Y-%m-%d %H:%M:%S'
             )
             file_handler.setFormatter(file_formatter)
-            self.logger.addHandler(file_handler)
+            handlers.append(file_handler)
             
             # Error file handler
             error_log_file = self.settings.get_error_log_file_path()
@@ -109,7 +212,40 @@ class AppLogger:
             )
             error_handler.setLevel(logging.ERROR)
             error_handler.setFormatter(file_formatter)
-            self.logger.addHandler(error_handler)
+            handlers.append(error_handler)
+            
+            # Optional structured event sink
+            if self.settings.log_json_events:
+                json_handler = logging.handlers.RotatingFileHandler(
+                    filename=self.settings.get_event_log_file_path(),
+                    maxBytes=self.settings.log_file_max_size,
+                    backupCount=self.settings.log_file_backup_count,
+                    encoding='utf-8'
+                )
+                json_handler.setLevel(logging.DEBUG)
+                json_handler.setFormatter(JsonLinesFormatter())
+                handlers.append(json_handler)
+        
+        # Callers only enqueue records; a listener thread does formatting and I/O
+        self._queue = queue.SimpleQueue()
+        self.logger.addHandler(LazyQueueHandler(self._queue))
+        self._listener = logging.handlers.QueueListener(
+            self._queue, *handlers, respect_handler_level=True
+        )
+        self._listener.start()
+    
+    def _stop_listener(self):
+        """Flush queued records and stop the listener thread."""
+        listener = getattr(self, "_listener", None)
+        if listener is not None:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+            self._listener = None
+    
+    def shutdown(self):
+        """Flush pending log records and close handlers."""
+        self._stop_listener()
     
     def debug(self, message: str, **kwargs):
         """Log debug message."""
@@ -135,41 +271,61 @@ class AppLogger:
         """Log exception with traceback."""
         self.logger.exception(message, **kwargs)
     
+    def log_event(self, level: int, event: LogEvent, **kwargs):
+        """Log a structured event."""
+        self.logger.log(level, event, **kwargs)
+    
     def log_telegram_event(self, event_type: str, account_id: int, message: str, **kwargs):
         """Log Telegram-specific event."""
-        self.info(f"[bold blue]Telegram[/bold blue] [{event_type}] Account {account_id}: {message}", **kwargs)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.log_event(logging.INFO, LogEvent("telegram", event_type, message, account_id=account_id), **kwargs)
     
     def log_campaign_event(self, event_type: str, campaign_id: int, message: str, **kwargs):
         """Log campaign-specific event."""
-        self.info(f"[bold green]Campaign[/bold green] [{event_type}] Campaign {campaign_id}: {message}", **kwargs)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.log_event(logging.INFO, LogEvent("campaign", event_type, message, campaign_id=campaign_id), **kwargs)
     
-    def log_send_event(self, status: str, account_id: int, recipient_id: int, message: str, **kwargs):
+    def log_send_event(
+        self,
+        status: str,
+        account_id: int,
+        recipient_id: int,
+        message: str,
+        campaign_id: Optional[int] = None,
+        latency_ms: Optional[float] = None,
+        **kwargs
+    ):
         """Log message send event."""
-        color = {
-            "sent": "green",
-            "failed": "red",
-            "rate_limited": "yellow",
-            "skipped": "blue",
-            "pending": "cyan"
-        }.get(status, "white")
-        
-        self.info(f"[bold {color}]Send[/bold {color}] [{status.upper()}] Account {account_id} -> Recipient {recipient_id}: {message}", **kwargs)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.log_event(logging.INFO, LogEvent(
+                "send", status.upper(), message,
+                account_id=account_id,
+                campaign_id=campaign_id,
+                recipient_id=recipient_id,
+                latency_ms=latency_ms
+            ), **kwargs)
     
     def log_rate_limit(self, account_id: int, limit_type: str, current: int, max_limit: int, **kwargs):
         """Log rate limit information."""
-        self.warning(f"[bold yellow]Rate Limit[/bold yellow] Account {account_id} {limit_type}: {current}/{max_limit}", **kwargs)
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.log_event(logging.WARNING, LogEvent(
+                "rate_limit", limit_type, f"{current}/{max_limit}", account_id=account_id
+            ), **kwargs)
     
     def log_safety_event(self, event_type: str, message: str, **kwargs):
         """Log safety/compliance event."""
-        self.warning(f"[bold red]Safety[/bold red] [{event_type}]: {message}", **kwargs)
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.log_event(logging.WARNING, LogEvent("safety", event_type, message), **kwargs)
     
     def log_performance(self, operation: str, duration_ms: float, **kwargs):
         """Log performance metrics."""
-        self.debug(f"[bold magenta]Performance[/bold magenta] {operation}: {duration_ms:.2f}ms", **kwargs)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.log_event(logging.DEBUG, LogEvent("performance", operation, latency_ms=duration_ms), **kwargs)
     
     def reload_settings(self):
         """Reload logger with updated settings."""
         self.settings = get_settings()
+        self._exporter = None
         self._setup_logging()
     
     def get_log_file_path(self) -> Path:
@@ -180,15 +336,31 @@ class AppLogger:
         """Get error log file path."""
         return self.settings.get_error_log_file_path()
     
-    def export_logs(self, start_time: Optional[datetime] = None, end_time: Optional[datetime] = None) -> str:
-        """Export logs for a time period."""
-        # This would implement log export functionality
-        # For now, return a placeholder
-        return "Log export functionality not yet implemented"
+    def export_logs(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        output_path: Optional[Path] = None
+    ) -> str:
+        """Export logs for a time period, returning the export file path."""
+        from .log_export import LogExporter
+        
+        if output_path is None:
+            output_path = self.settings.get_logs_path() / f"export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+        
+        if self._exporter is None:
+            self._exporter = LogExporter(self.get_log_file_path())
+        
+        with open(output_path, "wb") as output:
+            count = self._exporter.export(start_time, end_time, output)
+        
+        self.info(f"Exported {count} log lines to {output_path}")
+        return str(output_path)
 
 
 # Global logger instance
 logger = AppLogger()
+atexit.register(logger.shutdown)
 
 
 def get_logger() -> AppLogger:
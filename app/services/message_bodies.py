@@ -0,0 +1,172 @@
+"""
+Content-addressed message bodies shared by send logs.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import delete, event, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlmodel import Session
+
+from .logger import get_logger
+from ..models import MessageBody, SendLog
+
+
+_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+# Keeps IN lists well under SQLite's bound parameter limit
+_LOOKUP_CHUNK = 500
+
+# Session.info key for body ids interned by a transaction that hasn't committed yet
+_PENDING_KEY = "message_bodies.pending"
+
+
+def body_hash(text: Optional[str]) -> Optional[str]:
+    """Get the content hash a message text is stored under."""
+    if text is None:
+        return None
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+
+
+class MessageBodyStore:
+    """Stores each distinct message text once and points send logs at it.
+
+    A campaign sends the same text (or a handful of spintax variants) to
+    thousands of recipients, so logs keep only a ``message_body_id``. New
+    logs get theirs on flush, whichever session or write queue they came
+    from; ids of recently used bodies are cached so a running campaign
+    doesn't look its text up again for every send. Ids only enter the cache
+    once the transaction that stored them has committed.
+    """
+
+    def __init__(self, cache_size: int = 1024):
+        self.logger = get_logger()
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[str, str], int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._installed = False
+
+    def install(self, session_class) -> None:
+        """Intern the texts of new send logs on every flush of a session class."""
+        if self._installed:
+            return
+        event.listen(session_class, "before_flush", self._before_flush)
+        event.listen(session_class, "after_commit", self._after_commit)
+        event.listen(session_class, "after_rollback", self._after_rollback)
+        self._installed = True
+
+    def uninstall(self, session_class) -> None:
+        """Stop interning texts for a session class."""
+        if self._installed:
+            event.remove(session_class, "before_flush", self._before_flush)
+            event.remove(session_class, "after_commit", self._after_commit)
+            event.remove(session_class, "after_rollback", self._after_rollback)
+            self._installed = False
+
+    def _before_flush(self, session, flush_context, instances) -> None:
+        logs = [
+            log for log in session.new
+            if isinstance(log, SendLog) and log.message_body_id is None and log.__dict__.get("_message_text") is not None
+        ]
+        if not logs:
+            return
+        connection = session.connection()
+        ids = self.intern(connection, {log.message_text for log in logs})
+        for log in logs:
+            log.message_body_id = ids[log.message_text]
+        pending = session.info.setdefault(_PENDING_KEY, {})
+        pending.update(((str(connection.engine.url), body_hash(text)), body_id) for text, body_id in ids.items())
+
+    def _after_commit(self, session) -> None:
+        pending = session.info.pop(_PENDING_KEY, None)
+        if pending:
+            with self._lock:
+                for key, body_id in pending.items():
+                    self._cache[key] = body_id
+                    self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+    def _after_rollback(self, session) -> None:
+        # Bodies stored by the rolled back transaction are gone
+        session.info.pop(_PENDING_KEY, None)
+
+    def intern(self, connection: Connection, texts: Iterable[str]) -> Dict[str, int]:
+        """Get body ids for texts, storing the ones not seen before, in the caller's transaction."""
+        database = str(connection.engine.url)
+        ids: Dict[str, int] = {}
+        missing: Dict[str, str] = {}
+        with self._lock:
+            for text in texts:
+                digest = body_hash(text)
+                body_id = self._cache.get((database, digest))
+                if body_id is None:
+                    missing[digest] = text
+                else:
+                    self._cache.move_to_end((database, digest))
+                    ids[text] = body_id
+        if not missing:
+            return ids
+
+        table = MessageBody.__table__
+        insert = _INSERTS.get(connection.dialect.name)
+        if insert is not None:
+            # Another writer may store the same text first
+            connection.execute(
+                insert(table).on_conflict_do_nothing(index_elements=["content_hash"]),
+                [{"content_hash": digest, "text": text} for digest, text in missing.items()]
+            )
+        found: Dict[str, int] = {}
+        digests = list(missing)
+        for start in range(0, len(digests), _LOOKUP_CHUNK):
+            chunk = digests[start:start + _LOOKUP_CHUNK]
+            found.update(connection.execute(
+                select(table.c.content_hash, table.c.id).where(table.c.content_hash.in_(chunk))
+            ).all())
+        if insert is None:
+            for digest in set(missing) - set(found):
+                found[digest] = connection.execute(
+                    table.insert().values(content_hash=digest, text=missing[digest])
+                ).inserted_primary_key[0]
+
+        for digest, body_id in found.items():
+            ids[missing[digest]] = body_id
+        return ids
+
+    def prune(self) -> int:
+        """Delete bodies no send log refers to any more; returns bodies deleted."""
+        from .db import get_db_writer
+
+        def delete_unused(session: Session) -> int:
+            used = select(SendLog.message_body_id).where(SendLog.message_body_id.is_not(None))
+            return session.execute(delete(MessageBody).where(MessageBody.id.not_in(used))).rowcount
+
+        try:
+            deleted = get_db_writer(MessageBody.__tablename__).submit(delete_unused).result()
+        finally:
+            # Ids of deleted bodies may be handed out again
+            self.clear_cache()
+        if deleted:
+            self.logger.info(f"Deleted {deleted} unused message bodies")
+        return deleted
+
+    def clear_cache(self) -> None:
+        """Forget cached body ids, e.g. after bodies were deleted or the database was replaced."""
+        with self._lock:
+            self._cache.clear()
+
+
+# Global message body store instance
+_message_bodies: Optional[MessageBodyStore] = None
+
+
+def get_message_bodies() -> MessageBodyStore:
+    """Get the global message body store instance."""
+    global _message_bodies
+    if _message_bodies is None:
+        _message_bodies = MessageBodyStore()
+    return _message_bodies
@@ -0,0 +1,312 @@
+"""
+Versioned schema migrations applied at startup.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, List, Optional
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func, inspect, select
+from sqlalchemy.engine import Connection, Engine
+from sqlmodel import SQLModel
+
+from .logger import get_logger
+
+
+@dataclass(frozen=True)
+class Migration:
+    """One schema change; ``upgrade`` runs inside the migration's transaction."""
+    version: int
+    description: str
+    upgrade: Callable[[Connection], None]
+
+
+# Applied versions live outside SQLModel.metadata so create_all/drop_all leave them alone
+migration_metadata = MetaData()
+
+schema_migrations = Table(
+    "schema_migrations",
+    migration_metadata,
+    Column("version", Integer, primary_key=True),
+    Column("description", String, nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+def _create_indexes(connection: Connection, *names: str) -> None:
+    """Create model-declared indexes by name if they don't exist yet."""
+    from .log_database import create_index
+    wanted = set(names)
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            if index.name in wanted:
+                create_index(connection, index)
+                wanted.discard(index.name)
+    if wanted:
+        raise LookupError(f"Unknown indexes: {', '.join(sorted(wanted))}")
+
+
+def _baseline(connection: Connection) -> None:
+    """Create missing tables, and indexes added to existing tables before migrations."""
+    # Import all models to ensure they are registered with SQLModel
+    from ..models import Account, Campaign, Recipient, SendLog, SendLogErrorRollup, SendLogRollup, MessageTemplate
+    from ..models.recipient import RecipientList, RecipientListRecipient
+    from .log_database import LOG_SCHEMA, create_index, table_schema
+    # create_all only looks in main; don't shadow tables kept in the log database
+    tables = [t for t in SQLModel.metadata.sorted_tables if table_schema(connection, t.name) != LOG_SCHEMA]
+    SQLModel.metadata.create_all(connection, tables=tables)
+
+    # create_all skips existing tables, so add indexes introduced since; indexes on
+    # columns that a later migration adds are created by that migration
+    for table in SQLModel.metadata.sorted_tables:
+        schema = table_schema(connection, table.name)
+        columns = {column["name"] for column in inspect(connection).get_columns(table.name, schema=schema)}
+        for index in table.indexes:
+            if {column.name for column in index.columns} <= columns:
+                create_index(connection, index)
+
+
+def _index_pack(connection: Connection) -> None:
+    """Composite and partial indexes for the campaign engine's hot queries."""
+    _create_indexes(
+        connection,
+        "ix_send_logs_campaign_status_recipient",
+        "ix_recipients_live_status",
+        "ix_campaigns_live_status_start",
+        "ix_accounts_available_status",
+    )
+
+
+def _send_log_rollups(connection: Connection) -> None:
+    """Hourly send log rollups for reports, filled from the live and archived logs."""
+    from ..models import SendLogErrorRollup, SendLogRollup
+    from .log_database import create_index, table_schema
+    from .send_log_rollups import get_send_log_rollups
+    for table in (SendLogRollup.__table__, SendLogErrorRollup.__table__):
+        if table_schema(connection, table.name) is None:
+            table.create(connection)
+        for index in table.indexes:
+            create_index(connection, index)
+    get_send_log_rollups().rebuild(connection)
+
+
+def _send_error_codes(connection: Connection) -> None:
+    """Error codes on failed logs, indexed and counted per campaign and account."""
+    from sqlalchemy import bindparam, update
+    from ..models import SendLog, SendLogErrorRollup, SendStatus
+    from .log_database import LOG_SCHEMA, log_table, table_schema
+    from .send_errors import classify_error_message
+    from .send_log_rollups import get_send_log_rollups
+
+    # Code the failures logged before codes existed, one statement per distinct message
+    logs = SendLog.__table__
+    uncoded = (logs.c.status == SendStatus.FAILED) & logs.c.error_code.is_(None)
+    messages = connection.execute(select(logs.c.error_message).where(uncoded).distinct()).scalars().all()
+    coded = [{"message": message, "code": classify_error_message(message)} for message in messages if message]
+    if coded:
+        connection.execute(
+            update(logs).where(uncoded & (logs.c.error_message == bindparam("message"))).values(error_code=bindparam("code")),
+            coded
+        )
+    connection.execute(update(logs).where(uncoded).values(error_code=classify_error_message(None)))
+    _create_indexes(connection, "ix_send_logs_error_code_created_at")
+
+    # The error rollup was keyed by message before; it is recomputed below anyway
+    table = SendLogErrorRollup.__table__
+    schema = table_schema(connection, table.name)
+    if schema is not None:
+        columns = {column["name"] for column in inspect(connection).get_columns(table.name, schema=schema)}
+        if "error_code" not in columns:
+            connection.exec_driver_sql(f'DROP TABLE {schema}."{table.name}"')
+            schema = None
+    if schema is None:
+        placed = log_table(table) if table_schema(connection, SendLog.__tablename__) == LOG_SCHEMA else table
+        placed.create(connection)
+    _create_indexes(connection, "ix_send_log_error_rollups_error_code")
+    get_send_log_rollups().rebuild(connection)
+
+
+def _message_bodies(connection: Connection) -> None:
+    """Message texts stored once in message_bodies; logs drop their copy and unused columns."""
+    from ..models import MessageBody, SendLog
+    from .log_database import LOG_SCHEMA, log_table, table_schema
+    from .message_bodies import get_message_bodies
+
+    schema = table_schema(connection, SendLog.__tablename__)
+    if schema is None:
+        return
+    if table_schema(connection, MessageBody.__tablename__) is None:
+        (log_table(MessageBody.__table__) if schema == LOG_SCHEMA else MessageBody.__table__).create(connection)
+    _create_indexes(connection, "ix_message_bodies_content_hash")
+
+    columns = {column["name"] for column in inspect(connection).get_columns(SendLog.__tablename__, schema=schema)}
+    if "message_body_id" not in columns:
+        # Foreign keys can't point into another database file
+        reference = "" if schema == LOG_SCHEMA else " REFERENCES message_bodies (id)"
+        connection.exec_driver_sql(f"ALTER TABLE send_logs ADD COLUMN message_body_id INTEGER{reference}")
+
+    if "message_text" in columns:
+        # Intern every distinct text, then point each log at its body through a text -> id table
+        ids = Table(
+            "message_body_ids", MetaData(),
+            Column("text", String, primary_key=True),
+            Column("body_id", Integer, nullable=False),
+            prefixes=["TEMPORARY"],
+        )
+        ids.create(connection)
+        texts = connection.exec_driver_sql(
+            "SELECT DISTINCT message_text FROM send_logs WHERE message_text IS NOT NULL AND message_body_id IS NULL"
+        )
+        bodies = get_message_bodies()
+        for chunk in texts.scalars().partitions(1000):
+            interned = bodies.intern(connection, chunk)
+            connection.execute(ids.insert(), [{"text": text, "body_id": body_id} for text, body_id in interned.items()])
+        connection.exec_driver_sql(
+            "UPDATE send_logs SET message_body_id = "
+            "(SELECT body_id FROM message_body_ids WHERE message_body_ids.text = send_logs.message_text) "
+            "WHERE message_text IS NOT NULL AND message_body_id IS NULL"
+        )
+        ids.drop(connection)
+
+    for name in ("message_text", "user_agent", "ip_address"):
+        if name in columns:
+            connection.exec_driver_sql(f"ALTER TABLE send_logs DROP COLUMN {name}")
+
+
+def _campaign_progress(connection: Connection) -> None:
+    """Sent and failed recipients of each campaign, saved as bitmaps for resuming runs."""
+    from ..models import CampaignProgress
+    from .log_database import table_schema
+    if table_schema(connection, CampaignProgress.__tablename__) is None:
+        CampaignProgress.__table__.create(connection)
+
+
+def _recipient_list_members(connection: Connection) -> None:
+    """Index list membership by list, for resolving campaign recipient segments."""
+    _create_indexes(connection, "ix_recipientlist_recipients_list_recipient")
+
+
+def _json_columns(connection: Connection) -> None:
+    """JSON columns hold a valid array or object (or NULL), and entity tags get their own index."""
+    from ..models import EntityTag
+    from ..models.base import JSONDict, JSONList
+    from .entity_tags import get_entity_tags
+    from .log_database import table_schema
+
+    # Loading a row now parses the column, so repair values the old getters silently ignored
+    for table in SQLModel.metadata.sorted_tables:
+        schema = table_schema(connection, table.name)
+        if schema is None:
+            continue
+        for column in table.columns:
+            if column.type is not JSONList and column.type is not JSONDict:
+                continue
+            name = column.name
+            json_type = f"CASE WHEN json_valid({name}) THEN json_type({name}) END"
+            if column.type is JSONList:
+                # Stray values become the only element of a list, so no text is lost
+                kind, repaired = "array", (
+                    f"CASE WHEN NOT json_valid({name}) THEN json_array({name}) "
+                    f"WHEN json_type({name}) = 'null' THEN NULL ELSE json_array(json({name})) END"
+                )
+            else:
+                kind, repaired = "object", "NULL"
+            connection.exec_driver_sql(
+                f'UPDATE {schema}."{table.name}" SET {name} = {repaired} '
+                f"WHERE {name} IS NOT NULL AND {json_type} IS NOT '{kind}'"
+            )
+
+    if table_schema(connection, EntityTag.__tablename__) is None:
+        EntityTag.__table__.create(connection)
+    _create_indexes(connection, "ix_entity_tags_entity", "ix_recipients_live_custom_fields")
+    get_entity_tags().ensure_index(connection)
+
+
+def _recipient_labels(connection: Connection) -> None:
+    """Identifier and display label of each recipient as indexed generated columns."""
+    from sqlalchemy.schema import CreateColumn
+    from ..models import Recipient
+
+    table = Recipient.__table__
+    columns = {column["name"] for column in inspect(connection).get_columns(table.name)}
+    for name in ("identifier", "display_label"):
+        if name not in columns:
+            # Virtual generated columns are the kind ALTER TABLE can add; their indexes store the values
+            definition = CreateColumn(table.c[name]).compile(dialect=connection.dialect)
+            connection.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN {definition}")
+    _create_indexes(connection, "ix_recipients_live_identifier", "ix_recipients_live_display_label")
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "Baseline schema", _baseline),
+    Migration(2, "Index pack for hot queries", _index_pack),
+    Migration(3, "Send log rollups", _send_log_rollups),
+    Migration(4, "Send error codes", _send_error_codes),
+    Migration(5, "Message bodies", _message_bodies),
+    Migration(6, "Campaign progress", _campaign_progress),
+    Migration(7, "Recipient list member index", _recipient_list_members),
+    Migration(8, "JSON columns and entity tag index", _json_columns),
+    Migration(9, "Recipient identifier and display label", _recipient_labels),
+]
+
+
+class MigrationRunner:
+    """Brings a database up to the latest schema version.
+
+    A migration is recorded only after its upgrade finished, and upgrades are
+    written to be re-runnable, so an interrupted upgrade resumes from the last
+    recorded version. When the schema is already current, startup costs one
+    query.
+    """
+
+    def __init__(self, engine: Engine, migrations: Optional[List[Migration]] = None):
+        self.engine = engine
+        self.logger = get_logger()
+        self.migrations = sorted(migrations if migrations is not None else MIGRATIONS, key=lambda m: m.version)
+
+    def latest_version(self) -> int:
+        """Get the version the newest migration brings the schema to."""
+        return self.migrations[-1].version if self.migrations else 0
+
+    def current_version(self) -> int:
+        """Get the newest applied version, 0 for a database without migrations."""
+        with self.engine.connect() as connection:
+            return self._current_version(connection)
+
+    def is_current(self) -> bool:
+        """Check whether every migration has been applied."""
+        return self.current_version() >= self.latest_version()
+
+    def upgrade(self) -> List[int]:
+        """Apply pending migrations in order and return the versions applied."""
+        current = self.current_version()
+        pending = [m for m in self.migrations if m.version > current]
+        if not pending:
+            return []
+
+        applied = []
+        for migration in pending:
+            with self.engine.begin() as connection:
+                migration_metadata.create_all(connection)
+                # Another process may have applied it meanwhile
+                if self._current_version(connection) >= migration.version:
+                    continue
+                self.logger.info(f"Applying schema migration {migration.version}: {migration.description}")
+                migration.upgrade(connection)
+                connection.execute(schema_migrations.insert().values(
+                    version=migration.version,
+                    description=migration.description,
+                    applied_at=datetime.utcnow(),
+                ))
+            applied.append(migration.version)
+        return applied
+
+    def reset(self) -> None:
+        """Forget applied versions, e.g. after the schema was dropped."""
+        migration_metadata.drop_all(self.engine)
+
+    @staticmethod
+    def _current_version(connection: Connection) -> int:
+        if not inspect(connection).has_table(schema_migrations.name):
+            return 0
+        return connection.execute(select(func.max(schema_migrations.c.version))).scalar() or 0
@@ -0,0 +1,143 @@
+"""
+Fingerprint of the recipients a campaign sends to, kept up to date by SQLite triggers for manual campaigns.
+"""
+
+from typing import Optional, Tuple
+
+from sqlalchemy import func, select, text
+from sqlalchemy.engine import Connection, Engine
+
+from .logger import get_logger
+from .db import get_session
+from .recipient_segments import RecipientSegment
+from ..models import Recipient, RecipientStatus
+
+
+AUDIENCE_TABLE = "recipient_audience"
+
+# Campaigns with the "manual" source send to every live, active recipient
+MANUAL_AUDIENCE = "manual"
+
+# Each member id adds (id * K) % P to both sums; two multipliers make accidental matches unlikely
+_PRIME = 4294967291
+_MULTIPLIERS = (2654435761, 2246822519)
+
+
+def _member(row: str) -> str:
+    return f"(NOT {row}.is_deleted AND {row}.status = '{RecipientStatus.ACTIVE.name}')"
+
+
+def _mix(row: str, multiplier: int) -> str:
+    return f"(({row}.id * {multiplier}) % {_PRIME})"
+
+
+class RecipientAudienceService:
+    """Count and order-independent hash of the manual campaign audience.
+
+    Triggers on ``recipients`` add or remove a row's id from the
+    fingerprint whenever it enters or leaves the audience (insert, delete,
+    or a change of status or soft-delete flag), so comparing audiences
+    costs a single-row lookup instead of loading and hashing every id.
+    Adding and later removing a recipient gives the old fingerprint back.
+    Narrower segments (a list or filters) get the same hash
+    aggregated by one query over the segment.
+    """
+
+    def __init__(self):
+        self.logger = get_logger()
+        self._available = False
+
+    def is_available(self) -> bool:
+        """Check whether the trigger-maintained fingerprint has been set up."""
+        return self._available
+
+    def ensure_fingerprint(self, engine: Engine) -> None:
+        """Create the fingerprint table and its triggers, filling it if new."""
+        def apply(row: str, sign: str) -> str:
+            sums = ", ".join(
+                f"hash_{index} = (hash_{index} + {_PRIME} + {sign} * {_mix(row, multiplier)}) % {_PRIME}"
+                for index, multiplier in enumerate(_MULTIPLIERS)
+            )
+            return (
+                f"UPDATE {AUDIENCE_TABLE} SET member_count = member_count + {sign}, {sums} "
+                f"WHERE audience = '{MANUAL_AUDIENCE}';"
+            )
+
+        old_member, new_member = _member("old"), _member("new")
+        try:
+            with engine.begin() as connection:
+                exists = connection.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                    {"name": AUDIENCE_TABLE}
+                ).first()
+
+                connection.exec_driver_sql(
+                    f"CREATE TABLE IF NOT EXISTS {AUDIENCE_TABLE} ("
+                    f"audience VARCHAR PRIMARY KEY, member_count INTEGER NOT NULL, "
+                    f"hash_0 INTEGER NOT NULL, hash_1 INTEGER NOT NULL)"
+                )
+                connection.exec_driver_sql(
+                    f"CREATE TRIGGER IF NOT EXISTS {AUDIENCE_TABLE}_ai AFTER INSERT ON recipients "
+                    f"WHEN {new_member} BEGIN {apply('new', '1')} END"
+                )
+                connection.exec_driver_sql(
+                    f"CREATE TRIGGER IF NOT EXISTS {AUDIENCE_TABLE}_ad AFTER DELETE ON recipients "
+                    f"WHEN {old_member} BEGIN {apply('old', '-1')} END"
+                )
+                connection.exec_driver_sql(
+                    f"CREATE TRIGGER IF NOT EXISTS {AUDIENCE_TABLE}_au AFTER UPDATE OF id, status, is_deleted ON recipients "
+                    f"WHEN {old_member} OR {new_member} BEGIN "
+                    f"{apply('old', f'(CASE WHEN {old_member} THEN -1 ELSE 0 END)')} "
+                    f"{apply('new', f'(CASE WHEN {new_member} THEN 1 ELSE 0 END)')} END"
+                )
+
+                if not exists:
+                    self.rebuild(connection)
+            self._available = True
+        except Exception as e:
+            self._available = False
+            self.logger.warning(f"Recipient audience fingerprint unavailable: {e}")
+
+    def rebuild(self, connection: Connection) -> None:
+        """Recompute the stored fingerprint from the recipients table."""
+        count, hashes = self._compute(connection)
+        connection.exec_driver_sql(f"DELETE FROM {AUDIENCE_TABLE} WHERE audience = ?", (MANUAL_AUDIENCE,))
+        connection.exec_driver_sql(
+            f"INSERT INTO {AUDIENCE_TABLE} (audience, member_count, hash_0, hash_1) VALUES (?, ?, ?, ?)",
+            (MANUAL_AUDIENCE, count, *hashes)
+        )
+
+    def fingerprint(self, segment: Optional[RecipientSegment] = None) -> str:
+        """Get the fingerprint of a recipient segment; equal fingerprints mean the same recipients."""
+        segment = segment or RecipientSegment()
+        with get_session() as session:
+            connection = session.connection()
+            stored = None
+            if self._available and segment.is_everyone():
+                stored = connection.execute(
+                    text(f"SELECT member_count, hash_0, hash_1 FROM {AUDIENCE_TABLE} WHERE audience = :audience"),
+                    {"audience": MANUAL_AUDIENCE}
+                ).first()
+            if stored is not None:
+                count, hashes = stored[0], tuple(stored[1:])
+            else:
+                count, hashes = self._compute(connection, segment)
+        label = MANUAL_AUDIENCE if segment.is_everyone() else "segment"
+        return f"{label}:{count}:" + "".join(f"{value:08x}" for value in hashes)
+
+    @staticmethod
+    def _compute(connection: Connection, segment: Optional[RecipientSegment] = None) -> Tuple[int, Tuple[int, ...]]:
+        """Aggregate the fingerprint in the database without loading recipients."""
+        segment = segment or RecipientSegment()
+        sums = [func.coalesce(func.sum((Recipient.id * multiplier) % _PRIME), 0) for multiplier in _MULTIPLIERS]
+        row = connection.execute(select(func.count(Recipient.id), *sums).where(segment.where())).first()
+        return row[0], tuple(value % _PRIME for value in row[1:])
+
+
+# Global recipient audience service instance
+recipient_audience = RecipientAudienceService()
+
+
+def get_recipient_audience() -> RecipientAudienceService:
+    """Get recipient audience service instance."""
+    return recipient_audience
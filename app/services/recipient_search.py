@@ -0,0 +1,156 @@
+"""
+Full-text search index for recipients backed by SQLite FTS5.
+"""
+
+import re
+from typing import Any, List, Optional
+
+from sqlalchemy import String, cast, column, literal_column, or_, table, text
+from sqlalchemy.engine import Engine
+from sqlmodel import select
+
+from .logger import get_logger
+from .db import get_session
+from ..models import Recipient
+
+
+# Recipient columns mirrored into the FTS index
+FTS_COLUMNS = [
+    "display_name", "first_name", "last_name", "username",
+    "group_title", "group_username", "phone_number", "email",
+    "tags", "notes",
+]
+
+FTS_TABLE = "recipients_fts"
+
+recipients_fts = table(FTS_TABLE, column("rowid"), column("rank"))
+
+
+class RecipientSearchService:
+    """Service for ranked full-text recipient search."""
+
+    def __init__(self):
+        self.logger = get_logger()
+        self._available = False
+
+    def is_available(self) -> bool:
+        """Check whether the FTS5 index has been set up."""
+        return self._available
+
+    def ensure_index(self, engine: Engine) -> None:
+        """Create the FTS5 table and sync triggers, rebuilding the index if new."""
+        columns = ", ".join(FTS_COLUMNS)
+        new_values = ", ".join(f"new.{name}" for name in FTS_COLUMNS)
+        old_values = ", ".join(f"old.{name}" for name in FTS_COLUMNS)
+
+        try:
+            with engine.begin() as connection:
+                exists = connection.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                    {"name": FTS_TABLE}
+                ).first()
+
+                connection.exec_driver_sql(
+                    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+                    f"{columns}, content='recipients', content_rowid='id', "
+                    f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+                )
+                connection.exec_driver_sql(
+                    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON recipients BEGIN "
+                    f"INSERT INTO {FTS_TABLE}(rowid, {columns}) VALUES (new.id, {new_values}); END"
+                )
+                connection.exec_driver_sql(
+                    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON recipients BEGIN "
+                    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {columns}) "
+                    f"VALUES ('delete', old.id, {old_values}); END"
+                )
+                update_trigger = connection.execute(
+                    text("SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = :name"),
+                    {"name": f"{FTS_TABLE}_au"}
+                ).scalar()
+                if update_trigger and "UPDATE OF" not in update_trigger:
+                    # Older trigger re-indexed on every update, including send counter updates
+                    connection.exec_driver_sql(f"DROP TRIGGER {FTS_TABLE}_au")
+                connection.exec_driver_sql(
+                    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF {columns} ON recipients BEGIN "
+                    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {columns}) "
+                    f"VALUES ('delete', old.id, {old_values}); "
+                    f"INSERT INTO {FTS_TABLE}(rowid, {columns}) VALUES (new.id, {new_values}); END"
+                )
+
+                if not exists:
+                    # Index recipients that were created before the FTS table existed
+                    connection.exec_driver_sql(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+                    self.logger.info("Recipient search index built")
+
+            self._available = True
+        except Exception as e:
+            self._available = False
+            self.logger.warning(f"Recipient full-text search unavailable: {e}")
+
+    def rebuild_index(self, engine: Engine) -> None:
+        """Rebuild the FTS index from the recipients table."""
+        with engine.begin() as connection:
+            connection.exec_driver_sql(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+        self.logger.info("Recipient search index rebuilt")
+
+    @staticmethod
+    def build_match_query(search_text: str) -> Optional[str]:
+        """Convert free text into an FTS5 query of ANDed prefix terms."""
+        terms = re.findall(r"\w+", search_text or "")
+        if not terms:
+            return None
+        return " ".join('"{}"*'.format(term.replace('"', '""')) for term in terms)
+
+    def match_condition(self, search_text: str) -> Optional[Any]:
+        """Build a WHERE condition joining recipients to matching FTS rows."""
+        query = self.build_match_query(search_text)
+        if query is None:
+            return None
+        return (Recipient.id == recipients_fts.c.rowid) & literal_column(FTS_TABLE).op("MATCH")(query)
+
+    def like_condition(self, search_text: str) -> Optional[Any]:
+        """Build a LIKE condition over the indexed columns, for when FTS5 is unavailable."""
+        search_text = (search_text or "").strip()
+        if not search_text:
+            return None
+        pattern = f"%{search_text}%"
+        return or_(*[cast(getattr(Recipient, name), String).ilike(pattern) for name in FTS_COLUMNS])
+
+    def rank_column(self) -> Any:
+        """Get the FTS5 relevance column for ORDER BY (lower is better)."""
+        return recipients_fts.c.rank
+
+    def search(self, search_text: str, limit: int = 50, offset: int = 0) -> List[Recipient]:
+        """Search active recipients, ordered by relevance (by id without FTS5)."""
+        if self._available:
+            condition = self.match_condition(search_text)
+            order_by = [self.rank_column(), Recipient.id]
+        else:
+            condition = self.like_condition(search_text)
+            order_by = [Recipient.id]
+        if condition is None:
+            return []
+
+        try:
+            with get_session() as session:
+                statement = (
+                    select(Recipient)
+                    .where(condition, Recipient.is_deleted == False)
+                    .order_by(*order_by)
+                    .offset(offset)
+                    .limit(limit)
+                )
+                return list(session.exec(statement).all())
+        except Exception as e:
+            self.logger.error(f"Error searching recipients: {e}")
+            return []
+
+
+# Global recipient search service instance
+recipient_search = RecipientSearchService()
+
+
+def get_recipient_search() -> RecipientSearchService:
+    """Get recipient search service instance."""
+    return recipient_search
@@ -0,0 +1,186 @@
+"""
+Campaign audiences compiled to SQL: recipient list membership plus recipient filters.
+"""
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, Iterator, List, Optional, Type
+
+from sqlalchemy import and_, case, false, func, not_
+from sqlmodel import select
+
+from .db import get_session
+from .entity_tags import get_entity_tags
+from ..models import Campaign, Recipient, RecipientSource, RecipientStatus, RecipientType
+from ..models.recipient import RecipientListRecipient
+
+
+DEFAULT_BATCH_SIZE = 1000
+
+# The only campaign source that may send without a recipient list
+MANUAL_SOURCE = "manual"
+
+FILTER_KEYS = ("status", "recipient_type", "type", "source", "tags", "tags_all", "exclude_tags", "custom_fields")
+
+
+def _as_list(value: Any) -> List[Any]:
+    if value is None:
+        return []
+    return list(value) if isinstance(value, (list, tuple, set)) else [value]
+
+
+def _enum_members(enum_type: Type[Enum], value: Any) -> List[Enum]:
+    """Resolve filter values given as members, values or names (any case)."""
+    members = []
+    for item in _as_list(value):
+        if isinstance(item, enum_type):
+            members.append(item)
+            continue
+        key = str(item).lower()
+        match = next((m for m in enum_type if m.value.lower() == key or m.name.lower() == key), None)
+        if match is None:
+            raise ValueError(f"Unknown {enum_type.__name__} in recipient filters: {item!r}")
+        members.append(match)
+    return members
+
+
+def _valid_json(column):
+    # json_extract fails on malformed text; treat it as empty
+    return case((func.json_valid(column) == 1, column), else_=None)
+
+
+def _custom_field(name: str, value: Any):
+    if '"' in name:
+        raise ValueError(f"Invalid custom field name in recipient filters: {name!r}")
+    stored = func.json_extract(_valid_json(Recipient.custom_fields), f'$."{name}"')
+    # JSON true/false come back from json_extract as 1/0
+    values = [int(item) if isinstance(item, bool) else item for item in _as_list(value)]
+    if value is None:
+        return stored.is_(None)
+    return stored.in_(values)
+
+
+@dataclass
+class RecipientSegment:
+    """Recipients selected by list membership and a filter spec.
+
+    The filter spec is a dict with any of ``status``, ``recipient_type``
+    (or ``type``), ``source`` (one value or a list each), ``tags`` (any
+    of), ``tags_all``, ``exclude_tags`` and ``custom_fields`` (name to a
+    value or list of values). Without ``status`` only active recipients
+    match; deleted recipients never do. Everything compiles to one WHERE
+    clause, so counting and paging never load recipients into Python.
+    """
+
+    recipient_list_id: Optional[int] = None
+    filters: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def for_campaign(cls, campaign: Campaign) -> "RecipientSegment":
+        """Get the segment a campaign sends to.
+
+        Campaigns with a source other than "manual" (e.g. a CSV import)
+        send only to their recipient list, never to every recipient.
+        """
+        source_name = (campaign.recipient_source or MANUAL_SOURCE).lower()
+        if source_name != MANUAL_SOURCE and campaign.recipient_list_id is None:
+            raise ValueError(
+                f"Campaign recipient source {campaign.recipient_source!r} has no recipient list to send to"
+            )
+        return cls(recipient_list_id=campaign.recipient_list_id, filters=campaign.get_recipient_filters_dict())
+
+    @classmethod
+    def validate_filters(cls, filters: Optional[Dict[str, Any]]) -> None:
+        """Raise ``ValueError`` if a filter spec cannot be compiled."""
+        if filters is not None and not isinstance(filters, dict):
+            raise ValueError("Recipient filters must map filter names to values")
+        cls(filters=filters or {}).conditions()
+
+    def is_everyone(self) -> bool:
+        """Check whether the segment is every live, active recipient."""
+        return self.recipient_list_id is None and not self.filters
+
+    def conditions(self) -> List[Any]:
+        """Compile the segment to WHERE conditions on ``Recipient``."""
+        unknown = set(self.filters) - set(FILTER_KEYS)
+        if unknown:
+            raise ValueError(f"Unknown recipient filters: {', '.join(sorted(unknown))}")
+        filters = self.filters
+
+        status = Recipient.status.in_(_enum_members(RecipientStatus, filters.get("status", RecipientStatus.ACTIVE)))
+        conditions = [Recipient.is_deleted == False]
+        # Conditions that pick few recipients through an index of their own
+        narrowing = []
+        if self.recipient_list_id is not None:
+            narrowing.append(Recipient.id.in_(
+                select(RecipientListRecipient.recipient_id)
+                .where(RecipientListRecipient.recipient_list_id == self.recipient_list_id)
+            ))
+
+        for key, column, enum_type in (
+            ("recipient_type", Recipient.recipient_type, RecipientType),
+            ("type", Recipient.recipient_type, RecipientType),
+            ("source", Recipient.source, RecipientSource),
+        ):
+            if key in filters:
+                members = _enum_members(enum_type, filters[key])
+                conditions.append(column.in_(members) if members else false())
+
+        entity_tags = get_entity_tags()
+        tags = _as_list(filters.get("tags"))
+        if tags:
+            narrowing.append(entity_tags.tagged(Recipient, tags))
+        tags_all = _as_list(filters.get("tags_all"))
+        if tags_all:
+            narrowing.append(entity_tags.tagged(Recipient, tags_all, match_all=True))
+        exclude_tags = _as_list(filters.get("exclude_tags"))
+        if exclude_tags:
+            conditions.append(not_(entity_tags.tagged(Recipient, exclude_tags)))
+
+        custom_fields = filters.get("custom_fields") or {}
+        if not isinstance(custom_fields, dict):
+            raise ValueError("Recipient filter custom_fields must map field names to values")
+        if custom_fields and all(value is not None for value in custom_fields.values()):
+            # Only recipients with custom fields can match; lets SQLite use their partial status index
+            conditions.append(Recipient.custom_fields.is_not(None))
+        conditions.extend(_custom_field(name, value) for name, value in custom_fields.items())
+
+        # Most recipients pass the status check; marking it likely keeps SQLite from
+        # walking the status index when a narrowing condition has a smaller one
+        conditions.append(func.likely(status) if narrowing else status)
+        return conditions + narrowing
+
+    def where(self):
+        """Get the segment as a single condition."""
+        return and_(*self.conditions())
+
+    def select_page(self, after_id: int = 0, limit: int = DEFAULT_BATCH_SIZE):
+        """Select the next page of recipients in id order, after the last id of the previous page."""
+        return select(Recipient).where(self.where(), Recipient.id > after_id).order_by(Recipient.id).limit(limit)
+
+    def select_count(self):
+        """Select the number of recipients in the segment."""
+        return select(func.count(Recipient.id)).where(self.where())
+
+    def count(self) -> int:
+        """Count the recipients in the segment."""
+        with get_session() as session:
+            return session.exec(self.select_count()).one() or 0
+
+    def iter_batches(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[List[Recipient]]:
+        """Stream the recipients in id order, one short read per batch."""
+        after_id = 0
+        while True:
+            with get_session() as session:
+                batch = list(session.exec(self.select_page(after_id, batch_size)).all())
+            if not batch:
+                return
+            yield batch
+            if len(batch) < batch_size:
+                return
+            after_id = batch[-1].id
+
+    def __iter__(self) -> Iterator[Recipient]:
+        for batch in self.iter_batches():
+            yield from batch
+
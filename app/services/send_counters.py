@@ -0,0 +1,173 @@
+"""
+Per-account and per-recipient send counters, coalesced in memory and flushed in batches.
+"""
+
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional
+
+from sqlalchemy import DateTime, bindparam, func, update
+from sqlmodel import Session
+
+from .logger import get_logger
+from ..models import Account, Recipient
+
+
+@dataclass
+class _Counts:
+    """Sends counted for one account or recipient since the last flush."""
+    sent: int = 0
+    failed: int = 0
+    last_sent: Optional[datetime] = None
+    last_failed: Optional[datetime] = None
+
+    def add(self, success: bool, at: datetime) -> None:
+        if success:
+            self.sent += 1
+            self.last_sent = at
+        else:
+            self.failed += 1
+            self.last_failed = at
+
+    def merge(self, other: "_Counts") -> None:
+        """Fold counts that failed to flush back in."""
+        self.sent += other.sent
+        self.failed += other.failed
+        self.last_sent = max(filter(None, (self.last_sent, other.last_sent)), default=None)
+        self.last_failed = max(filter(None, (self.last_failed, other.last_failed)), default=None)
+
+    @property
+    def last_send(self) -> Optional[datetime]:
+        return max(filter(None, (self.last_sent, self.last_failed)), default=None)
+
+
+_accounts = Account.__table__
+_recipients = Recipient.__table__
+
+# One statement per table, executed with a parameter set per row
+_UPDATE_ACCOUNTS = update(_accounts).where(_accounts.c.id == bindparam("row_id")).values(
+    total_messages_sent=_accounts.c.total_messages_sent + bindparam("sent"),
+    total_messages_failed=_accounts.c.total_messages_failed + bindparam("failed"),
+    last_send_time=bindparam("last_send", type_=DateTime),
+    last_activity=bindparam("last_send", type_=DateTime),
+)
+_UPDATE_RECIPIENTS = update(_recipients).where(_recipients.c.id == bindparam("row_id")).values(
+    total_messages_sent=_recipients.c.total_messages_sent + bindparam("sent"),
+    total_messages_failed=_recipients.c.total_messages_failed + bindparam("failed"),
+    last_message_sent=func.coalesce(bindparam("last_sent", type_=DateTime), _recipients.c.last_message_sent),
+    last_message_failed=func.coalesce(bindparam("last_failed", type_=DateTime), _recipients.c.last_message_failed),
+)
+
+
+class SendCounters:
+    """Keeps ``total_messages_sent``/``failed`` and last send times of accounts and recipients.
+
+    The send pipeline records every outcome here instead of writing the
+    account and recipient rows itself. Outcomes are added up per row in
+    memory and applied every ``flush_interval`` seconds as one batched
+    ``x = x + ?`` UPDATE per table on the write queue, so a campaign costs
+    one statement per interval rather than two row writes per send.
+    Counts that fail to flush are kept for the next attempt. Without a
+    ``flush_interval`` counts are only applied by ``flush`` and ``stop``.
+    """
+
+    def __init__(self, flush_interval: Optional[float] = 5.0):
+        self.logger = get_logger()
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        # Serializes flushes so counts are never applied twice or out of order
+        self._flush_lock = threading.Lock()
+        self._accounts: Dict[int, _Counts] = {}
+        self._recipients: Dict[int, _Counts] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def record(self, account_id: Optional[int], recipient_id: Optional[int], success: bool) -> None:
+        """Count one send attempt for its account and recipient."""
+        now = datetime.utcnow()
+        with self._lock:
+            if account_id is not None:
+                self._accounts.setdefault(account_id, _Counts()).add(success, now)
+            if recipient_id is not None:
+                self._recipients.setdefault(recipient_id, _Counts()).add(success, now)
+            if self._thread is None and self.flush_interval:
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="send-counters", daemon=True)
+                self._thread.start()
+
+    def pending(self) -> int:
+        """Get the number of rows with counts waiting to be flushed."""
+        with self._lock:
+            return len(self._accounts) + len(self._recipients)
+
+    def flush(self) -> int:
+        """Apply the counted sends now; returns the number of rows updated."""
+        from .db import get_db_writer
+        from .change_bus import get_change_bus, ChangeSet, TableChanges
+
+        with self._flush_lock:
+            with self._lock:
+                accounts, self._accounts = self._accounts, {}
+                recipients, self._recipients = self._recipients, {}
+            if not accounts and not recipients:
+                return 0
+
+            def apply(session: Session) -> int:
+                if accounts:
+                    session.execute(_UPDATE_ACCOUNTS, [
+                        {"row_id": row_id, "sent": c.sent, "failed": c.failed, "last_send": c.last_send}
+                        for row_id, c in accounts.items()
+                    ])
+                if recipients:
+                    session.execute(_UPDATE_RECIPIENTS, [
+                        {"row_id": row_id, "sent": c.sent, "failed": c.failed,
+                         "last_sent": c.last_sent, "last_failed": c.last_failed}
+                        for row_id, c in recipients.items()
+                    ])
+                return len(accounts) + len(recipients)
+
+            try:
+                updated = get_db_writer().submit(apply).result()
+            except Exception as e:
+                self.logger.error(f"Error flushing send counters: {e}")
+                with self._lock:
+                    for pending, failed in ((self._accounts, accounts), (self._recipients, recipients)):
+                        for row_id, counts in failed.items():
+                            counts.merge(pending.pop(row_id, _Counts()))
+                            pending[row_id] = counts
+                return 0
+
+        # Core UPDATEs aren't seen by the change bus's session hooks
+        changes = ChangeSet()
+        if accounts:
+            changes[Account.__tablename__] = TableChanges(updated=set(accounts))
+        if recipients:
+            changes[Recipient.__tablename__] = TableChanges(updated=set(recipients))
+        get_change_bus().publish(changes)
+        return updated
+
+    def stop(self) -> None:
+        """Stop the flush thread and apply what is still counted."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join(self.flush_interval + 5.0)
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+
+# Global send counters instance
+_send_counters: Optional[SendCounters] = None
+
+
+def get_send_counters() -> SendCounters:
+    """Get the global send counters instance."""
+    global _send_counters
+    if _send_counters is None:
+        _send_counters = SendCounters()
+    return _send_counters
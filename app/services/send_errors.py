@@ -0,0 +1,131 @@
+"""
+Classification of send failures into stable error codes.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from telethon import errors
+
+from ..models import SendErrorCode
+
+
+@dataclass
+class SendError:
+    """A classified send failure."""
+    code: SendErrorCode
+    # Telegram's own error name (e.g. "FLOOD_WAIT"), when the failure came from Telegram
+    telegram_error_code: Optional[str] = None
+    retry_after: Optional[int] = None
+
+
+def _error_classes(*names: str) -> Tuple[type, ...]:
+    # Older Telethon releases lack some of the newer errors
+    return tuple(getattr(errors, name) for name in names if hasattr(errors, name))
+
+
+# Checked in order, so specific errors come before the base classes they derive from
+_EXCEPTION_CODES = [
+    (_error_classes("FloodWaitError", "FloodPremiumWaitError", "FloodTestPhoneWaitError"), SendErrorCode.FLOOD_WAIT),
+    (_error_classes("PeerFloodError"), SendErrorCode.PEER_FLOOD),
+    (_error_classes("SlowModeWaitError"), SendErrorCode.SLOW_MODE),
+    (_error_classes("UserPrivacyRestrictedError"), SendErrorCode.PRIVACY_RESTRICTED),
+    (_error_classes("UserIsBlockedError", "YouBlockedUserError"), SendErrorCode.BLOCKED),
+    (_error_classes(
+        "UsernameNotOccupiedError", "UsernameInvalidError", "PeerIdInvalidError", "ChannelInvalidError"
+    ), SendErrorCode.PEER_NOT_FOUND),
+    (_error_classes("InputUserDeactivatedError", "UserDeactivatedError"), SendErrorCode.PEER_DEACTIVATED),
+    (_error_classes(
+        "ChatWriteForbiddenError", "ChannelPrivateError", "UserBannedInChannelError", "ChatAdminRequiredError"
+    ), SendErrorCode.WRITE_FORBIDDEN),
+    (_error_classes("MessageEmptyError", "MessageTooLongError", "MediaEmptyError"), SendErrorCode.INVALID_MESSAGE),
+    (_error_classes("UserDeactivatedBanError", "PhoneNumberBannedError"), SendErrorCode.ACCOUNT_BANNED),
+    (_error_classes(
+        "SessionPasswordNeededError", "AuthKeyUnregisteredError", "AuthKeyDuplicatedError",
+        "SessionRevokedError", "SessionExpiredError"
+    ), SendErrorCode.AUTH),
+    (_error_classes("FloodError"), SendErrorCode.FLOOD_WAIT),
+    (_error_classes("UnauthorizedError"), SendErrorCode.AUTH),
+    (_error_classes("ForbiddenError"), SendErrorCode.WRITE_FORBIDDEN),
+    (_error_classes("ServerError", "TimedOutError"), SendErrorCode.NETWORK),
+    ((ConnectionError, TimeoutError, OSError), SendErrorCode.NETWORK),
+]
+
+# Fallbacks for failures only known by their message, e.g. logs written before codes existed
+_MESSAGE_CODES = [
+    (r"flood ?wait|wait of \d+ seconds|rate limited|too many requests", SendErrorCode.FLOOD_WAIT),
+    (r"peer.?flood", SendErrorCode.PEER_FLOOD),
+    (r"slow ?mode", SendErrorCode.SLOW_MODE),
+    (r"privacy", SendErrorCode.PRIVACY_RESTRICTED),
+    (r"blocked", SendErrorCode.BLOCKED),
+    (r"deactivated|deleted account", SendErrorCode.PEER_DEACTIVATED),
+    (r"banned", SendErrorCode.ACCOUNT_BANNED),
+    (r"no user has|cannot find any entity|could not find the input entity|username.*(invalid|not occupied)|"
+     r"peer.?id.?invalid|failed to get entity", SendErrorCode.PEER_NOT_FOUND),
+    (r"write.?forbidden|can't write|channel.?private|admin.?required", SendErrorCode.WRITE_FORBIDDEN),
+    (r"message.*(empty|too long)|media.?empty", SendErrorCode.INVALID_MESSAGE),
+    (r"password|auth.?key|session.*(revoked|expired)|unauthori[sz]ed", SendErrorCode.AUTH),
+    (r"not (connected|ready)|failed to start client", SendErrorCode.CLIENT_NOT_READY),
+    (r"connection|timed? ?out|network", SendErrorCode.NETWORK),
+]
+_MESSAGE_PATTERNS = [(re.compile(pattern, re.IGNORECASE), code) for pattern, code in _MESSAGE_CODES]
+
+
+def _telegram_error_code(exc: Exception) -> Optional[str]:
+    """Get Telegram's error name, e.g. "FLOOD_WAIT" for FloodWaitError."""
+    if not isinstance(exc, errors.RPCError):
+        return None
+    name = type(exc).__name__
+    if type(exc).__module__.startswith("telethon.errors.rpcerrorlist") and name.endswith("Error"):
+        return re.sub(r"(?<!^)(?=[A-Z])", "_", name[:-len("Error")]).upper()
+    # Errors Telethon doesn't know keep the server's name as their message
+    return exc.message if exc.message and exc.message.isupper() else None
+
+
+def classify_send_error(exc: BaseException) -> SendError:
+    """Classify an exception raised while connecting, resolving or sending."""
+    retry_after = getattr(exc, "seconds", None)
+    for classes, code in _EXCEPTION_CODES:
+        if classes and isinstance(exc, classes):
+            break
+    else:
+        # e.g. the ValueError get_entity raises for unknown usernames
+        code = classify_error_message(str(exc))
+    return SendError(
+        code=code,
+        telegram_error_code=_telegram_error_code(exc),
+        retry_after=retry_after if isinstance(retry_after, int) else None,
+    )
+
+
+def classify_error_message(message: Optional[str]) -> SendErrorCode:
+    """Classify a failure from its error message alone."""
+    for pattern, code in _MESSAGE_PATTERNS:
+        if message and pattern.search(message):
+            return code
+    return SendErrorCode.UNKNOWN
+
+
+def send_failure(
+    message: str,
+    exc: Optional[BaseException] = None,
+    code: Optional[SendErrorCode] = None
+) -> Dict[str, Any]:
+    """Build the result of a failed send.
+
+    The exception decides the code; ``code`` (or else the message) is used
+    when there is no exception or it doesn't match a known failure.
+    """
+    error = classify_send_error(exc) if exc is not None else SendError(SendErrorCode.UNKNOWN)
+    if error.code == SendErrorCode.UNKNOWN:
+        error.code = code or classify_error_message(message)
+    result = {
+        "success": False,
+        "error": message,
+        "error_code": error.code,
+        "telegram_error_code": error.telegram_error_code,
+    }
+    if error.retry_after is not None:
+        result["retry_after"] = error.retry_after
+    return result
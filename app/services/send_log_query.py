@@ -0,0 +1,192 @@
+"""
+Send log query service with server-side filtering and keyset pagination.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Iterator, List, Optional, Tuple
+
+from sqlalchemy import and_, func, or_
+from sqlmodel import select
+
+from .logger import get_logger
+from .db import get_session
+from ..models import SendLog, SendErrorCode, SendStatus, Campaign, Account, Recipient
+
+
+@dataclass
+class SendLogFilter:
+    """Filters applied to send log queries."""
+    status: Optional[str] = None
+    campaign_id: Optional[int] = None
+    campaign_name: Optional[str] = None
+    account_id: Optional[int] = None
+    date_from: Optional[datetime] = None
+    date_to: Optional[datetime] = None
+    search_text: Optional[str] = None
+
+
+@dataclass
+class SendLogRow:
+    """Projection of the send log columns shown in the viewer."""
+    id: int
+    created_at: datetime
+    campaign_name: Optional[str]
+    account_name: Optional[str]
+    recipient_id: Optional[int]
+    recipient_name: Optional[str]
+    recipient_identifier: Optional[str]
+    status: SendStatus
+    error_message: Optional[str]
+    error_code: Optional[SendErrorCode]
+    telegram_error_code: Optional[str]
+    duration_ms: Optional[int]
+    retry_count: int
+
+    @property
+    def cursor(self) -> Tuple[datetime, int]:
+        """Keyset cursor pointing at this row."""
+        return (self.created_at, self.id)
+
+    def get_recipient_text(self) -> str:
+        """Get the recipient display text."""
+        return self.recipient_name or self.recipient_identifier or f"ID: {self.recipient_id}"
+
+    def get_error_summary(self) -> str:
+        """Get a summary of the error."""
+        if not self.error_message:
+            return ""
+
+        summary = self.error_message
+        if self.error_code:
+            summary += f" (Code: {self.error_code.value})"
+        if self.telegram_error_code:
+            summary += f" (Telegram: {self.telegram_error_code})"
+
+        return summary
+
+
+class SendLogQueryService:
+    """Service for paging through send logs newest first."""
+
+    def __init__(self):
+        self.logger = get_logger()
+
+    def _build_query(self, filters: SendLogFilter, columns: List[Any]):
+        """Build a projection query with filters applied."""
+        query = (
+            select(*columns)
+            .select_from(SendLog)
+            .outerjoin(Campaign, SendLog.campaign_id == Campaign.id)
+            .outerjoin(Account, SendLog.account_id == Account.id)
+            .outerjoin(Recipient, SendLog.recipient_id == Recipient.id)
+        )
+
+        if filters.status:
+            query = query.where(SendLog.status == SendStatus(filters.status))
+        if filters.campaign_id is not None:
+            query = query.where(SendLog.campaign_id == filters.campaign_id)
+        if filters.campaign_name:
+            query = query.where(Campaign.name == filters.campaign_name)
+        if filters.account_id is not None:
+            query = query.where(SendLog.account_id == filters.account_id)
+        if filters.date_from:
+            query = query.where(SendLog.created_at >= filters.date_from)
+        if filters.date_to:
+            query = query.where(SendLog.created_at <= filters.date_to)
+
+        search_text = (filters.search_text or "").strip()
+        if search_text:
+            pattern = f"%{search_text}%"
+            query = query.where(or_(
+                SendLog.error_message.ilike(pattern),
+                SendLog.recipient_identifier.ilike(pattern),
+                Recipient.display_label.ilike(pattern),
+                Recipient.username.ilike(pattern),
+                Campaign.name.ilike(pattern),
+                Account.name.ilike(pattern),
+            ))
+
+        return query
+
+    def fetch_page(
+        self,
+        filters: SendLogFilter,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: int = 200
+    ) -> List[SendLogRow]:
+        """Fetch the next page of logs older than the given (created_at, id) cursor."""
+        query = self._build_query(filters, [
+            SendLog.id,
+            SendLog.created_at,
+            Campaign.name,
+            Account.name,
+            SendLog.recipient_id,
+            Recipient.display_label,
+            SendLog.recipient_identifier,
+            SendLog.status,
+            SendLog.error_message,
+            SendLog.error_code,
+            SendLog.telegram_error_code,
+            SendLog.duration_ms,
+            SendLog.retry_count,
+        ])
+
+        if after is not None:
+            created_at, log_id = after
+            query = query.where(or_(
+                SendLog.created_at < created_at,
+                and_(SendLog.created_at == created_at, SendLog.id < log_id)
+            ))
+
+        query = query.order_by(SendLog.created_at.desc(), SendLog.id.desc()).limit(limit)
+
+        with get_session() as session:
+            return [SendLogRow(*row) for row in session.exec(query).all()]
+
+    def count(self, filters: SendLogFilter, include_archive: bool = True) -> int:
+        """Count matching logs, including archived ones."""
+        with get_session() as session:
+            count = session.exec(self._build_query(filters, [func.count(SendLog.id)])).one()
+            oldest = None
+            if include_archive and count:
+                oldest = tuple(session.exec(
+                    self._build_query(filters, [SendLog.created_at, SendLog.id])
+                    .order_by(SendLog.created_at, SendLog.id)
+                    .limit(1)
+                ).one())
+        if include_archive:
+            # Like iter_rows, archived logs only count from below the oldest one in the database
+            from .log_archive import get_send_log_archive
+            count += get_send_log_archive().count(filters, before=oldest)
+        return count
+
+    def iter_rows(
+        self,
+        filters: SendLogFilter,
+        batch_size: int = 1000,
+        include_archive: bool = True
+    ) -> Iterator[SendLogRow]:
+        """Iterate over all matching logs in keyset-paged batches, continuing into the archive."""
+        cursor = None
+        while True:
+            rows = self.fetch_page(filters, after=cursor, limit=batch_size)
+            yield from rows
+            if rows:
+                cursor = rows[-1].cursor
+            if len(rows) < batch_size:
+                break
+
+        if include_archive:
+            # Archived logs are older than the database's; resuming from the cursor skips any kept in both
+            from .log_archive import get_send_log_archive
+            yield from get_send_log_archive().iter_rows(filters, before=cursor)
+
+
+# Global send log query service instance
+send_log_query = SendLogQueryService()
+
+
+def get_send_log_query() -> SendLogQueryService:
+    """Get send log query service instance."""
+    return send_log_query
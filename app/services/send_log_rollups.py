@@ -0,0 +1,341 @@
+"""
+Hourly send log rollups, maintained on flush, for reports that don't load individual logs.
+"""
+
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import Table, case, delete, event, extract, func, inspect
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection, Engine
+from sqlmodel import Session, select
+
+from .logger import get_logger
+from .send_errors import classify_error_message
+from ..models import SendErrorCode, SendLog, SendLogErrorRollup, SendLogRollup, SendStatus
+
+
+CountKey = Tuple[int, int, datetime, SendStatus]
+ErrorKey = Tuple[int, int, SendErrorCode]
+
+# Changing any of these moves a log to another bucket or changes its duration
+TRACKED_FIELDS = (
+    "campaign_id", "account_id", "status", "completed_at", "created_at", "duration_ms", "error_code", "error_message"
+)
+
+# Statuses every breakdown entry reports, even when zero
+BREAKDOWN_STATUSES = (SendStatus.SENT, SendStatus.FAILED, SendStatus.SKIPPED)
+
+_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+def _count_key(campaign_id, account_id, status, completed_at, created_at) -> CountKey:
+    moment = completed_at or created_at or datetime.utcnow()
+    return (campaign_id or 0, account_id, moment.replace(minute=0, second=0, microsecond=0), SendStatus(status))
+
+
+def _error_key(campaign_id, account_id, status, error_code, error_message) -> Optional[ErrorKey]:
+    if SendStatus(status) != SendStatus.FAILED:
+        return None
+    # Logs written without a code are classified by their message
+    code = SendErrorCode(error_code) if error_code else classify_error_message(error_message)
+    return (campaign_id or 0, account_id, code)
+
+
+def _empty_breakdown() -> Dict[str, int]:
+    return {status.value: 0 for status in BREAKDOWN_STATUSES}
+
+
+class _Deltas:
+    """Changes to both rollup tables collected from one flush or rebuild."""
+
+    def __init__(self):
+        # count, duration total, logs with a duration
+        self.counts: Dict[CountKey, List[int]] = defaultdict(lambda: [0, 0, 0])
+        self.errors: Dict[ErrorKey, int] = defaultdict(int)
+
+    def add(self, values: Dict[str, Any], sign: int = 1) -> None:
+        """Count (or uncount) one log given its column values."""
+        counts = self.counts[_count_key(
+            values["campaign_id"], values["account_id"], values["status"],
+            values["completed_at"], values["created_at"]
+        )]
+        counts[0] += sign
+        if values["duration_ms"] is not None:
+            counts[1] += sign * values["duration_ms"]
+            counts[2] += sign
+        error = _error_key(
+            values["campaign_id"], values["account_id"], values["status"], values["error_code"], values["error_message"]
+        )
+        if error is not None:
+            self.errors[error] += sign
+
+    def __bool__(self) -> bool:
+        return bool(self.counts or self.errors)
+
+
+class SendLogRollups:
+    """Send log counts and durations per campaign, account, hour and status.
+
+    Every flush that inserts send logs or changes their status adds its
+    deltas to ``send_log_rollups`` (and failures to ``send_log_error_rollups``)
+    in the same transaction, whichever session or write queue it came from.
+    Deleting logs (retention, purges of old rows) leaves the rollups alone,
+    so reports keep covering the archived history; only deleting every log
+    clears them.
+    """
+
+    def __init__(self, engine: Optional[Engine] = None):
+        self.logger = get_logger()
+        # Queries go through the application database unless given an engine
+        self.engine = engine
+        self._installed = False
+
+    def install(self, session_class) -> None:
+        """Keep rollups up to date on every flush of a session class."""
+        if self._installed:
+            return
+        event.listen(session_class, "after_flush", self._after_flush)
+        self._installed = True
+
+    def uninstall(self, session_class) -> None:
+        """Stop maintaining rollups for a session class."""
+        if self._installed:
+            event.remove(session_class, "after_flush", self._after_flush)
+            self._installed = False
+
+    # Maintenance
+
+    def _after_flush(self, session, flush_context) -> None:
+        # Still the pre-flush state: new objects and attribute history are available
+        deltas = _Deltas()
+        for log in session.new:
+            if isinstance(log, SendLog):
+                deltas.add({name: getattr(log, name) for name in TRACKED_FIELDS})
+        for log in session.dirty:
+            if not isinstance(log, SendLog):
+                continue
+            attrs = inspect(log).attrs
+            if not any(attrs[name].history.has_changes() for name in TRACKED_FIELDS):
+                continue
+            deltas.add({name: (attrs[name].history.deleted or [getattr(log, name)])[0] for name in TRACKED_FIELDS}, -1)
+            deltas.add({name: getattr(log, name) for name in TRACKED_FIELDS})
+
+        if deltas:
+            self._apply(session.connection(), deltas)
+
+    def _apply(self, connection: Connection, deltas: _Deltas) -> None:
+        """Add deltas to their rollup rows, creating missing rows."""
+        self._upsert(connection, SendLogRollup.__table__, [
+            {
+                "campaign_id": campaign_id, "account_id": account_id, "hour": hour, "status": status,
+                "count": count, "duration_ms_total": duration_total, "duration_count": duration_count,
+            }
+            for (campaign_id, account_id, hour, status), (count, duration_total, duration_count) in deltas.counts.items()
+            if count or duration_count
+        ])
+        self._upsert(connection, SendLogErrorRollup.__table__, [
+            {"campaign_id": campaign_id, "account_id": account_id, "error_code": code, "count": count}
+            for (campaign_id, account_id, code), count in deltas.errors.items()
+            if count
+        ])
+
+    @staticmethod
+    def _upsert(connection: Connection, table: Table, rows: List[Dict[str, Any]]) -> None:
+        insert = _INSERTS.get(connection.dialect.name)
+        if insert is None or not rows:
+            return
+        keys = [column.name for column in table.primary_key]
+        statement = insert(table)
+        statement = statement.on_conflict_do_update(
+            index_elements=keys,
+            set_={
+                column.name: column + statement.excluded[column.name]
+                for column in table.columns if column.name not in keys
+            },
+        )
+        connection.execute(statement, rows)
+
+    def rebuild(self, connection: Connection, include_archive: bool = True) -> int:
+        """Recompute all rollups from the live logs and the Parquet archive; returns hourly rows written."""
+        connection.execute(delete(SendLogRollup))
+        connection.execute(delete(SendLogErrorRollup))
+        deltas = _Deltas()
+
+        moment = func.coalesce(SendLog.completed_at, SendLog.created_at)
+        if connection.dialect.name == "sqlite":
+            hour = func.strftime("%Y-%m-%d %H:00:00", moment)
+        else:
+            hour = func.date_trunc("hour", moment)
+        query = select(
+            SendLog.campaign_id, SendLog.account_id, SendLog.status, hour,
+            func.count(), func.coalesce(func.sum(SendLog.duration_ms), 0), func.count(SendLog.duration_ms)
+        ).group_by(SendLog.campaign_id, SendLog.account_id, SendLog.status, hour)
+        for campaign_id, account_id, status, bucket, count, duration_total, duration_count in connection.execute(query):
+            if isinstance(bucket, str):
+                bucket = datetime.fromisoformat(bucket)
+            counts = deltas.counts[_count_key(campaign_id, account_id, status, bucket, None)]
+            counts[0] += count
+            counts[1] += duration_total
+            counts[2] += duration_count
+
+        # Messages only matter for logs that have no code to group by
+        uncoded_message = case((SendLog.error_code.is_(None), SendLog.error_message))
+        query = select(
+            SendLog.campaign_id, SendLog.account_id, SendLog.status, SendLog.error_code, uncoded_message, func.count()
+        ).where(SendLog.status == SendStatus.FAILED).group_by(
+            SendLog.campaign_id, SendLog.account_id, SendLog.error_code, uncoded_message
+        )
+        for campaign_id, account_id, status, error_code, error_message, count in connection.execute(query):
+            error = _error_key(campaign_id, account_id, status, error_code, error_message)
+            if error is not None:
+                deltas.errors[error] += count
+
+        if include_archive:
+            self._add_archived(deltas)
+        self._apply(connection, deltas)
+        return len(deltas.counts)
+
+    def _add_archived(self, deltas: _Deltas) -> None:
+        """Add the per-bucket counts of archived logs, one day partition at a time."""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        from .log_archive import get_send_log_archive
+        from .send_log_query import SendLogFilter
+
+        for table in get_send_log_archive().read_table(SendLogFilter()):
+            logs = pa.table({
+                "campaign_id": pc.fill_null(table["campaign_id"], 0),
+                "account_id": table["account_id"],
+                "status": table["status"],
+                "hour": pc.floor_temporal(pc.coalesce(table["completed_at"], table["created_at"]), unit="hour"),
+                "duration_ms": table["duration_ms"],
+                "error_code": table["error_code"],
+                "error_message": table["error_message"],
+            })
+            buckets = logs.group_by(["campaign_id", "account_id", "status", "hour"]).aggregate([
+                ([], "count_all"), ("duration_ms", "sum"), ("duration_ms", "count")
+            ])
+            for row in buckets.to_pylist():
+                counts = deltas.counts[_count_key(row["campaign_id"], row["account_id"], row["status"], row["hour"], None)]
+                counts[0] += row["count_all"]
+                counts[1] += row["duration_ms_sum"] or 0
+                counts[2] += row["duration_ms_count"]
+
+            failed = logs.filter(pc.equal(logs["status"], SendStatus.FAILED.value))
+            errors = failed.group_by(["campaign_id", "account_id", "status", "error_code", "error_message"]).aggregate([
+                ([], "count_all")
+            ])
+            for row in errors.to_pylist():
+                error = _error_key(
+                    row["campaign_id"], row["account_id"], row["status"], row["error_code"], row["error_message"]
+                )
+                if error is not None:
+                    deltas.errors[error] += row["count_all"]
+
+    def clear(self) -> None:
+        """Delete all rollups, e.g. after every log was deleted."""
+        from .db import get_db_writer
+
+        def clear_rollups(session):
+            session.execute(delete(SendLogRollup))
+            session.execute(delete(SendLogErrorRollup))
+
+        get_db_writer(SendLogRollup.__tablename__).submit(clear_rollups).result()
+
+    # Queries
+
+    def status_counts(self, campaign_id: Optional[int] = None, account_id: Optional[int] = None) -> Dict[str, int]:
+        """Get log counts by status value."""
+        query = self._filtered(
+            SendLogRollup,
+            select(SendLogRollup.status, func.sum(SendLogRollup.count)).group_by(SendLogRollup.status),
+            campaign_id, account_id
+        )
+        with self._session() as session:
+            return {status.value: count for status, count in session.exec(query).all() if count}
+
+    def average_duration_ms(self, campaign_id: Optional[int] = None, account_id: Optional[int] = None) -> float:
+        """Get the average send duration of logs with a recorded duration."""
+        query = self._filtered(
+            SendLogRollup,
+            select(func.sum(SendLogRollup.duration_ms_total), func.sum(SendLogRollup.duration_count)),
+            campaign_id, account_id
+        )
+        with self._session() as session:
+            total, count = session.exec(query).one()
+        return total / count if count else 0.0
+
+    def breakdown(
+        self,
+        group: str,
+        campaign_id: Optional[int] = None,
+        account_id: Optional[int] = None
+    ) -> Dict[Any, Dict[str, int]]:
+        """Get status counts per account id, hour of day (0-23) or day ("YYYY-MM-DD")."""
+        groups = {
+            "account": SendLogRollup.account_id,
+            "hour": extract("hour", SendLogRollup.hour),
+            "day": func.date(SendLogRollup.hour),
+        }
+        key = groups[group].label("key")
+        query = self._filtered(
+            SendLogRollup,
+            select(key, SendLogRollup.status, func.sum(SendLogRollup.count))
+            .group_by(key, SendLogRollup.status)
+            .order_by(key),
+            campaign_id, account_id
+        )
+        result: Dict[Any, Dict[str, int]] = defaultdict(_empty_breakdown)
+        with self._session() as session:
+            for value, status, count in session.exec(query).all():
+                if count:
+                    result[str(value) if group == "day" else value][status.value] = count
+        return dict(result)
+
+    def error_summary(
+        self,
+        campaign_id: Optional[int] = None,
+        account_id: Optional[int] = None,
+        limit: int = 20
+    ) -> Dict[str, int]:
+        """Get failure counts by error code value, most frequent first."""
+        total = func.sum(SendLogErrorRollup.count)
+        query = self._filtered(
+            SendLogErrorRollup,
+            select(SendLogErrorRollup.error_code, total)
+            .group_by(SendLogErrorRollup.error_code)
+            .having(total > 0)
+            .order_by(total.desc())
+            .limit(limit),
+            campaign_id, account_id
+        )
+        with self._session() as session:
+            return {code.value: count for code, count in session.exec(query).all()}
+
+    @staticmethod
+    def _filtered(model, query, campaign_id: Optional[int], account_id: Optional[int]):
+        if campaign_id is not None:
+            query = query.where(model.campaign_id == campaign_id)
+        if account_id is not None:
+            query = query.where(model.account_id == account_id)
+        return query
+
+    def _session(self) -> Session:
+        if self.engine is not None:
+            return Session(self.engine)
+        from .db import get_session
+        return get_session()
+
+
+# Global send log rollups instance
+_send_log_rollups: Optional[SendLogRollups] = None
+
+
+def get_send_log_rollups() -> SendLogRollups:
+    """Get the global send log rollups instance."""
+    global _send_log_rollups
+    if _send_log_rollups is None:
+        _send_log_rollups = SendLogRollups()
+    return _send_log_rollups
@@ -77,9 +77,21 @@ class Settings(BaseSettings):
     log_to_file: bool = True
     log_file_max_size: int = 10 * 1024 * 1024  # 10MB
     log_file_backup_count: int = 5
+    log_viewer_max_lines: int = 5000
+    log_json_events: bool = False
+    log_retention_days: int = 90  # send logs older than this move to the archive; 0 keeps all
+    log_retention_chunk_size: int = 5000
     
     # Database
     database_url: str = "sqlite:///app_data/app.db"
+    db_pool_size: int = 8
+    db_write_batch_size: int = 200
+    db_checkpoint_interval_seconds: int = 30
+    db_backup_interval_hours: int = 24  # 0 disables scheduled backups
+    db_backup_keep: int = 7
+    db_backup_compress: bool = True
+    db_split_logs: bool = False  # keep send logs in their own SQLite file with its own writer
+    db_log_database_path: str = "app_data/logs.db"
     
     # Telegram API
     telegram_api_id: Optional[int] = None
@@ -188,6 +200,12 @@ class Settings(BaseSettings):
             return Path(db_path)
         raise ValueError("Database path only available for SQLite")
     
+    def get_log_database_path(self) -> Optional[Path]:
+        """Get the send log database file path, or None when logs share the main database."""
+        if self.db_split_logs and self.database_url.startswith("sqlite:///"):
+            return Path(self.db_log_database_path)
+        return None
+    
     def get_sessions_path(self) -> Path:
         """Get sessions directory path."""
         return Path(self.sessions_dir)
@@ -262,6 +280,10 @@ class Settings(BaseSettings):
     def get_error_log_file_path(self) -> Path:
         """Get error log file path."""
         return self.get_logs_path() / "error.log"
+    
+    def get_event_log_file_path(self) -> Path:
+        """Get structured event log (JSON lines) file path."""
+        return self.get_logs_path() / "events.jsonl"
 
 
 # Global settings instance
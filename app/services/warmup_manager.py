@@ -7,8 +7,11 @@ from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
 from PyQt5.QtCore import QObject, pyqtSignal, QTimer
 
-from ..models import Account, SendLog, SendStatus
+from ..models import Account, SendErrorCode, SendLog, SendStatus
 from ..services import get_logger, get_session
+from .db import dispose_async_engine
+from .async_repository import get_async_repository
+from .send_errors import send_failure
 from ..core.telethon_client import TelegramClientManager
 
 
@@ -116,81 +119,86 @@ class WarmupManager(QObject):
     
     async def _warmup_account(self, account_id: int):
         """Warmup an account by sending test messages."""
+        repository = get_async_repository()
         try:
-            with get_session() as session:
-                account = session.get(Account, account_id)
-                if not account:
-                    return
-                
-                self.logger.info(f"Starting warmup for account {account.name}")
-                
-                # Get warmup settings
-                target_messages = account.warmup_target_messages
-                interval_minutes = account.warmup_interval_minutes
-                sent_messages = account.warmup_messages_sent
-                
-                # Calculate how many messages to send
-                messages_to_send = target_messages - sent_messages
-                
-                if messages_to_send <= 0:
-                    self.logger.info(f"Warmup complete for account {account.name}")
-                    self.warmup_completed.emit(account_id)
-                    return
-                
-                # Send warmup messages
-                for i in range(messages_to_send):
-                    try:
-                        # Create a test recipient (self)
-                        test_recipient = {
-                            "user_id": account.phone_number,  # Use phone number as test recipient
-                            "username": f"test_{account.name}",
-                            "first_name": "Test",
-                            "last_name": "User"
-                        }
+            account = await repository.get_account(account_id)
+            if not account:
+                return
+            
+            self.logger.info(f"Starting warmup for account {account.name}")
+            
+            # Get warmup settings
+            target_messages = account.warmup_target_messages
+            interval_minutes = account.warmup_interval_minutes
+            sent_messages = account.warmup_messages_sent
+            
+            # Calculate how many messages to send
+            messages_to_send = target_messages - sent_messages
+            
+            if messages_to_send <= 0:
+                self.logger.info(f"Warmup complete for account {account.name}")
+                self.warmup_completed.emit(account_id)
+                return
+            
+            def record_sent(session):
+                stored = session.get(Account, account_id)
+                if stored:
+                    stored.warmup_messages_sent += 1
+                    stored.total_messages_sent += 1
+                    stored.last_activity = datetime.utcnow()
+                return stored
+            
+            # Send warmup messages
+            for i in range(messages_to_send):
+                try:
+                    # Create a test recipient (self)
+                    test_recipient = {
+                        "user_id": account.phone_number,  # Use phone number as test recipient
+                        "username": f"test_{account.name}",
+                        "first_name": "Test",
+                        "last_name": "User"
+                    }
+                    
+                    # Create warmup message
+                    warmup_message = self._create_warmup_message(i + 1, target_messages)
+                    
+                    # Send message
+                    result = await self._send_warmup_message(account, test_recipient, warmup_message)
+                    
+                    if result["success"]:
+                        # Update warmup progress
+                        account = await repository.write(record_sent) or account
                         
-                        # Create warmup message
-                        warmup_message = self._create_warmup_message(i + 1, target_messages)
+                        # Emit progress signal
+                        self.warmup_progress.emit(account_id, account.warmup_messages_sent, target_messages)
                         
-                        # Send message
-                        result = await self._send_warmup_message(account, test_recipient, warmup_message)
+                        self.logger.info(f"Warmup message {account.warmup_messages_sent}/{target_messages} sent for account {account.name}")
                         
-                        if result["success"]:
-                            # Update warmup progress
-                            account.warmup_messages_sent += 1
-                            account.total_messages_sent += 1
-                            account.last_activity = datetime.utcnow()
-                            
-                            session.commit()
-                            
-                            # Emit progress signal
-                            self.warmup_progress.emit(account_id, account.warmup_messages_sent, target_messages)
-                            
-                            self.logger.info(f"Warmup message {account.warmup_messages_sent}/{target_messages} sent for account {account.name}")
-                            
-                            # Check if warmup is complete
-                            if account.is_warmup_complete():
-                                self.logger.info(f"Warmup completed for account {account.name}")
-                                self.warmup_completed.emit(account_id)
-                                break
-                            
-                            # Wait for interval before next message
-                            if i < messages_to_send - 1:  # Don't wait after last message
-                                await asyncio.sleep(interval_minutes * 60)
-                        else:
-                            self.logger.warning(f"Failed to send warmup message for account {account.name}: {result.get('error', 'Unknown error')}")
-                            self.warmup_error.emit(account_id, result.get('error', 'Unknown error'))
+                        # Check if warmup is complete
+                        if account.is_warmup_complete():
+                            self.logger.info(f"Warmup completed for account {account.name}")
+                            self.warmup_completed.emit(account_id)
                             break
-                            
-                    except Exception as e:
-                        self.logger.error(f"Error sending warmup message {i+1} for account {account.name}: {e}")
-                        self.warmup_error.emit(account_id, str(e))
+                        
+                        # Wait for interval before next message
+                        if i < messages_to_send - 1:  # Don't wait after last message
+                            await asyncio.sleep(interval_minutes * 60)
+                    else:
+                        self.logger.warning(f"Failed to send warmup message for account {account.name}: {result.get('error', 'Unknown error')}")
+                        self.warmup_error.emit(account_id, result.get('error', 'Unknown error'))
                         break
+                        
+                except Exception as e:
+                    self.logger.error(f"Error sending warmup message {i+1} for account {account.name}: {e}")
+                    self.warmup_error.emit(account_id, str(e))
+                    break
                 
         except Exception as e:
             self.logger.error(f"Error in warmup process for account {account_id}: {e}")
             self.warmup_error.emit(account_id, str(e))
         finally:
             self.warmup_in_progress[account_id] = False
+            await dispose_async_engine()
     
     def _create_warmup_message(self, message_number: int, total_messages: int) -> str:
         """Create a warmup message."""
@@ -217,60 +225,62 @@ class WarmupManager(QObject):
                 try:
                     success = await self.client_manager.add_account(account)
                     if not success:
-                        return {"success": False, "error": "Failed to add account to client manager"}
+                        return send_failure("Failed to add account to client manager", code=SendErrorCode.CLIENT_NOT_READY)
                     
                     client = self.client_manager.get_client(account.id)
                     if not client:
-                        return {"success": False, "error": "Failed to initialize Telegram client after adding account"}
+                        return send_failure(
+                            "Failed to initialize Telegram client after adding account", code=SendErrorCode.CLIENT_NOT_READY
+                        )
                 except Exception as e:
                     self.logger.error(f"Error adding account to client manager: {e}")
-                    return {"success": False, "error": f"Failed to add account to client manager: {e}"}
+                    return send_failure(f"Failed to add account to client manager: {e}", e, SendErrorCode.CLIENT_NOT_READY)
             
             # Check if client is ready
             self.logger.debug(f"Checking if client is ready for account {account.name}")
             if not client.is_ready():
                 self.logger.warning(f"Client not ready for account {account.name}")
-                return {"success": False, "error": "Telegram client is not ready"}
+                return send_failure("Telegram client is not ready", code=SendErrorCode.CLIENT_NOT_READY)
             
             # Send message to self (saved messages)
             try:
                 # Send to "Saved Messages" (self)
-                await client.send_message("me", message)
+                result = await client.send_message("me", message)
                 
                 # Create send log
-                await self._create_warmup_log(account, recipient, message, True, None)
+                await self._create_warmup_log(account, recipient, message, result)
                 
-                return {"success": True}
+                return result
                 
             except Exception as e:
                 # Create send log for failed message
-                await self._create_warmup_log(account, recipient, message, False, str(e))
-                return {"success": False, "error": str(e)}
+                result = send_failure(str(e), e)
+                await self._create_warmup_log(account, recipient, message, result)
+                return result
                 
         except Exception as e:
-            return {"success": False, "error": str(e)}
+            return send_failure(str(e), e)
     
-    async def _create_warmup_log(self, account: Account, recipient: Dict[str, Any], message: str, success: bool, error: Optional[str]):
+    async def _create_warmup_log(self, account: Account, recipient: Dict[str, Any], message: str, result: Dict[str, Any]):
         """Create a send log for warmup message."""
         try:
-            with get_session() as session:
-                send_log = SendLog(
-                    account_id=account.id,
-                    recipient_id=None,  # No specific recipient for warmup
-                    recipient_type="warmup",
-                    recipient_identifier=f"warmup_{account.id}",
-                    message_text=message,
-                    message_type="text",
-                    status=SendStatus.SENT if success else SendStatus.FAILED,
-                    error_message=error,
-                    sent_at=datetime.utcnow(),
-                    campaign_id=0,  # Use 0 for warmup (no real campaign)
-                    is_warmup=True
-                )
-                
-                session.add(send_log)
-                session.commit()
-                
+            send_log = SendLog(
+                account_id=account.id,
+                recipient_id=None,  # No specific recipient for warmup
+                recipient_type="warmup",
+                recipient_identifier=f"warmup_{account.id}",
+                message_text=message,
+                message_type="text",
+                status=SendStatus.SENT if result["success"] else SendStatus.FAILED,
+                error_message=result.get("error"),
+                error_code=result.get("error_code"),
+                telegram_error_code=result.get("telegram_error_code"),
+                sent_at=datetime.utcnow(),
+                campaign_id=0,  # Use 0 for warmup (no real campaign)
+                is_warmup=True
+            )
+            await get_async_repository().add(send_log)
+            
         except Exception as e:
             self.logger.error(f"Error creating warmup log: {e}")
     
@@ -0,0 +1,187 @@
+"""
+Compressed bitmap of non-negative integer ids.
+"""
+
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, Iterator, Optional, Union
+
+
+# Chunks with more values than this are stored as a 64K-bit bitmap (8 KiB) instead of a sorted array
+ARRAY_MAX = 4096
+
+_BITMAP_BYTES = 1 << 13
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<BI")
+_CHUNK_HEADER = struct.Struct("<HBI")
+_ARRAY, _BITS = 0, 1
+
+Container = Union[array, bytearray]
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array("H", values)
+        values.byteswap()
+    return values.tobytes()
+
+
+class IdBitmap:
+    """Set of ids from 0 to 2**32 - 1, stored in 64K-value chunks (roaring-style).
+
+    Each chunk holds the low 16 bits of its ids either as a sorted array of
+    2-byte values or, once it has more than ``ARRAY_MAX`` of them, as a
+    bitmap, so membership is a dict lookup plus a bisect or a bit test and
+    memory stays at most 2 bytes per id, far below a ``set`` of ints.
+    """
+
+    __slots__ = ("_chunks", "_len")
+
+    def __init__(self, ids: Iterable[int] = ()):
+        self._chunks: Dict[int, Container] = {}
+        self._len = 0
+        self.update(ids)
+
+    @staticmethod
+    def _split(value: int):
+        if not 0 <= value <= 0xFFFFFFFF:
+            raise ValueError(f"Id out of range for a bitmap: {value}")
+        return value >> 16, value & 0xFFFF
+
+    def __contains__(self, value: object) -> bool:
+        if not isinstance(value, int) or not 0 <= value <= 0xFFFFFFFF:
+            return False
+        chunk = self._chunks.get(value >> 16)
+        if chunk is None:
+            return False
+        low = value & 0xFFFF
+        if isinstance(chunk, bytearray):
+            return bool(chunk[low >> 3] & (1 << (low & 7)))
+        index = bisect_left(chunk, low)
+        return index < len(chunk) and chunk[index] == low
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __bool__(self) -> bool:
+        return self._len > 0
+
+    def __iter__(self) -> Iterator[int]:
+        for key in sorted(self._chunks):
+            chunk, high = self._chunks[key], key << 16
+            if isinstance(chunk, bytearray):
+                for byte_index, byte in enumerate(chunk):
+                    while byte:
+                        bit = byte & -byte
+                        yield high | (byte_index << 3) | (bit.bit_length() - 1)
+                        byte ^= bit
+            else:
+                for low in chunk:
+                    yield high | low
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IdBitmap):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"IdBitmap({len(self)} ids, {self.nbytes} bytes)"
+
+    def add(self, value: int) -> None:
+        """Add an id."""
+        key, low = self._split(value)
+        chunk = self._chunks.get(key)
+        if chunk is None:
+            self._chunks[key] = array("H", [low])
+            self._len += 1
+        elif isinstance(chunk, bytearray):
+            mask = 1 << (low & 7)
+            if not chunk[low >> 3] & mask:
+                chunk[low >> 3] |= mask
+                self._len += 1
+        else:
+            index = bisect_left(chunk, low)
+            if index < len(chunk) and chunk[index] == low:
+                return
+            chunk.insert(index, low)
+            self._len += 1
+            if len(chunk) > ARRAY_MAX:
+                bits = bytearray(_BITMAP_BYTES)
+                for value_low in chunk:
+                    bits[value_low >> 3] |= 1 << (value_low & 7)
+                self._chunks[key] = bits
+
+    def discard(self, value: int) -> None:
+        """Remove an id if present."""
+        if value not in self:
+            return
+        key, low = self._split(value)
+        chunk = self._chunks[key]
+        if isinstance(chunk, bytearray):
+            chunk[low >> 3] &= ~(1 << (low & 7)) & 0xFF
+            # Empty bitmaps are rare; dropped when the bitmap is saved
+        else:
+            del chunk[bisect_left(chunk, low)]
+            if not chunk:
+                del self._chunks[key]
+        self._len -= 1
+
+    def update(self, ids: Iterable[int]) -> None:
+        """Add many ids."""
+        for value in ids:
+            self.add(value)
+
+    def clear(self) -> None:
+        """Remove every id."""
+        self._chunks.clear()
+        self._len = 0
+
+    @property
+    def nbytes(self) -> int:
+        """Get the memory used by the chunk payloads."""
+        return sum(len(chunk) if isinstance(chunk, bytearray) else len(chunk) * 2 for chunk in self._chunks.values())
+
+    # Persistence
+
+    def to_bytes(self) -> bytes:
+        """Serialize to a compact, byte-order independent form."""
+        parts = [_HEADER.pack(_FORMAT_VERSION, self._len)]
+        for key in sorted(self._chunks):
+            chunk = self._chunks[key]
+            if isinstance(chunk, bytearray):
+                count = int.from_bytes(chunk, "little").bit_count()
+                if count:
+                    parts.append(_CHUNK_HEADER.pack(key, _BITS, count))
+                    parts.append(bytes(chunk))
+            else:
+                parts.append(_CHUNK_HEADER.pack(key, _ARRAY, len(chunk)))
+                parts.append(_little_endian(chunk))
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: Optional[bytes]) -> "IdBitmap":
+        """Load a bitmap saved with ``to_bytes``; empty data gives an empty bitmap."""
+        bitmap = cls()
+        if not data:
+            return bitmap
+        version, total = _HEADER.unpack_from(data)
+        if version != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported bitmap format version: {version}")
+        offset = _HEADER.size
+        while offset < len(data):
+            key, kind, count = _CHUNK_HEADER.unpack_from(data, offset)
+            offset += _CHUNK_HEADER.size
+            if kind == _BITS:
+                bitmap._chunks[key] = bytearray(data[offset:offset + _BITMAP_BYTES])
+                offset += _BITMAP_BYTES
+            else:
+                chunk = array("H")
+                chunk.frombytes(data[offset:offset + count * 2])
+                if sys.byteorder == "big":
+                    chunk.byteswap()
+                bitmap._chunks[key] = chunk
+                offset += count * 2
+        bitmap._len = total
+        return bitmap
@@ -0,0 +1,161 @@
+"""
+Read latency benchmark for SQLite while a campaign-like writer is busy.
+
+Compares the old setup (one shared connection for every thread) with pooled
+reader connections plus the single-writer queue.
+
+    python scripts/benchmark_db_contention.py --seconds 5 --readers 2
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import event
+from sqlalchemy.pool import QueuePool, StaticPool
+from sqlmodel import SQLModel, Session, create_engine, select
+
+from app.models import SendLog, SendStatus
+from app.services.db_writer import DatabaseWriter
+
+
+def set_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+def make_engine(path: Path, poolclass, **kwargs):
+    engine = create_engine(
+        f"sqlite:///{path}",
+        poolclass=poolclass,
+        connect_args={"check_same_thread": False, "timeout": 30},
+        **kwargs
+    )
+    event.listen(engine, "connect", set_pragmas)
+    return engine
+
+
+def make_send_log(i: int) -> SendLog:
+    return SendLog(
+        account_id=1,
+        recipient_id=1,
+        recipient_type="user",
+        recipient_identifier=f"user_{i}",
+        message_text=f"Message {i}",
+        status=SendStatus.SENT,
+        sent_at=datetime.utcnow(),
+    )
+
+
+def read_recent(engine) -> None:
+    with Session(engine) as session:
+        session.exec(
+            select(SendLog.id, SendLog.status, SendLog.created_at)
+            .order_by(SendLog.created_at.desc(), SendLog.id.desc())
+            .limit(200)
+        ).all()
+
+
+def run(label: str, read_engine, write, seconds: float, readers: int) -> None:
+    stop = threading.Event()
+    latencies = []
+    errors = [0]
+    writes = [0]
+
+    def writer_loop():
+        i = 0
+        while not stop.is_set():
+            try:
+                write(make_send_log(i))
+                i += 1
+            except Exception:
+                errors[0] += 1
+        writes[0] = i
+
+    def reader_loop():
+        while not stop.is_set():
+            started = time.perf_counter()
+            try:
+                read_recent(read_engine)
+            except Exception:
+                # Interleaved transactions on a shared connection fail outright
+                errors[0] += 1
+                continue
+            latencies.append((time.perf_counter() - started) * 1000)
+            # Readers poll like the GUI does rather than spinning
+            time.sleep(0.01)
+
+    threads = [threading.Thread(target=writer_loop)]
+    threads += [threading.Thread(target=reader_loop) for _ in range(readers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    latencies.sort()
+    if not latencies:
+        latencies.append(0.0)
+    p95 = latencies[max(0, int(len(latencies) * 0.95) - 1)]
+    print(
+        f"{label:<24} reads={len(latencies):>6}  errors={errors[0]:>5}  "
+        f"p50={statistics.median(latencies):6.2f} ms  p95={p95:6.2f} ms  max={latencies[-1]:7.2f} ms  "
+        f"writes/s={writes[0] / seconds:6.0f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--readers", type=int, default=2)
+    parser.add_argument("--rows", type=int, default=20000, help="send logs to seed before measuring")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Shared connection: every thread goes through one sqlite3 connection
+        path = Path(tmp) / "shared.db"
+        engine = make_engine(path, StaticPool)
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add_all(make_send_log(i) for i in range(args.rows))
+            session.commit()
+
+        def shared_write(send_log):
+            with Session(engine) as session:
+                session.add(send_log)
+                session.commit()
+
+        run("shared connection", engine, shared_write, args.seconds, args.readers)
+        engine.dispose()
+
+        # Pooled readers plus the single-writer queue
+        path = Path(tmp) / "pooled.db"
+        read_engine = make_engine(path, QueuePool, pool_size=args.readers + 1)
+        write_engine = make_engine(path, StaticPool)
+        DatabaseWriter.configure_sqlite_engine(write_engine)
+        SQLModel.metadata.create_all(write_engine)
+        with Session(write_engine) as session:
+            session.add_all(make_send_log(i) for i in range(args.rows))
+            session.commit()
+
+        writer = DatabaseWriter(write_engine)
+        writer.start()
+        run("pooled + write queue", read_engine, lambda send_log: writer.add(send_log).result(),
+            args.seconds, args.readers)
+        writer.stop()
+        read_engine.dispose()
+        write_engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,14 +2,23 @@
 Pytest configuration and fixtures.
 """
 
+import os
 import pytest
 import asyncio
 from pathlib import Path
 from unittest.mock import Mock, AsyncMock
 
+from sqlalchemy import event
+from sqlmodel import create_engine
+
 from app.services import initialize_database, get_settings
+from app.services.log_database import attach_log_database
+from app.services.migrations import MigrationRunner
 from app.models import Account, Campaign, Recipient
 
+# Qt tests (pytest-qt) run without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
 
 @pytest.fixture(scope="session")
 def event_loop():
@@ -36,6 +45,29 @@ def temp_db():
     close_database()
 
 
+@pytest.fixture
+def log_database_path():
+    """Path of a send log database to attach to migrated_engine, if any."""
+    return None
+
+
+@pytest.fixture
+def engine_options():
+    """Extra create_engine() arguments for migrated_engine."""
+    return {}
+
+
+@pytest.fixture
+def migrated_engine(tmp_path, log_database_path, engine_options):
+    """Create a SQLite database file upgraded to the latest schema."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}", **engine_options)
+    if log_database_path is not None:
+        event.listen(engine, "connect", lambda conn, record: attach_log_database(conn, log_database_path))
+    MigrationRunner(engine).upgrade()
+    yield engine
+    engine.dispose()
+
+
 @pytest.fixture
 def sample_account():
     """Create a sample account for testing."""
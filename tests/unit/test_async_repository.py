@@ -0,0 +1,135 @@
+"""
+Unit tests for async reads and queued writes used by the campaign engine.
+"""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models import Account, Campaign, CampaignStatus, Recipient, SendLog, SendStatus
+from app.services import async_repository
+from app.services.async_repository import AsyncRepository
+from app.services.db_writer import DatabaseWriter
+
+
+SINCE = datetime(2024, 5, 1)
+
+
+@pytest.fixture
+def sessions(migrated_engine, monkeypatch):
+    """Async sessions on the migrated database; the list records each one opened."""
+    with Session(migrated_engine) as session:
+        session.add(Account(name="a", phone_number="+1", api_id=1, api_hash="h", session_path="s"))
+        session.add(Campaign(name="Launch", message_text="Hi", status=CampaignStatus.RUNNING))
+        session.add_all([Recipient(username=f"user{index}") for index in range(5)])
+        session.add(Recipient(username="gone", is_deleted=True))
+        session.flush()
+        session.add_all([
+            SendLog(campaign_id=1, account_id=1, recipient_id=1, status=SendStatus.SENT,
+                    created_at=SINCE - timedelta(days=1)),
+            SendLog(campaign_id=1, account_id=1, recipient_id=2, status=SendStatus.SENT, created_at=SINCE),
+            SendLog(campaign_id=1, account_id=1, recipient_id=3, status=SendStatus.FAILED, created_at=SINCE),
+            SendLog(campaign_id=1, account_id=1, recipient_id=None, status=SendStatus.SENT, created_at=SINCE),
+            SendLog(campaign_id=None, account_id=1, recipient_id=4, status=SendStatus.SENT, created_at=SINCE),
+        ])
+        session.commit()
+
+    # No pooling, so no connection outlives the test's event loop
+    engine = create_async_engine(str(migrated_engine.url).replace("sqlite:", "sqlite+aiosqlite:"), poolclass=NullPool)
+    opened = []
+
+    @asynccontextmanager
+    async def get_async_session():
+        opened.append(1)
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            yield session
+
+    monkeypatch.setattr(async_repository, "get_async_session", get_async_session)
+    return opened
+
+
+@pytest.fixture
+def writers(migrated_engine, monkeypatch):
+    """Tables the repository asked for a writer queue; writes commit inline."""
+    writer = DatabaseWriter(migrated_engine)
+    tables = []
+
+    def get_db_writer(table=None):
+        tables.append(table)
+        return writer
+
+    monkeypatch.setattr(async_repository, "get_db_writer", get_db_writer)
+    return tables
+
+
+class TestAsyncRepository:
+    """Test reads through async sessions and writes through the writer queue."""
+
+    @pytest.mark.asyncio
+    async def test_campaign_reads(self, sessions):
+        """Test campaigns come back detached with their fields loaded."""
+        repository = AsyncRepository()
+
+        campaign = await repository.get_campaign(1)
+
+        assert campaign.name == "Launch" and campaign.status == CampaignStatus.RUNNING
+        assert await repository.get_campaign(2) is None
+        assert await repository.get_campaign_status(1) == CampaignStatus.RUNNING
+        assert await repository.get_campaign_status(2) is None
+
+    @pytest.mark.asyncio
+    async def test_recipients_stream_in_batches(self, sessions):
+        """Test recipients are read in id order with one short session per batch."""
+        repository = AsyncRepository()
+        campaign = await repository.get_campaign(1)
+        sessions.clear()
+
+        ids = [recipient.id async for recipient in repository.iter_campaign_recipients(campaign, batch_size=2)]
+
+        assert ids == [1, 2, 3, 4, 5]
+        assert len(sessions) == 3
+        assert await repository.count_campaign_recipients(campaign) == 5
+        assert [recipient.id for recipient in await repository.get_campaign_recipients(campaign)] == ids
+
+    @pytest.mark.asyncio
+    async def test_sent_recipient_ids(self, sessions):
+        """Test only the campaign's successful sends to known recipients count, optionally since a time."""
+        repository = AsyncRepository()
+
+        assert await repository.get_sent_recipient_ids(1) == {1, 2}
+        assert await repository.get_sent_recipient_ids(1, since=SINCE) == {2}
+        assert await repository.get_sent_recipient_ids(2) == set()
+
+    @pytest.mark.asyncio
+    async def test_update_campaign_checks_status(self, sessions, writers):
+        """Test a conditional update is skipped when the status moved on, and reads see committed writes."""
+        repository = AsyncRepository()
+
+        assert not await repository.update_campaign(1, only_if_status=CampaignStatus.PAUSED, name="Skipped")
+        assert await repository.update_campaign(
+            1, only_if_status=CampaignStatus.RUNNING, status=CampaignStatus.COMPLETED
+        )
+        assert not await repository.update_campaign(2, status=CampaignStatus.COMPLETED)
+
+        campaign = await repository.get_campaign(1)
+        assert (campaign.name, campaign.status) == ("Launch", CampaignStatus.COMPLETED)
+        assert writers == [None, None, None]
+
+    @pytest.mark.asyncio
+    async def test_add_uses_table_writer(self, sessions, writers):
+        """Test inserts of one table go to that table's writer queue."""
+        repository = AsyncRepository()
+
+        await repository.add(
+            SendLog(campaign_id=1, account_id=1, recipient_id=5, status=SendStatus.SENT, created_at=SINCE)
+        )
+        await repository.add(Recipient(username="new"), SendLog(account_id=1, status=SendStatus.SKIPPED))
+
+        assert writers == ["send_logs", None]
+        assert await repository.get_sent_recipient_ids(1, since=SINCE) == {2, 5}
+        assert await repository.count_campaign_recipients(await repository.get_campaign(1)) == 6
@@ -0,0 +1,41 @@
+"""
+Unit tests for the compressed id bitmap.
+"""
+
+import pytest
+
+from app.utils.bitmap import ARRAY_MAX, IdBitmap
+
+
+class TestIdBitmap:
+    """Test membership, chunk conversion and persistence."""
+
+    def test_membership(self):
+        """Test ids across chunks are added, found and removed once."""
+        bitmap = IdBitmap([5, 70000, 5, 2**32 - 1])
+        bitmap.discard(70000)
+        bitmap.discard(12)
+
+        assert len(bitmap) == 2
+        assert 5 in bitmap and 2**32 - 1 in bitmap
+        assert 70000 not in bitmap and -1 not in bitmap and "5" not in bitmap
+        assert list(bitmap) == [5, 2**32 - 1]
+        with pytest.raises(ValueError):
+            bitmap.add(2**32)
+
+    def test_dense_chunks_become_bitmaps(self):
+        """Test a full chunk stays at 8 KiB and iterates in order."""
+        bitmap = IdBitmap(range(0, 3 * (ARRAY_MAX + 1), 3))
+        sparse = IdBitmap(range(ARRAY_MAX))
+
+        assert bitmap.nbytes == 8192 and sparse.nbytes == ARRAY_MAX * 2
+        assert list(bitmap) == list(range(0, 3 * (ARRAY_MAX + 1), 3))
+        bitmap.discard(3)
+        assert 3 not in bitmap and len(bitmap) == ARRAY_MAX
+
+    def test_round_trip(self):
+        """Test saved bitmaps load back equal, and empty data loads as empty."""
+        bitmap = IdBitmap(list(range(10000)) + [1 << 20, 1 << 30])
+
+        assert IdBitmap.from_bytes(bitmap.to_bytes()) == bitmap
+        assert len(IdBitmap.from_bytes(None)) == 0
@@ -0,0 +1,140 @@
+"""
+Unit tests for data change notifications.
+"""
+
+import pytest
+from sqlalchemy import delete, event, update
+from sqlmodel import Session
+
+from app.models import Campaign, Recipient
+from app.services.change_bus import ChangeSet, DataChangeBus, TableChanges
+from app.services.db_writer import DatabaseWriter
+
+
+class TestChangeSet:
+    """Test change set merging."""
+
+    def test_merge_tables(self):
+        """Test changes from separate commits are combined per table."""
+        changes = ChangeSet(accounts=TableChanges(updated={1}))
+        changes.merge(ChangeSet(accounts=TableChanges(updated={2}), campaigns=TableChanges(inserted={5})))
+
+        assert changes["accounts"].updated == {1, 2}
+        assert changes["campaigns"].inserted == {5}
+        assert changes.touches("campaigns", "recipients")
+        assert not changes.touches("recipients")
+
+    def test_insert_then_delete(self):
+        """Test a row inserted and deleted before delivery is reported as deleted only."""
+        changes = TableChanges(inserted={1})
+        changes.merge(TableChanges(updated={1}))
+        changes.merge(TableChanges(deleted={1}))
+
+        assert changes.inserted == set()
+        assert changes.updated == set()
+        assert changes.deleted == {1}
+        assert changes.has_membership_changes()
+
+    def test_updates_only(self):
+        """Test plain updates are not membership changes."""
+        assert not TableChanges(updated={3}).has_membership_changes()
+        assert TableChanges(full=True).has_membership_changes()
+
+
+class BusSession(Session):
+    """Session class of its own, so the hooks don't reach the app's sessions."""
+
+
+@pytest.fixture
+def bus(qapp, migrated_engine):
+    # Savepoints need the writer's explicit BEGIN on pysqlite
+    DatabaseWriter.configure_sqlite_engine(migrated_engine)
+    bus = DataChangeBus(coalesce_ms=0)
+    bus.install(BusSession)
+    yield bus
+    for name, hook in (
+        ("after_flush", bus._after_flush),
+        ("after_commit", bus._after_commit),
+        ("after_soft_rollback", bus._after_rollback),
+        ("do_orm_execute", bus._on_orm_execute),
+    ):
+        event.remove(BusSession, name, hook)
+
+
+@pytest.fixture
+def published(bus, monkeypatch):
+    published = []
+    monkeypatch.setattr(bus, "publish", published.append)
+    return published
+
+
+class TestSessionHooks:
+    """Test commits publish the rows they changed and rollbacks publish nothing."""
+
+    def test_commit_publishes_row_ids(self, bus, migrated_engine, qtbot):
+        """Test each commit is delivered with inserted, updated and deleted ids."""
+        with BusSession(migrated_engine) as session:
+            first, second = Recipient(username="alice"), Recipient(username="bob")
+            with qtbot.waitSignal(bus.entities_changed) as inserted:
+                session.add_all([first, second])
+                session.commit()
+
+            with qtbot.waitSignal(bus.entities_changed) as changed:
+                first.first_name = "Alice"
+                session.delete(second)
+                session.commit()
+
+        [recipients] = inserted.args[0].values()
+        assert (recipients.inserted, recipients.updated, recipients.deleted) == ({1, 2}, set(), set())
+        recipients = changed.args[0]["recipients"]
+        assert (recipients.inserted, recipients.updated, recipients.deleted) == (set(), {1}, {2})
+        assert bus.version("recipients") == 2
+
+    def test_unchanged_flush_is_not_an_update(self, migrated_engine, published):
+        """Test setting a field to its current value publishes nothing."""
+        with BusSession(migrated_engine) as session:
+            recipient = Recipient(username="alice")
+            session.add(recipient)
+            session.commit()
+            recipient.username = recipient.username
+            session.commit()
+
+        assert len(published) == 1
+
+    def test_rollback_drops_changes(self, migrated_engine, published):
+        """Test rolled back changes are neither published nor carried into the next commit."""
+        with BusSession(migrated_engine) as session:
+            session.add(Recipient(username="alice"))
+            session.flush()
+            session.rollback()
+
+            session.add(Campaign(name="Launch", message_text="Hi"))
+            session.commit()
+
+        [changes] = published
+        assert set(changes) == {"campaigns"}
+
+    def test_savepoint_rollback_keeps_transaction_changes(self, migrated_engine, published):
+        """Test rolling back a savepoint keeps the changes flushed before it."""
+        with BusSession(migrated_engine) as session:
+            session.add(Recipient(username="alice"))
+            session.flush()
+            savepoint = session.begin_nested()
+            session.add(Recipient(username="bob"))
+            session.flush()
+            savepoint.rollback()
+            session.commit()
+
+        [changes] = published
+        assert 1 in changes["recipients"].inserted
+
+    def test_bulk_statements_mark_table_full(self, migrated_engine, published):
+        """Test bulk updates and deletes publish the table without row ids."""
+        with BusSession(migrated_engine) as session:
+            session.exec(update(Recipient).where(Recipient.username == "alice").values(first_name="Alice"))
+            session.exec(delete(Campaign))
+            session.commit()
+
+        [changes] = published
+        assert changes["recipients"].full and changes["campaigns"].full
+        assert not changes["recipients"].updated
@@ -0,0 +1,115 @@
+"""
+Unit tests for background data access on the Qt thread pool.
+"""
+
+import threading
+
+import pytest
+
+from app.services.data_access import DataAccessService
+
+
+@pytest.fixture
+def service(qapp):
+    service = DataAccessService(max_threads=1)
+    yield service
+    service.shutdown()
+
+
+@pytest.fixture
+def busy(service):
+    """Occupy the only pool thread until the returned event is set."""
+    release = threading.Event()
+    started = threading.Event()
+
+    def block():
+        started.set()
+        release.wait(5)
+
+    service.submit(block)
+    assert started.wait(5)
+    yield release
+    release.set()
+
+
+class TestDataAccessService:
+    """Test results, de-duplication and cancellation."""
+
+    def test_callbacks_run_on_owner_thread(self, service, qtbot):
+        """Test jobs run on the pool while results and errors come back on the GUI thread."""
+        results, errors = [], []
+
+        def fail():
+            raise ValueError("no such table")
+
+        service.submit(
+            lambda: threading.current_thread(),
+            on_result=lambda job_thread: results.append((job_thread, threading.current_thread()))
+        )
+        service.submit(fail, on_error=errors.append)
+        qtbot.waitUntil(lambda: bool(results and errors))
+
+        [(job_thread, callback_thread)] = results
+        assert job_thread is not threading.main_thread()
+        assert callback_thread is threading.main_thread()
+        assert isinstance(errors[0], ValueError)
+        assert service.in_flight() == 0
+
+    def test_same_key_shares_one_query(self, service, busy, qtbot):
+        """Test callers submitting a key already in flight get the result of a single run."""
+        runs, results = [], []
+
+        def count():
+            runs.append(1)
+            return len(runs)
+
+        first = service.submit(count, on_result=results.append, key=("campaign", 1))
+        second = service.submit(count, on_result=results.append, key=("campaign", 1))
+        other = service.submit(count, on_result=results.append, key=("campaign", 2))
+        assert first._query is second._query is not other._query
+        busy.set()
+        qtbot.waitUntil(lambda: len(results) == 3)
+
+        assert sorted(results) == [1, 1, 2] and len(runs) == 2
+        assert first.done and second.done
+
+    def test_cancel_takes_query_off_queue(self, service, busy, qtbot):
+        """Test a queued query nobody waits for is removed from the pool without running."""
+        runs, results = [], []
+        handle = service.submit(lambda: runs.append("cancelled"), on_result=results.append, key="names")
+        assert service.in_flight() == 2
+
+        handle.cancel()
+        assert service.in_flight() == 1
+        # Already taken off the pool queue by cancel()
+        assert not service.pool.tryTake(handle._query)
+        busy.set()
+        service.pool.waitForDone(5000)
+        qtbot.wait(50)
+
+        assert runs == [] and results == []
+        assert service.in_flight() == 0
+
+    def test_cancel_one_of_shared_callers(self, service, busy, qtbot):
+        """Test cancelling one caller keeps the query running for the others."""
+        kept, dropped = [], []
+        cancelled = service.submit(lambda: "rows", on_result=dropped.append, key="page")
+        service.submit(lambda: "rows", on_result=kept.append, key="page")
+
+        cancelled.cancel()
+        busy.set()
+        qtbot.waitUntil(lambda: bool(kept))
+
+        assert kept == ["rows"] and dropped == []
+        assert cancelled.cancelled and not cancelled.done
+
+    def test_shutdown_drops_queued_queries(self, service, busy):
+        """Test shutting down discards queries that have not started."""
+        runs = []
+        service.submit(lambda: runs.append(1))
+
+        service.shutdown(timeout_ms=50)
+        busy.set()
+        service.pool.waitForDone(5000)
+
+        assert runs == [] and service.in_flight() == 0
@@ -0,0 +1,95 @@
+"""
+Unit tests for streaming exports.
+"""
+
+import csv
+import json
+import threading
+from datetime import datetime
+
+import pyarrow.parquet as pq
+import pytest
+from sqlmodel import Session, create_engine
+
+from app.models import Recipient, RecipientStatus
+from app.services import data_export
+from app.services.data_export import DataExportService, ExportCancelled, ExportColumn, ExportSource, recipient_source
+from app.services.migrations import MigrationRunner
+
+
+CREATED = datetime(2024, 3, 1, 12, 0)
+
+
+def numbers_source(count: int) -> ExportSource:
+    """A source of ``count`` numbered rows."""
+    def batches(batch_size):
+        for start in range(0, count, batch_size):
+            yield [(number, f"row {number}") for number in range(start, min(start + batch_size, count))]
+
+    return ExportSource(
+        name="numbers",
+        columns=[
+            ExportColumn("number", lambda row: row[0], int),
+            ExportColumn("label", lambda row: row[1]),
+            ExportColumn("created_at", lambda row: CREATED, datetime),
+        ],
+        batches=batches,
+        count=lambda: count,
+    )
+
+
+@pytest.fixture
+def service():
+    return DataExportService(batch_size=10)
+
+
+class TestDataExport:
+    """Test exporting sources in batches to every format."""
+
+    def test_formats(self, service, tmp_path):
+        """Test each extension picks its format and every row is written once."""
+        progress = []
+        csv_result = service.export(numbers_source(25), tmp_path / "out.csv", progress=lambda rows, total: progress.append((rows, total)))
+        service.export(numbers_source(25), tmp_path / "out.jsonl")
+        service.export(numbers_source(25), tmp_path / "out.parquet")
+
+        with open(tmp_path / "out.csv", newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        lines = (tmp_path / "out.jsonl").read_text(encoding="utf-8").splitlines()
+        table = pq.read_table(tmp_path / "out.parquet")
+
+        assert csv_result.rows == 25 and progress == [(10, 25), (20, 25), (25, 25)]
+        assert rows[0] == {"number": "0", "label": "row 0", "created_at": "2024-03-01T12:00:00"}
+        assert json.loads(lines[-1]) == {"number": 24, "label": "row 24", "created_at": "2024-03-01T12:00:00"}
+        assert table.num_rows == 25 and table.column("number").to_pylist()[-1] == 24
+
+    def test_cancel_leaves_no_file(self, service, tmp_path):
+        """Test a cancelled export removes its partial file."""
+        cancelled = threading.Event()
+
+        def cancel_after_first_batch(rows, total):
+            cancelled.set()
+
+        with pytest.raises(ExportCancelled):
+            service.export(numbers_source(25), tmp_path / "out.csv", progress=cancel_after_first_batch, cancelled=cancelled)
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_recipients_honour_conditions(self, service, tmp_path, monkeypatch):
+        """Test recipient exports stream only the rows matching the table's filters."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+        MigrationRunner(engine).upgrade()
+        with Session(engine) as session:
+            for number in range(15):
+                status = RecipientStatus.BLOCKED if number % 3 == 0 else RecipientStatus.ACTIVE
+                session.add(Recipient(username=f"user{number}", display_name=f"User {number}", status=status))
+            session.commit()
+        monkeypatch.setattr(data_export, "get_session", lambda: Session(engine))
+
+        source = recipient_source([Recipient.status == RecipientStatus.BLOCKED])
+        result = service.export(source, tmp_path / "blocked.jsonl", progress=lambda rows, total: None)
+
+        rows = [json.loads(line) for line in (tmp_path / "blocked.jsonl").read_text(encoding="utf-8").splitlines()]
+        assert result.rows == source.count() == 5
+        assert {row["status"] for row in rows} == {RecipientStatus.BLOCKED.value}
+        engine.dispose()
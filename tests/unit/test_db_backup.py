@@ -0,0 +1,146 @@
+"""
+Unit tests for online database backups.
+"""
+
+import os
+import sqlite3
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from sqlmodel import SQLModel
+
+from app.models import Recipient, SendLog
+from app.services import change_bus, db, message_bodies
+from app.services.db_backup import DatabaseBackupService, _open_backup, log_backup_path
+
+
+ROWS = 500
+
+
+@pytest.fixture
+def database_path(tmp_path):
+    """Live WAL database with enough rows to span many pages."""
+    path = tmp_path / "app.db"
+    connection = sqlite3.connect(path, isolation_level=None)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("CREATE TABLE notes (id INTEGER PRIMARY KEY, body TEXT NOT NULL)")
+    connection.executemany("INSERT INTO notes (body) VALUES (?)", [("x" * 200,)] * ROWS)
+    connection.close()
+    return path
+
+
+@pytest.fixture
+def service(database_path, tmp_path):
+    service = DatabaseBackupService(pages_per_step=4)
+    service.settings = SimpleNamespace(
+        app_data_dir=str(tmp_path),
+        db_backup_compress=False,
+        db_backup_keep=7,
+        db_log_database_path=str(tmp_path / "logs.db"),
+        get_database_path=lambda: database_path,
+        get_log_database_path=lambda: None,
+    )
+    return service
+
+
+def note_count(path: Path) -> int:
+    connection = sqlite3.connect(path)
+    try:
+        return connection.execute("SELECT COUNT(*) FROM notes").fetchone()[0]
+    finally:
+        connection.close()
+
+
+def touch_backup(directory: Path, name: str, mtime: int) -> Path:
+    path = directory / name
+    path.write_bytes(b"backup")
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+class TestDatabaseBackup:
+    """Test taking, pruning and restoring backups."""
+
+    def test_backup_during_writes_is_consistent(self, service, database_path, tmp_path):
+        """Test writes committed between copy steps don't reach or corrupt the backup."""
+        writer = sqlite3.connect(database_path, isolation_level=None)
+        steps = []
+
+        def write_between_steps(copied, total):
+            steps.append(copied)
+            writer.execute("INSERT INTO notes (body) VALUES (?)", ("y" * 200,))
+
+        try:
+            result = service.create_backup(tmp_path / "copy.db", progress=write_between_steps)
+        finally:
+            writer.close()
+
+        assert len(steps) > 1 and result.verified
+        assert service.verify_backup(result.path)
+        connection = sqlite3.connect(result.path)
+        assert connection.execute("PRAGMA integrity_check").fetchall() == [("ok",)]
+        connection.close()
+        assert note_count(result.path) == ROWS
+        assert note_count(database_path) == ROWS + len(steps)
+
+    @pytest.mark.parametrize("name", ["copy.db", "copy.db.gz"])
+    def test_failed_backup_removes_partial_file(self, service, tmp_path, monkeypatch, name):
+        """Test a backup failing its integrity check leaves neither a partial nor a final file."""
+        def corrupt(connection, path):
+            raise ValueError(f"Integrity check failed for {path}")
+
+        monkeypatch.setattr(service, "_check_integrity", corrupt)
+
+        with pytest.raises(ValueError):
+            service.create_backup(tmp_path / "backups" / name)
+        assert list((tmp_path / "backups").iterdir()) == []
+
+    def test_compressed_backup_round_trip(self, service, database_path):
+        """Test a gzip backup opens as a plain database that goes away afterwards."""
+        result = service.create_backup(compress=True)
+
+        assert result.compressed and result.path.name.endswith(".db.gz")
+        assert service.list_backups() == [result.path]
+        with _open_backup(result.path) as opened:
+            assert opened.suffix == ".db"
+            assert note_count(opened) == note_count(database_path)
+        assert not opened.exists()
+
+    def test_prune_removes_log_backups(self, service):
+        """Test pruning deletes the send log copy next to each old backup."""
+        directory = service.backup_dir()
+        directory.mkdir()
+        old = touch_backup(directory, "backup_20240101_000000.db.gz", 1_700_000_000)
+        old_logs = touch_backup(directory, log_backup_path(old).name, 1_700_000_000)
+        new = touch_backup(directory, "backup_20240102_000000.db.gz", 1_700_086_400)
+        new_logs = touch_backup(directory, log_backup_path(new).name, 1_700_086_400)
+
+        assert service.list_backups() == [new, old]
+        assert service.prune_backups(keep=1) == [old]
+        assert sorted(directory.iterdir()) == sorted([new, new_logs])
+        assert not old_logs.exists()
+
+    def test_restore_publishes_full_change(self, service, database_path, tmp_path, monkeypatch):
+        """Test restoring puts rows back, reruns migrations and tells every view to reload."""
+        published, calls = [], []
+        monkeypatch.setattr(change_bus, "get_change_bus", lambda: SimpleNamespace(publish=published.append))
+        monkeypatch.setattr(message_bodies, "get_message_bodies", lambda: SimpleNamespace(
+            clear_cache=lambda: calls.append("clear_cache")
+        ))
+        monkeypatch.setattr(db, "get_db_service", lambda: SimpleNamespace(
+            engine=object(), create_tables=lambda: calls.append("create_tables")
+        ))
+        backup = service.create_backup(tmp_path / "copy.db.gz").path
+        connection = sqlite3.connect(database_path, isolation_level=None)
+        connection.execute("DELETE FROM notes WHERE id > 10")
+        connection.close()
+
+        service.restore_backup(backup)
+
+        assert note_count(database_path) == ROWS
+        assert calls == ["clear_cache", "create_tables"]
+        [changes] = published
+        assert set(changes) == set(SQLModel.metadata.tables)
+        assert {Recipient.__tablename__, SendLog.__tablename__} <= set(changes)
+        assert all(table_changes.full for table_changes in changes.values())
@@ -0,0 +1,168 @@
+"""
+Unit tests for the single-writer queue.
+"""
+
+import sqlite3
+import threading
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, select
+
+from app.models import Recipient
+from app.services.db_writer import DatabaseWriter
+
+
+@pytest.fixture
+def engine_options():
+    """One shared connection, the way the app sets up the writer's engine."""
+    return {"poolclass": StaticPool, "connect_args": {"check_same_thread": False, "timeout": 0.2}}
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "app.db"
+
+
+@pytest.fixture
+def writer(migrated_engine):
+    """Writer on the migrated database, switched to WAL mode."""
+    with migrated_engine.connect() as connection:
+        connection.exec_driver_sql("PRAGMA journal_mode=WAL")
+    DatabaseWriter.configure_sqlite_engine(migrated_engine)
+    # Reconnect so the connection picks up the writer's transaction handling
+    migrated_engine.dispose()
+    writer = DatabaseWriter(migrated_engine, checkpoint_interval=60.0)
+    yield writer
+    writer.stop()
+
+
+def add_recipient(username, fail=False):
+    def job(session):
+        session.add(Recipient(username=username))
+        session.flush()
+        if fail:
+            raise ValueError(f"{username} rejected")
+        return threading.current_thread().name
+    return job
+
+
+def blocking_job(release):
+    def job(session):
+        release.wait(5)
+    return job
+
+
+def usernames(writer):
+    with Session(writer.engine) as session:
+        return sorted(session.exec(select(Recipient.username)).all())
+
+
+class TestDatabaseWriter:
+    """Test queued writes, their transactions and shutdown."""
+
+    def test_failing_job_rolls_back_to_its_savepoint(self, writer):
+        """Test one failing job leaves the rest of its batch committed."""
+        writer.start()
+        release = threading.Event()
+        writer.submit(blocking_job(release))
+        futures = [
+            writer.submit(add_recipient("alice")),
+            writer.submit(add_recipient("bob", fail=True)),
+            writer.submit(add_recipient("carol")),
+        ]
+        release.set()
+
+        assert futures[0].result(5) == futures[2].result(5) == writer.name
+        with pytest.raises(ValueError, match="bob rejected"):
+            futures[1].result(5)
+        assert usernames(writer) == ["alice", "carol"]
+
+    def test_writes_inline_without_thread(self, writer):
+        """Test jobs run and commit on the calling thread before the writer starts."""
+        future = writer.submit(add_recipient("alice"))
+
+        assert future.done()
+        assert future.result() == threading.current_thread().name
+        assert usernames(writer) == ["alice"]
+
+        failed = writer.submit(add_recipient("bob", fail=True))
+        assert isinstance(failed.exception(), ValueError)
+        assert usernames(writer) == ["alice"]
+
+    def test_lock_errors_reach_futures(self, writer, db_path):
+        """Test every future in a batch that cannot take the write lock gets the error."""
+        writer.start()
+        other = sqlite3.connect(db_path, isolation_level=None)
+        other.execute("BEGIN IMMEDIATE")
+        try:
+            release = threading.Event()
+            writer.submit(blocking_job(release))
+            futures = [writer.submit(add_recipient("alice")), writer.submit(add_recipient("bob"))]
+            release.set()
+
+            for future in futures:
+                error = future.exception(5)
+                assert isinstance(error, OperationalError)
+                assert "locked" in str(error)
+        finally:
+            other.rollback()
+            other.close()
+
+        assert writer.submit(add_recipient("carol")).result(5) == writer.name
+        assert usernames(writer) == ["carol"]
+
+    def test_commit_errors_reach_futures(self, writer):
+        """Test a batch whose commit fails reports the error to jobs that had succeeded."""
+        def fail_commit(session):
+            if session.bind is writer.engine:
+                raise OperationalError("COMMIT", {}, sqlite3.OperationalError("database is locked"))
+
+        event.listen(Session, "before_commit", fail_commit)
+        try:
+            writer.start()
+            release = threading.Event()
+            writer.submit(blocking_job(release))
+            futures = [writer.submit(add_recipient("alice")), writer.submit(add_recipient("bob", fail=True))]
+            release.set()
+
+            assert isinstance(futures[0].exception(5), OperationalError)
+            assert isinstance(futures[1].exception(5), ValueError)
+        finally:
+            event.remove(Session, "before_commit", fail_commit)
+        assert writer.submit(add_recipient("carol")).result(5) == writer.name
+        assert usernames(writer) == ["carol"]
+
+    def test_stop_truncates_wal(self, writer, db_path):
+        """Test stopping applies queued writes and empties the WAL file."""
+        writer.start()
+        futures = [writer.submit(add_recipient(f"user{index}")) for index in range(20)]
+        wal = db_path.with_name(db_path.name + "-wal")
+
+        futures[-1].result(5)
+        assert wal.stat().st_size > 0
+        writer.stop()
+
+        assert not writer.is_running()
+        assert all(future.done() for future in futures)
+        assert wal.stat().st_size == 0
+
+    def test_stop_timeout_keeps_queueing(self, writer):
+        """Test writes submitted while a timed out stop is still finishing go to the writer thread."""
+        writer.start()
+        release = threading.Event()
+        writer.submit(blocking_job(release))
+
+        writer.stop(timeout=0.1)
+        assert writer.is_running()
+        late = writer.submit(add_recipient("alice"))
+        assert not late.done()
+
+        release.set()
+        assert late.result(5) == writer.name
+        writer.stop()
+        assert not writer.is_running()
+        assert writer.submit(add_recipient("bob")).result() == threading.current_thread().name
+        assert usernames(writer) == ["alice", "bob"]
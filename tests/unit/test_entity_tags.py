@@ -0,0 +1,67 @@
+"""
+Unit tests for the trigger-maintained entity tag index and JSON columns.
+"""
+
+from sqlmodel import Session, create_engine, select
+
+from app.models import Campaign, EntityTag, Recipient
+from app.services.entity_tags import get_entity_tags
+from app.services.migrations import MIGRATIONS, MigrationRunner
+
+
+def indexed(engine):
+    with Session(engine) as session:
+        rows = session.exec(select(EntityTag).order_by(EntityTag.entity_type, EntityTag.entity_id, EntityTag.tag)).all()
+        return [(row.entity_type, row.entity_id, row.tag) for row in rows]
+
+
+def tagged_ids(engine, tags, match_all=False):
+    with Session(engine) as session:
+        condition = get_entity_tags().tagged(Recipient, tags, match_all=match_all)
+        return list(session.exec(select(Recipient.id).where(condition).order_by(Recipient.id)).all())
+
+
+class TestEntityTags:
+    """Test tag writes are mirrored into the index and JSON columns round-trip."""
+
+    def test_index_follows_writes(self, migrated_engine):
+        """Test inserts, replaced and in-place edited tags, and deletes keep the index exact."""
+        with Session(migrated_engine) as session:
+            session.add_all([
+                Recipient(username="first", tags=["vip", "beta", "vip"]),
+                Recipient(username="second", tags=["beta"], custom_fields={"city": "Berlin"}),
+                Campaign(name="Launch", message_text="Hi", tags=["vip"]),
+            ])
+            session.commit()
+            assert tagged_ids(migrated_engine, ["vip", "beta"]) == [1, 2]
+            assert tagged_ids(migrated_engine, ["vip", "beta"], match_all=True) == [1]
+
+            first, second = session.get(Recipient, 1), session.get(Recipient, 2)
+            first.set_tags_list(["new"])
+            second.tags.append("vip")
+            session.commit()
+            assert second.get_custom_fields_dict() == {"city": "Berlin"}
+            session.delete(session.get(Campaign, 1))
+            session.commit()
+
+        assert indexed(migrated_engine) == [("recipients", 1, "new"), ("recipients", 2, "beta"), ("recipients", 2, "vip")]
+
+    def test_migration_repairs_json(self, tmp_path):
+        """Test upgrading keeps malformed tags as text and indexes tags written before the index."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+        MigrationRunner(engine, MIGRATIONS[:7]).upgrade()
+        with engine.begin() as connection:
+            connection.exec_driver_sql(
+                "INSERT INTO recipients (id, created_at, updated_at, is_deleted, recipient_type, status, source, "
+                "total_messages_sent, total_messages_failed, tags, custom_fields) VALUES "
+                "(1, '2025-01-01', '2025-01-01', 0, 'USER', 'ACTIVE', 'MANUAL', 0, 0, 'vip, beta', 'null'), "
+                "(2, '2025-01-01', '2025-01-01', 0, 'USER', 'ACTIVE', 'MANUAL', 0, 0, '[\"vip\"]', '[1]')"
+            )
+
+        MigrationRunner(engine).upgrade()
+
+        with Session(engine) as session:
+            recipients = session.exec(select(Recipient).order_by(Recipient.id)).all()
+            assert [(r.tags, r.custom_fields) for r in recipients] == [(["vip, beta"], None), (["vip"], None)]
+        assert indexed(engine) == [("recipients", 1, "vip, beta"), ("recipients", 2, "vip")]
+        engine.dispose()
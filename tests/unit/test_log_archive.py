@@ -0,0 +1,86 @@
+"""
+Unit tests for the send log Parquet archive.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models import SendStatus
+from app.services.log_archive import SendLogArchive
+from app.services.send_log_query import SendLogFilter
+
+
+START = datetime(2024, 3, 1, 12, 0, 0)
+
+
+def make_row(log_id: int, hours: int, status: SendStatus = SendStatus.SENT, error: str = None) -> dict:
+    return {
+        "id": log_id,
+        "created_at": START + timedelta(hours=hours),
+        "campaign_id": 1,
+        "account_id": 2,
+        "recipient_id": log_id,
+        "recipient_identifier": f"user{log_id}",
+        "status": status,
+        "error_message": error,
+        "retry_count": 0,
+        "campaign_name": "Spring sale",
+        "account_name": "Main",
+        "recipient_name": None,
+    }
+
+
+@pytest.fixture
+def archive(tmp_path):
+    """Create an archive holding logs spread over three days."""
+    archive = SendLogArchive(tmp_path / "archive")
+    archive.write_rows([
+        make_row(1, 0),
+        make_row(2, 1, SendStatus.FAILED, "FloodWait for 30 seconds"),
+        make_row(3, 24),
+        make_row(4, 25, SendStatus.FAILED, "Peer flood"),
+        make_row(5, 48),
+    ])
+    return archive
+
+
+class TestSendLogArchive:
+    """Test archiving and querying send logs."""
+
+    def test_day_partitions(self, archive):
+        """Test rows are written into one directory per day, newest listed first."""
+        days = [day.isoformat() for day, _ in archive.partitions()]
+
+        assert days == ["2024-03-03", "2024-03-02", "2024-03-01"]
+
+    def test_rewrite_is_idempotent(self, archive):
+        """Test archiving the same chunk again replaces it instead of duplicating rows."""
+        archive.write_rows([make_row(5, 48)])
+
+        assert archive.count(SendLogFilter()) == 5
+
+    def test_newest_first_with_filters(self, archive):
+        """Test filtered rows come back newest first as viewer rows."""
+        rows = list(archive.iter_rows(SendLogFilter(status="failed")))
+
+        assert [row.id for row in rows] == [4, 2]
+        assert rows[0].status == SendStatus.FAILED
+        assert rows[0].campaign_name == "Spring sale"
+
+    def test_date_range_and_search(self, archive):
+        """Test date bounds and case-insensitive search narrow the result."""
+        filters = SendLogFilter(date_from=START + timedelta(hours=24), search_text="PEER")
+
+        assert [row.id for row in archive.iter_rows(filters)] == [4]
+
+    def test_resume_before_cursor(self, archive):
+        """Test iteration continues strictly after a keyset cursor."""
+        rows = list(archive.iter_rows(SendLogFilter(), before=(START + timedelta(hours=24), 3)))
+
+        assert [row.id for row in rows] == [2, 1]
+
+    def test_clear(self, archive):
+        """Test clearing removes every archived file."""
+        assert archive.clear() > 0
+        assert archive.partitions() == []
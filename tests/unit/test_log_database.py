@@ -0,0 +1,78 @@
+"""
+Unit tests for keeping send logs in a separate database file.
+"""
+
+import pytest
+from sqlalchemy import func, inspect
+from sqlmodel import Session, select
+
+from app.models import Account, SendLog, SendStatus
+from app.services.log_database import LOG_SCHEMA, place_log_tables, table_schema
+from app.services.migrations import MIGRATIONS
+
+
+@pytest.fixture
+def log_database_path(tmp_path):
+    return tmp_path / "logs.db"
+
+
+@pytest.fixture
+def engine(migrated_engine):
+    """Migrated database with the log database attached, holding one account and log."""
+    engine = migrated_engine
+    with Session(engine) as session:
+        account = Account(name="Main", phone_number="+10000000000", api_id=1, api_hash="0" * 32, session_path="main.session")
+        session.add(account)
+        session.commit()
+        session.add(SendLog(account_id=account.id, message_text="Hello", status=SendStatus.SENT))
+        session.commit()
+    return engine
+
+
+def split(engine, enabled: bool = True) -> dict:
+    with engine.begin() as connection:
+        return place_log_tables(connection, enabled)
+
+
+class TestLogDatabase:
+    """Test moving log tables between the main and the log database."""
+
+    def test_split_moves_rows_and_indexes(self, engine):
+        """Test rows and model-named indexes end up in the log database only."""
+        assert split(engine)["send_logs"] == 1
+
+        with engine.connect() as connection:
+            assert table_schema(connection, "send_logs") == LOG_SCHEMA
+            indexes = {index["name"] for index in inspect(connection).get_indexes("send_logs", schema=LOG_SCHEMA)}
+        assert indexes == {index.name for index in SendLog.__table__.indexes}
+
+    def test_queries_join_across_databases(self, engine):
+        """Test unqualified ORM queries and writes reach the attached log table."""
+        split(engine)
+
+        with Session(engine) as session:
+            account = session.exec(select(Account)).one()
+            session.add(SendLog(account_id=account.id, message_text="Again", status=SendStatus.FAILED))
+            session.commit()
+            count = session.exec(
+                select(func.count(SendLog.id)).join(Account, SendLog.account_id == Account.id)
+            ).one()
+
+        assert count == 2
+
+    def test_migrations_do_not_shadow_split_tables(self, engine):
+        """Test rerunning the baseline keeps send_logs out of the main database."""
+        split(engine)
+
+        with engine.begin() as connection:
+            MIGRATIONS[0].upgrade(connection)
+            assert table_schema(connection, "send_logs") == LOG_SCHEMA
+
+    def test_split_off_moves_rows_back(self, engine):
+        """Test turning the split off puts the rows back into main."""
+        split(engine)
+
+        assert split(engine, enabled=False)["send_logs"] == 1
+        with engine.connect() as connection:
+            assert table_schema(connection, "send_logs") == "main"
+            assert not inspect(connection).has_table("send_logs", schema=LOG_SCHEMA)
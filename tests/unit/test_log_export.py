@@ -0,0 +1,80 @@
+"""
+Unit tests for time-range log export.
+"""
+
+import gzip
+import io
+from datetime import datetime
+from app.services.log_export import LogExporter, line_timestamp
+
+
+def record(minute, text):
+    return f"2024-01-01 12:{minute:02d}:00 - app - INFO - a.py:1 - {text}\n"
+
+
+def export(exporter, start_minute, end_minute):
+    output = io.BytesIO()
+    count = exporter.export(
+        datetime(2024, 1, 1, 12, start_minute),
+        datetime(2024, 1, 1, 12, end_minute),
+        output
+    )
+    return count, output.getvalue().decode("utf-8").splitlines()
+
+
+class TestLogExporter:
+    """Test log exporter functionality."""
+
+    def test_line_timestamp(self):
+        """Test timestamp extraction from formatted lines."""
+        assert line_timestamp(record(5, "x").encode()) == "2024-01-01 12:05:00"
+        assert line_timestamp(b"Traceback (most recent call last):\n") is None
+
+    def test_window_across_segments(self, tmp_path):
+        """Test export spans gzip, rotated and live segments in order."""
+        with gzip.open(tmp_path / "app.log.2.gz", "wt", encoding="utf-8") as f:
+            f.write("".join(record(m, f"gz {m}") for m in range(0, 10)))
+        (tmp_path / "app.log.1").write_text("".join(record(m, f"old {m}") for m in range(10, 20)))
+        (tmp_path / "app.log").write_text("".join(record(m, f"new {m}") for m in range(20, 30)))
+        (tmp_path / "export_20240101_000000.log").write_text(record(15, "ignored"))
+
+        exporter = LogExporter(tmp_path / "app.log", index_interval=64)
+        count, lines = export(exporter, 8, 21)
+
+        assert count == 14
+        assert lines[0].endswith("gz 8")
+        assert lines[-1].endswith("new 21")
+
+    def test_continuation_lines_follow_record(self, tmp_path):
+        """Test traceback lines are exported with the record they belong to."""
+        (tmp_path / "app.log").write_text(
+            record(1, "before") + record(2, "failed") + "Traceback (most recent call last):\n"
+            + "  ValueError\n" + record(3, "after")
+        )
+
+        count, lines = export(LogExporter(tmp_path / "app.log"), 2, 2)
+
+        assert count == 3
+        assert lines[1] == "Traceback (most recent call last):"
+
+    def test_index_cached_and_extended(self, tmp_path):
+        """Test the index is persisted and extended when the file grows."""
+        log_file = tmp_path / "app.log"
+        log_file.write_text("".join(record(m, f"line {m}") for m in range(0, 30)))
+
+        exporter = LogExporter(log_file, index_interval=256)
+        export(exporter, 0, 1)
+        assert (tmp_path / ".log_index.json").exists()
+
+        reloaded = LogExporter(log_file, index_interval=256)
+        index = reloaded.get_index(log_file)
+        assert index.size == log_file.stat().st_size
+        assert len(index.offsets) > 1
+        assert index.seek_offset("2024-01-01 12:25:00") > 0
+
+        with open(log_file, "a", encoding="utf-8") as f:
+            f.write(record(45, "appended"))
+
+        count, lines = export(reloaded, 40, 50)
+        assert count == 1
+        assert lines[0].endswith("appended")
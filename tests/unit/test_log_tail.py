@@ -0,0 +1,99 @@
+"""
+Unit tests for log tailing functionality.
+"""
+
+import os
+from app.services.log_tail import LogTailer, LogLineBuffer, parse_level
+
+
+def write(path, text, mode="a"):
+    with open(path, mode, encoding="utf-8") as f:
+        f.write(text)
+
+
+class TestLogTailer:
+    """Test log tailer functionality."""
+
+    def test_incremental_reads(self, tmp_path):
+        """Test only appended lines are returned."""
+        log_file = tmp_path / "app.log"
+        write(log_file, "one\ntwo\n", "w")
+
+        tailer = LogTailer(log_file)
+        assert tailer.poll() == ["one", "two"]
+        assert tailer.poll() == []
+
+        write(log_file, "three\n")
+        assert tailer.poll() == ["three"]
+
+    def test_partial_line_held_back(self, tmp_path):
+        """Test incomplete lines are returned once finished."""
+        log_file = tmp_path / "app.log"
+        write(log_file, "start", "w")
+
+        tailer = LogTailer(log_file)
+        assert tailer.poll() == []
+
+        write(log_file, "ed ✓\n")
+        assert tailer.poll() == ["started ✓"]
+
+    def test_rotation(self, tmp_path):
+        """Test lines written before and after rotation are both seen."""
+        log_file = tmp_path / "app.log"
+        write(log_file, "old 1\n", "w")
+
+        tailer = LogTailer(log_file)
+        assert tailer.poll() == ["old 1"]
+
+        write(log_file, "old 2\n")
+        os.rename(log_file, tmp_path / "app.log.1")
+        write(log_file, "new 1\n", "w")
+
+        assert tailer.poll() == ["old 2", "new 1"]
+
+    def test_truncation(self, tmp_path):
+        """Test following restarts when the file is truncated in place."""
+        log_file = tmp_path / "app.log"
+        write(log_file, "a long first line\n", "w")
+
+        tailer = LogTailer(log_file)
+        tailer.poll()
+
+        write(log_file, "b\n", "w")
+        assert tailer.poll() == ["b"]
+
+    def test_open_tail_bytes(self, tmp_path):
+        """Test opening near the end skips to the first full line."""
+        log_file = tmp_path / "app.log"
+        write(log_file, "".join(f"line {i}\n" for i in range(100)), "w")
+
+        tailer = LogTailer(log_file)
+        tailer.open(tail_bytes=20)
+        assert tailer.poll() == ["line 98", "line 99"]
+
+
+class TestLogLineBuffer:
+    """Test log line buffer functionality."""
+
+    def test_level_parsing(self):
+        """Test level extraction from formatted lines."""
+        line = "2024-01-01 12:00:00 - telegram_sender - WARNING - db.py:10 - message"
+        assert parse_level(line) == "WARNING"
+        assert parse_level("Traceback (most recent call last):") is None
+
+    def test_bounded_and_filtered(self):
+        """Test buffer keeps only the newest lines and filters by level."""
+        buffer = LogLineBuffer(max_lines=3)
+        buffer.append([
+            "2024-01-01 12:00:00 - app - INFO - a.py:1 - first",
+            "2024-01-01 12:00:01 - app - ERROR - a.py:2 - failed",
+            "Traceback (most recent call last):",
+            "2024-01-01 12:00:02 - app - INFO - a.py:3 - last",
+        ])
+
+        assert len(buffer) == 3
+        assert buffer.lines("ERROR") == [
+            "2024-01-01 12:00:01 - app - ERROR - a.py:2 - failed",
+            "Traceback (most recent call last):",
+        ]
+        assert buffer.lines("DEBUG") == []
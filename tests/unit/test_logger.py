@@ -0,0 +1,120 @@
+"""
+Unit tests for structured log events and the queued logging pipeline.
+"""
+
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+
+from app.services.logger import JsonLinesFormatter, LazyQueueHandler, LogEvent
+
+
+def make_record(msg, args=(), level=logging.INFO, exc_info=None) -> logging.LogRecord:
+    return logging.LogRecord("telegram_sender", level, __file__, 1, msg, args, exc_info)
+
+
+def raised_exc_info():
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        return sys.exc_info()
+
+
+class TestLogEvent:
+    """Test rendering structured events."""
+
+    def test_text(self):
+        """Test the plain text lists only the ids that are set."""
+        event = LogEvent("send", "sent", "Message sent", account_id=2, recipient_id=7, latency_ms=41.6)
+
+        assert str(event) == "Send [sent] account=2 recipient=7 latency=42ms: Message sent"
+        assert str(LogEvent("campaign", "started", campaign_id=3)) == "Campaign [started] campaign=3"
+
+    def test_markup(self):
+        """Test send events are styled by status and message text cannot inject markup."""
+        sent = LogEvent("send", "FAILED", "[bold]flood[/bold]", recipient_id=1)
+        rate = LogEvent("rate_limit", "wait", "30s")
+
+        assert sent.to_markup() == "[bold red]Send[/bold red] [FAILED] recipient=1: \\[bold]flood\\[/bold]"
+        assert rate.to_markup().startswith("[bold yellow]Rate Limit[/bold yellow]")
+        assert LogEvent("other", "x").to_markup().startswith("[white]Other[/white]")
+
+    def test_to_dict_drops_empty_fields(self):
+        """Test unset ids and an empty message are left out."""
+        assert LogEvent("telegram", "connected", account_id=0).to_dict() == {
+            "category": "telegram", "event": "connected", "account_id": 0
+        }
+
+
+class TestJsonLinesFormatter:
+    """Test one JSON object per record."""
+
+    def test_structured_event(self):
+        """Test event fields become top-level keys."""
+        record = make_record(LogEvent("send", "sent", "Zürich", campaign_id=5, latency_ms=12.0))
+
+        data = json.loads(JsonLinesFormatter().format(record))
+
+        assert data["lvl"] == "INFO" and data["ts"] == round(record.created, 3)
+        assert {key: data[key] for key in ("category", "event", "message", "campaign_id", "latency_ms")} == {
+            "category": "send", "event": "sent", "message": "Zürich", "campaign_id": 5, "latency_ms": 12.0
+        }
+        assert "Zürich" in JsonLinesFormatter().format(record)
+
+    def test_plain_message_and_exception(self):
+        """Test plain records keep their formatted message and traceback."""
+        line = JsonLinesFormatter().format(make_record("%s failed", ("send",), logging.ERROR, raised_exc_info()))
+
+        data = json.loads(line)
+        assert "\n" not in line
+        assert data["msg"] == "send failed" and data["lvl"] == "ERROR"
+        assert "RuntimeError: boom" in data["exc"]
+
+
+class TestLazyQueueHandler:
+    """Test only the listener thread renders structured events."""
+
+    def test_events_are_queued_unformatted(self):
+        """Test the queued record still carries the event, while plain records are rendered as usual."""
+        records = queue.SimpleQueue()
+        handler = LazyQueueHandler(records)
+        event = LogEvent("campaign", "started", campaign_id=1)
+
+        handler.emit(make_record(event))
+        handler.emit(make_record("%d sent", (3,)))
+        handler.emit(make_record(event, exc_info=raised_exc_info()))
+
+        queued = [records.get_nowait() for _ in range(3)]
+        assert queued[0].msg is event
+        assert (queued[1].msg, queued[1].args) == ("3 sent", None)
+        assert isinstance(queued[2].msg, str) and queued[2].exc_info is None
+
+    def test_listener_formats_events(self):
+        """Test events reach the listener's handlers and are formatted there."""
+        records = queue.SimpleQueue()
+        collected = []
+
+        class Collect(logging.Handler):
+            def emit(self, record):
+                collected.append(self.format(record))
+
+        sink = Collect()
+        sink.setFormatter(JsonLinesFormatter())
+        listener = logging.handlers.QueueListener(records, sink)
+        logger = logging.getLogger("test_lazy_queue_handler")
+        logger.propagate = False
+        logger.addHandler(LazyQueueHandler(records))
+        listener.start()
+        try:
+            logger.warning(LogEvent("safety", "blocked", "Peer flood", account_id=4))
+        finally:
+            listener.stop()
+            logger.handlers.clear()
+
+        [line] = collected
+        assert json.loads(line) == {
+            "ts": json.loads(line)["ts"], "lvl": "WARNING",
+            "category": "safety", "event": "blocked", "message": "Peer flood", "account_id": 4,
+        }
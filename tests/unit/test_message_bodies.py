@@ -0,0 +1,88 @@
+"""
+Unit tests for storing send log message texts once.
+"""
+
+import pytest
+from sqlalchemy import func, inspect
+from sqlmodel import Session, create_engine, select
+
+from app.models import Account, MessageBody, SendLog, SendStatus
+from app.services.message_bodies import MessageBodyStore
+from app.services.migrations import MIGRATIONS, MigrationRunner
+
+
+@pytest.fixture
+def engine(migrated_engine):
+    """Migrated database holding one account."""
+    with Session(migrated_engine) as session:
+        session.add(Account(name="Main", phone_number="+10000000000", api_id=1, api_hash="0" * 32, session_path="main.session"))
+        session.commit()
+    return migrated_engine
+
+
+@pytest.fixture
+def store():
+    store = MessageBodyStore()
+    store.install(Session)
+    yield store
+    store.uninstall(Session)
+
+
+def add_logs(engine, *texts: str) -> None:
+    with Session(engine) as session:
+        for text in texts:
+            session.add(SendLog(account_id=1, message_text=text, status=SendStatus.SENT))
+        session.commit()
+
+
+class TestMessageBodies:
+    """Test send logs share one stored body per distinct text."""
+
+    def test_logs_share_bodies(self, engine, store):
+        """Test repeated texts across flushes are stored once and read back through the log."""
+        add_logs(engine, "Hello", "Hello", "Bye")
+        add_logs(engine, "Hello")
+
+        with Session(engine) as session:
+            bodies = session.exec(select(func.count(MessageBody.id))).one()
+            logs = session.exec(select(SendLog).order_by(SendLog.id)).all()
+            texts = [log.message_text for log in logs]
+
+        assert bodies == 2
+        assert texts == ["Hello", "Hello", "Bye", "Hello"]
+
+    def test_rolled_back_bodies_are_not_cached(self, engine, store):
+        """Test a body stored by a rolled back flush is stored again next time."""
+        with Session(engine) as session:
+            session.add(SendLog(account_id=1, message_text="Lost", status=SendStatus.SENT))
+            session.flush()
+            session.rollback()
+        add_logs(engine, "Lost")
+
+        with Session(engine) as session:
+            log = session.exec(select(SendLog)).one()
+            assert log.message_body.text == "Lost"
+
+    def test_migration_moves_texts_into_bodies(self, tmp_path):
+        """Test upgrading logs that kept their own text points them at shared bodies."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+        MigrationRunner(engine, MIGRATIONS[:4]).upgrade()
+        with engine.begin() as connection:
+            connection.exec_driver_sql("ALTER TABLE send_logs ADD COLUMN message_text VARCHAR")
+        with Session(engine) as session:
+            session.add(Account(name="Main", phone_number="+10000000000", api_id=1, api_hash="0" * 32, session_path="main.session"))
+            session.commit()
+            # No store installed: the logs keep their text in the old column only
+            session.add_all(SendLog(account_id=1, status=SendStatus.SENT) for _ in range(3))
+            session.commit()
+        with engine.begin() as connection:
+            connection.exec_driver_sql("UPDATE send_logs SET message_text = CASE id WHEN 3 THEN 'Other' ELSE 'Hi' END")
+
+        MigrationRunner(engine).upgrade()
+
+        with Session(engine) as session:
+            texts = [log.message_text for log in session.exec(select(SendLog).order_by(SendLog.id)).all()]
+            bodies = session.exec(select(func.count(MessageBody.id))).one()
+        assert texts == ["Hi", "Hi", "Other"] and bodies == 2
+        assert "message_text" not in {column["name"] for column in inspect(engine).get_columns("send_logs")}
+        engine.dispose()
@@ -0,0 +1,72 @@
+"""
+Unit tests for the trigger-maintained recipient audience fingerprint.
+"""
+
+import pytest
+from sqlmodel import Session
+
+from app.models import Recipient, RecipientStatus
+from app.services import recipient_audience
+from app.services.recipient_audience import RecipientAudienceService
+
+
+@pytest.fixture
+def engine(migrated_engine, monkeypatch):
+    """Migrated database with two active recipients."""
+    engine = migrated_engine
+    with Session(engine) as session:
+        session.add_all([Recipient(username="first"), Recipient(username="second")])
+        session.commit()
+    monkeypatch.setattr(recipient_audience, "get_session", lambda: Session(engine))
+    return engine
+
+
+@pytest.fixture
+def audience(engine):
+    service = RecipientAudienceService()
+    service.ensure_fingerprint(engine)
+    return service
+
+
+def computed(service) -> str:
+    """Fingerprint aggregated from the recipients table, bypassing the stored row."""
+    service._available = False
+    try:
+        return service.fingerprint()
+    finally:
+        service._available = True
+
+
+class TestRecipientAudience:
+    """Test the stored fingerprint follows audience membership."""
+
+    def test_follows_membership_changes(self, engine, audience):
+        """Test inserts, status changes, soft and hard deletes keep the stored fingerprint exact."""
+        initial = audience.fingerprint()
+        with Session(engine) as session:
+            session.add(Recipient(username="third"))
+            session.add(Recipient(username="blocked", status=RecipientStatus.BLOCKED))
+            session.get(Recipient, 1).is_deleted = True
+            session.commit()
+            after_changes = audience.fingerprint()
+            session.get(Recipient, 2).status = RecipientStatus.INACTIVE
+            session.delete(session.get(Recipient, 3))
+            session.commit()
+
+        assert audience.is_available()
+        assert after_changes != initial and after_changes.startswith("manual:2:")
+        assert audience.fingerprint() == computed(audience) == "manual:0:" + "0" * 16
+
+    def test_same_members_same_fingerprint(self, engine, audience):
+        """Test adding and removing a recipient gives the original fingerprint back."""
+        initial = audience.fingerprint()
+        with Session(engine) as session:
+            recipient = Recipient(username="temporary")
+            session.add(recipient)
+            session.commit()
+            changed = audience.fingerprint()
+            recipient.status = RecipientStatus.BLOCKED
+            session.commit()
+
+        assert changed != initial
+        assert audience.fingerprint() == initial == computed(audience)
@@ -0,0 +1,73 @@
+"""
+Unit tests for the generated recipient identifier and display label columns.
+"""
+
+from sqlmodel import Session, create_engine, select
+
+from app.models import Recipient, RecipientType
+from app.services.migrations import MIGRATIONS, MigrationRunner
+
+
+def recipients():
+    return [
+        Recipient(username="alice", user_id=1, first_name="Alice", last_name="Smith"),
+        Recipient(user_id=42, first_name="Bob"),
+        Recipient(phone_number="+15550100", display_name="Carol"),
+        Recipient(),
+        Recipient(recipient_type=RecipientType.GROUP, group_id=-100, group_title="Chat"),
+        Recipient(recipient_type=RecipientType.CHANNEL, group_username="news"),
+        Recipient(recipient_type=RecipientType.GROUP),
+    ]
+
+
+class TestRecipientLabels:
+    """Test the generated columns match the Python getters."""
+
+    def test_columns_match_getters(self, migrated_engine):
+        """Test each generated value equals the getter computed in Python."""
+        expected = [(r.get_identifier(), r.get_display_name()) for r in recipients()]
+        with Session(migrated_engine) as session:
+            session.add_all(recipients())
+            session.commit()
+            stored = session.exec(
+                select(Recipient.id, Recipient.identifier, Recipient.display_label).order_by(Recipient.id)
+            ).all()
+
+        # Fallbacks that use the id are only known once the row exists
+        expected[3] = (f"recipient_{stored[3][0]}", "Unknown")
+        expected[6] = (f"group_{stored[6][0]}", "Unknown Group")
+        assert [(identifier, label) for _, identifier, label in stored] == expected
+
+    def test_getters_follow_unsaved_changes(self, migrated_engine):
+        """Test loaded values are used until a field changes."""
+        with Session(migrated_engine) as session:
+            session.add(Recipient(username="alice"))
+            session.commit()
+            recipient = session.exec(select(Recipient)).one()
+
+            assert recipient.get_identifier() == "@alice"
+            recipient.username = "bob"
+            assert recipient.get_identifier() == "@bob"
+            assert session.exec(select(Recipient.id).where(Recipient.identifier == "@bob")).one() == recipient.id
+
+    def test_upgrade_adds_columns(self, tmp_path):
+        """Test upgrading a database from before the columns adds and indexes them."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+        MigrationRunner(engine, MIGRATIONS[:8]).upgrade()
+        with Session(engine) as session:
+            session.add(Recipient(username="old"))
+            session.commit()
+        with engine.begin() as connection:
+            for name in ("identifier", "display_label"):
+                connection.exec_driver_sql(f"DROP INDEX ix_recipients_live_{name}")
+                connection.exec_driver_sql(f"ALTER TABLE recipients DROP COLUMN {name}")
+
+        assert MigrationRunner(engine).upgrade() == [9]
+        with engine.connect() as connection:
+            assert connection.exec_driver_sql("SELECT identifier FROM recipients").scalar() == "@old"
+            plan = connection.exec_driver_sql(
+                "EXPLAIN QUERY PLAN SELECT id FROM recipients WHERE is_deleted = 0 AND identifier = '@old'"
+            ).all()
+        engine.dispose()
+
+        assert "ix_recipients_live_identifier" in " ".join(row[3] for row in plan)
@@ -0,0 +1,103 @@
+"""
+Unit tests for the FTS5 recipient search index.
+"""
+
+import pytest
+from sqlalchemy import event, text
+from sqlmodel import Session
+
+from app.models import Recipient
+from app.services import recipient_search
+from app.services.recipient_search import FTS_TABLE, RecipientSearchService
+
+
+@pytest.fixture
+def engine(migrated_engine, monkeypatch):
+    """Migrated database with recipients stored before the search index exists."""
+    with Session(migrated_engine) as session:
+        session.add_all([
+            Recipient(username="alice_smith", first_name="Alice", last_name="Smith"),
+            Recipient(username="bob", first_name="Bob", notes="Met in Zürich"),
+        ])
+        session.commit()
+    monkeypatch.setattr(recipient_search, "get_session", lambda: Session(migrated_engine))
+    return migrated_engine
+
+
+@pytest.fixture
+def search(engine):
+    service = RecipientSearchService()
+    service.ensure_index(engine)
+    return service
+
+
+def usernames(recipients):
+    return [recipient.username for recipient in recipients]
+
+
+class TestRecipientSearch:
+    """Test the FTS index follows the recipients table."""
+
+    def test_builds_index_for_existing_recipients(self, search):
+        """Test recipients stored before the FTS table are indexed when it is created."""
+        assert search.is_available()
+        assert usernames(search.search("alice")) == ["alice_smith"]
+        assert usernames(search.search("zurich")) == ["bob"]
+
+    def test_triggers_follow_writes(self, engine, search):
+        """Test inserts, updates of indexed columns and deletes reach the index."""
+        with Session(engine) as session:
+            session.add(Recipient(username="carol", first_name="Carol"))
+            session.get(Recipient, 2).notes = "Met in Paris"
+            session.delete(session.get(Recipient, 1))
+            session.commit()
+
+        assert usernames(search.search("carol")) == ["carol"]
+        assert usernames(search.search("paris")) == ["bob"]
+        assert search.search("zurich") == search.search("alice") == []
+
+    def test_update_trigger_skips_unindexed_columns(self, engine):
+        """Test an older trigger firing on every update is replaced by one limited to indexed columns."""
+        with engine.begin() as connection:
+            connection.exec_driver_sql(f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(username)")
+            connection.exec_driver_sql(
+                f"CREATE TRIGGER {FTS_TABLE}_au AFTER UPDATE ON recipients BEGIN SELECT 1; END"
+            )
+        RecipientSearchService().ensure_index(engine)
+
+        with engine.connect() as connection:
+            trigger = connection.execute(
+                text("SELECT sql FROM sqlite_master WHERE name = :name"), {"name": f"{FTS_TABLE}_au"}
+            ).scalar()
+        assert "AFTER UPDATE OF display_name, first_name" in trigger
+        assert "total_messages_sent" not in trigger
+
+    def test_match_query(self):
+        """Test free text becomes quoted prefix terms that FTS5 ANDs together."""
+        build = RecipientSearchService.build_match_query
+
+        assert build("ali smi") == '"ali"* "smi"*'
+        assert build('"bob" OR (NEAR') == '"bob"* "OR"* "NEAR"*'
+        assert build("  -*  ") is None and build(None) is None
+
+    def test_prefix_terms_must_all_match(self, search):
+        """Test every term has to match, each as a prefix."""
+        assert usernames(search.search("ali smi")) == ["alice_smith"]
+        assert search.search("ali bob") == []
+        assert search.search('smith" OR "bob') == []
+
+    def test_like_fallback_without_fts5(self, engine):
+        """Test search falls back to LIKE over the indexed columns when FTS5 cannot be set up."""
+        def no_fts5(conn, cursor, statement, parameters, context, executemany):
+            if "USING fts5" in statement:
+                raise RuntimeError("no such module: fts5")
+
+        event.listen(engine, "before_cursor_execute", no_fts5)
+        service = RecipientSearchService()
+        service.ensure_index(engine)
+        event.remove(engine, "before_cursor_execute", no_fts5)
+
+        assert not service.is_available()
+        assert usernames(service.search("zür")) == ["bob"]
+        assert usernames(service.search("SMITH")) == ["alice_smith"]
+        assert service.search("  ") == []
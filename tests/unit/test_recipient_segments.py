@@ -0,0 +1,98 @@
+"""
+Unit tests for compiling campaign recipient segments to SQL.
+"""
+
+import pytest
+from sqlmodel import Session
+
+from app.models import Campaign, Recipient, RecipientSource, RecipientStatus, RecipientType
+from app.models.recipient import RecipientList, RecipientListRecipient
+from app.services import recipient_segments
+from app.services.recipient_segments import RecipientSegment
+
+
+@pytest.fixture
+def engine(migrated_engine, monkeypatch):
+    """Migrated database with tagged recipients and a two-member list."""
+    engine = migrated_engine
+    with Session(engine) as session:
+        session.add_all([
+            Recipient(username="vip", tags=["vip", "beta"], custom_fields={"city": "Berlin"}),
+            Recipient(username="beta", tags=["beta"], source=RecipientSource.CSV_IMPORT),
+            Recipient(username="plain", custom_fields={"city": "Paris", "tier": 2}),
+            Recipient(group_username="chat", recipient_type=RecipientType.GROUP, source=RecipientSource.CSV_IMPORT),
+            Recipient(username="blocked", status=RecipientStatus.BLOCKED, tags=["vip"]),
+            Recipient(username="gone", is_deleted=True),
+        ])
+        session.add(RecipientList(name="Customers"))
+        session.flush()
+        session.add_all([
+            RecipientListRecipient(id=1, recipient_list_id=1, recipient_id=2),
+            RecipientListRecipient(id=2, recipient_list_id=1, recipient_id=5),
+        ])
+        session.commit()
+    monkeypatch.setattr(recipient_segments, "get_session", lambda: Session(engine))
+    return engine
+
+
+def member_ids(segment: RecipientSegment):
+    return [recipient.id for recipient in segment]
+
+
+class TestRecipientSegment:
+    """Test list membership and filters select the same recipients as the spec."""
+
+    @pytest.mark.parametrize("filters, expected", [
+        ({}, [1, 2, 3, 4]),
+        ({"status": ["blocked", "ACTIVE"]}, [1, 2, 3, 4, 5]),
+        ({"type": "group"}, [4]),
+        ({"source": "csv_import", "recipient_type": "USER"}, [2]),
+        ({"tags": ["vip", "beta"]}, [1, 2]),
+        ({"tags_all": ["vip", "beta"]}, [1]),
+        ({"exclude_tags": "beta"}, [3, 4]),
+        ({"custom_fields": {"city": ["Berlin", "Paris"], "tier": 2}}, [3]),
+    ])
+    def test_filters(self, engine, filters, expected):
+        """Test each filter, with live active recipients as the default."""
+        segment = RecipientSegment(filters=filters)
+
+        assert member_ids(segment) == expected
+        assert segment.count() == len(expected)
+
+    def test_campaign_list(self, engine):
+        """Test a campaign's list narrows its recipients, and batches page by id."""
+        listed = RecipientSegment.for_campaign(Campaign(name="List", message_text="Hi", recipient_list_id=1))
+        csv = RecipientSegment.for_campaign(Campaign(
+            name="CSV", message_text="Hi", recipient_source="csv_import", recipient_list_id=1,
+            recipient_filters={"status": ["active", "blocked"]}
+        ))
+
+        assert member_ids(listed) == [2] and not listed.is_everyone()
+        assert [[r.id for r in batch] for batch in csv.iter_batches(batch_size=1)] == [[2], [5]]
+
+    def test_campaign_source_without_list(self, engine):
+        """Test a non-manual campaign without a list is refused instead of matching by recipient source."""
+        manual = RecipientSegment.for_campaign(Campaign(name="Manual", message_text="Hi"))
+
+        assert manual.is_everyone() and member_ids(manual) == [1, 2, 3, 4]
+        with pytest.raises(ValueError, match="no recipient list"):
+            RecipientSegment.for_campaign(Campaign(name="CSV", message_text="Hi", recipient_source="csv_import"))
+
+    @pytest.mark.parametrize("filters", [
+        {"colour": "red"},
+        {"status": "sleeping"},
+        {"custom_fields": ["city"]},
+        ["vip"],
+    ])
+    def test_invalid_filters(self, filters):
+        """Test filter specs that cannot be compiled are rejected."""
+        with pytest.raises(ValueError):
+            RecipientSegment.validate_filters(filters)
+
+    def test_list_statistics(self, engine):
+        """Test list statistics are counted in the database."""
+        with Session(engine) as session:
+            recipient_list = session.get(RecipientList, 1)
+            recipient_list.update_statistics()
+
+            assert (recipient_list.total_recipients, recipient_list.active_recipients) == (2, 1)
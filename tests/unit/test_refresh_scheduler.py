@@ -0,0 +1,112 @@
+"""
+Unit tests for visibility-aware widget refreshes.
+"""
+
+import threading
+
+import pytest
+from PyQt5.QtWidgets import QWidget
+
+from app.gui import refresh_scheduler
+from app.gui.refresh_scheduler import RefreshScheduler
+from app.services.data_access import DataAccessService
+
+
+@pytest.fixture
+def scheduler(qapp):
+    return RefreshScheduler(tick_ms=10)
+
+
+@pytest.fixture
+def widget(qtbot):
+    widget = QWidget()
+    qtbot.addWidget(widget)
+    return widget
+
+
+@pytest.fixture
+def shown(widget, qtbot):
+    widget.show()
+    qtbot.waitExposed(widget)
+    return widget
+
+
+@pytest.fixture
+def data_access(qapp, monkeypatch):
+    service = DataAccessService(max_threads=1)
+    monkeypatch.setattr(refresh_scheduler, "get_data_access", lambda: service)
+    yield service
+    service.shutdown()
+
+
+class TestRefreshScheduler:
+    """Test held, coalesced and prepared refreshes."""
+
+    def test_requests_coalesce(self, scheduler, shown, qtbot):
+        """Test several requests before a tick give a single refresh."""
+        calls = []
+        scheduler.register(shown, lambda: calls.append(1))
+
+        for _ in range(3):
+            scheduler.request(shown)
+        qtbot.waitUntil(lambda: bool(calls))
+        qtbot.wait(50)
+
+        assert calls == [1]
+
+    def test_hidden_widget_is_held_until_shown(self, scheduler, widget, qtbot):
+        """Test a request for a hidden widget waits, with the timer idle, until it is shown."""
+        calls = []
+        scheduler.register(widget, lambda: calls.append(1))
+        scheduler.request(widget)
+        qtbot.wait(50)
+
+        assert calls == [] and not scheduler._timer.isActive()
+        widget.show()
+        qtbot.waitUntil(lambda: calls == [1])
+
+    def test_minimized_window_is_held_until_restored(self, scheduler, shown, qtbot):
+        """Test requests made while the window is minimized run once it is restored."""
+        calls = []
+        scheduler.register(shown, lambda: calls.append(1))
+        shown.showMinimized()
+        for _ in range(2):
+            scheduler.request(shown)
+        qtbot.wait(50)
+
+        assert calls == [] and not scheduler.is_active(shown)
+        shown.showNormal()
+        qtbot.waitUntil(lambda: calls == [1])
+        qtbot.wait(50)
+        assert calls == [1]
+
+    def test_prepare_runs_one_job_at_a_time(self, scheduler, shown, data_access, qtbot):
+        """Test prepared queries run on the pool, and a request made meanwhile runs after the first."""
+        release = threading.Event()
+        jobs, applied = [], []
+
+        def query():
+            jobs.append(threading.current_thread())
+            release.wait(5)
+            return len(jobs)
+
+        scheduler.register(shown, applied.append, prepare=lambda: query)
+        scheduler.request(shown)
+        qtbot.waitUntil(lambda: len(jobs) == 1)
+        scheduler.request(shown)
+        qtbot.wait(50)
+
+        assert len(jobs) == 1 and applied == []
+        release.set()
+        qtbot.waitUntil(lambda: applied == [1, 2])
+        assert threading.main_thread() not in jobs
+
+    def test_unregistered_widget_is_ignored(self, scheduler, shown, qtbot):
+        """Test a request after unregistering does nothing."""
+        calls = []
+        scheduler.register(shown, lambda: calls.append(1))
+        scheduler.unregister(shown)
+        scheduler.request(shown)
+        qtbot.wait(50)
+
+        assert calls == []
@@ -0,0 +1,68 @@
+"""
+Unit tests for coalescing account and recipient send counters.
+"""
+
+import pytest
+from sqlmodel import Session
+
+from app.models import Account, Recipient
+from app.services import db
+from app.services.db_writer import DatabaseWriter
+from app.services.send_counters import SendCounters
+
+
+@pytest.fixture
+def engine(migrated_engine, monkeypatch):
+    """Migrated database with one account and two recipients, written through an inline writer."""
+    engine = migrated_engine
+    with Session(engine) as session:
+        session.add(Account(
+            name="Main", phone_number="+10000000000", api_id=1, api_hash="0" * 32,
+            session_path="main.session", total_messages_sent=10
+        ))
+        session.add_all([Recipient(username="first"), Recipient(username="second")])
+        session.commit()
+    writer = DatabaseWriter(engine)
+    monkeypatch.setattr(db, "get_db_writer", lambda table=None: writer)
+    return engine
+
+
+class TestSendCounters:
+    """Test send outcomes are added up in memory and applied in one batch."""
+
+    def test_flush_adds_counts(self, engine):
+        """Test counts are added to the stored totals, with last send times per outcome."""
+        counters = SendCounters(flush_interval=None)
+        for recipient_id, success in ((1, True), (2, True), (2, False)):
+            counters.record(1, recipient_id, success)
+
+        assert counters.pending() == 3
+        assert counters.flush() == 3
+
+        with Session(engine) as session:
+            account = session.get(Account, 1)
+            first, second = session.get(Recipient, 1), session.get(Recipient, 2)
+        assert (account.total_messages_sent, account.total_messages_failed) == (12, 1)
+        assert account.last_send_time is not None
+        assert (first.total_messages_sent, first.last_message_failed) == (1, None)
+        assert (second.total_messages_sent, second.total_messages_failed) == (1, 1)
+        assert counters.pending() == 0 and counters.flush() == 0
+
+    def test_failed_flush_keeps_counts(self, engine, monkeypatch):
+        """Test counts survive a failed flush and merge with later sends."""
+        counters = SendCounters(flush_interval=None)
+        counters.record(1, None, True)
+
+        class BrokenWriter:
+            def submit(self, job):
+                raise RuntimeError("database is locked")
+
+        working = db.get_db_writer()
+        monkeypatch.setattr(db, "get_db_writer", lambda table=None: BrokenWriter())
+        assert counters.flush() == 0
+        counters.record(1, None, True)
+        monkeypatch.setattr(db, "get_db_writer", lambda table=None: working)
+        counters.flush()
+
+        with Session(engine) as session:
+            assert session.get(Account, 1).total_messages_sent == 12
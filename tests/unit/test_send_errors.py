@@ -0,0 +1,41 @@
+"""
+Unit tests for classifying send failures into error codes.
+"""
+
+from telethon import errors
+
+from app.models import SendErrorCode
+from app.services.send_errors import classify_error_message, classify_send_error, send_failure
+
+
+class TestSendErrors:
+    """Test Telethon errors and legacy messages map to stable codes."""
+
+    def test_telethon_errors(self):
+        """Test known errors get their code, Telegram's name and the wait."""
+        flood = classify_send_error(errors.FloodWaitError(request=None, capture=30))
+        privacy = classify_send_error(errors.UserPrivacyRestrictedError(request=None))
+
+        assert (flood.code, flood.telegram_error_code, flood.retry_after) == (SendErrorCode.FLOOD_WAIT, "FLOOD_WAIT", 30)
+        assert (privacy.code, privacy.telegram_error_code) == (SendErrorCode.PRIVACY_RESTRICTED, "USER_PRIVACY_RESTRICTED")
+
+    def test_unlisted_errors_fall_back_to_base_class(self):
+        """Test errors Telethon doesn't list keep the server's name and use their base class."""
+        error = classify_send_error(errors.ForbiddenError(None, "CHAT_SEND_PLAIN_FORBIDDEN"))
+
+        assert (error.code, error.telegram_error_code) == (SendErrorCode.WRITE_FORBIDDEN, "CHAT_SEND_PLAIN_FORBIDDEN")
+        assert classify_send_error(ConnectionError("reset")).code == SendErrorCode.NETWORK
+
+    def test_messages(self):
+        """Test messages with embedded ids collapse into the same code."""
+        assert classify_error_message('Failed to get entity: No user has "abc123" as username') == SendErrorCode.PEER_NOT_FOUND
+        assert classify_error_message("A wait of 42 seconds is required") == SendErrorCode.FLOOD_WAIT
+        assert classify_error_message(None) == SendErrorCode.UNKNOWN
+
+    def test_failure_result(self):
+        """Test the fallback code is used only when the exception doesn't classify."""
+        result = send_failure("Failed to start client: boom", RuntimeError("boom"), SendErrorCode.CLIENT_NOT_READY)
+
+        assert result["success"] is False
+        assert result["error_code"] == SendErrorCode.CLIENT_NOT_READY
+        assert "retry_after" not in send_failure("Rate limited", code=SendErrorCode.FLOOD_WAIT)
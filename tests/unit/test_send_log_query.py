@@ -0,0 +1,125 @@
+"""
+Unit tests for keyset-paged send log queries.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+from sqlmodel import Session
+
+from app.models import Account, Campaign, Recipient, SendLog, SendStatus
+from app.services import log_archive, send_log_query
+from app.services.log_archive import SendLogArchive
+from app.services.send_log_query import SendLogFilter, SendLogQueryService
+
+
+START = datetime(2024, 3, 1, 12, 0, 0)
+
+# (created_at offset in hours, campaign id, status, recipient id); ids follow list order
+LOGS = [
+    (0, 1, SendStatus.SENT, 1),
+    (1, 1, SendStatus.FAILED, 2),
+    (1, 2, SendStatus.SENT, 1),
+    (1, 1, SendStatus.SENT, 2),
+    (1, 2, SendStatus.FAILED, 1),
+    (2, 2, SendStatus.SENT, 2),
+    (3, 1, SendStatus.FAILED, 1),
+]
+
+
+@pytest.fixture
+def engine(migrated_engine, tmp_path, monkeypatch):
+    """Migrated database with two campaigns, two accounts and logs sharing timestamps."""
+    with Session(migrated_engine) as session:
+        session.add_all([
+            Account(name="Main", phone_number="+10000000000", api_id=1, api_hash="0" * 32, session_path="main.session"),
+            Account(name="Spare", phone_number="+10000000001", api_id=1, api_hash="0" * 32, session_path="spare.session"),
+            Campaign(name="Spring sale", message_text="Hi"),
+            Campaign(name="Newsletter", message_text="Hi"),
+            Recipient(username="alice"),
+            Recipient(username="bob"),
+        ])
+        session.commit()
+        for log_id, (hours, campaign_id, status, recipient_id) in enumerate(LOGS, start=1):
+            session.add(SendLog(
+                id=log_id, created_at=START + timedelta(hours=hours), campaign_id=campaign_id,
+                account_id=1 if log_id % 2 else 2, recipient_id=recipient_id, status=status,
+                message_text="Hi", error_message="Peer flood" if status == SendStatus.FAILED else None
+            ))
+        session.commit()
+    monkeypatch.setattr(send_log_query, "get_session", lambda: Session(migrated_engine))
+    archive = SendLogArchive(tmp_path / "archive")
+    monkeypatch.setattr(log_archive, "get_send_log_archive", lambda: archive)
+    return migrated_engine
+
+
+@pytest.fixture
+def query(engine):
+    return SendLogQueryService()
+
+
+def newest_first(*log_ids):
+    return sorted(log_ids, key=lambda log_id: (LOGS[log_id - 1][0], log_id), reverse=True)
+
+
+def paged_ids(query, filters, limit):
+    ids, cursor = [], None
+    while True:
+        rows = query.fetch_page(filters, after=cursor, limit=limit)
+        ids.extend(row.id for row in rows)
+        if len(rows) < limit:
+            return ids
+        cursor = rows[-1].cursor
+
+
+def archive_row(log_id: int, hours: int) -> dict:
+    return {
+        "id": log_id, "created_at": START + timedelta(hours=hours), "campaign_id": 1, "account_id": 1,
+        "status": SendStatus.SENT, "retry_count": 0, "campaign_name": "Spring sale", "account_name": "Main",
+    }
+
+
+class TestSendLogQuery:
+    """Test paging, filtering and counting send logs."""
+
+    def test_ties_broken_by_id(self, query):
+        """Test pages split inside a run of equal timestamps without skipping or repeating rows."""
+        expected = newest_first(*range(1, len(LOGS) + 1))
+
+        assert expected == [7, 6, 5, 4, 3, 2, 1]
+        for limit in (1, 2, 3):
+            assert paged_ids(query, SendLogFilter(), limit) == expected
+
+    @pytest.mark.parametrize("filters, expected", [
+        (SendLogFilter(status="failed"), [7, 5, 2]),
+        (SendLogFilter(campaign_id=2), [6, 5, 3]),
+        (SendLogFilter(campaign_name="Spring sale"), [7, 4, 2, 1]),
+        (SendLogFilter(account_id=2), [6, 4, 2]),
+        (SendLogFilter(date_from=START + timedelta(hours=2)), [7, 6]),
+        (SendLogFilter(date_to=START + timedelta(hours=1)), [5, 4, 3, 2, 1]),
+        (SendLogFilter(search_text="BOB"), [6, 4, 2]),
+        (SendLogFilter(search_text="flood", campaign_id=1), [7, 2]),
+    ])
+    def test_filters(self, query, engine, filters, expected):
+        """Test each filter is part of the paged SQL query, so pages are full of matching rows."""
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        assert paged_ids(query, filters, 2) == expected
+        assert len(statements) == len(expected) // 2 + 1
+        assert all("WHERE" in statement and "LIMIT" in statement for statement in statements)
+
+    def test_continues_into_archive(self, query):
+        """Test counting and iterating read archived logs once, even when a trim left them in both places."""
+        # Log 1 was archived but not yet trimmed; logs 101 and 102 are only in the archive
+        log_archive.get_send_log_archive().write_rows([archive_row(1, 0), archive_row(101, -2), archive_row(102, -1)])
+
+        ids = [row.id for row in query.iter_rows(SendLogFilter(), batch_size=3)]
+        failed = [row.id for row in query.iter_rows(SendLogFilter(status="failed"), batch_size=3)]
+
+        assert ids == [7, 6, 5, 4, 3, 2, 1, 102, 101]
+        assert query.count(SendLogFilter()) == len(ids)
+        assert query.count(SendLogFilter(), include_archive=False) == len(LOGS)
+        assert failed == [7, 5, 2] and query.count(SendLogFilter(status="failed")) == 3
+        assert query.count(SendLogFilter(campaign_id=2)) == 3
@@ -0,0 +1,99 @@
+"""
+Unit tests for the hourly send log rollups behind campaign and account reports.
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlmodel import Session, select
+
+from app.models import Account, SendErrorCode, SendLog, SendLogRollup, SendStatus
+from app.services.send_log_rollups import SendLogRollups
+
+
+MORNING = datetime(2024, 3, 1, 9, 15)
+EVENING = datetime(2024, 3, 2, 18, 40)
+
+
+@pytest.fixture
+def rollups(migrated_engine):
+    """Migrated database whose sessions maintain rollups."""
+    rollups = SendLogRollups(migrated_engine)
+    rollups.install(Session)
+    with Session(migrated_engine) as session:
+        for number in (1, 2):
+            session.add(Account(
+                name=f"Account {number}", phone_number=f"+1000000000{number}",
+                api_id=1, api_hash="0" * 32, session_path=f"{number}.session"
+            ))
+        session.commit()
+    yield rollups
+    rollups.uninstall(Session)
+
+
+def add_log(
+    rollups, account_id: int, status: SendStatus, completed_at=None, duration_ms=None, error=None, error_code=None
+) -> SendLog:
+    with Session(rollups.engine, expire_on_commit=False) as session:
+        log = SendLog(
+            campaign_id=None, account_id=account_id, message_text="Hi", status=status,
+            completed_at=completed_at, duration_ms=duration_ms, error_message=error, error_code=error_code
+        )
+        session.add(log)
+        session.commit()
+        return log
+
+
+class TestSendLogRollups:
+    """Test rollups stay in step with send log writes."""
+
+    def test_inserts_are_counted(self, rollups):
+        """Test new logs show up in status counts, durations and breakdowns."""
+        add_log(rollups, 1, SendStatus.SENT, MORNING, duration_ms=100)
+        add_log(rollups, 1, SendStatus.FAILED, MORNING, duration_ms=300, error="Failed: 42", error_code=SendErrorCode.PEER_FLOOD)
+        add_log(rollups, 2, SendStatus.SENT, EVENING)
+
+        assert rollups.status_counts() == {"sent": 2, "failed": 1}
+        assert rollups.average_duration_ms(account_id=1) == 200
+        assert rollups.breakdown("account") == {
+            1: {"sent": 1, "failed": 1, "skipped": 0},
+            2: {"sent": 1, "failed": 0, "skipped": 0},
+        }
+        assert rollups.breakdown("hour", account_id=1) == {9: {"sent": 1, "failed": 1, "skipped": 0}}
+        assert list(rollups.breakdown("day")) == ["2024-03-01", "2024-03-02"]
+        assert rollups.error_summary(account_id=1) == {"peer_flood": 1}
+
+    def test_status_change_moves_bucket(self, rollups):
+        """Test completing a pending log moves its count to the new status and hour."""
+        log = add_log(rollups, 1, SendStatus.PENDING)
+        with Session(rollups.engine) as session:
+            stored = session.get(SendLog, log.id)
+            stored.status = SendStatus.SENT
+            stored.completed_at = EVENING
+            session.commit()
+
+        assert rollups.status_counts() == {"sent": 1}
+        assert rollups.breakdown("hour") == {18: {"sent": 1, "failed": 0, "skipped": 0}}
+
+    def test_rebuild_matches_incremental(self, rollups):
+        """Test recomputing from the logs gives the same rows as incremental upkeep."""
+        add_log(rollups, 1, SendStatus.SENT, MORNING, duration_ms=100)
+        add_log(rollups, 1, SendStatus.SENT, MORNING.replace(minute=50), duration_ms=50)
+        add_log(rollups, 2, SendStatus.FAILED, error="Peer flood")
+
+        def snapshot():
+            with Session(rollups.engine) as session:
+                return sorted(
+                    (row.campaign_id, row.account_id, row.hour, row.status, row.count, row.duration_ms_total)
+                    for row in session.exec(select(SendLogRollup)).all()
+                )
+
+        incremental = snapshot()
+        errors = rollups.error_summary()
+        with rollups.engine.begin() as connection:
+            rollups.rebuild(connection, include_archive=False)
+
+        assert snapshot() == incremental
+        # Logs without a code are grouped by what their message classifies as
+        assert rollups.error_summary() == errors == {"peer_flood": 1}
+        assert incremental[0][2:5] == (MORNING.replace(minute=0), SendStatus.SENT, 2)